@@ -7,6 +7,7 @@ from app.core.security import get_password_hash, verify_password, create_access_
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from jose import JWTError, jwt
 from app.core.config import settings
+from app.core.user_cache import auth_cache
 from datetime import timedelta, datetime
 import secrets
 import asyncio
@@ -102,16 +103,25 @@ async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
+    email = auth_cache.get_subject(token)
+    if email is None:
+        try:
+            payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.ALGORITHM])
+            email = payload.get("sub")
+            if email is None:
+                raise credentials_exception
+        except JWTError:
             raise credentials_exception
-        token_data = TokenData(email=email)
-    except JWTError:
-        raise credentials_exception
+        auth_cache.put_subject(token, email, payload.get("exp"))
+    token_data = TokenData(email=email)
+    
+    user = auth_cache.get_user(token_data.email)
+    if user is not None:
+        return user
     
     db: AsyncIOMotorDatabase = request.app.mongodb
+    # Taken before the read so a write to this user while it runs prevents caching it
+    ticket = auth_cache.users.ticket()
     async with db_operation_context(db, "get_current_user"):
         user = await safe_db_operation(
             db.users.find_one({"email": token_data.email}),
@@ -119,6 +129,7 @@ async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)
         )
         if user is None:
             raise credentials_exception
+        auth_cache.put_user(token_data.email, user, ticket)
         return user
 
 @router.post("/register", response_model=TokenWithAssessment)
@@ -291,6 +302,7 @@ async def forgot_password(request_data: ForgotPasswordRequest, request: Request)
             ),
             "update_reset_token"
         )
+        auth_cache.invalidate_user(request_data.email)
     
     # In a real application, you would send an email here
     # TODO: Implement email sending service
@@ -331,28 +343,29 @@ async def reset_password(request_data: ResetPasswordRequest, request: Request):
             status_code=400,
             detail="Invalid or expired reset token"
         )
-        
-        # Hash new password
-        hashed_password = get_password_hash(request_data.new_password)
-        
-        # Update user password and clear reset token
-        await safe_db_operation(
-            db.users.update_one(
-                {"_id": user["_id"]},
-                {
-                    "$set": {
-                        "hashed_password": hashed_password,
-                        "updated_at": datetime.utcnow(),
-                        "password_reset_required": False
-                    },
-                    "$unset": {
-                        "reset_token": "",
-                        "reset_token_expires": ""
-                    }
+    
+    # Hash new password
+    hashed_password = get_password_hash(request_data.new_password)
+    
+    # Update user password and clear reset token
+    await safe_db_operation(
+        db.users.update_one(
+            {"_id": user["_id"]},
+            {
+                "$set": {
+                    "hashed_password": hashed_password,
+                    "updated_at": datetime.utcnow(),
+                    "password_reset_required": False
+                },
+                "$unset": {
+                    "reset_token": "",
+                    "reset_token_expires": ""
                 }
-            ),
-            "update_password_and_clear_token"
-        )
+            }
+        ),
+        "update_password_and_clear_token"
+    )
+    auth_cache.invalidate_user(user.get("email"))
     
     return {"message": "Password has been reset successfully"}
 
@@ -406,5 +419,6 @@ async def change_password(
             ),
             "update_user_password"
         )
+        auth_cache.invalidate_user(current_user["email"])
     
     return {"message": "Password changed successfully"}
\ No newline at end of file
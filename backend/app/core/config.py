@@ -8,6 +8,10 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = "a_very_secret_key_that_should_be_changed"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Per-process caches used by get_current_user (see app.core.user_cache)
+    USER_CACHE_TTL_SECONDS: float = 30.0
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,146 @@
+"""
+Index manifest and startup bootstrapper.
+
+INDEX_MANIFEST lists every index the API's queries rely on. At startup
+bootstrap_indexes() creates any that are missing (create_index is a no-op for an
+index that already exists with the same options) and then explains each hot
+query to check that it is answered from an index rather than a collection scan.
+The same code runs against MongoDB and the in-memory stand-in.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+ASCENDING, DESCENDING = 1, -1
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """One required index"""
+    collection: str
+    keys: Tuple[Tuple[str, int], ...]
+    name: str
+    unique: bool = False
+    sparse: bool = False
+    expire_after_seconds: Optional[int] = None  # TTL index
+
+    def options(self) -> Dict[str, Any]:
+        options: Dict[str, Any] = {"name": self.name}
+        if self.unique:
+            options["unique"] = True
+        if self.sparse:
+            options["sparse"] = True
+        if self.expire_after_seconds is not None:
+            options["expireAfterSeconds"] = self.expire_after_seconds
+        return options
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """A query that must be served by an index, with representative values"""
+    name: str
+    collection: str
+    filter: Dict[str, Any]
+    sort: Tuple[Tuple[str, int], ...] = field(default_factory=tuple)
+    index: Optional[str] = None  # Index the query is expected to use
+
+
+INDEX_MANIFEST: Tuple[IndexSpec, ...] = (
+    # Login, registration and get_current_user look users up by email
+    IndexSpec("users", (("email", ASCENDING),), "email_1", unique=True),
+    # reset-password looks users up by token; most users have none
+    IndexSpec("users", (("reset_token", ASCENDING),), "reset_token_1", sparse=True),
+    # Latest assessment / recommendation set per user
+    IndexSpec("assessments", (("user_id", ASCENDING), ("created_at", DESCENDING)), "user_id_1_created_at_-1"),
+    IndexSpec("recommendations", (("user_id", ASCENDING), ("created_at", DESCENDING)), "user_id_1_created_at_-1"),
+    # Recommendation sets are deleted once expires_at passes (same index as RecommendationModel's)
+    IndexSpec("recommendations", (("expires_at", ASCENDING),), "expires_at_1", expire_after_seconds=0),
+)
+
+HOT_QUERIES: Tuple[HotQuery, ...] = (
+    HotQuery("user_by_email", "users", {"email": "probe@example.com"}, index="email_1"),
+    HotQuery("user_by_reset_token", "users",
+             {"reset_token": "probe", "reset_token_expires": {"$gt": datetime(2000, 1, 1)}}, index="reset_token_1"),
+    HotQuery("latest_assessment", "assessments", {"user_id": "probe"},
+             (("created_at", DESCENDING),), index="user_id_1_created_at_-1"),
+    HotQuery("latest_recommendations", "recommendations", {"user_id": "probe"},
+             (("created_at", DESCENDING),), index="user_id_1_created_at_-1"),
+)
+
+
+async def ensure_indexes(db, manifest=INDEX_MANIFEST) -> Dict[str, List]:
+    """
+    Create the manifest's indexes.
+
+    A failure (e.g. duplicate emails blocking the unique index, or an existing
+    index with the same name and other options) is reported, not raised, so the
+    API still starts.
+
+    Returns:
+        {"ensured": [collection.name, ...], "failed": [{"index", "error"}, ...]}
+    """
+    report: Dict[str, List] = {"ensured": [], "failed": []}
+    for spec in manifest:
+        qualified = f"{spec.collection}.{spec.name}"
+        try:
+            await db[spec.collection].create_index(list(spec.keys), **spec.options())
+            report["ensured"].append(qualified)
+        except Exception as e:
+            report["failed"].append({"index": qualified, "error": str(e)})
+    return report
+
+
+def _index_stages(plan: Any) -> List[Dict[str, Any]]:
+    """All stages of an explained plan that read an index (any nesting or plan format)"""
+    found = []
+    if isinstance(plan, dict):
+        stage = plan.get("stage", "")
+        if "IXSCAN" in stage or stage in ("IDHACK", "COUNT_SCAN", "DISTINCT_SCAN"):
+            found.append(plan)
+        for value in plan.values():
+            found.extend(_index_stages(value))
+    elif isinstance(plan, list):
+        for value in plan:
+            found.extend(_index_stages(value))
+    return found
+
+
+async def verify_hot_queries(db, queries=HOT_QUERIES) -> List[Dict[str, Any]]:
+    """
+    Explain each hot query and check that its winning plan reads an index.
+
+    Returns:
+        One {"query", "covered", "index", "expected_index"} entry per query
+        ("error" instead of "index" if explain failed)
+    """
+    results = []
+    for query in queries:
+        result: Dict[str, Any] = {"query": query.name, "covered": False, "expected_index": query.index}
+        try:
+            cursor = db[query.collection].find(query.filter)
+            if query.sort:
+                cursor = cursor.sort(list(query.sort))
+            explained = await cursor.limit(1).explain()
+            stages = _index_stages(explained.get("queryPlanner", {}).get("winningPlan", {}))
+            result["index"] = stages[0].get("indexName") if stages else None
+            result["covered"] = bool(stages) and (query.index is None or result["index"] == query.index)
+        except Exception as e:
+            result["error"] = str(e)
+        results.append(result)
+    return results
+
+
+async def bootstrap_indexes(db, manifest=INDEX_MANIFEST, queries=HOT_QUERIES) -> Dict[str, Any]:
+    """Ensure the manifest's indexes exist, then verify the hot queries use them"""
+    report: Dict[str, Any] = await ensure_indexes(db, manifest)
+    report["queries"] = await verify_hot_queries(db, queries)
+
+    print(f"🗂️  Indexes ensured: {len(report['ensured'])}/{len(manifest)}")
+    for failure in report["failed"]:
+        print(f"⚠️  Could not create index {failure['index']}: {failure['error']}")
+    for query in report["queries"]:
+        if not query["covered"]:
+            print(f"⚠️  Hot query {query['query']} is not served by {query['expected_index']} "
+                  f"(plan uses {query.get('index') or query.get('error') or 'a collection scan'})")
+    return report
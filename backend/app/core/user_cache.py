@@ -0,0 +1,139 @@
+"""
+Caches for authenticating requests.
+
+Every authenticated request decodes its JWT and loads the user document. Both
+results are cached per process:
+
+- decoded tokens, keyed by a SHA-256 hash of the token (raw tokens are never
+  kept), until the token expires
+- user documents, keyed by email (the token subject), for a short TTL
+
+Writes to a user (password change or reset, reset tokens, profile updates)
+must call invalidate_user(). Other processes only see the change once their
+TTL runs out, which bounds how long a stale user document can be served.
+"""
+
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries also expire after a time-to-live.
+
+    Fills can be guarded with a ticket taken before the value was loaded: if an
+    invalidation happened in between, the (possibly stale) value is dropped
+    instead of cached. Meant to be used from the event loop thread.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._generation = 0
+        self.stats = {"hits": 0, "misses": 0, "expirations": 0, "evictions": 0, "invalidations": 0, "stale_fills": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self.clock():
+            del self._entries[key]
+            self.stats["expirations"] += 1
+            entry = None
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[1]
+
+    def ticket(self) -> int:
+        """Take before loading a value that will be passed to set()"""
+        return self._generation
+
+    def set(self, key: Hashable, value: Any, ticket: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        if ticket is not None and ticket != self._generation:
+            self.stats["stale_fills"] += 1
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (self.clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, key: Hashable):
+        self._generation += 1
+        self.stats["invalidations"] += 1
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._generation += 1
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+        }
+
+
+def token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class AuthCache:
+    """Decoded-token and user-document caches used by get_current_user"""
+
+    def __init__(self, user_ttl_seconds: float, max_users: int, max_tokens: int,
+                 clock: Callable[[], float] = time.monotonic):
+        self.users = TTLCache(max_users, user_ttl_seconds, clock)
+        # Tokens carry their own expiry; the TTL here only caps how long one is kept
+        self.tokens = TTLCache(max_tokens, 24 * 3600, clock)
+
+    def get_subject(self, token: str) -> Optional[str]:
+        return self.tokens.get(token_key(token))
+
+    def put_subject(self, token: str, subject: str, expires_at: Optional[float] = None):
+        """Cache a decoded token's subject until the token's exp (a Unix timestamp)"""
+        ttl = None if expires_at is None else expires_at - time.time()
+        self.tokens.set(token_key(token), subject, ttl_seconds=ttl)
+
+    def get_user(self, email: str) -> Optional[Dict[str, Any]]:
+        user = self.users.get(email)
+        return copy.deepcopy(user) if user is not None else None
+
+    def put_user(self, email: str, user: Dict[str, Any], ticket: int):
+        self.users.set(email, copy.deepcopy(user), ticket=ticket)
+
+    def invalidate_user(self, email: Optional[str]):
+        """Drop a user's cached document after any write to it"""
+        if email:
+            self.users.invalidate(email)
+
+    def clear(self):
+        self.users.clear()
+        self.tokens.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"users": self.users.get_stats(), "tokens": self.tokens.get_stats()}
+
+
+auth_cache = AuthCache(
+    user_ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    max_users=settings.USER_CACHE_MAX_ENTRIES,
+    max_tokens=settings.TOKEN_CACHE_MAX_ENTRIES,
+)
@@ -16,6 +16,7 @@ except ImportError as e:
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from .api.v1.router import api_router
+from .core.indexes import bootstrap_indexes
 
 # Load environment variables from .env file
 load_dotenv()
@@ -102,6 +103,13 @@ async def startup_db_client(app: FastAPI):
         app.mongodb_client = AsyncIOMotorClient(database_url)
         app.mongodb = app.mongodb_client["recommender"]
         print("✅ MongoDB replacement system ready (minimal mode)")
+    
+    # Make sure the hot queries are index-backed (MongoDB or the replacement)
+    try:
+        app.index_report = await asyncio.wait_for(bootstrap_indexes(app.mongodb), timeout=30.0)
+    except Exception as e:
+        app.index_report = {"error": str(e)}
+        print(f"⚠️  Index bootstrap failed: {e}")
 
 async def shutdown_db_client(app: FastAPI):
     """Properly shutdown database connections and cleanup resources"""
@@ -163,4 +171,15 @@ async def health_check():
     except Exception as e:
         return {"status": "ok", "database": "disconnected", "error": str(e)}
 
+@app.get("/api/v1/health/indexes")
+async def index_report():
+    """Indexes ensured at startup and whether each hot query uses one"""
+    return getattr(app, "index_report", None) or {"error": "Index bootstrap has not run"}
+
+@app.get("/api/v1/health/cache")
+async def cache_stats():
+    """Hit rates and sizes of the authentication caches"""
+    from .core.user_cache import auth_cache
+    return auth_cache.get_stats()
+
 app.include_router(api_router, prefix="/api/v1")
\ No newline at end of file
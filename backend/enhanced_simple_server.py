@@ -22,10 +22,14 @@ from comprehensive_careers import COMPREHENSIVE_CAREERS
 # Try to import the recommendation engine, fallback if not available
 try:
     from recommendation_engine.enhanced_engine import EnhancedRecommendationEngine
+    from recommendation_engine.executor import EngineOverloadedError
 except ImportError as e:
     print(f"Warning: Could not import EnhancedRecommendationEngine: {e}")
     EnhancedRecommendationEngine = None
 
+    class EngineOverloadedError(Exception):
+        pass
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -142,10 +146,10 @@ async def get_recommendations(request: UserProfileRequest):
         logger.info(f"Received recommendation request: {request.dict()}")
         
         if recommendation_engine:
-            # Use enhanced recommendation engine
-            recommendations = recommendation_engine.get_recommendations(
-                user_profile=request.dict(),
-                career_data=MONGODB_CAREERS,
+            # Use enhanced recommendation engine (scored on its executor, off the event loop)
+            recommendations = await recommendation_engine.get_recommendations_async(
+                request.dict(),
+                MONGODB_CAREERS,
                 limit=10
             )
         else:
@@ -176,6 +180,9 @@ async def get_recommendations(request: UserProfileRequest):
         
         return enhanced_recommendations
         
+    except EngineOverloadedError as e:
+        logger.warning(f"Scoring executor overloaded: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"Error generating recommendations: {e}")
         raise HTTPException(status_code=500, detail=f"Error generating recommendations: {str(e)}")
@@ -200,9 +207,9 @@ async def get_mongodb_recommendations(request: Dict[str, Any]):
         )
         
         if recommendation_engine:
-            recommendations = recommendation_engine.get_recommendations(
-                user_profile=user_profile.dict(),
-                career_data=career_data,
+            recommendations = await recommendation_engine.get_recommendations_async(
+                user_profile.dict(),
+                career_data,
                 limit=limit
             )
         else:
@@ -249,6 +256,9 @@ async def get_mongodb_recommendations(request: Dict[str, Any]):
         
         return mongodb_response
         
+    except EngineOverloadedError as e:
+        logger.warning(f"Scoring executor overloaded: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"Error generating MongoDB recommendations: {e}")
         raise HTTPException(status_code=500, detail=f"Error generating recommendations: {str(e)}")
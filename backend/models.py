@@ -3,6 +3,7 @@ MongoDB models using Beanie ODM for the career recommendation system.
 """
 
 from beanie import Document, Indexed
+from pymongo import IndexModel
 import uuid
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
@@ -180,7 +181,8 @@ class RecommendationModel(Document):
         name = "recommendations"
         indexes = [
             [("user_id", 1), ("created_at", -1)],  # Compound index for user recommendations
-            [("expires_at", 1)],  # TTL index for automatic cleanup
+            # TTL index: MongoDB deletes cached recommendations once expires_at passes
+            IndexModel([("expires_at", 1)], name="expires_at_1", expireAfterSeconds=0),
         ]
 
 # Request/Response models for API
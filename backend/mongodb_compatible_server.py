@@ -18,6 +18,7 @@ load_dotenv()
 # Import comprehensive career data and recommendation engine
 from comprehensive_careers import COMPREHENSIVE_CAREERS
 from recommendation_engine.enhanced_engine import EnhancedRecommendationEngine
+from recommendation_engine.executor import EngineOverloadedError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -133,10 +134,10 @@ async def get_recommendations(request: Dict[str, Any]):
     try:
         logger.info(f"Received recommendation request: {request}")
         
-        # Use the enhanced recommendation engine
-        recommendations = recommendation_engine.get_recommendations(
-            user_profile=request,
-            career_data=COMPREHENSIVE_CAREERS,  # Use original format for engine
+        # Use the enhanced recommendation engine (scored on its executor, off the event loop)
+        recommendations = await recommendation_engine.get_recommendations_async(
+            request,
+            COMPREHENSIVE_CAREERS,  # Use original format for engine
             limit=request.get("limit", 10)
         )
         
@@ -163,6 +164,9 @@ async def get_recommendations(request: Dict[str, Any]):
         
         return mongodb_recommendations
         
+    except EngineOverloadedError as e:
+        logger.warning(f"Scoring executor overloaded: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"Error generating recommendations: {e}")
         raise HTTPException(status_code=500, detail=f"Error generating recommendations: {str(e)}")
@@ -177,10 +181,10 @@ async def get_mongodb_recommendations(request: Dict[str, Any]):
         
         logger.info(f"MongoDB-style recommendation request for user: {user_id}")
         
-        # Use the enhanced recommendation engine
-        recommendations = recommendation_engine.get_recommendations(
-            user_profile=request,
-            career_data=COMPREHENSIVE_CAREERS,
+        # Use the enhanced recommendation engine (scored on its executor, off the event loop)
+        recommendations = await recommendation_engine.get_recommendations_async(
+            request,
+            COMPREHENSIVE_CAREERS,
             limit=limit
         )
         
@@ -225,6 +229,9 @@ async def get_mongodb_recommendations(request: Dict[str, Any]):
         
         return mongodb_response
         
+    except EngineOverloadedError as e:
+        logger.warning(f"Scoring executor overloaded: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"Error generating MongoDB recommendations: {e}")
         raise HTTPException(status_code=500, detail=f"Error generating recommendations: {str(e)}")
@@ -13,11 +13,20 @@ import os
 import json
 from dotenv import load_dotenv
 
+from recommendation_engine.catalog_artifact import load_catalog
+
 # Load environment variables
 load_dotenv()
 
-# Import comprehensive career data
-from comprehensive_careers import COMPREHENSIVE_CAREERS
+
+def _import_comprehensive_careers():
+    from comprehensive_careers import COMPREHENSIVE_CAREERS
+    return COMPREHENSIVE_CAREERS
+
+
+# Import comprehensive career data, from the compiled catalog artifact when one is
+# configured (see recommendation_engine.catalog_artifact)
+COMPREHENSIVE_CAREERS = load_catalog(os.getenv("CAREER_CATALOG_ARTIFACT"), _import_comprehensive_careers)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -7,13 +7,14 @@ sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from backend.recommendation_engine.career_database import CareerDatabase, CareerData, CareerField, ExperienceLevel
 
-def populate_from_json(db_path: str = "backend/careers.db", json_path: str = "backend/career_data.json"):
+def populate_from_json(db_path: str = "backend/careers.db", json_path: str = "backend/career_data.json", batch_size: int = 1000):
     """
     Populates the career database from a JSON file.
 
     Args:
         db_path: The path to the SQLite database file.
         json_path: The path to the source JSON file.
+        batch_size: Careers written per transaction.
     """
     print(f"Initializing database at: {db_path}")
     db = CareerDatabase(db_path)
@@ -31,7 +32,17 @@ def populate_from_json(db_path: str = "backend/careers.db", json_path: str = "ba
 
     print(f"Found {len(careers_json)} careers to process.")
     
-    migrated_count = 0
+    reports = db.add_careers_bulk(_iter_career_data(careers_json), batch_size=batch_size)
+    migrated_count = sum(report.inserted for report in reports)
+    for report in reports:
+        for career_id, error in report.errors:
+            print(f"Skipping career '{career_id}' in batch {report.batch_number}: {error}")
+            
+    print(f"\nDatabase population complete.")
+    print(f"Successfully migrated {migrated_count} out of {len(careers_json)} careers.")
+
+def _iter_career_data(careers_json):
+    """Yield CareerData for every valid career dictionary, reporting the invalid ones."""
     for i, career_dict in enumerate(careers_json):
         try:
             # Basic validation
@@ -39,7 +50,7 @@ def populate_from_json(db_path: str = "backend/careers.db", json_path: str = "ba
                 print(f"Skipping career {i+1} due to missing required fields (careerType, title, experienceLevel).")
                 continue
 
-            career_data = CareerData(
+            yield CareerData(
                 career_id=career_dict.get('careerType'),
                 title=career_dict.get('title'),
                 description=career_dict.get('description', ''),
@@ -75,16 +86,10 @@ def populate_from_json(db_path: str = "backend/careers.db", json_path: str = "ba
                 day_in_life=career_dict.get('dayInLife', ''),
                 resume_keywords=career_dict.get('resumeKeywords', [])
             )
-            
-            if db.add_career(career_data):
-                migrated_count += 1
                 
         except (ValueError, KeyError) as e:
             print(f"Skipping career {i+1} ('{career_dict.get('title', 'N/A')}') due to a data error: {e}")
             continue
-            
-    print(f"\nDatabase population complete.")
-    print(f"Successfully migrated {migrated_count} out of {len(careers_json)} careers.")
 
 if __name__ == "__main__":
     populate_from_json()
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""
+Async façade over CareerDatabase.
+
+FastAPI handlers are ``async def`` but sqlite3 calls block. AsyncCareerDatabase
+runs every CareerDatabase method on a small, bounded pool of database threads;
+each thread keeps its own read connection (see ConnectionManager), so readers
+run in parallel and never block the event loop. Per-method timings are recorded
+for the health endpoints. The wrapped CareerDatabase stays usable directly, so
+scripts and other sync callers keep working unchanged.
+"""
+
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Union
+import functools
+import os
+import threading
+import time
+
+from .career_database import CareerDatabase, CareerFilters
+from .executor import ScoringExecutor
+
+# Defaults can be overridden per deployment without code changes
+DEFAULT_DB_MAX_WORKERS = int(os.getenv("CAREER_DB_MAX_WORKERS", "4"))
+DEFAULT_DB_MAX_QUEUE_DEPTH = int(os.getenv("CAREER_DB_MAX_QUEUE_DEPTH", "64"))
+
+
+class QueryTimings:
+    """Thread-safe call counts and timings per database method."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._methods: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, name: str, elapsed_ms: float, failed: bool = False):
+        """Add one call to the totals."""
+        with self._lock:
+            totals = self._methods.setdefault(name, {"calls": 0, "failed": 0, "total_ms": 0.0, "max_ms": 0.0})
+            totals["calls"] += 1
+            totals["failed"] += int(failed)
+            totals["total_ms"] += elapsed_ms
+            totals["max_ms"] = max(totals["max_ms"], elapsed_ms)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get call counts and average/maximum duration per method.
+
+        Returns:
+            Dictionary keyed by method name
+        """
+        with self._lock:
+            return {
+                name: {
+                    "calls": totals["calls"],
+                    "failed": totals["failed"],
+                    "average_ms": totals["total_ms"] / totals["calls"],
+                    "max_ms": totals["max_ms"]
+                }
+                for name, totals in self._methods.items()
+            }
+
+
+def _awaitable(name: str):
+    """Build the awaitable version of a CareerDatabase method."""
+    method = getattr(CareerDatabase, name)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self.run(getattr(self.db, name), *args, timing_name=name, **kwargs)
+
+    wrapper.__doc__ = f"Awaitable version of CareerDatabase.{name}.\n\n{method.__doc__ or ''}"
+    return wrapper
+
+
+class AsyncCareerDatabase:
+    """
+    Awaitable CareerDatabase.
+
+    Calls are admitted while fewer than ``max_workers + max_queue_depth`` are
+    in flight; beyond that they raise EngineOverloadedError immediately so the
+    HTTP layer can answer 503 instead of queueing without limit.
+    """
+
+    def __init__(
+        self,
+        db: Union[CareerDatabase, str] = "careers.db",
+        max_workers: int = DEFAULT_DB_MAX_WORKERS,
+        max_queue_depth: int = DEFAULT_DB_MAX_QUEUE_DEPTH
+    ):
+        """
+        Initialize the façade.
+
+        Args:
+            db: CareerDatabase to wrap, or the path of one to open
+            max_workers: Number of database threads
+            max_queue_depth: Maximum calls allowed to wait for a free thread
+        """
+        self.db = db if isinstance(db, CareerDatabase) else CareerDatabase(db)
+        self.executor = ScoringExecutor(
+            max_workers=max_workers,
+            max_queue_depth=max_queue_depth,
+            thread_name_prefix="career-db"
+        )
+        self.timings = QueryTimings()
+
+    async def run(self, func: Callable[..., Any], *args, timing_name: Optional[str] = None, **kwargs) -> Any:
+        """
+        Run a blocking callable on a database thread and await its result.
+
+        Args:
+            func: Callable using the database (e.g. a composite API method)
+            *args: Positional arguments for the callable
+            timing_name: Name to record the timing under (default: func's name)
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            EngineOverloadedError: If the database pool is at capacity
+        """
+        name = timing_name or getattr(func, "__name__", "call")
+
+        def timed():
+            started = time.perf_counter()
+            failed = True
+            try:
+                result = func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self.timings.record(name, (time.perf_counter() - started) * 1000, failed)
+
+        return await self.executor.run(timed)
+
+    add_career = _awaitable("add_career")
+    add_careers_bulk = _awaitable("add_careers_bulk")
+    update_career = _awaitable("update_career")
+    delete_career = _awaitable("delete_career")
+    get_career = _awaitable("get_career")
+    get_careers_by_field = _awaitable("get_careers_by_field")
+    get_careers_by_experience_level = _awaitable("get_careers_by_experience_level")
+    search_careers = _awaitable("search_careers")
+    rank_careers_by_skills = _awaitable("rank_careers_by_skills")
+    get_all_careers = _awaitable("get_all_careers")
+    get_careers_page = _awaitable("get_careers_page")
+    get_career_statistics = _awaitable("get_career_statistics")
+    rebuild_statistics = _awaitable("rebuild_statistics")
+
+    async def iter_careers(
+        self,
+        filters: Optional[CareerFilters] = None,
+        batch_size: int = 500,
+        after: Optional[str] = None,
+        columns=None
+    ) -> AsyncIterator[Any]:
+        """
+        Stream careers like CareerDatabase.iter_careers, one awaited batch at a time.
+
+        Args:
+            filters: Optional column filters
+            batch_size: Rows fetched per database call
+            after: Optional cursor token to resume after
+            columns: Optional columns to select; lazy CareerRows are yielded then
+
+        Yields:
+            CareerData objects (or CareerRows)
+        """
+        cursor = after
+        while True:
+            careers, cursor = await self.get_careers_page(
+                filters, page_size=batch_size, cursor=cursor, columns=columns
+            )
+            for career in careers:
+                yield career
+            if cursor is None:
+                return
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get pool utilization and per-method timings.
+
+        Returns:
+            Dictionary with the pool metrics and a timing entry per method
+        """
+        metrics = self.executor.get_metrics()
+        metrics["queries"] = self.timings.get_metrics()
+        return metrics
+
+    def close(self):
+        """Stop the database threads and close the connections."""
+        self.executor.shutdown(wait=True)
+        self.db.close()
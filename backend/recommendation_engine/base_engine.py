@@ -0,0 +1,809 @@
+"""
+Shared plumbing for the recommendation engines.
+
+RecommendationEngine and EnhancedRecommendationEngine differ in how they
+pre-filter candidates, which categorization engine they use and how they order
+the final recommendations. Everything else - the swappable engine snapshot, the
+ranking cascade and its stages, the async entry points and the final limits -
+lives in BaseRecommendationEngine so the two engines cannot drift apart.
+"""
+
+from typing import Callable, List, Dict, Optional, Set, Tuple
+import abc
+import logging
+import json
+import threading
+
+# Import models - try both relative and absolute imports
+try:
+    from ..models import UserProfileModel as UserProfile, CareerModel as Career, SkillModel as Skill, RecommendationModel as CareerRecommendation
+except ImportError:
+    try:
+        from models import UserProfileModel as UserProfile, CareerModel as Career, SkillModel as Skill, RecommendationModel as CareerRecommendation
+    except ImportError:
+        # Fallback: define basic types if models can't be imported
+        from typing import Any
+        UserProfile = Any
+        Career = Any
+        Skill = Any
+        CareerRecommendation = Any
+
+from .config import RecommendationConfig, DEFAULT_CONFIG
+from .filters import FilterEngine
+from .scoring import ScoringEngine
+from .categorization import CategorizationEngine
+from .config_manager import EngineSnapshot, build_engine_snapshot
+from .catalog_index import CatalogIndex, CatalogIndexCache, build_catalog_index
+from .cascade import (
+    CascadeContext, CascadeMetrics, CascadeResult, CascadeStage, CostClass,
+    FunctionStage, InvertedIndexRetrievalStage, RankingCascade, build_cascade
+)
+from .executor import ScoringExecutor, get_default_executor
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Constants for prompt size validation
+MAX_PROMPT_SIZE = 100000  # Maximum characters in prompt (adjust based on model limits)
+MAX_CAREERS_FOR_PROMPT = 50  # Maximum number of careers to include in a single prompt
+
+
+class BaseRecommendationEngine(abc.ABC):
+    """
+    Snapshot, cascade and executor handling shared by the recommendation engines.
+    
+    Subclasses implement:
+    - _build_prefilter_features: profile-independent features per career
+    - _prefilter_candidates: the linear cascade stage's pre-filter
+    and may override _build_snapshot (categorization engine) and
+    _sort_recommendations (final ordering).
+    """
+    
+    def __init__(
+        self,
+        config: Optional[RecommendationConfig] = None,
+        skills_db: Optional[List[Skill]] = None,
+        executor: Optional[ScoringExecutor] = None
+    ):
+        """
+        Initialize the engine.
+        
+        Args:
+            config: Configuration for the recommendation engine
+            skills_db: Database of all available skills
+            executor: Executor for the async entry points (defaults to the shared one)
+        """
+        self.executor = executor or get_default_executor()
+        
+        # Config and component engines live in an immutable snapshot that is
+        # swapped as a whole on reconfiguration (see config_manager)
+        self._snapshot_lock = threading.Lock()
+        self._snapshot = self._build_snapshot(config or DEFAULT_CONFIG, skills_db or [], version=1)
+        
+        # Read-only per-catalog features shared by all requests and threads
+        self._catalog_index = CatalogIndexCache(self._build_prefilter_features)
+        
+        # Ranking cascade built from the active snapshot's config
+        self._cascade: Optional[Tuple[EngineSnapshot, RankingCascade]] = None
+        self.cascade_metrics = CascadeMetrics()
+    
+    def _build_snapshot(
+        self,
+        config: RecommendationConfig,
+        skills_db: List[Skill],
+        version: int
+    ) -> EngineSnapshot:
+        """
+        Build a snapshot of the component engines for a configuration.
+        
+        Args:
+            config: Configuration to build from
+            skills_db: Database of all available skills
+            version: Version number for the snapshot
+        
+        Returns:
+            New EngineSnapshot
+        """
+        return build_engine_snapshot(config, skills_db, version, CategorizationEngine)
+    
+    @property
+    def snapshot(self) -> EngineSnapshot:
+        """The currently active engine snapshot."""
+        return self._snapshot
+    
+    @property
+    def config(self) -> RecommendationConfig:
+        """Copy of the active configuration (request paths read snapshot.compiled)."""
+        return self._snapshot.config
+    
+    @property
+    def skills_db(self) -> List[Skill]:
+        """Skills database of the active snapshot."""
+        return list(self._snapshot.skills_db)
+    
+    @property
+    def filter_engine(self) -> FilterEngine:
+        """Filter engine of the active snapshot."""
+        return self._snapshot.filter_engine
+    
+    @property
+    def scoring_engine(self) -> ScoringEngine:
+        """Scoring engine of the active snapshot."""
+        return self._snapshot.scoring_engine
+    
+    @property
+    def categorization_engine(self):
+        """Categorization engine of the active snapshot."""
+        return self._snapshot.categorization_engine
+    
+    def update_config(self, new_config: RecommendationConfig) -> EngineSnapshot:
+        """
+        Update the engine configuration.
+        
+        The new configuration is validated and compiled into a fresh snapshot
+        which replaces the active one in a single assignment. Requests already
+        in flight finish on the snapshot they started with.
+        
+        Args:
+            new_config: New configuration to apply
+        
+        Returns:
+            The newly active EngineSnapshot
+        
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        new_config.validate_config()
+        
+        with self._snapshot_lock:
+            current = self._snapshot
+            snapshot = self._build_snapshot(new_config, current.skills_db, current.version + 1)
+            
+            # Reject unknown cascade stages before the swap
+            self._build_cascade(snapshot)
+            self._snapshot = snapshot
+        
+        return snapshot
+    
+    def update_skills_database(self, skills_db: List[Skill]) -> EngineSnapshot:
+        """
+        Update the skills database.
+        
+        Args:
+            skills_db: New skills database
+        
+        Returns:
+            The newly active EngineSnapshot
+        """
+        with self._snapshot_lock:
+            current = self._snapshot
+            snapshot = self._build_snapshot(current.config, skills_db, current.version + 1)
+            self._snapshot = snapshot
+        
+        return snapshot
+    
+    def get_recommendations(
+        self,
+        user_profile: UserProfile,
+        available_careers: List[Career],
+        limit: Optional[int] = None,
+        exploration_level: int = 3,
+        prefilter_features: Optional[List[Dict]] = None
+    ) -> List[CareerRecommendation]:
+        """
+        Generate career recommendations for a user using the multi-step process.
+        
+        This method implements the architecture that prevents "prompt too long" errors:
+        1. Pre-process user profile to create a concise summary
+        2. Narrow the careers down through the ranking cascade (by default:
+           lightweight pre-filtering, prompt size budget, rule filters, full scoring)
+        3. Categorize, sort and limit the fully scored careers
+        
+        Args:
+            user_profile: User's profile with skills, interests, and preferences
+            available_careers: List of all available careers to consider
+            limit: Maximum number of recommendations to return
+            exploration_level: User's exploration level (1-5) for consistency penalty
+            prefilter_features: Precomputed per-career features for available_careers,
+                shared across a batch (see get_recommendations_batch)
+        
+        Returns:
+            List of CareerRecommendation objects sorted by score
+        """
+        return self._recommend(
+            self._snapshot, user_profile, available_careers, limit, exploration_level, prefilter_features
+        )
+    
+    def _recommend(
+        self,
+        snapshot: EngineSnapshot,
+        user_profile: UserProfile,
+        available_careers: List[Career],
+        limit: Optional[int] = None,
+        exploration_level: int = 3,
+        prefilter_features: Optional[List[Dict]] = None
+    ) -> List[CareerRecommendation]:
+        """Generate recommendations against one pinned snapshot (see get_recommendations)."""
+        logger.info(f"Starting recommendation generation for user with {len(available_careers)} available careers")
+        
+        # Steps 1-4: Pre-process the profile and run the ranking cascade
+        context, result = self.run_cascade(
+            user_profile, available_careers, exploration_level, prefilter_features, snapshot=snapshot
+        )
+        self.cascade_metrics.record(result)
+        
+        refined_careers = result.candidates
+        logger.info(f"Using {len(refined_careers)} careers for final scoring and categorization")
+        
+        # Step 5: Full scores with consistency penalty (computed by the cascade
+        # unless its full_score stage is disabled)
+        scores = self._get_full_scores(context, refined_careers)
+        
+        # Step 6: Categorize recommendations
+        recommendations = snapshot.categorization_engine.categorize_recommendations(
+            user_profile, refined_careers, scores
+        )
+        
+        # Step 7: Apply final limits and sorting
+        recommendations = self._sort_recommendations(recommendations, user_profile, context.catalog)
+        
+        compiled = snapshot.compiled
+        if limit:
+            recommendations = recommendations[:limit]
+        elif len(recommendations) > compiled.max_recommendations:
+            recommendations = recommendations[:compiled.max_recommendations]
+        
+        # Ensure minimum recommendations if possible
+        if len(recommendations) < compiled.min_recommendations and len(available_careers) >= compiled.min_recommendations:
+            recommendations = self._ensure_minimum_recommendations(
+                user_profile, available_careers, recommendations, exploration_level, snapshot
+            )
+        
+        logger.info(f"Generated {len(recommendations)} final recommendations")
+        
+        return recommendations
+    
+    def _sort_recommendations(
+        self,
+        recommendations: List[CareerRecommendation],
+        user_profile: UserProfile,
+        catalog: Optional[CatalogIndex] = None
+    ) -> List[CareerRecommendation]:
+        """Order categorized recommendations, best first (catalog is for subclasses)."""
+        recommendations.sort(key=lambda x: x.score.total_score, reverse=True)
+        return recommendations
+    
+    def get_recommendations_batch(
+        self,
+        user_profiles: List[UserProfile],
+        available_careers: List[Career],
+        limits: Optional[List[Optional[int]]] = None,
+        exploration_levels: Optional[List[int]] = None,
+        return_exceptions: bool = False
+    ) -> List[List[CareerRecommendation]]:
+        """
+        Generate recommendations for several users against the same career list.
+        
+        Every profile is scored against one pinned snapshot and one catalog
+        index, so the career-side features (skill/industry sets, text, career
+        fields) are computed once per career list rather than once per profile.
+        Profile-side inputs (summary, skill set, user field) are derived once per
+        profile and reused for every career it is scored against. The profiles
+        themselves still run one after another on the calling thread; callers
+        that want parallelism split the batch (see RequestCoalescer).
+        
+        Args:
+            user_profiles: Profiles to generate recommendations for
+            available_careers: Career list shared by every profile in the batch
+            limits: Optional per-profile recommendation limits
+            exploration_levels: Optional per-profile exploration levels (default 3)
+            return_exceptions: Return a profile's exception in its result slot
+                instead of aborting the whole batch
+        
+        Returns:
+            One recommendation list (or exception) per profile, in input order
+        """
+        # Build (or reuse) the shared catalog index once for the whole batch
+        self._catalog_index.get(available_careers)
+        snapshot = self._snapshot
+        
+        results = []
+        for i, user_profile in enumerate(user_profiles):
+            try:
+                results.append(self._recommend(
+                    snapshot,
+                    user_profile,
+                    available_careers,
+                    limits[i] if limits else None,
+                    exploration_levels[i] if exploration_levels else 3
+                ))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        
+        return results
+    
+    async def get_recommendations_async(
+        self,
+        user_profile: UserProfile,
+        available_careers: List[Career],
+        limit: Optional[int] = None,
+        exploration_level: int = 3
+    ) -> List[CareerRecommendation]:
+        """
+        Async version of get_recommendations that scores on the engine's executor.
+        
+        The event loop stays free while scoring runs on a dedicated thread.
+        
+        Raises:
+            EngineOverloadedError: If the executor queue is full
+        """
+        return await self.executor.run(
+            self.get_recommendations, user_profile, available_careers, limit, exploration_level
+        )
+    
+    async def explain_recommendation_async(
+        self,
+        user_profile: UserProfile,
+        career: Career,
+        exploration_level: int = 3
+    ) -> Dict[str, any]:
+        """Async version of explain_recommendation that runs on the engine's executor."""
+        return await self.executor.run(
+            self.explain_recommendation, user_profile, career, exploration_level
+        )
+    
+    @abc.abstractmethod
+    def explain_recommendation(
+        self,
+        user_profile: UserProfile,
+        career: Career,
+        exploration_level: int = 3
+    ) -> Dict[str, any]:
+        """Generate detailed explanation for why a career was recommended."""
+    
+    def get_recommendations_by_category(
+        self,
+        user_profile: UserProfile,
+        available_careers: List[Career],
+        limit_per_category: int = 5,
+        exploration_level: int = 3
+    ) -> Dict[str, List[CareerRecommendation]]:
+        """
+        Get recommendations organized by category.
+        
+        Args:
+            user_profile: User's profile
+            available_careers: List of available careers
+            limit_per_category: Maximum recommendations per category
+            exploration_level: User's exploration level (1-5)
+        
+        Returns:
+            Dictionary with recommendations organized by category
+        """
+        snapshot = self._snapshot
+        all_recommendations = self._recommend(snapshot, user_profile, available_careers, None, exploration_level)
+        
+        return snapshot.categorization_engine.get_top_recommendations_per_category(
+            all_recommendations, limit_per_category
+        )
+    
+    def run_cascade(
+        self,
+        user_profile: UserProfile,
+        available_careers: List[Career],
+        exploration_level: int = 3,
+        prefilter_features: Optional[List[Dict]] = None,
+        reference: Optional[Set[int]] = None,
+        snapshot: Optional[EngineSnapshot] = None
+    ) -> Tuple[CascadeContext, CascadeResult]:
+        """
+        Run the ranking cascade for one user.
+        
+        Args:
+            user_profile: User's profile
+            available_careers: Careers to rank
+            exploration_level: User's exploration level (1-5)
+            prefilter_features: Precomputed features for available_careers
+            reference: Optional ids of careers whose survival each stage should
+                report as recall (e.g. the exhaustive top-K)
+            snapshot: Engine snapshot to use (defaults to the active one)
+        
+        Returns:
+            Tuple of (request context holding the full scores, cascade result)
+        """
+        # Pin the snapshot so a concurrent config reload cannot change the
+        # configuration halfway through this request
+        snapshot = snapshot or self._snapshot
+        
+        context = CascadeContext(
+            user_profile=user_profile,
+            summarized_profile=self._preprocess_user_profile(user_profile),
+            exploration_level=exploration_level,
+            snapshot=snapshot,
+            catalog=self._get_catalog(available_careers, prefilter_features)
+        )
+        
+        result = self._get_cascade(snapshot).run(context, list(available_careers), reference)
+        return context, result
+    
+    def get_cascade_metrics(self) -> Dict[str, any]:
+        """
+        Get per-stage timing and funnel sizes of the ranking cascade.
+        
+        Returns:
+            Dictionary with the configured stages and their running averages
+        """
+        metrics = self.cascade_metrics.get_metrics()
+        metrics["configured_stages"] = [repr(stage) for stage in self._get_cascade(self._snapshot).stages]
+        return metrics
+    
+    def warm_catalog(self, available_careers: List[Career]) -> CatalogIndex:
+        """
+        Build (or reuse) the shared catalog index ahead of requests.
+        
+        Subscribe this to catalog changes so the first request after a change
+        does not pay for indexing.
+        
+        Args:
+            available_careers: Career list later passed to get_recommendations
+        
+        Returns:
+            CatalogIndex for the careers
+        """
+        return self._catalog_index.get(available_careers)
+    
+    def _get_catalog(
+        self,
+        available_careers: List[Career],
+        prefilter_features: Optional[List[Dict]] = None
+    ) -> CatalogIndex:
+        """Get the shared catalog index, or index caller-supplied features."""
+        if prefilter_features is not None:
+            return build_catalog_index(available_careers, lambda careers: prefilter_features)
+        return self._catalog_index.get(available_careers)
+    
+    def _get_cascade(self, snapshot: EngineSnapshot) -> RankingCascade:
+        """Get the cascade for a snapshot, building it once per snapshot."""
+        cached = self._cascade
+        if cached is None or cached[0] is not snapshot:
+            cached = (snapshot, self._build_cascade(snapshot))
+            self._cascade = cached
+        return cached[1]
+    
+    def _build_cascade(self, snapshot: EngineSnapshot) -> RankingCascade:
+        """Build the ranking cascade configured in a snapshot."""
+        return build_cascade(snapshot.compiled.cascade_stages, self._cascade_stage_factories())
+    
+    def _cascade_stage_factories(self) -> Dict[str, Callable[[Optional[int]], CascadeStage]]:
+        """
+        Get the cascade stages this engine can build, by configuration name.
+        
+        Returns:
+            Factory per stage name, taking the stage's output size
+        """
+        return {
+            "retrieval": lambda size: InvertedIndexRetrievalStage(size),
+            "linear": lambda size: FunctionStage("linear", CostClass.CHEAP, self._linear_stage, size),
+            "prompt_budget": lambda size: FunctionStage("prompt_budget", CostClass.CHEAP, self._prompt_budget_stage, size),
+            "filter": lambda size: FunctionStage("filter", CostClass.CHEAP, self._filter_stage, size),
+            "full_score": lambda size: FunctionStage("full_score", CostClass.FULL, self._full_score_stage, size)
+        }
+    
+    def _linear_stage(self, context: CascadeContext, candidates: List[Career], output_size: Optional[int]) -> List[Career]:
+        """Cheap pre-filter, falling back to rule filters when it finds nothing."""
+        features = [context.catalog.features_for(career) for career in candidates]
+        selected = self._prefilter_candidates(context, candidates, features, output_size or len(candidates))
+        
+        if not selected:
+            # If pre-filtering returns no results, fall back to traditional filtering
+            logger.warning("Pre-filtering returned no careers, falling back to traditional filtering")
+            selected = context.snapshot.filter_engine.filter_careers(context.user_profile, candidates, context.catalog)
+            
+            if not selected:
+                # If still no careers, use fallback filtering
+                selected = self._fallback_filtering(context.user_profile, candidates, context.snapshot)
+        
+        return selected
+    
+    @abc.abstractmethod
+    def _prefilter_candidates(
+        self,
+        context: CascadeContext,
+        candidates: List[Career],
+        features: List[Dict],
+        limit: int
+    ) -> List[Career]:
+        """
+        Select up to limit candidates for the linear stage.
+        
+        Args:
+            context: Request context (profiles and pinned snapshot)
+            candidates: Careers entering the stage
+            features: Precomputed features for each candidate, in the same order
+            limit: Maximum careers to keep
+        
+        Returns:
+            The selected careers, best first
+        """
+    
+    @abc.abstractmethod
+    def _build_prefilter_features(self, available_careers: List[Career]) -> List[Dict]:
+        """Precompute the profile-independent features used by pre-filtering."""
+    
+    def _prompt_budget_stage(self, context: CascadeContext, candidates: List[Career], output_size: Optional[int]) -> List[Career]:
+        """Truncate the candidates so the prompt stays within MAX_PROMPT_SIZE."""
+        validated, was_truncated = self._validate_prompt_size(context.user_profile, candidates)
+        
+        if was_truncated:
+            logger.warning(f"Career list was truncated from {len(candidates)} to {len(validated)} to prevent prompt overflow")
+        
+        return validated
+    
+    def _filter_stage(self, context: CascadeContext, candidates: List[Career], output_size: Optional[int]) -> List[Career]:
+        """Rule-based refinement; keeps its input if every career would be removed."""
+        refined = context.snapshot.filter_engine.filter_careers(context.user_profile, candidates, context.catalog)
+        return refined or candidates
+    
+    def _full_score_stage(self, context: CascadeContext, candidates: List[Career], output_size: Optional[int]) -> List[Career]:
+        """Score with the full ScoringEngine and rank by total score."""
+        scores = context.snapshot.scoring_engine.score_multiple_careers(
+            context.user_profile, candidates, context.exploration_level,
+            self._career_fields(context, candidates)
+        )
+        
+        ranked = sorted(zip(candidates, scores), key=lambda pair: pair[1].total_score, reverse=True)
+        for career, score in ranked:
+            context.scores[id(career)] = score
+        
+        return [career for career, _ in ranked]
+    
+    def _get_full_scores(self, context: CascadeContext, careers: List[Career]) -> List:
+        """Get full scores for careers, scoring any the cascade did not."""
+        missing = [career for career in careers if id(career) not in context.scores]
+        if missing:
+            scores = context.snapshot.scoring_engine.score_multiple_careers(
+                context.user_profile, missing, context.exploration_level,
+                self._career_fields(context, missing)
+            )
+            for career, score in zip(missing, scores):
+                context.scores[id(career)] = score
+        
+        return [context.scores[id(career)] for career in careers]
+    
+    def _career_fields(self, context: CascadeContext, careers: List[Career]) -> Optional[List[str]]:
+        """Read each career's scoring field from the catalog, or None if any is not indexed."""
+        fields = []
+        for career in careers:
+            if context.catalog.position_of(career) is None:
+                return None
+            fields.append(context.catalog.features_for(career).get("career_field"))
+        
+        return None if None in fields else fields
+    
+    def _fallback_filtering(
+        self,
+        user_profile: UserProfile,
+        available_careers: List[Career],
+        snapshot: Optional[EngineSnapshot] = None
+    ) -> List[Career]:
+        """
+        Fallback filtering when initial filtering returns no results.
+        
+        Args:
+            user_profile: User's profile
+            available_careers: List of all careers
+            snapshot: Engine snapshot to use (defaults to the active one)
+        
+        Returns:
+            List of careers with relaxed filtering
+        """
+        snapshot = snapshot or self._snapshot
+        
+        # Try with relaxed salary constraints
+        relaxed_careers = snapshot.filter_engine.apply_initial_filters(user_profile, available_careers)
+        
+        if relaxed_careers:
+            return relaxed_careers
+        
+        # If still no results, return top careers by basic compatibility
+        return available_careers[:snapshot.compiled.max_recommendations]
+    
+    def _ensure_minimum_recommendations(
+        self,
+        user_profile: UserProfile,
+        available_careers: List[Career],
+        current_recommendations: List[CareerRecommendation],
+        exploration_level: int = 3,
+        snapshot: Optional[EngineSnapshot] = None
+    ) -> List[CareerRecommendation]:
+        """
+        Ensure minimum number of recommendations by adding lower-scored options.
+        
+        Args:
+            user_profile: User's profile
+            available_careers: All available careers
+            current_recommendations: Current recommendations
+            exploration_level: User's exploration level (1-5)
+            snapshot: Engine snapshot to use (defaults to the active one)
+        
+        Returns:
+            Extended list of recommendations
+        """
+        snapshot = snapshot or self._snapshot
+        
+        if len(current_recommendations) >= snapshot.compiled.min_recommendations:
+            return current_recommendations
+        
+        # Get careers not already recommended
+        recommended_ids = {rec.career.career_id for rec in current_recommendations}
+        remaining_careers = [
+            career for career in available_careers
+            if career.career_id not in recommended_ids
+        ]
+        
+        # Score remaining careers
+        remaining_scores = snapshot.scoring_engine.score_multiple_careers(
+            user_profile, remaining_careers, exploration_level
+        )
+        
+        # Categorize additional recommendations
+        additional_recommendations = snapshot.categorization_engine.categorize_recommendations(
+            user_profile, remaining_careers, remaining_scores
+        )
+        
+        # Add best additional recommendations
+        needed = snapshot.compiled.min_recommendations - len(current_recommendations)
+        additional_recommendations.sort(key=lambda x: x.score.total_score, reverse=True)
+        
+        return current_recommendations + additional_recommendations[:needed]
+    
+    def _preprocess_user_profile(self, user_profile: UserProfile) -> Dict:
+        """
+        Summarizes the user's profile and resume using a dedicated process.
+        
+        This method condenses the user's profile into a concise summary to reduce
+        the amount of data sent in subsequent steps, preventing "prompt too long" errors.
+        
+        Args:
+            user_profile: The user's full profile.
+        
+        Returns:
+            A dictionary containing the summarized profile.
+        """
+        logger.info("Starting user profile preprocessing")
+        
+        # Extract key information from the user profile
+        summary = {
+            "key_skills": user_profile.technicalSkills[:10] if user_profile.technicalSkills else [],
+            "soft_skills": user_profile.softSkills[:5] if user_profile.softSkills else [],
+            "experience_years": user_profile.experience,
+            "primary_industries": user_profile.industries[:3] if user_profile.industries else [],
+            "career_goals": user_profile.careerGoals,
+            "interests": user_profile.interests[:5] if user_profile.interests else [],
+            "work_preferences": {
+                "workingWithData": getattr(user_profile, 'workingWithData', 3),
+                "workingWithPeople": getattr(user_profile, 'workingWithPeople', 3),
+                "creativeTasks": getattr(user_profile, 'creativeTasks', 3),
+                "problemSolving": getattr(user_profile, 'problemSolving', 3),
+                "leadership": getattr(user_profile, 'leadership', 3),
+                "physicalHandsOnWork": getattr(user_profile, 'physicalHandsOnWork', 3),
+                "mechanicalAptitude": getattr(user_profile, 'mechanicalAptitude', 3)
+            },
+            "salary_range": user_profile.salaryExpectations,
+            "education_level": user_profile.educationLevel,
+            "current_role": user_profile.currentRole,
+            "location": user_profile.location
+        }
+        
+        # Summarize resume text if it's too long (keep first 500 characters)
+        if hasattr(user_profile, 'resumeText') and user_profile.resumeText:
+            resume_text = user_profile.resumeText.strip()
+            if len(resume_text) > 500:
+                summary["resume_summary"] = resume_text[:500] + "..."
+            else:
+                summary["resume_summary"] = resume_text
+        else:
+            summary["resume_summary"] = ""
+        
+        logger.info(f"User profile preprocessed: {len(summary['key_skills'])} skills, "
+                   f"{len(summary['primary_industries'])} industries")
+        
+        return summary
+    
+    def _validate_prompt_size(
+        self,
+        user_profile: UserProfile,
+        careers: List[Career],
+        max_size: int = MAX_PROMPT_SIZE
+    ) -> tuple[List[Career], bool]:
+        """
+        Validate that the prompt size is within acceptable limits.
+        
+        This method estimates the size of the prompt that would be sent to the model
+        and truncates the career list if necessary to prevent "prompt too long" errors.
+        
+        Args:
+            user_profile: User's profile
+            careers: List of careers to include in prompt
+            max_size: Maximum allowed prompt size in characters
+        
+        Returns:
+            Tuple of (truncated_careers_list, was_truncated)
+        """
+        logger.info(f"Validating prompt size for {len(careers)} careers")
+        
+        # Estimate prompt size by serializing key data
+        try:
+            # Create a simplified representation of the data that would be in the prompt
+            prompt_data = {
+                "user_profile": {
+                    "skills": [skill.name for skill in user_profile.skills],
+                    "interests": list(user_profile.assessment_results.interests.keys()),
+                    "experience_years": sum(exp.duration_years for exp in user_profile.professional_data.experience),
+                    "salary_range": user_profile.personal_info.salary_expectations.dict() if user_profile.personal_info.salary_expectations else None,
+                    "work_values": user_profile.assessment_results.work_values,
+                    "personality_traits": user_profile.assessment_results.personality_traits
+                },
+                "careers": [
+                    {
+                        "title": career.title,
+                        "description": career.description[:200],  # Truncate description for estimation
+                        "required_skills": [skill.name for skill in career.required_skills],
+                        "salary_range": career.salary_range.dict(),
+                        "career_field": career.career_field
+                    }
+                    for career in careers
+                ]
+            }
+            
+            # Estimate prompt size
+            estimated_size = len(json.dumps(prompt_data, default=str))
+            logger.info(f"Estimated prompt size: {estimated_size} characters")
+            
+            if estimated_size <= max_size:
+                return careers, False
+            
+            # If prompt is too large, truncate careers list
+            logger.warning(f"Prompt size ({estimated_size}) exceeds limit ({max_size}). Truncating careers list.")
+            
+            # Binary search to find maximum number of careers that fit
+            left, right = 1, len(careers)
+            best_count = min(MAX_CAREERS_FOR_PROMPT, len(careers))
+            
+            while left <= right:
+                mid = (left + right) // 2
+                test_careers = careers[:mid]
+                
+                test_data = prompt_data.copy()
+                test_data["careers"] = [
+                    {
+                        "title": career.title,
+                        "description": career.description[:200],
+                        "required_skills": [skill.name for skill in career.required_skills],
+                        "salary_range": career.salary_range.dict(),
+                        "career_field": career.career_field
+                    }
+                    for career in test_careers
+                ]
+                
+                test_size = len(json.dumps(test_data, default=str))
+                
+                if test_size <= max_size:
+                    best_count = mid
+                    left = mid + 1
+                else:
+                    right = mid - 1
+            
+            truncated_careers = careers[:best_count]
+            logger.warning(f"Truncated careers list from {len(careers)} to {len(truncated_careers)} careers")
+            
+            return truncated_careers, True
+        
+        except Exception as e:
+            logger.error(f"Error during prompt size validation: {e}")
+            # Fallback: use a conservative limit
+            fallback_limit = min(MAX_CAREERS_FOR_PROMPT, len(careers))
+            logger.warning(f"Using fallback limit of {fallback_limit} careers due to validation error")
+            return careers[:fallback_limit], len(careers) > fallback_limit
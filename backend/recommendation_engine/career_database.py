@@ -5,11 +5,18 @@ This module provides the database schema and management functions for storing
 career data centrally, replacing the hardcoded career templates in the frontend.
 """
 
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Any, Callable, Iterable, Iterator, Mapping, Sequence, Tuple, Union
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from enum import Enum
+import base64
+import itertools
 import json
+import os
+import re
 import sqlite3
+import threading
+import weakref
 from pathlib import Path
 
 
@@ -40,6 +47,16 @@ class CareerField(Enum):
     OTHER = "other"
 
 
+# Columns stored as JSON-encoded lists
+JSON_LIST_COLUMNS = (
+    'required_technical_skills', 'required_soft_skills', 'preferred_skills',
+    'required_certifications', 'valued_certifications', 'alternative_qualifications',
+    'preferred_industries', 'preferred_interests', 'companies', 'valued_companies',
+    'work_environments', 'career_progression_patterns', 'related_job_titles',
+    'resume_keywords'
+)
+
+
 @dataclass
 class CareerData:
     """
@@ -142,15 +159,7 @@ class CareerData:
             data['experience_level'] = ExperienceLevel(data['experience_level'])
         
         # Convert JSON list fields
-        list_fields = [
-            'required_technical_skills', 'required_soft_skills', 'preferred_skills',
-            'required_certifications', 'valued_certifications', 'alternative_qualifications',
-            'preferred_industries', 'preferred_interests', 'companies', 'valued_companies',
-            'work_environments', 'career_progression_patterns', 'related_job_titles',
-            'resume_keywords'
-        ]
-        
-        for field_name in list_fields:
+        for field_name in JSON_LIST_COLUMNS:
             if field_name in data and isinstance(data[field_name], str):
                 try:
                     data[field_name] = json.loads(data[field_name])
@@ -160,7 +169,458 @@ class CareerData:
         return cls(**data)
 
 
-import re
+# Column order used for inserts; matches CareerData.to_dict()
+CAREER_COLUMNS = [f.name for f in fields(CareerData)]
+
+
+def decode_career_column(name: str, value: Any) -> Any:
+    """
+    Decode one stored careers column the same way CareerData.from_dict does.
+    
+    Args:
+        name: Column name
+        value: Value as stored in SQLite
+        
+    Returns:
+        Decoded value (lists for JSON columns, enums for field and level)
+    """
+    if name in JSON_LIST_COLUMNS and isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return []
+    if name == 'career_field':
+        return CareerField(value)
+    if name == 'experience_level':
+        return ExperienceLevel(value)
+    return value
+
+
+class CareerRow:
+    """
+    Read-only view of a careers row that decodes columns on first access.
+    
+    Returned by the read methods when columns are projected. Attributes have
+    the same names and decoded types as CareerData, but JSON list columns are
+    only parsed when read, so scans that look at a few fields skip the
+    json.loads calls for the rest. Reading a column that was not selected
+    raises AttributeError.
+    """
+    
+    __slots__ = ('_row', '_decoded')
+    
+    def __init__(self, row: Mapping[str, Any]):
+        """
+        Initialize the view.
+        
+        Args:
+            row: sqlite3.Row or dictionary of stored column values
+        """
+        self._row = row
+        self._decoded: Dict[str, Any] = {}
+    
+    def __getattr__(self, name: str) -> Any:
+        decoded = self._decoded
+        if name in decoded:
+            return decoded[name]
+        try:
+            value = self._row[name]
+        except (KeyError, IndexError):
+            raise AttributeError(f"Column '{name}' was not selected") from None
+        value = decode_career_column(name, value)
+        decoded[name] = value
+        return value
+    
+    def keys(self) -> List[str]:
+        """Names of the selected columns."""
+        return list(self._row.keys())
+    
+    def to_career_data(self) -> CareerData:
+        """
+        Decode the whole row.
+        
+        Raises:
+            TypeError: If required CareerData columns were not selected
+        """
+        return CareerData.from_dict(dict(self._row))
+    
+    def __repr__(self) -> str:
+        return f"CareerRow(career_id={self._row['career_id']!r}, columns={len(self._row.keys())})"
+
+
+def select_career_columns(columns: Optional[Sequence[str]], required: Sequence[str] = ()) -> str:
+    """
+    Build the select list for a projection.
+    
+    Args:
+        columns: Columns to select, or None for all of them
+        required: Columns the query needs in addition (career_id is always added)
+        
+    Returns:
+        SQL select list qualified with the careers table
+        
+    Raises:
+        ValueError: If a column does not exist
+    """
+    if columns is None:
+        return "careers.*"
+    
+    selected = []
+    for column in ('career_id', *required, *columns):
+        if column not in CAREER_COLUMNS and column not in ('created_at', 'updated_at'):
+            raise ValueError(f"Unknown career column: {column}")
+        if column not in selected:
+            selected.append(column)
+    return ', '.join(f"careers.{column}" for column in selected)
+
+
+def load_career_row(row: Mapping[str, Any], columns: Optional[Sequence[str]]) -> Union[CareerData, CareerRow]:
+    """Decode a row eagerly as CareerData, or lazily as CareerRow for projections."""
+    if columns is None:
+        return CareerData.from_dict(dict(row))
+    return CareerRow(row)
+
+# Secondary indexes, by name
+CAREER_INDEXES = {
+    "idx_career_field": "CREATE INDEX IF NOT EXISTS idx_career_field ON careers(career_field)",
+    "idx_experience_level": "CREATE INDEX IF NOT EXISTS idx_experience_level ON careers(experience_level)",
+    "idx_salary_range": "CREATE INDEX IF NOT EXISTS idx_salary_range ON careers(salary_min, salary_max)",
+    "idx_salary_max": "CREATE INDEX IF NOT EXISTS idx_salary_max ON careers(salary_max)",
+    "idx_title": "CREATE INDEX IF NOT EXISTS idx_title ON careers(title)",
+    # Keyset pagination order used by iter_careers
+    "idx_title_career_id": "CREATE INDEX IF NOT EXISTS idx_title_career_id ON careers(title, career_id)",
+    # Covers skill -> career lookups for skill overlap ranking without touching the table
+    "idx_career_skills_skill": (
+        "CREATE INDEX IF NOT EXISTS idx_career_skills_skill "
+        "ON career_skills(skill_id, kind, career_id, weight)"
+    ),
+}
+
+# Skill list columns normalized into career_skills, with the kind stored and
+# the weight a match of that kind contributes to skill overlap scores
+SKILL_KINDS = {
+    "required_technical_skills": ("technical", 1.0),
+    "required_soft_skills": ("soft", 0.75),
+    "preferred_skills": ("preferred", 0.5),
+}
+
+
+def career_skill_entries(career: CareerData) -> List[Tuple[str, str, float]]:
+    """
+    Get the normalized skills of a career.
+    
+    Args:
+        career: Career to read skills from
+        
+    Returns:
+        (skill name, kind, weight) per distinct skill and kind
+    """
+    entries = []
+    seen = set()
+    for column, (kind, weight) in SKILL_KINDS.items():
+        for name in getattr(career, column) or []:
+            name = str(name).strip()
+            if name and (name.lower(), kind) not in seen:
+                seen.add((name.lower(), kind))
+                entries.append((name, kind, weight))
+    return entries
+
+# Insert a career or update it in place. A real upsert (unlike INSERT OR
+# REPLACE) fires UPDATE triggers, which keep the search index in sync.
+CAREER_UPSERT = (
+    f"INSERT INTO careers ({', '.join(CAREER_COLUMNS)}) "
+    f"VALUES ({', '.join(['?' for _ in CAREER_COLUMNS])}) "
+    f"ON CONFLICT(career_id) DO UPDATE SET "
+    f"{', '.join(f'{column} = excluded.{column}' for column in CAREER_COLUMNS if column != 'career_id')}, "
+    f"updated_at = CURRENT_TIMESTAMP"
+)
+
+# Columns covered by the full-text search index and their bm25 weights
+SEARCH_COLUMNS = {
+    "title": 10.0,
+    "description": 1.0,
+    "required_technical_skills": 4.0,
+    "required_soft_skills": 4.0,
+    "related_job_titles": 5.0,
+    "resume_keywords": 3.0,
+}
+
+_SEARCH_COLUMN_LIST = ', '.join(SEARCH_COLUMNS)
+_NEW_SEARCH_VALUES = ', '.join(f"new.{column}" for column in SEARCH_COLUMNS)
+_OLD_SEARCH_VALUES = ', '.join(f"old.{column}" for column in SEARCH_COLUMNS)
+
+# Triggers keeping careers_fts in sync with the careers table, by name
+SEARCH_TRIGGERS = {
+    "careers_fts_insert": f"""
+        CREATE TRIGGER IF NOT EXISTS careers_fts_insert AFTER INSERT ON careers BEGIN
+            INSERT INTO careers_fts(rowid, {_SEARCH_COLUMN_LIST}) VALUES (new.rowid, {_NEW_SEARCH_VALUES});
+        END""",
+    "careers_fts_delete": f"""
+        CREATE TRIGGER IF NOT EXISTS careers_fts_delete AFTER DELETE ON careers BEGIN
+            INSERT INTO careers_fts(careers_fts, rowid, {_SEARCH_COLUMN_LIST}) VALUES ('delete', old.rowid, {_OLD_SEARCH_VALUES});
+        END""",
+    "careers_fts_update": f"""
+        CREATE TRIGGER IF NOT EXISTS careers_fts_update AFTER UPDATE ON careers BEGIN
+            INSERT INTO careers_fts(careers_fts, rowid, {_SEARCH_COLUMN_LIST}) VALUES ('delete', old.rowid, {_OLD_SEARCH_VALUES});
+            INSERT INTO careers_fts(rowid, {_SEARCH_COLUMN_LIST}) VALUES (new.rowid, {_NEW_SEARCH_VALUES});
+        END""",
+}
+
+
+def _range_values_sql(row: str) -> str:
+    return (
+        f"{row}.rowid, "
+        f"min({row}.salary_min, {row}.salary_max), max({row}.salary_min, {row}.salary_max), "
+        f"min(COALESCE({row}.min_years_experience, 0), COALESCE({row}.max_years_experience, 50)), "
+        f"max(COALESCE({row}.min_years_experience, 0), COALESCE({row}.max_years_experience, 50))"
+    )
+
+
+# Triggers keeping the career_ranges R*Tree (salary and experience ranges per
+# careers rowid) in sync with the careers table, by name
+RANGE_TRIGGERS = {
+    "career_ranges_insert": f"""
+        CREATE TRIGGER IF NOT EXISTS career_ranges_insert AFTER INSERT ON careers BEGIN
+            INSERT INTO career_ranges VALUES ({_range_values_sql('new')});
+        END""",
+    "career_ranges_delete": """
+        CREATE TRIGGER IF NOT EXISTS career_ranges_delete AFTER DELETE ON careers BEGIN
+            DELETE FROM career_ranges WHERE id = old.rowid;
+        END""",
+    "career_ranges_update": f"""
+        CREATE TRIGGER IF NOT EXISTS career_ranges_update
+        AFTER UPDATE OF salary_min, salary_max, min_years_experience, max_years_experience ON careers BEGIN
+            DELETE FROM career_ranges WHERE id = old.rowid;
+            INSERT INTO career_ranges VALUES ({_range_values_sql('new')});
+        END""",
+}
+
+# Width of the salary histogram bands (by salary midpoint)
+SALARY_BAND_WIDTH = 25000
+
+
+def _salary_band_sql(row: str) -> str:
+    return f"(({row}.salary_min + {row}.salary_max) / 2 / {SALARY_BAND_WIDTH}) * {SALARY_BAND_WIDTH}"
+
+
+def _count_careers_sql(row: str, delta: str) -> str:
+    """Statements adding delta (+1/-1) for a careers row to the materialized statistics."""
+    if delta == "+1":
+        counts = f"""
+            INSERT INTO career_stat_counts (dimension, bucket, count) VALUES
+                ('career_field', {row}.career_field, 1),
+                ('experience_level', {row}.experience_level, 1),
+                ('salary_band', {_salary_band_sql(row)}, 1)
+            ON CONFLICT (dimension, bucket) DO UPDATE SET count = count + 1;"""
+    else:
+        counts = f"""
+            UPDATE career_stat_counts SET count = count - 1 WHERE
+                (dimension = 'career_field' AND bucket = {row}.career_field) OR
+                (dimension = 'experience_level' AND bucket = {row}.experience_level) OR
+                (dimension = 'salary_band' AND bucket = {_salary_band_sql(row)});"""
+    return counts + f"""
+            UPDATE career_stat_totals SET
+                career_count = career_count {delta},
+                salary_min_sum = salary_min_sum {delta[0]} {row}.salary_min,
+                salary_max_sum = salary_max_sum {delta[0]} {row}.salary_max
+            WHERE id = 1;"""
+
+
+# Triggers keeping the materialized statistics current, by name
+STATISTICS_TRIGGERS = {
+    "career_stats_insert": f"""
+        CREATE TRIGGER IF NOT EXISTS career_stats_insert AFTER INSERT ON careers BEGIN
+            {_count_careers_sql('new', '+1')}
+        END""",
+    "career_stats_delete": f"""
+        CREATE TRIGGER IF NOT EXISTS career_stats_delete AFTER DELETE ON careers BEGIN
+            {_count_careers_sql('old', '-1')}
+        END""",
+    "career_stats_update": f"""
+        CREATE TRIGGER IF NOT EXISTS career_stats_update
+        AFTER UPDATE OF career_field, experience_level, salary_min, salary_max ON careers BEGIN
+            {_count_careers_sql('old', '-1')}
+            {_count_careers_sql('new', '+1')}
+        END""",
+    "skill_stats_insert": """
+        CREATE TRIGGER IF NOT EXISTS skill_stats_insert AFTER INSERT ON career_skills BEGIN
+            INSERT INTO skill_stats (skill_id, link_count) VALUES (new.skill_id, 1)
+            ON CONFLICT (skill_id) DO UPDATE SET link_count = link_count + 1;
+            UPDATE career_stat_totals SET skill_link_count = skill_link_count + 1 WHERE id = 1;
+        END""",
+    "skill_stats_delete": """
+        CREATE TRIGGER IF NOT EXISTS skill_stats_delete AFTER DELETE ON career_skills BEGIN
+            UPDATE skill_stats SET link_count = link_count - 1 WHERE skill_id = old.skill_id;
+            UPDATE career_stat_totals SET skill_link_count = skill_link_count - 1 WHERE id = 1;
+        END""",
+}
+
+_SEARCH_TOKEN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def build_search_query(text: str) -> Optional[str]:
+    """
+    Turn user search text into a safe FTS5 MATCH expression.
+    
+    Quoted text is matched as a phrase; every other word is matched as a
+    prefix, so "data eng" finds "Data Engineer". All terms must match.
+    FTS5 operators typed by the user are treated as plain words.
+    
+    Args:
+        text: Search text as typed by the user
+        
+    Returns:
+        MATCH expression, or None if the text has no searchable terms
+    """
+    terms = []
+    for phrase, word in _SEARCH_TOKEN.findall(text or ""):
+        if phrase.strip():
+            terms.append('"' + phrase.strip().replace('"', '""') + '"')
+        elif word:
+            word = word.strip('*')
+            if word:
+                terms.append('"' + word.replace('"', '""') + '"*')
+    return ' AND '.join(terms) or None
+
+
+@dataclass
+class BulkLoadReport:
+    """
+    Outcome of one batch of a bulk load.
+    
+    Attributes:
+        batch_number: 1-based batch number
+        attempted: Careers in the batch
+        inserted: Careers written
+        errors: (career_id, message) for every career that was not written
+    """
+    batch_number: int
+    attempted: int
+    inserted: int
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+
+
+@dataclass
+class CareerFilters:
+    """
+    Column filters shared by the search and iteration methods.
+    
+    Attributes:
+        career_fields: Career fields to include
+        experience_levels: Experience levels to include
+        salary_min: Minimum salary requirement
+        salary_max: Maximum salary requirement
+        title_query: Substring of the career title
+        experience_min: Start of the experience window in years; careers whose
+            experience range overlaps the window match
+        experience_max: End of the experience window in years
+    """
+    career_fields: Optional[List[CareerField]] = None
+    experience_levels: Optional[List[ExperienceLevel]] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    title_query: Optional[str] = None
+    experience_min: Optional[int] = None
+    experience_max: Optional[int] = None
+    
+    def to_sql(self, range_index: bool = False) -> Tuple[str, List[Any]]:
+        """
+        Build the WHERE conditions for the filters.
+        
+        Args:
+            range_index: Narrow salary/experience windows with the career_ranges
+                R*Tree first. Its bounds are 32-bit floats rounded outwards, so
+                the exact column comparisons are always added as well.
+        
+        Returns:
+            (conditions, params); conditions is empty or starts with " AND "
+        """
+        query = ""
+        params: List[Any] = []
+        
+        if self.title_query:
+            query += " AND careers.title LIKE ?"
+            params.append(f"%{self.title_query}%")
+        
+        if self.career_fields:
+            field_placeholders = ','.join(['?' for _ in self.career_fields])
+            query += f" AND careers.career_field IN ({field_placeholders})"
+            params.extend([field.value for field in self.career_fields])
+        
+        if self.experience_levels:
+            level_placeholders = ','.join(['?' for _ in self.experience_levels])
+            query += f" AND careers.experience_level IN ({level_placeholders})"
+            params.extend([level.value for level in self.experience_levels])
+        
+        if self.salary_min is not None:
+            query += " AND careers.salary_max >= ?"
+            params.append(self.salary_min)
+        
+        if self.salary_max is not None:
+            query += " AND careers.salary_min <= ?"
+            params.append(self.salary_max)
+        
+        if self.experience_min is not None:
+            query += " AND careers.max_years_experience >= ?"
+            params.append(self.experience_min)
+        
+        if self.experience_max is not None:
+            query += " AND careers.min_years_experience <= ?"
+            params.append(self.experience_max)
+        
+        windows = [
+            ("salary_max >= ?", self.salary_min),
+            ("salary_min <= ?", self.salary_max),
+            ("experience_max >= ?", self.experience_min),
+            ("experience_min <= ?", self.experience_max),
+        ]
+        windows = [(condition, value) for condition, value in windows if value is not None]
+        if range_index and windows:
+            query += (
+                " AND careers.rowid IN (SELECT id FROM career_ranges WHERE "
+                + " AND ".join(condition for condition, _ in windows) + ")"
+            )
+            params.extend(value for _, value in windows)
+        
+        return query, params
+
+
+def encode_cursor(title: str, career_id: str) -> str:
+    """
+    Encode a pagination position as an opaque URL-safe token.
+    
+    Args:
+        title: Title of the last career returned
+        career_id: ID of the last career returned
+        
+    Returns:
+        Cursor token
+    """
+    raw = json.dumps([title, career_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> Tuple[str, str]:
+    """
+    Decode a token produced by encode_cursor.
+    
+    Args:
+        token: Cursor token
+        
+    Returns:
+        (title, career_id) of the last career returned
+        
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        title, career_id = json.loads(raw.decode('utf-8'))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {token!r}") from e
+    if not isinstance(title, str) or not isinstance(career_id, str):
+        raise ValueError(f"Invalid cursor: {token!r}")
+    return title, career_id
 
 
 def normalize_career_title(title: str) -> str:
@@ -191,6 +651,171 @@ def normalize_career_title(title: str) -> str:
     return title
 
 
+class _ReaderSlot:
+    """Holds one thread's read connection; collected when the thread exits."""
+    
+    __slots__ = ("conn", "__weakref__")
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+def _close_reader(readers: Dict[int, Any], key: int, conn: sqlite3.Connection, pid: int):
+    """Close a read connection whose thread is gone (or whose manager closed)."""
+    # May run from garbage collection while ConnectionManager holds its lock,
+    # so it must not take it; dict.pop is atomic on its own
+    readers.pop(key, None)
+    if os.getpid() != pid:
+        # Inherited over fork: the parent still owns the underlying handle
+        return
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+class ConnectionManager:
+    """
+    Persistent SQLite connections for a CareerDatabase.
+    
+    Every thread gets its own long-lived read connection and all writes go
+    through a single writer connection guarded by a lock. The database runs in
+    WAL journal mode, so readers keep reading the last committed state while a
+    writer transaction is open instead of waiting for it. Connections are kept
+    open, so each one's prepared statement cache stays warm across calls; a
+    thread's read connection is closed when the thread exits.
+    """
+    
+    def __init__(
+        self,
+        db_path: str,
+        cache_size_kb: int = 16384,
+        mmap_size: int = 64 * 1024 * 1024,
+        cached_statements: int = 256,
+        busy_timeout_ms: int = 5000
+    ):
+        """
+        Initialize the connection manager.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            cache_size_kb: Page cache size per connection in KiB
+            mmap_size: Bytes of the database file to memory-map (0 disables)
+            cached_statements: Prepared statements cached per connection
+            busy_timeout_ms: How long to wait on locks held by other processes
+        """
+        self.db_path = db_path
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size = mmap_size
+        self.cached_statements = cached_statements
+        self.busy_timeout_ms = busy_timeout_ms
+        
+        # An in-memory database only exists inside one connection, so readers
+        # and the writer have to share it
+        self._shared = db_path == ":memory:" or db_path.startswith("file::memory:")
+        
+        self._write_lock = threading.RLock()
+        self._connections_lock = threading.Lock()
+        self._local = threading.local()
+        self._reset()
+    
+    def _reset(self):
+        """Forget all connections (used on startup and after a fork)."""
+        self._pid = os.getpid()
+        self._local = threading.local()
+        # Close callbacks of the live read connections, keyed by id of their slot
+        self._readers: Dict[int, weakref.finalize] = {}
+        self._writer: Optional[sqlite3.Connection] = None
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open and tune a new connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        conn.row_factory = sqlite3.Row
+        if not self._shared:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        
+        return conn
+    
+    def _check_pid(self):
+        """Drop connections inherited from a parent process (e.g. pre-fork workers)."""
+        if self._pid != os.getpid():
+            with self._connections_lock:
+                self._reset()
+    
+    def _get_writer(self) -> sqlite3.Connection:
+        if self._writer is None:
+            self._writer = self._connect()
+        return self._writer
+    
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get this thread's read connection.
+        
+        Yields:
+            Connection with sqlite3.Row rows; do not write through it
+        """
+        self._check_pid()
+        if self._shared:
+            with self._write_lock:
+                yield self._get_writer()
+            return
+        
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            slot = _ReaderSlot(self._connect(read_only=True))
+            key = id(slot)
+            with self._connections_lock:
+                # Fires when the thread exits and its thread-local slot is freed
+                self._readers[key] = weakref.finalize(
+                    slot, _close_reader, self._readers, key, slot.conn, self._pid
+                )
+            self._local.slot = slot
+        yield slot.conn
+    
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a write transaction on the writer connection.
+        
+        Writes are serialized; the transaction is committed when the block
+        exits normally and rolled back if it raises.
+        
+        Yields:
+            The writer connection
+        """
+        self._check_pid()
+        with self._write_lock:
+            conn = self._get_writer()
+            with conn:
+                yield conn
+    
+    def close(self):
+        """Close every connection opened by this manager."""
+        with self._connections_lock:
+            readers = list(self._readers.values())
+            writer = self._writer
+            self._reset()
+        for close_reader in readers:
+            close_reader()
+        if writer is not None:
+            try:
+                writer.close()
+            except sqlite3.Error:
+                pass
+
+
 class CareerDatabase:
     """
     Career database management class.
@@ -198,19 +823,58 @@ class CareerDatabase:
     Provides methods to store, retrieve, and manage career data.
     """
     
-    def __init__(self, db_path: str = "careers.db"):
+    def __init__(self, db_path: str = "careers.db", connections: Optional[ConnectionManager] = None):
         """
         Initialize the career database.
         
         Args:
             db_path: Path to the SQLite database file
+            connections: Optional connection manager (one with default tuning
+                is created for db_path otherwise)
         """
         self.db_path = db_path
+        self.connections = connections or ConnectionManager(db_path)
+        self.full_text_search = False
+        self.range_index = False
+        self._subscribers: List[Callable[[str, Tuple[str, ...]], None]] = []
         self._init_database()
     
+    def close(self):
+        """Close the database connections."""
+        self.connections.close()
+    
+    def subscribe(self, callback: Callable[[str, Tuple[str, ...]], None]) -> Callable[[], None]:
+        """
+        Call a function after every committed change.
+        
+        The callback receives the kind of change ("add", "update", "delete",
+        or "reload" after a bulk load) and the affected career IDs. It runs
+        on the writing thread after the transaction commits.
+        
+        Args:
+            callback: Function called with (kind, career_ids)
+            
+        Returns:
+            Function that removes the subscription
+        """
+        self._subscribers = self._subscribers + [callback]
+        
+        def unsubscribe():
+            self._subscribers = [item for item in self._subscribers if item is not callback]
+        
+        return unsubscribe
+    
+    def _notify(self, kind: str, career_ids: Tuple[str, ...]):
+        """Tell subscribers about a committed change."""
+        for callback in self._subscribers:
+            try:
+                callback(kind, career_ids)
+            except Exception as e:
+                print(f"Error notifying career database subscriber: {e}")
+    
     def _init_database(self):
         """Initialize the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connections.writer() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS careers (
                     career_id TEXT PRIMARY KEY,
@@ -264,11 +928,215 @@ class CareerDatabase:
                 )
             """)
             
+            # Normalized skills for skill-based queries
+            skills_exist = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'career_skills'"
+            ).fetchone() is not None
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS skills (
+                    skill_id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS career_skills (
+                    career_id TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    skill_id INTEGER NOT NULL,
+                    weight REAL NOT NULL,
+                    PRIMARY KEY (career_id, kind, skill_id)
+                ) WITHOUT ROWID
+            """)
+            if not skills_exist:
+                careers = [
+                    CareerData.from_dict(dict(row))
+                    for row in conn.execute("SELECT * FROM careers")
+                ]
+                self._write_career_skills(conn, careers)
+            
+            # Materialized statistics, kept current by triggers
+            stats_exist = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'career_stat_totals'"
+            ).fetchone() is not None
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS career_stat_counts (
+                    dimension TEXT NOT NULL,
+                    bucket NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (dimension, bucket)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS career_stat_totals (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    career_count INTEGER NOT NULL,
+                    salary_min_sum INTEGER NOT NULL,
+                    salary_max_sum INTEGER NOT NULL,
+                    skill_link_count INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS skill_stats (
+                    skill_id INTEGER PRIMARY KEY,
+                    link_count INTEGER NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_skill_stats_count ON skill_stats(link_count)")
+            if not stats_exist:
+                self._rebuild_statistics(conn)
+            for statement in STATISTICS_TRIGGERS.values():
+                conn.execute(statement)
+            
             # Create indexes for common queries
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_career_field ON careers(career_field)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_experience_level ON careers(experience_level)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_salary_range ON careers(salary_min, salary_max)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_title ON careers(title)")
+            self._create_indexes(conn)
+            
+            # Salary/experience window index (needs SQLite built with R*Tree).
+            # Missing triggers mean a bulk load died before recreating them, so
+            # the index missed its writes and must be rebuilt too.
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'career_ranges'"
+            ).fetchone() is not None
+            stale = not exists or self._triggers_missing(conn, RANGE_TRIGGERS)
+            try:
+                conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS career_ranges USING rtree(
+                        id, salary_min, salary_max, experience_min, experience_max
+                    )
+                """)
+            except sqlite3.OperationalError as e:
+                print(f"Range index unavailable, filtering salary windows by column: {e}")
+            else:
+                self.range_index = True
+                self._create_range_triggers(conn, rebuild=stale)
+            
+            # Full-text search index (needs SQLite built with FTS5); rebuilt
+            # as well if an interrupted bulk load left its triggers dropped
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'careers_fts'"
+            ).fetchone() is not None
+            stale = not exists or self._triggers_missing(conn, SEARCH_TRIGGERS)
+            try:
+                conn.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS careers_fts USING fts5(
+                        {_SEARCH_COLUMN_LIST},
+                        content='careers',
+                        content_rowid='rowid',
+                        tokenize='unicode61 remove_diacritics 2'
+                    )
+                """)
+            except sqlite3.OperationalError as e:
+                print(f"Full-text search unavailable, falling back to LIKE: {e}")
+                return
+            
+            self.full_text_search = True
+            self._create_search_triggers(conn, rebuild=stale)
+    
+    def _create_indexes(self, conn: sqlite3.Connection):
+        """Create the secondary indexes on the careers table."""
+        for statement in CAREER_INDEXES.values():
+            conn.execute(statement)
+    
+    def _drop_indexes(self, conn: sqlite3.Connection):
+        """Drop the secondary indexes on the careers table."""
+        for name in CAREER_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+    
+    def _rebuild_statistics(self, conn: sqlite3.Connection):
+        """Recompute the materialized statistics from the careers and career_skills tables."""
+        conn.execute("DELETE FROM career_stat_counts")
+        conn.execute("DELETE FROM skill_stats")
+        conn.execute("""
+            INSERT OR REPLACE INTO career_stat_totals
+                (id, career_count, salary_min_sum, salary_max_sum, skill_link_count)
+            SELECT 1, COUNT(*), COALESCE(SUM(salary_min), 0), COALESCE(SUM(salary_max), 0),
+                   (SELECT COUNT(*) FROM career_skills)
+            FROM careers
+        """)
+        conn.execute("""
+            INSERT INTO career_stat_counts (dimension, bucket, count)
+            SELECT 'career_field', career_field, COUNT(*) FROM careers GROUP BY career_field
+        """)
+        conn.execute("""
+            INSERT INTO career_stat_counts (dimension, bucket, count)
+            SELECT 'experience_level', experience_level, COUNT(*) FROM careers GROUP BY experience_level
+        """)
+        conn.execute(f"""
+            INSERT INTO career_stat_counts (dimension, bucket, count)
+            SELECT 'salary_band', {_salary_band_sql('careers')}, COUNT(*) FROM careers GROUP BY 2
+        """)
+        conn.execute("""
+            INSERT INTO skill_stats (skill_id, link_count)
+            SELECT skill_id, COUNT(*) FROM career_skills GROUP BY skill_id
+        """)
+    
+    def rebuild_statistics(self) -> bool:
+        """
+        Recompute the materialized statistics from scratch.
+        
+        Only needed if the tables were changed with triggers disabled, e.g.
+        by another tool.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self.connections.writer() as conn:
+                self._rebuild_statistics(conn)
+            return True
+        except Exception as e:
+            print(f"Error rebuilding statistics: {e}")
+            return False
+    
+    def _write_career_skills(self, conn: sqlite3.Connection, careers: List[CareerData]):
+        """Replace the career_skills rows of the given careers."""
+        conn.executemany(
+            "DELETE FROM career_skills WHERE career_id = ?",
+            [(career.career_id,) for career in careers]
+        )
+        rows = [
+            (career.career_id, kind, weight, name)
+            for career in careers
+            for name, kind, weight in career_skill_entries(career)
+        ]
+        conn.executemany(
+            "INSERT OR IGNORE INTO skills (name) VALUES (?)",
+            [(row[3],) for row in rows]
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO career_skills (career_id, kind, skill_id, weight) "
+            "SELECT ?, ?, skill_id, ? FROM skills WHERE name = ?",
+            rows
+        )
+    
+    def _triggers_missing(self, conn: sqlite3.Connection, names) -> bool:
+        """Whether any of the named triggers does not exist."""
+        existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+        return not existing.issuperset(names)
+    
+    def _create_search_triggers(self, conn: sqlite3.Connection, rebuild: bool = False):
+        """Create the search index triggers, optionally rebuilding the index from the table."""
+        for statement in SEARCH_TRIGGERS.values():
+            conn.execute(statement)
+        if rebuild:
+            conn.execute("INSERT INTO careers_fts(careers_fts) VALUES ('rebuild')")
+    
+    def _drop_search_triggers(self, conn: sqlite3.Connection):
+        """Drop the search index triggers; the index goes stale until rebuilt."""
+        for name in SEARCH_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    
+    def _create_range_triggers(self, conn: sqlite3.Connection, rebuild: bool = False):
+        """Create the range index triggers, optionally rebuilding the index from the table."""
+        for statement in RANGE_TRIGGERS.values():
+            conn.execute(statement)
+        if rebuild:
+            conn.execute("DELETE FROM career_ranges")
+            conn.execute(f"INSERT INTO career_ranges SELECT {_range_values_sql('careers')} FROM careers")
+    
+    def _drop_range_triggers(self, conn: sqlite3.Connection):
+        """Drop the range index triggers; the index goes stale until rebuilt."""
+        for name in RANGE_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
     
     def add_career(self, career: CareerData) -> bool:
         """
@@ -281,90 +1149,189 @@ class CareerDatabase:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connections.writer() as conn:
                 data = career.to_dict()
-                columns = ', '.join(data.keys())
-                placeholders = ', '.join(['?' for _ in data])
-                
-                conn.execute(
-                    f"INSERT OR REPLACE INTO careers ({columns}) VALUES ({placeholders})",
-                    list(data.values())
-                )
-                return True
+                exists = conn.execute(
+                    "SELECT 1 FROM careers WHERE career_id = ?", (career.career_id,)
+                ).fetchone() is not None
+                conn.execute(CAREER_UPSERT, [data[column] for column in CAREER_COLUMNS])
+                self._write_career_skills(conn, [career])
         except Exception as e:
             print(f"Error adding career: {e}")
             return False
+        
+        self._notify("update" if exists else "add", (career.career_id,))
+        return True
+    
+    def add_careers_bulk(
+        self,
+        careers: Iterable[CareerData],
+        batch_size: int = 1000,
+        defer_indexes: bool = True
+    ) -> List[BulkLoadReport]:
+        """
+        Add many careers in batched transactions.
+        
+        Careers are streamed from the iterable and written with executemany,
+        one transaction per batch. If a batch fails, it is retried row by row
+        so only the offending careers are skipped. With defer_indexes the
+        secondary indexes and search triggers are dropped for the load and
+        rebuilt once at the end, which is much faster for large catalogs;
+        other connections see slower (and, for full-text search, stale)
+        searches until the rebuild finishes.
+        
+        Args:
+            careers: CareerData objects to add (existing IDs are replaced)
+            batch_size: Careers per transaction
+            defer_indexes: Build secondary indexes after the load
+            
+        Returns:
+            One BulkLoadReport per batch
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        statement = CAREER_UPSERT
+        reports = []
+        iterator = iter(careers)
+        
+        if defer_indexes:
+            with self.connections.writer() as conn:
+                self._drop_indexes(conn)
+                if self.full_text_search:
+                    self._drop_search_triggers(conn)
+                if self.range_index:
+                    self._drop_range_triggers(conn)
+        
+        try:
+            for batch_number in itertools.count(1):
+                batch = list(itertools.islice(iterator, batch_size))
+                if not batch:
+                    break
+                
+                report = BulkLoadReport(batch_number=batch_number, attempted=len(batch), inserted=0)
+                rows = []
+                valid = []
+                for career in batch:
+                    career_id = getattr(career, 'career_id', None) or '<unknown>'
+                    try:
+                        data = career.to_dict()
+                        rows.append([data[column] for column in CAREER_COLUMNS])
+                        valid.append(career)
+                    except Exception as e:
+                        report.errors.append((career_id, str(e)))
+                
+                try:
+                    with self.connections.writer() as conn:
+                        conn.executemany(statement, rows)
+                        self._write_career_skills(conn, valid)
+                    report.inserted = len(rows)
+                except sqlite3.Error:
+                    # Isolate the bad rows; the batch transaction was rolled back
+                    with self.connections.writer() as conn:
+                        for career, row in zip(valid, rows):
+                            try:
+                                conn.execute(statement, row)
+                                self._write_career_skills(conn, [career])
+                                report.inserted += 1
+                            except sqlite3.Error as e:
+                                report.errors.append((career.career_id, str(e)))
+                
+                reports.append(report)
+        finally:
+            if defer_indexes:
+                with self.connections.writer() as conn:
+                    self._create_indexes(conn)
+                    if self.full_text_search:
+                        self._create_search_triggers(conn, rebuild=True)
+                    if self.range_index:
+                        self._create_range_triggers(conn, rebuild=True)
+        
+        if any(report.inserted for report in reports):
+            self._notify("reload", ())
+        return reports
     
-    def get_career(self, career_id: str) -> Optional[CareerData]:
+    def get_career(self, career_id: str, columns: Optional[Sequence[str]] = None) -> Optional[CareerData]:
         """
         Get a career by ID.
         
         Args:
             career_id: Career ID to retrieve
+            columns: Optional columns to select; a lazy CareerRow is returned then
             
         Returns:
             CareerData object if found, None otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute("SELECT * FROM careers WHERE career_id = ?", (career_id,))
+            with self.connections.reader() as conn:
+                cursor = conn.execute(
+                    f"SELECT {select_career_columns(columns)} FROM careers WHERE career_id = ?",
+                    (career_id,)
+                )
                 row = cursor.fetchone()
                 
                 if row:
-                    return CareerData.from_dict(dict(row))
+                    return load_career_row(row, columns)
                 return None
         except Exception as e:
             print(f"Error getting career: {e}")
             return None
     
-    def get_careers_by_field(self, career_field: CareerField) -> List[CareerData]:
+    def get_careers_by_field(
+        self,
+        career_field: CareerField,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[CareerData]:
         """
         Get all careers in a specific field.
         
         Args:
             career_field: Career field to filter by
+            columns: Optional columns to select; lazy CareerRows are returned then
             
         Returns:
             List of CareerData objects
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.connections.reader() as conn:
                 cursor = conn.execute(
-                    "SELECT * FROM careers WHERE career_field = ?", 
+                    f"SELECT {select_career_columns(columns)} FROM careers WHERE career_field = ?", 
                     (career_field.value,)
                 )
                 
                 careers = []
                 for row in cursor.fetchall():
-                    careers.append(CareerData.from_dict(dict(row)))
+                    careers.append(load_career_row(row, columns))
                 return careers
         except Exception as e:
             print(f"Error getting careers by field: {e}")
             return []
     
-    def get_careers_by_experience_level(self, experience_level: ExperienceLevel) -> List[CareerData]:
+    def get_careers_by_experience_level(
+        self,
+        experience_level: ExperienceLevel,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[CareerData]:
         """
         Get all careers for a specific experience level.
         
         Args:
             experience_level: Experience level to filter by
+            columns: Optional columns to select; lazy CareerRows are returned then
             
         Returns:
             List of CareerData objects
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.connections.reader() as conn:
                 cursor = conn.execute(
-                    "SELECT * FROM careers WHERE experience_level = ?", 
+                    f"SELECT {select_career_columns(columns)} FROM careers WHERE experience_level = ?", 
                     (experience_level.value,)
                 )
                 
                 careers = []
                 for row in cursor.fetchall():
-                    careers.append(CareerData.from_dict(dict(row)))
+                    careers.append(load_career_row(row, columns))
                 return careers
         except Exception as e:
             print(f"Error getting careers by experience level: {e}")
@@ -377,11 +1344,20 @@ class CareerDatabase:
         experience_levels: Optional[List[ExperienceLevel]] = None,
         salary_min: Optional[int] = None,
         salary_max: Optional[int] = None,
-        limit: int = 100
+        limit: int = 100,
+        text_query: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        experience_min: Optional[int] = None,
+        experience_max: Optional[int] = None
     ) -> List[CareerData]:
         """
         Search careers with multiple filters.
         
+        With a text_query, careers are matched against the full-text index
+        (title, description, required skills, related job titles and resume
+        keywords) and returned best match first; see build_search_query for
+        the phrase and prefix syntax. Otherwise results are ordered by title.
+        
         Args:
             title_query: Search term for career title
             career_fields: List of career fields to include
@@ -389,80 +1365,236 @@ class CareerDatabase:
             salary_min: Minimum salary requirement
             salary_max: Maximum salary requirement
             limit: Maximum number of results
+            text_query: Full-text search over the indexed columns
+            columns: Optional columns to select; lazy CareerRows are returned then
+            experience_min: Start of the experience window in years
+            experience_max: End of the experience window in years
             
         Returns:
             List of matching CareerData objects
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
-                query = "SELECT * FROM careers WHERE 1=1"
+            with self.connections.reader() as conn:
+                select = select_career_columns(columns)
+                query = f"SELECT {select} FROM careers WHERE 1=1"
                 params = []
+                order_by = "careers.title, careers.career_id"
                 
-                if title_query:
-                    query += " AND title LIKE ?"
-                    params.append(f"%{title_query}%")
-                
-                if career_fields:
-                    field_placeholders = ','.join(['?' for _ in career_fields])
-                    query += f" AND career_field IN ({field_placeholders})"
-                    params.extend([field.value for field in career_fields])
-                
-                if experience_levels:
-                    level_placeholders = ','.join(['?' for _ in experience_levels])
-                    query += f" AND experience_level IN ({level_placeholders})"
-                    params.extend([level.value for level in experience_levels])
-                
-                if salary_min is not None:
-                    query += " AND salary_max >= ?"
-                    params.append(salary_min)
+                match = build_search_query(text_query) if text_query else None
+                if match and self.full_text_search:
+                    weights = ', '.join(str(weight) for weight in SEARCH_COLUMNS.values())
+                    query = (
+                        f"SELECT {select} FROM careers_fts "
+                        "JOIN careers ON careers.rowid = careers_fts.rowid "
+                        "WHERE careers_fts MATCH ?"
+                    )
+                    params.append(match)
+                    order_by = f"bm25(careers_fts, {weights}), careers.title, careers.career_id"
+                elif text_query:
+                    query += " AND (title LIKE ? OR description LIKE ?)"
+                    params.extend([f"%{text_query}%", f"%{text_query}%"])
                 
-                if salary_max is not None:
-                    query += " AND salary_min <= ?"
-                    params.append(salary_max)
+                conditions, filter_params = CareerFilters(
+                    career_fields=career_fields,
+                    experience_levels=experience_levels,
+                    salary_min=salary_min,
+                    salary_max=salary_max,
+                    title_query=title_query,
+                    experience_min=experience_min,
+                    experience_max=experience_max
+                ).to_sql(range_index=self.range_index)
+                query += conditions
+                params.extend(filter_params)
                 
-                query += f" ORDER BY title LIMIT ?"
+                query += f" ORDER BY {order_by} LIMIT ?"
                 params.append(limit)
                 
                 cursor = conn.execute(query, params)
                 
                 careers = []
                 for row in cursor.fetchall():
-                    careers.append(CareerData.from_dict(dict(row)))
+                    careers.append(load_career_row(row, columns))
                 return careers
         except Exception as e:
             print(f"Error searching careers: {e}")
             return []
     
-    def get_all_careers(self, limit: Optional[int] = None) -> List[CareerData]:
+    def rank_careers_by_skills(
+        self,
+        skills: List[str],
+        kinds: Optional[List[str]] = None,
+        career_fields: Optional[List[CareerField]] = None,
+        limit: int = 20,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[Tuple[CareerData, float]]:
         """
-        Get all careers from the database.
+        Rank careers by weighted overlap with a list of skills.
+        
+        The score of a career is the sum of the weights (see SKILL_KINDS) of
+        its skills that appear in the list, matched case-insensitively. The
+        aggregation runs inside SQLite on the career_skills index, so only
+        the returned careers are loaded.
         
         Args:
-            limit: Optional limit on number of results
+            skills: Skill names to match
+            kinds: Optional skill kinds to consider ("technical", "soft", "preferred")
+            career_fields: Optional list of career fields to include
+            limit: Maximum number of results
+            columns: Optional columns to select; lazy CareerRows are returned then
             
         Returns:
-            List of all CareerData objects
+            (CareerData, score) pairs, best match first
         """
+        names = sorted({str(skill).strip() for skill in skills if str(skill).strip()})
+        if not names:
+            return []
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.connections.reader() as conn:
+                query = (
+                    f"SELECT {select_career_columns(columns)}, matches.skill_score FROM ("
+                    "SELECT cs.career_id, SUM(cs.weight) AS skill_score "
+                    "FROM skills JOIN career_skills cs ON cs.skill_id = skills.skill_id "
+                    f"WHERE skills.name IN ({','.join(['?' for _ in names])})"
+                )
+                params: List[Any] = list(names)
                 
-                query = "SELECT * FROM careers ORDER BY title"
-                if limit:
-                    query += f" LIMIT {limit}"
+                if kinds:
+                    query += f" AND cs.kind IN ({','.join(['?' for _ in kinds])})"
+                    params.extend(kinds)
                 
-                cursor = conn.execute(query)
+                query += " GROUP BY cs.career_id) matches JOIN careers ON careers.career_id = matches.career_id"
                 
-                careers = []
-                for row in cursor.fetchall():
-                    careers.append(CareerData.from_dict(dict(row)))
-                return careers
+                if career_fields:
+                    query += f" WHERE careers.career_field IN ({','.join(['?' for _ in career_fields])})"
+                    params.extend([field.value for field in career_fields])
+                
+                query += " ORDER BY matches.skill_score DESC, careers.title LIMIT ?"
+                params.append(limit)
+                
+                results = []
+                for row in conn.execute(query, params).fetchall():
+                    if columns is not None:
+                        results.append((CareerRow(row), row['skill_score']))
+                        continue
+                    data = dict(row)
+                    score = data.pop('skill_score')
+                    results.append((CareerData.from_dict(data), score))
+                return results
+        except Exception as e:
+            print(f"Error ranking careers by skills: {e}")
+            return []
+    
+    def get_all_careers(
+        self,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[CareerData]:
+        """
+        Get all careers from the database.
+        
+        Args:
+            limit: Optional limit on number of results
+            columns: Optional columns to select; lazy CareerRows are returned then
+            
+        Returns:
+            List of all CareerData objects
+        """
+        try:
+            return list(itertools.islice(self.iter_careers(columns=columns), limit or None))
         except Exception as e:
             print(f"Error getting all careers: {e}")
             return []
     
+    def iter_careers(
+        self,
+        filters: Optional[CareerFilters] = None,
+        batch_size: int = 500,
+        after: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> Iterator[CareerData]:
+        """
+        Stream careers ordered by title using keyset pagination.
+        
+        Careers are fetched batch_size rows at a time, each batch continuing
+        after the (title, career_id) of the previous one, so memory stays
+        bounded and no read transaction is held open between batches. Careers
+        added or changed while iterating may or may not be seen.
+        
+        Args:
+            filters: Optional column filters
+            batch_size: Rows fetched per query
+            after: Optional cursor token (see encode_cursor) to resume after
+            columns: Optional columns to select; lazy CareerRows are yielded then
+            
+        Yields:
+            CareerData objects
+            
+        Raises:
+            ValueError: If batch_size is not positive or the cursor is malformed
+            sqlite3.Error: If a query fails
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        conditions, filter_params = (filters or CareerFilters()).to_sql(range_index=self.range_index)
+        position = decode_cursor(after) if after else None
+        select = select_career_columns(columns, required=('title',))
+        
+        while True:
+            query = f"SELECT {select} FROM careers WHERE 1=1" + conditions
+            params = list(filter_params)
+            if position:
+                query += " AND (careers.title, careers.career_id) > (?, ?)"
+                params.extend(position)
+            query += " ORDER BY careers.title, careers.career_id LIMIT ?"
+            params.append(batch_size)
+            
+            with self.connections.reader() as conn:
+                rows = conn.execute(query, params).fetchall()
+            
+            for row in rows:
+                yield load_career_row(row, columns)
+            
+            if len(rows) < batch_size:
+                return
+            position = (rows[-1]['title'], rows[-1]['career_id'])
+    
+    def get_careers_page(
+        self,
+        filters: Optional[CareerFilters] = None,
+        page_size: int = 50,
+        cursor: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> Tuple[List[CareerData], Optional[str]]:
+        """
+        Get one page of careers for cursor-based pagination over HTTP.
+        
+        Args:
+            filters: Optional column filters
+            page_size: Careers per page
+            cursor: Token returned with the previous page, None for the first
+            columns: Optional columns to select; lazy CareerRows are returned then
+            
+        Returns:
+            (careers, next_cursor); next_cursor is None on the last page
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        
+        careers = list(itertools.islice(
+            self.iter_careers(filters, batch_size=page_size + 1, after=cursor, columns=columns),
+            page_size + 1
+        ))
+        if len(careers) <= page_size:
+            return careers, None
+        
+        last = careers[page_size - 1]
+        return careers[:page_size], encode_cursor(last.title, last.career_id)
+    
     def update_career(self, career: CareerData) -> bool:
         """
         Update an existing career.
@@ -473,7 +1605,7 @@ class CareerDatabase:
         Returns:
             True if successful, False otherwise
         """
-        return self.add_career(career)  # INSERT OR REPLACE handles updates
+        return self.add_career(career)  # The upsert handles updates
     
     def delete_career(self, career_id: str) -> bool:
         """
@@ -486,63 +1618,82 @@ class CareerDatabase:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connections.writer() as conn:
                 cursor = conn.execute("DELETE FROM careers WHERE career_id = ?", (career_id,))
-                return cursor.rowcount > 0
+                conn.execute("DELETE FROM career_skills WHERE career_id = ?", (career_id,))
+                deleted = cursor.rowcount > 0
         except Exception as e:
             print(f"Error deleting career: {e}")
             return False
+        
+        if deleted:
+            self._notify("delete", (career_id,))
+        return deleted
     
-    def get_career_statistics(self) -> Dict[str, Any]:
+    def get_career_statistics(self, top_skills: int = 10) -> Dict[str, Any]:
         """
         Get statistics about the career database.
         
+        Counts, sums and histograms are read from tables that triggers keep
+        current on every insert, update and delete, so this does not scan
+        the careers table; salary extremes come from index lookups.
+        
+        Args:
+            top_skills: Number of most frequent skills to include
+        
         Returns:
             Dictionary with database statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Total careers
-                total_careers = conn.execute("SELECT COUNT(*) FROM careers").fetchone()[0]
+            with self.connections.reader() as conn:
+                totals = conn.execute(
+                    "SELECT career_count, salary_min_sum, salary_max_sum, skill_link_count "
+                    "FROM career_stat_totals WHERE id = 1"
+                ).fetchone()
+                total_careers, salary_min_sum, salary_max_sum, skill_links = totals or (0, 0, 0, 0)
                 
-                # Careers by field
-                field_counts = {}
-                cursor = conn.execute("SELECT career_field, COUNT(*) FROM careers GROUP BY career_field")
-                for field, count in cursor.fetchall():
-                    field_counts[field] = count
+                counts: Dict[str, Dict[Any, int]] = {
+                    "career_field": {}, "experience_level": {}, "salary_band": {}
+                }
+                cursor = conn.execute(
+                    "SELECT dimension, bucket, count FROM career_stat_counts WHERE count > 0"
+                )
+                for dimension, bucket, count in cursor.fetchall():
+                    counts.setdefault(dimension, {})[bucket] = count
                 
-                # Careers by experience level
-                level_counts = {}
-                cursor = conn.execute("SELECT experience_level, COUNT(*) FROM careers GROUP BY experience_level")
-                for level, count in cursor.fetchall():
-                    level_counts[level] = count
+                # Salary extremes (index lookups)
+                lowest = conn.execute("SELECT MIN(salary_min) FROM careers").fetchone()[0]
+                highest = conn.execute("SELECT MAX(salary_max) FROM careers").fetchone()[0]
                 
-                # Salary statistics
-                salary_stats = conn.execute("""
-                    SELECT 
-                        AVG(salary_min) as avg_min_salary,
-                        AVG(salary_max) as avg_max_salary,
-                        MIN(salary_min) as min_salary,
-                        MAX(salary_max) as max_salary
-                    FROM careers
-                """).fetchone()
+                skills = conn.execute("""
+                    SELECT skills.name, skill_stats.link_count
+                    FROM skill_stats JOIN skills ON skills.skill_id = skill_stats.skill_id
+                    WHERE skill_stats.link_count > 0
+                    ORDER BY skill_stats.link_count DESC, skills.name
+                    LIMIT ?
+                """, (top_skills,)).fetchall()
                 
                 return {
                     "total_careers": total_careers,
-                    "careers_by_field": field_counts,
-                    "careers_by_experience_level": level_counts,
+                    "careers_by_field": counts["career_field"],
+                    "careers_by_experience_level": counts["experience_level"],
                     "salary_statistics": {
-                        "average_min_salary": salary_stats[0],
-                        "average_max_salary": salary_stats[1],
-                        "lowest_salary": salary_stats[2],
-                        "highest_salary": salary_stats[3]
-                    }
+                        "average_min_salary": salary_min_sum / total_careers if total_careers else None,
+                        "average_max_salary": salary_max_sum / total_careers if total_careers else None,
+                        "lowest_salary": lowest,
+                        "highest_salary": highest
+                    },
+                    "salary_histogram": {
+                        "band_width": SALARY_BAND_WIDTH,
+                        "bands": dict(sorted(counts["salary_band"].items()))
+                    },
+                    "skill_career_links": skill_links,
+                    "top_skills": [{"skill": name, "careers": count} for name, count in skills]
                 }
         except Exception as e:
             print(f"Error getting statistics: {e}")
             return {}
 
-
 def migrate_frontend_careers_to_database(db: CareerDatabase, frontend_careers: List[Dict]) -> int:
     """
     Migrate career data from frontend hardcoded templates to database.
@@ -554,15 +1705,24 @@ def migrate_frontend_careers_to_database(db: CareerDatabase, frontend_careers: L
     Returns:
         Number of careers successfully migrated
     """
-    migrated_count = 0
+    reports = db.add_careers_bulk(_convert_frontend_careers(frontend_careers))
+    
+    for report in reports:
+        for career_id, error in report.errors:
+            print(f"Error migrating career {career_id}: {error}")
     
+    return sum(report.inserted for report in reports)
+
+
+def _convert_frontend_careers(frontend_careers: Iterable[Dict]) -> Iterator[CareerData]:
+    """Convert frontend career templates to CareerData, skipping invalid ones."""
     for i, career_dict in enumerate(frontend_careers):
         try:
             # Generate career ID if not present
             career_id = career_dict.get('careerType', f'career_{i:04d}')
             
             # Map frontend fields to database fields
-            career_data = CareerData(
+            yield CareerData(
                 career_id=career_id,
                 title=normalize_career_title(career_dict.get('title', 'Unknown Career')),
                 description=career_dict.get('description', ''),
@@ -598,15 +1758,10 @@ def migrate_frontend_careers_to_database(db: CareerDatabase, frontend_careers: L
                 day_in_life=career_dict.get('dayInLife', ''),
                 resume_keywords=career_dict.get('resumeKeywords', [])
             )
-            
-            if db.add_career(career_data):
-                migrated_count += 1
                 
         except Exception as e:
             print(f"Error migrating career {i}: {e}")
             continue
-    
-    return migrated_count
 
 
 if __name__ == "__main__":
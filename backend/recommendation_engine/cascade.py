@@ -0,0 +1,296 @@
+"""
+Multi-stage cascade ranking.
+
+Recommendation generation is a funnel: cheap stages shrink the candidate set so
+that expensive stages (full scoring, AI re-ranking) only see a few careers. This
+module expresses that funnel as an ordered list of stages, each with a cost class
+and an output size, and records per-stage timing and recall so the funnel can be
+tuned for latency without silently dropping good careers.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Set
+from dataclasses import dataclass, field
+from enum import Enum
+import abc
+import threading
+import time
+
+from .catalog_index import CatalogIndex
+
+
+class CostClass(str, Enum):
+    """Relative cost of a cascade stage per candidate."""
+    RETRIEVAL = "retrieval"  # Index lookups, sub-linear in the catalog size
+    CHEAP = "cheap"          # Linear pass with set/keyword features
+    FULL = "full"            # Full ScoringEngine scoring
+    RERANK = "rerank"        # Model-based re-ranking (AI calls)
+
+
+@dataclass
+class CascadeContext:
+    """
+    Request-local state shared by the stages of one cascade run.
+
+    Attributes:
+        user_profile: User's profile
+        summarized_profile: Output of the engine's profile preprocessing
+        exploration_level: User's exploration level (1-5)
+        snapshot: Engine snapshot pinned for the request
+        catalog: Read-only feature index for the career list
+        scores: Full scores computed so far, keyed by id(career)
+    """
+    user_profile: Any
+    summarized_profile: Dict
+    exploration_level: int
+    snapshot: Any
+    catalog: CatalogIndex
+    scores: Dict[int, Any] = field(default_factory=dict)
+
+
+@dataclass
+class StageReport:
+    """Timing and recall of one stage in one cascade run."""
+    name: str
+    cost_class: CostClass
+    input_count: int
+    output_count: int
+    elapsed_ms: float
+    recall: Optional[float] = None
+
+
+@dataclass
+class CascadeResult:
+    """Final candidates of a cascade run and a report per stage."""
+    candidates: List[Any]
+    reports: List[StageReport]
+
+    @property
+    def total_ms(self) -> float:
+        """Total time spent in all stages."""
+        return sum(report.elapsed_ms for report in self.reports)
+
+
+class CascadeStage(abc.ABC):
+    """
+    One stage of a ranking cascade.
+
+    Stages receive the candidates from the previous stage in ranked order and
+    return at most ``output_size`` of them, best first. Stages must keep all
+    per-request state in the CascadeContext so a cascade can run on many
+    threads at once.
+    """
+
+    def __init__(self, name: str, cost_class: CostClass, output_size: Optional[int] = None):
+        """
+        Initialize the stage.
+
+        Args:
+            name: Stage name used in reports and configuration
+            cost_class: Relative cost of the stage
+            output_size: Maximum candidates passed on (None keeps all)
+        """
+        if output_size is not None and output_size < 1:
+            raise ValueError("output_size must be at least 1")
+
+        self.name = name
+        self.cost_class = cost_class
+        self.output_size = output_size
+
+    @abc.abstractmethod
+    def run(self, context: CascadeContext, candidates: List[Any]) -> List[Any]:
+        """
+        Rank and cut the candidates.
+
+        Args:
+            context: Request-local cascade state
+            candidates: Candidates from the previous stage
+
+        Returns:
+            At most output_size candidates, best first
+        """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r}, cost_class={self.cost_class.value}, output_size={self.output_size})"
+
+
+class FunctionStage(CascadeStage):
+    """Cascade stage backed by a plain function ``func(context, candidates, output_size)``."""
+
+    def __init__(
+        self,
+        name: str,
+        cost_class: CostClass,
+        func: Callable[[CascadeContext, List[Any], Optional[int]], List[Any]],
+        output_size: Optional[int] = None
+    ):
+        super().__init__(name, cost_class, output_size)
+        self.func = func
+
+    def run(self, context: CascadeContext, candidates: List[Any]) -> List[Any]:
+        result = self.func(context, candidates, self.output_size)
+        if self.output_size is not None:
+            result = result[:self.output_size]
+        return result
+
+
+class InvertedIndexRetrievalStage(CascadeStage):
+    """
+    Retrieves careers sharing at least one skill or industry token with the user.
+
+    Candidates are ranked by the number of matching tokens using the catalog's
+    postings lists, so only careers that share a token are touched. When nothing
+    matches, the candidates are passed through unchanged.
+    """
+
+    def __init__(self, output_size: Optional[int] = None, name: str = "retrieval"):
+        super().__init__(name, CostClass.RETRIEVAL, output_size)
+
+    def run(self, context: CascadeContext, candidates: List[Any]) -> List[Any]:
+        summary = context.summarized_profile
+        tokens = {skill.lower() for skill in summary.get("key_skills", [])}
+        tokens.update(industry.lower() for industry in summary.get("primary_industries", []))
+
+        hits = context.catalog.match_counts(tokens)
+        if not hits:
+            return candidates[:self.output_size]
+
+        # Most matching tokens first, ties in incoming order
+        ranked = []
+        for order, career in enumerate(candidates):
+            count = hits.get(context.catalog.position_of(career))
+            if count:
+                ranked.append((-count, order, career))
+        ranked.sort(key=lambda item: item[:2])
+
+        return [career for _, _, career in ranked][:self.output_size]
+
+
+class RankingCascade:
+    """An ordered list of cascade stages."""
+
+    def __init__(self, stages: List[CascadeStage]):
+        """
+        Initialize the cascade.
+
+        Args:
+            stages: Stages in execution order
+        """
+        self.stages = list(stages)
+
+    def run(
+        self,
+        context: CascadeContext,
+        candidates: List[Any],
+        reference: Optional[Set[int]] = None
+    ) -> CascadeResult:
+        """
+        Run every stage in order.
+
+        Args:
+            context: Request-local cascade state
+            candidates: Initial candidates (usually the whole catalog)
+            reference: Optional ids of careers that should survive (e.g. the
+                exhaustive top-K); each stage's recall against it is reported
+
+        Returns:
+            CascadeResult with the final candidates and per-stage reports
+        """
+        reports = []
+
+        for stage in self.stages:
+            started = time.perf_counter()
+            output = stage.run(context, candidates)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            recall = None
+            if reference:
+                recall = len(reference.intersection(id(career) for career in output)) / len(reference)
+
+            reports.append(StageReport(
+                name=stage.name,
+                cost_class=stage.cost_class,
+                input_count=len(candidates),
+                output_count=len(output),
+                elapsed_ms=elapsed_ms,
+                recall=recall
+            ))
+            candidates = output
+
+        return CascadeResult(candidates=candidates, reports=reports)
+
+    def __repr__(self) -> str:
+        return f"RankingCascade({' -> '.join(stage.name for stage in self.stages)})"
+
+
+def build_cascade(
+    stage_configs: List[Any],
+    factories: Dict[str, Callable[[Optional[int]], CascadeStage]]
+) -> RankingCascade:
+    """
+    Build a cascade from stage configurations.
+
+    Args:
+        stage_configs: CascadeStageConfig entries in execution order
+        factories: Stage factory per stage name, taking the output size
+
+    Returns:
+        RankingCascade with the enabled stages
+
+    Raises:
+        ValueError: If a stage name has no factory
+    """
+    stages = []
+    for stage_config in stage_configs:
+        if not stage_config.enabled:
+            continue
+        factory = factories.get(stage_config.name)
+        if factory is None:
+            raise ValueError(f"Unknown cascade stage: {stage_config.name}")
+        stages.append(factory(stage_config.output_size))
+    return RankingCascade(stages)
+
+
+class CascadeMetrics:
+    """Thread-safe running totals of cascade stage reports."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._runs = 0
+        self._stages: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, result: CascadeResult):
+        """Add one cascade run to the totals."""
+        with self._lock:
+            self._runs += 1
+            for report in result.reports:
+                totals = self._stages.setdefault(report.name, {
+                    "cost_class": report.cost_class.value,
+                    "runs": 0,
+                    "total_ms": 0.0,
+                    "total_in": 0,
+                    "total_out": 0
+                })
+                totals["runs"] += 1
+                totals["total_ms"] += report.elapsed_ms
+                totals["total_in"] += report.input_count
+                totals["total_out"] += report.output_count
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get average timing and funnel sizes per stage.
+
+        Returns:
+            Dictionary with the run count and per-stage averages
+        """
+        with self._lock:
+            stages = {}
+            for name, totals in self._stages.items():
+                runs = totals["runs"]
+                stages[name] = {
+                    "cost_class": totals["cost_class"],
+                    "runs": runs,
+                    "average_ms": totals["total_ms"] / runs,
+                    "average_input": totals["total_in"] / runs,
+                    "average_output": totals["total_out"] / runs
+                }
+            return {"runs": self._runs, "stages": stages}
@@ -0,0 +1,344 @@
+"""
+Memory-mapped columnar catalog artifact.
+
+Importing the ``*_careers.py`` modules and parsing ``career_data.json`` costs
+every worker process the same startup time and its own private copy of the
+catalog. This module compiles a catalog once, at build time, into a single
+read-only file:
+
+    magic | header length | JSON header | column sections (8-byte aligned)
+
+Integer and float columns are stored as native fixed-width arrays. Text columns
+are stored as an offset array (``count + 1`` uint64 values) into a UTF-8 string
+heap; values that are not plain strings (lists, mixed types, missing keys) are
+stored as JSON text in the same way. Servers open the file with ``mmap``, so
+startup only parses the header and the pages are shared by every worker that
+maps the same file. Records are decoded lazily, one field at a time.
+
+Build from the command line:
+
+    python -m recommendation_engine.catalog_artifact build catalog.bin
+    python -m recommendation_engine.catalog_artifact build catalog.bin --json career_data.json
+"""
+
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
+from collections.abc import Mapping as MappingABC
+from array import array
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+
+MAGIC = b"CATALOG1"
+FORMAT_VERSION = 1
+
+# Column kinds and their array type codes
+INT_COLUMN = "int"      # array('q')
+FLOAT_COLUMN = "float"  # array('d')
+TEXT_COLUMN = "text"    # str values, offsets array('Q') into the heap
+JSON_COLUMN = "json"    # anything else, JSON text; empty means the key is absent
+
+_TYPE_CODES = {INT_COLUMN: "q", FLOAT_COLUMN: "d", TEXT_COLUMN: "Q", JSON_COLUMN: "Q"}
+
+
+def _column_kind(values: List[Any], present: int, count: int) -> str:
+    """Pick the most compact column kind that round-trips every value."""
+    if present == count:
+        if all(type(value) is int for value in values):
+            return INT_COLUMN
+        if all(type(value) is float for value in values):
+            return FLOAT_COLUMN
+        if all(type(value) is str for value in values):
+            return TEXT_COLUMN
+    return JSON_COLUMN
+
+
+def _align(handle, boundary: int = 8):
+    """Pad the file to the next multiple of boundary."""
+    padding = -handle.tell() % boundary
+    if padding:
+        handle.write(b"\0" * padding)
+
+
+def build_catalog_artifact(careers: Sequence[Mapping[str, Any]], path: str, source: str = "") -> Dict[str, Any]:
+    """
+    Compile career dictionaries into a columnar artifact.
+
+    The file is written next to its destination and renamed into place, so
+    processes that already mapped the old artifact keep a consistent view.
+
+    Args:
+        careers: Career dictionaries (e.g. COMPREHENSIVE_CAREERS)
+        path: Output file path
+        source: Description of the input, stored in the header
+
+    Returns:
+        The artifact header
+    """
+    count = len(careers)
+    names: List[str] = []
+    for career in careers:
+        for name in career:
+            if name not in names:
+                names.append(name)
+
+    columns = []
+    for name in names:
+        values = [career.get(name) for career in careers]
+        present = sum(1 for career in careers if name in career)
+        kind = _column_kind(values, present, count)
+
+        if kind in (INT_COLUMN, FLOAT_COLUMN):
+            columns.append((name, kind, array(_TYPE_CODES[kind], values), None))
+            continue
+
+        heap = bytearray()
+        offsets = array("Q", [0])
+        for career in careers:
+            if name in career:
+                value = career[name]
+                text = value if kind == TEXT_COLUMN else json.dumps(value, separators=(",", ":"))
+                heap += text.encode("utf-8")
+            offsets.append(len(heap))
+        columns.append((name, kind, offsets, bytes(heap)))
+
+    # Lay out the sections, then write the header describing them
+    sections = []
+    position = 0
+    for name, kind, data, heap in columns:
+        entry = {"name": name, "kind": kind, "offset": position, "length": len(data) * data.itemsize}
+        position += entry["length"] + (-entry["length"] % 8)
+        if heap is not None:
+            entry["heap_offset"] = position
+            entry["heap_length"] = len(heap)
+            position += len(heap) + (-len(heap) % 8)
+        sections.append(entry)
+
+    header = {
+        "format_version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "count": count,
+        "source": source,
+        "built_at": time.time(),
+        "columns": sections
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, "wb") as handle:
+        handle.write(MAGIC)
+        handle.write(struct.pack("<Q", len(header_bytes)))
+        handle.write(header_bytes)
+        _align(handle)
+        base = handle.tell()
+        for entry, (_, _, data, heap) in zip(sections, columns):
+            assert handle.tell() == base + entry["offset"]
+            data.tofile(handle)
+            _align(handle)
+            if heap is not None:
+                handle.write(heap)
+                _align(handle)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+    return header
+
+
+class ArtifactRecord(MappingABC):
+    """Read-only mapping view of one career; fields are decoded on access."""
+
+    __slots__ = ("_artifact", "_index")
+
+    def __init__(self, artifact: "CatalogArtifact", index: int):
+        self._artifact = artifact
+        self._index = index
+
+    def __getitem__(self, name: str) -> Any:
+        return self._artifact.value(name, self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self._artifact.column_names:
+            if self._artifact.has_value(name, self._index):
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"ArtifactRecord({self._index}, {dict(self)!r})"
+
+
+class CatalogArtifact(Sequence):
+    """
+    Read-only, memory-mapped view of a catalog artifact.
+
+    Behaves as a sequence of ArtifactRecord mappings. Numeric columns can be
+    read in bulk through ``column()`` without decoding any records.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map an artifact.
+
+        Args:
+            path: Artifact file path
+
+        Raises:
+            ValueError: If the file is not a compatible catalog artifact
+        """
+        self.path = path
+        with open(path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self._mmap[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a catalog artifact")
+            (header_length,) = struct.unpack_from("<Q", self._mmap, len(MAGIC))
+            start = len(MAGIC) + 8
+            self.header = json.loads(self._mmap[start:start + header_length].decode("utf-8"))
+            if self.header.get("format_version") != FORMAT_VERSION:
+                raise ValueError(f"{path} has unsupported format version {self.header.get('format_version')}")
+            if self.header.get("byteorder") != sys.byteorder:
+                raise ValueError(f"{path} was built for {self.header.get('byteorder')}-endian machines")
+        except Exception:
+            self._mmap.close()
+            raise
+
+        base = start + header_length + (-(start + header_length) % 8)
+        buffer = memoryview(self._mmap)
+        self._views = [buffer]
+        self.count: int = self.header["count"]
+        self._columns: Dict[str, Any] = {}
+        for entry in self.header["columns"]:
+            offset = base + entry["offset"]
+            data = buffer[offset:offset + entry["length"]].cast(_TYPE_CODES[entry["kind"]])
+            heap = None
+            if "heap_offset" in entry:
+                heap_offset = base + entry["heap_offset"]
+                heap = buffer[heap_offset:heap_offset + entry["heap_length"]]
+                self._views.append(heap)
+            self._views.append(data)
+            self._columns[entry["name"]] = (entry["kind"], data, heap)
+        self.column_names = tuple(self._columns)
+
+    @classmethod
+    def open(cls, path: str) -> "CatalogArtifact":
+        """Map an artifact (alias of the constructor)."""
+        return cls(path)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ArtifactRecord(self, i) for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("catalog index out of range")
+        return ArtifactRecord(self, index)
+
+    def column(self, name: str) -> memoryview:
+        """
+        Get a numeric column as a zero-copy array view.
+
+        Raises:
+            KeyError: If the column does not exist
+            TypeError: If the column is not numeric
+        """
+        kind, data, _ = self._columns[name]
+        if kind not in (INT_COLUMN, FLOAT_COLUMN):
+            raise TypeError(f"Column {name!r} is a {kind} column")
+        return data
+
+    def has_value(self, name: str, index: int) -> bool:
+        """Check whether a record has a value for a column."""
+        kind, data, _ = self._columns[name]
+        return kind != JSON_COLUMN or data[index + 1] > data[index]
+
+    def value(self, name: str, index: int) -> Any:
+        """
+        Decode one field of one record.
+
+        Raises:
+            KeyError: If the column does not exist or the record has no value
+        """
+        kind, data, heap = self._columns[name]
+        if kind in (INT_COLUMN, FLOAT_COLUMN):
+            return data[index]
+
+        start, end = data[index], data[index + 1]
+        if kind == TEXT_COLUMN:
+            return str(heap[start:end], "utf-8")
+        if start == end:
+            raise KeyError(name)
+        return json.loads(str(heap[start:end], "utf-8"))
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Decode every record into a plain dictionary."""
+        return [dict(record) for record in self]
+
+    def close(self):
+        """Unmap the file; records and column views must not be used afterwards."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._columns = {}
+        self._mmap.close()
+
+
+def load_catalog(artifact_path: Optional[str], fallback):
+    """
+    Open the catalog artifact if it exists, otherwise build the catalog in-process.
+
+    Args:
+        artifact_path: Artifact path (e.g. from an environment variable), or None
+        fallback: Callable returning the career list the slow way
+
+    Returns:
+        CatalogArtifact or the fallback's career list
+    """
+    if artifact_path and os.path.exists(artifact_path):
+        return CatalogArtifact(artifact_path)
+    return fallback()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point: build or inspect an artifact."""
+    parser = argparse.ArgumentParser(description="Compile the career catalog into a memory-mapped artifact.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    build = subcommands.add_parser("build", help="compile a catalog")
+    build.add_argument("output", help="artifact path to write")
+    build.add_argument("--json", help="read careers from a JSON list instead of COMPREHENSIVE_CAREERS")
+
+    inspect = subcommands.add_parser("inspect", help="print an artifact's header")
+    inspect.add_argument("path", help="artifact path")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "inspect":
+        artifact = CatalogArtifact(args.path)
+        print(json.dumps(artifact.header, indent=2))
+        artifact.close()
+        return
+
+    if args.json:
+        with open(args.json, "r") as f:
+            careers = json.load(f)
+        source = args.json
+    else:
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from comprehensive_careers import COMPREHENSIVE_CAREERS
+        careers = COMPREHENSIVE_CAREERS
+        source = "comprehensive_careers.COMPREHENSIVE_CAREERS"
+
+    header = build_catalog_artifact(careers, args.output, source=source)
+    print(f"Wrote {header['count']} careers in {len(header['columns'])} columns to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Immutable, shareable per-catalog feature index.
+
+Pre-filtering needs profile-independent features for every career (skill and
+industry sets, searchable text, detected field). These are built once per career
+list and published as a frozen CatalogIndex that any number of scoring threads
+can read without locks. Everything specific to a single request stays in local
+variables of the request.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from .interval_index import SalaryExperienceIndex, build_salary_experience_index
+
+
+@dataclass(frozen=True)
+class CatalogIndex:
+    """
+    Read-only features for one career list.
+
+    Attributes:
+        careers: The indexed careers (held so their ids stay valid)
+        career_ids: Identity of each indexed career object
+        features: Frozen feature mapping per career, in the same order
+        positions: Catalog position per career identity
+        postings: Catalog positions per token of the set-valued features
+            (skills, industries), for inverted-index retrieval
+        ranges: Salary/experience interval index over catalog positions, for
+            window filtering
+    """
+    careers: Tuple[Any, ...]
+    career_ids: Tuple[int, ...]
+    features: Tuple[Mapping[str, Any], ...]
+    positions: Mapping[int, int]
+    postings: Mapping[str, Tuple[int, ...]]
+    ranges: Optional[SalaryExperienceIndex] = None
+
+    def matches(self, careers: List[Any]) -> bool:
+        """Check whether this index was built for exactly these career objects."""
+        return len(careers) == len(self.career_ids) and tuple(map(id, careers)) == self.career_ids
+
+    def position_of(self, career: Any) -> Optional[int]:
+        """Get a career's catalog position, or None if it is not indexed."""
+        return self.positions.get(id(career))
+
+    def features_for(self, career: Any) -> Mapping[str, Any]:
+        """Get the features of an indexed career."""
+        return self.features[self.positions[id(career)]]
+
+    def match_counts(self, tokens: Iterable[str]) -> Dict[int, int]:
+        """
+        Count matching tokens per career using the postings lists.
+
+        Args:
+            tokens: Lowercased skill/industry tokens
+
+        Returns:
+            Number of matching tokens per catalog position (matches only)
+        """
+        counts: Dict[int, int] = {}
+        for token in tokens:
+            for position in self.postings.get(token, ()):
+                counts[position] = counts.get(position, 0) + 1
+        return counts
+
+
+def freeze_features(features: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Make a feature dictionary safe to share between threads.
+
+    Sets become frozensets, lists become tuples and the mapping itself is wrapped
+    in a read-only proxy.
+    """
+    frozen = {}
+    for key, value in features.items():
+        if isinstance(value, (set, frozenset)):
+            value = frozenset(value)
+        elif isinstance(value, list):
+            value = tuple(value)
+        frozen[key] = value
+    return MappingProxyType(frozen)
+
+
+def build_catalog_index(
+    careers: List[Any],
+    feature_builder: Callable[[List[Any]], List[Dict[str, Any]]]
+) -> CatalogIndex:
+    """
+    Build a frozen index for a career list.
+
+    Args:
+        careers: Careers to index
+        feature_builder: Function returning one feature dict per career
+
+    Returns:
+        New CatalogIndex
+    """
+    careers = tuple(careers)
+    features = tuple(freeze_features(entry) for entry in feature_builder(list(careers)))
+    career_ids = tuple(map(id, careers))
+
+    postings: Dict[str, List[int]] = {}
+    for position, entry in enumerate(features):
+        tokens = set()
+        for value in entry.values():
+            if isinstance(value, frozenset):
+                tokens.update(token for token in value if isinstance(token, str))
+        for token in tokens:
+            postings.setdefault(token, []).append(position)
+
+    return CatalogIndex(
+        careers=careers,
+        career_ids=career_ids,
+        features=features,
+        positions=MappingProxyType({career_id: position for position, career_id in enumerate(career_ids)}),
+        postings=MappingProxyType({token: tuple(positions) for token, positions in postings.items()}),
+        ranges=build_salary_experience_index(careers)
+    )
+
+
+class CatalogIndexCache:
+    """
+    Holds the index for the most recently used career list.
+
+    Lookups and replacement are single reference reads and writes, so the cache
+    needs no lock: two threads racing on a new catalog both build an identical
+    index and one of them wins the assignment.
+    """
+
+    def __init__(self, feature_builder: Callable[[List[Any]], List[Dict[str, Any]]]):
+        """
+        Initialize the cache.
+
+        Args:
+            feature_builder: Function returning one feature dict per career
+        """
+        self.feature_builder = feature_builder
+        self._index: Optional[CatalogIndex] = None
+
+    def get(self, careers: List[Any]) -> CatalogIndex:
+        """
+        Get the index for a career list, building it if the list changed.
+
+        Args:
+            careers: Careers to look up
+
+        Returns:
+            CatalogIndex for exactly these careers
+        """
+        index = self._index
+        if index is None or not index.matches(careers):
+            index = build_catalog_index(careers, self.feature_builder)
+            self._index = index
+        return index
@@ -0,0 +1,326 @@
+"""
+Versioned in-memory career catalog.
+
+Servers used to load the catalog each in their own way (module-level lists,
+per-request SQLite queries, JSON converted at import) and nothing knew when it
+changed. A CatalogStore holds the catalog as an immutable, indexed snapshot with
+a monotonically increasing version. Every change builds a new snapshot, swaps it
+in with a single assignment and publishes a CatalogChange, so caches and indexes
+can subscribe instead of polling. Readers grab ``store.snapshot`` once per
+request and never take a lock.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
+from types import MappingProxyType
+import json
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def career_key(career: Any) -> str:
+    """
+    Get the identifier of a career record.
+
+    Works for CareerData/Career objects (``career_id``) and for the frontend
+    dictionaries used by the JSON catalogs (``career_id`` or ``careerType``).
+    """
+    if isinstance(career, Mapping):
+        key = career.get("career_id") or career.get("careerType")
+    else:
+        key = getattr(career, "career_id", None)
+    if not key:
+        raise ValueError(f"Career has no identifier: {career!r}")
+    return str(key)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    One immutable version of the catalog.
+
+    Attributes:
+        version: Monotonically increasing snapshot version
+        careers: Careers in catalog order; shared by every reader, never mutate
+        by_id: Career per identifier
+        indexes: Careers per key, per secondary index name
+        created_at: When the snapshot was built (time.time())
+    """
+    version: int
+    careers: List[Any]
+    by_id: Mapping[str, Any]
+    indexes: Mapping[str, Mapping[Any, Tuple[Any, ...]]]
+    created_at: float = field(default_factory=time.time)
+
+    def __len__(self) -> int:
+        return len(self.careers)
+
+    def get(self, career_id: str) -> Optional[Any]:
+        """Get a career by identifier."""
+        return self.by_id.get(career_id)
+
+    def lookup(self, index: str, value: Any) -> Tuple[Any, ...]:
+        """
+        Get the careers with a given key in a secondary index.
+
+        Raises:
+            KeyError: If the index does not exist
+        """
+        return self.indexes[index].get(value, ())
+
+
+@dataclass(frozen=True)
+class CatalogChange:
+    """
+    Change event published after a new snapshot is swapped in.
+
+    Attributes:
+        kind: "add", "update", "delete" or "reload"
+        career_ids: Identifiers of the changed careers (empty for a reload)
+        snapshot: The snapshot that is now active
+    """
+    kind: str
+    career_ids: Tuple[str, ...]
+    snapshot: CatalogSnapshot
+
+    @property
+    def version(self) -> int:
+        return self.snapshot.version
+
+
+class CatalogStore:
+    """
+    Holds the active catalog snapshot and publishes changes.
+
+    Writers are serialized by a lock; each one builds the next snapshot, swaps
+    it in and then notifies subscribers in version order. Subscriber errors are
+    logged and do not affect the change or other subscribers.
+    """
+
+    def __init__(
+        self,
+        careers: Iterable[Any] = (),
+        key: Callable[[Any], str] = career_key,
+        indexes: Optional[Dict[str, Callable[[Any], Any]]] = None
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            careers: Initial catalog
+            key: Function returning a career's identifier
+            indexes: Secondary index key function per index name
+        """
+        self.key = key
+        self.index_keys = dict(indexes or {})
+        self._write_lock = threading.RLock()
+        self._subscribers: List[Callable[[CatalogChange], None]] = []
+        self._snapshot = self._build(list(careers), version=1)
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """The active snapshot."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """Version of the active snapshot."""
+        return self._snapshot.version
+
+    def subscribe(self, callback: Callable[[CatalogChange], None]) -> Callable[[], None]:
+        """
+        Call a function after every change.
+
+        Args:
+            callback: Receives the CatalogChange
+
+        Returns:
+            Function that removes the subscription
+        """
+        with self._write_lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._write_lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def add_career(self, career: Any) -> CatalogChange:
+        """Add a career, replacing one with the same identifier."""
+        return self.apply_changes(upserts=[career])
+
+    def update_career(self, career: Any) -> CatalogChange:
+        """Replace a career (added if it does not exist yet)."""
+        return self.apply_changes(upserts=[career])
+
+    def delete_career(self, career_id: str) -> Optional[CatalogChange]:
+        """
+        Remove a career.
+
+        Returns:
+            The change, or None if the career was not in the catalog
+        """
+        with self._write_lock:
+            if career_id not in self._snapshot.by_id:
+                return None
+            return self.apply_changes(deletes=[career_id])
+
+    def apply_changes(
+        self,
+        upserts: Iterable[Any] = (),
+        deletes: Iterable[str] = ()
+    ) -> CatalogChange:
+        """
+        Add, replace and remove careers as one new snapshot.
+
+        Replaced careers keep their position (duplicates of a replaced
+        identifier are dropped); new careers are appended.
+
+        Args:
+            upserts: Careers to add or replace
+            deletes: Identifiers of careers to remove
+
+        Returns:
+            The published change
+        """
+        upserts = list(upserts)
+        with self._write_lock:
+            current = self._snapshot
+            replacements = {self.key(career): career for career in upserts}
+            removed = set(deletes) - set(replacements)
+
+            changed = tuple(replacements) + tuple(sorted(removed))
+            if not replacements:
+                kind = "delete"
+            elif all(career_id in current.by_id for career_id in replacements):
+                kind = "update"
+            else:
+                kind = "add"
+
+            careers = []
+            replaced = set()
+            for career in current.careers:
+                career_id = self.key(career)
+                if career_id in removed or career_id in replaced:
+                    continue
+                if career_id in replacements:
+                    careers.append(replacements[career_id])
+                    replaced.add(career_id)
+                else:
+                    careers.append(career)
+            careers.extend(career for career_id, career in replacements.items() if career_id not in replaced)
+
+            return self._publish(kind, changed, careers)
+
+    def replace_all(self, careers: Iterable[Any]) -> CatalogChange:
+        """
+        Replace the whole catalog.
+
+        Args:
+            careers: New catalog
+
+        Returns:
+            The published "reload" change
+        """
+        with self._write_lock:
+            return self._publish("reload", (), list(careers))
+
+    def load_file(self, path: str, converter: Optional[Callable[[Dict], Any]] = None) -> CatalogChange:
+        """
+        Reload the catalog from a JSON file holding a list of careers.
+
+        The active snapshot is kept if the file cannot be read.
+
+        Args:
+            path: JSON file path
+            converter: Optional function turning each JSON entry into a career
+
+        Returns:
+            The published "reload" change
+
+        Raises:
+            OSError, ValueError: If the file cannot be read or parsed
+        """
+        with open(path, "r") as f:
+            entries = json.load(f)
+        if not isinstance(entries, list):
+            raise ValueError(f"{path} does not contain a list of careers")
+        careers = [converter(entry) for entry in entries] if converter else entries
+        return self.replace_all(careers)
+
+    def attach_database(self, db: Any, converter: Optional[Callable[[Any], Any]] = None) -> Callable[[], None]:
+        """
+        Mirror a CareerDatabase: load all careers and follow its changes.
+
+        Args:
+            db: CareerDatabase to mirror
+            converter: Optional function turning each CareerData into a career
+
+        Returns:
+            Function that stops following the database
+        """
+        convert = converter or (lambda career: career)
+
+        def reload():
+            self.replace_all([convert(career) for career in db.iter_careers()])
+
+        def on_database_change(kind: str, career_ids: Tuple[str, ...]):
+            if kind == "reload":
+                reload()
+                return
+            if kind == "delete":
+                self.apply_changes(deletes=career_ids)
+                return
+            upserts = []
+            deletes = []
+            for career_id in career_ids:
+                career = db.get_career(career_id)
+                if career is None:
+                    deletes.append(career_id)
+                else:
+                    upserts.append(convert(career))
+            self.apply_changes(upserts=upserts, deletes=deletes)
+
+        with self._write_lock:
+            unsubscribe = db.subscribe(on_database_change)
+            reload()
+        return unsubscribe
+
+    def _publish(self, kind: str, career_ids: Tuple[str, ...], careers: List[Any]) -> CatalogChange:
+        """Swap in a new snapshot and notify subscribers (write lock held)."""
+        snapshot = self._build(careers, version=self._snapshot.version + 1)
+        self._snapshot = snapshot
+
+        change = CatalogChange(kind=kind, career_ids=career_ids, snapshot=snapshot)
+        for callback in list(self._subscribers):
+            try:
+                callback(change)
+            except Exception as e:
+                logger.error(f"Catalog subscriber failed on version {snapshot.version}: {e}")
+        return change
+
+    def _build(self, careers: List[Any], version: int) -> CatalogSnapshot:
+        """Build an indexed snapshot."""
+        # Like a linear search, the first career wins for duplicate identifiers
+        by_id = {}
+        for career in careers:
+            by_id.setdefault(self.key(career), career)
+
+        indexes = {}
+        for name, index_key in self.index_keys.items():
+            entries: Dict[Any, List[Any]] = {}
+            for career in careers:
+                entries.setdefault(index_key(career), []).append(career)
+            indexes[name] = MappingProxyType({value: tuple(items) for value, items in entries.items()})
+
+        return CatalogSnapshot(
+            version=version,
+            careers=careers,
+            by_id=MappingProxyType(by_id),
+            indexes=MappingProxyType(indexes)
+        )
@@ -215,14 +215,22 @@ class CategorizationEngine:
     - Adventure Zone: Interesting matches that require significant upskilling
     """
     
-    def __init__(self, thresholds: CategorizationThresholds):
+    def __init__(self, thresholds: CategorizationThresholds, compiled_config=None):
         """
         Initialize the categorization engine.
         
         Args:
             thresholds: Thresholds for different recommendation categories
+            compiled_config: Precompiled vectors for the same configuration; the
+                threshold vector is built from thresholds when not provided
         """
         self.thresholds = thresholds
+        
+        # (safe, stretch, adventure) zone minimums used on the hot path
+        if compiled_config is not None:
+            self.threshold_vector = compiled_config.threshold_vector
+        else:
+            self.threshold_vector = (thresholds.safe_zone_min, thresholds.stretch_zone_min, thresholds.adventure_zone_min)
     
     def categorize_recommendations(
         self, 
@@ -284,9 +292,10 @@ class CategorizationEngine:
         """
         total_score = score.total_score
         skill_score = score.skill_match_score
+        safe_min, stretch_min, adventure_min = self.threshold_vector
         
         # Primary categorization based on total score
-        if total_score >= self.thresholds.safe_zone_min:
+        if total_score >= safe_min:
             # High score - but check if it's truly "safe" based on skills
             if skill_score >= 0.8:
                 return RecommendationCategory.SAFE_ZONE
@@ -294,7 +303,7 @@ class CategorizationEngine:
                 # High overall score but lower skill match - might be stretch
                 return RecommendationCategory.STRETCH_ZONE
                 
-        elif total_score >= self.thresholds.stretch_zone_min:
+        elif total_score >= stretch_min:
             # Medium score - check skill requirements vs user skills
             missing_mandatory = self._count_missing_mandatory_skills(user_profile, career)
             
@@ -305,7 +314,7 @@ class CategorizationEngine:
             else:
                 return RecommendationCategory.ADVENTURE_ZONE
                 
-        elif total_score >= self.thresholds.adventure_zone_min:
+        elif total_score >= adventure_min:
             # Lower score - likely adventure zone
             return RecommendationCategory.ADVENTURE_ZONE
         
@@ -0,0 +1,193 @@
+"""
+Micro-batching of concurrent recommendation requests.
+
+Under load many recommendation requests arrive within a few milliseconds of each
+other and each one walks the full career catalog. The RequestCoalescer collects
+requests that arrive within a short window (or until a batch size is reached),
+splits each batch into one chunk per executor worker, scores the chunks through
+the engine's ``get_recommendations_batch`` and fans the results back out to the
+waiting handlers.
+"""
+
+from typing import Any, Dict, List, Optional, Set
+from dataclasses import dataclass
+import asyncio
+import logging
+
+from .executor import ScoringExecutor
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    """A request waiting for its batch to be scored."""
+    user_profile: Any
+    available_careers: List[Any]
+    limit: Optional[int]
+    exploration_level: int
+    future: asyncio.Future
+
+
+class RequestCoalescer:
+    """
+    Coalesces concurrent recommendation requests into batched scoring passes.
+
+    Requests are grouped by the career list they target (by identity), so only
+    requests against the same catalog are scored together.
+    """
+
+    def __init__(
+        self,
+        engine,
+        window_ms: float = 3.0,
+        max_batch_size: int = 16,
+        executor: Optional[ScoringExecutor] = None
+    ):
+        """
+        Initialize the request coalescer.
+
+        Args:
+            engine: Engine providing get_recommendations_batch
+            window_ms: How long to wait for more requests after the first arrives
+            max_batch_size: Flush immediately once this many requests are waiting
+            executor: Executor to score batches on (defaults to the engine's)
+        """
+        if window_ms < 0:
+            raise ValueError("window_ms cannot be negative")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.engine = engine
+        self.window_ms = window_ms
+        self.max_batch_size = max_batch_size
+        self.executor = executor or engine.executor
+
+        self._pending: List[_PendingRequest] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Strong references to in-flight batch tasks; the event loop only keeps weak ones
+        self._tasks: Set[asyncio.Task] = set()
+
+        self._batches = 0
+        self._chunks = 0
+        self._requests = 0
+        self._largest_batch = 0
+
+    async def submit(
+        self,
+        user_profile,
+        available_careers: List[Any],
+        limit: Optional[int] = None,
+        exploration_level: int = 3
+    ) -> List[Any]:
+        """
+        Queue a request for the next batch and wait for its recommendations.
+
+        Args:
+            user_profile: User's profile
+            available_careers: Careers to consider
+            limit: Maximum number of recommendations to return
+            exploration_level: User's exploration level (1-5)
+
+        Returns:
+            The recommendations for this request
+
+        Raises:
+            EngineOverloadedError: If the executor rejects the batch
+        """
+        loop = asyncio.get_running_loop()
+        request = _PendingRequest(
+            user_profile=user_profile,
+            available_careers=available_careers,
+            limit=limit,
+            exploration_level=exploration_level,
+            future=loop.create_future()
+        )
+        self._pending.append(request)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_ms / 1000.0, self._flush)
+
+        return await request.future
+
+    def _flush(self):
+        """Dispatch everything collected so far as one batch per career list."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        groups: Dict[int, List[_PendingRequest]] = {}
+        for request in pending:
+            groups.setdefault(id(request.available_careers), []).append(request)
+
+        for group in groups.values():
+            task = asyncio.ensure_future(self._run_batch(group))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[_PendingRequest]):
+        """Split a batch across the executor's workers and score the chunks concurrently."""
+        self._batches += 1
+        self._requests += len(batch)
+        self._largest_batch = max(self._largest_batch, len(batch))
+
+        # Contiguous chunks keep each worker on a run of requests; the catalog
+        # index they share is built once and cached by the engine.
+        chunk_count = min(len(batch), self.executor.max_workers)
+        chunk_size = -(-len(batch) // chunk_count)
+        chunks = [batch[i:i + chunk_size] for i in range(0, len(batch), chunk_size)]
+        self._chunks += len(chunks)
+
+        await asyncio.gather(*(self._run_chunk(chunk) for chunk in chunks))
+
+    async def _run_chunk(self, batch: List[_PendingRequest]):
+        """Score one chunk on the executor and resolve each request's future."""
+        try:
+            results = await self.executor.run(
+                self.engine.get_recommendations_batch,
+                [request.user_profile for request in batch],
+                batch[0].available_careers,
+                [request.limit for request in batch],
+                [request.exploration_level for request in batch],
+                True
+            )
+        except Exception as e:
+            logger.warning(f"Recommendation batch of {len(batch)} failed: {e}")
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        for request, result in zip(batch, results):
+            if request.future.done():
+                # The waiting handler was cancelled (e.g. client disconnected)
+                continue
+            if isinstance(result, Exception):
+                request.future.set_exception(result)
+            else:
+                request.future.set_result(result)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get batching metrics.
+
+        Returns:
+            Dictionary with batch counts and sizes
+        """
+        return {
+            "window_ms": self.window_ms,
+            "max_batch_size": self.max_batch_size,
+            "waiting": len(self._pending),
+            "batches": self._batches,
+            "chunks": self._chunks,
+            "requests": self._requests,
+            "largest_batch": self._largest_batch,
+            "average_batch_size": (self._requests / self._batches) if self._batches else 0.0
+        }
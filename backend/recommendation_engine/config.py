@@ -5,7 +5,9 @@ This module defines configuration classes and default values for the
 recommendation engine's scoring weights, thresholds, and parameters.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from dataclasses import dataclass
+from types import MappingProxyType
 from pydantic import BaseModel, Field
 
 
@@ -111,6 +113,20 @@ class ConsistencyPenaltyConfig(BaseModel):
     max_penalty: float = Field(0.6, ge=0.0, le=1.0, description="Maximum penalty that can be applied")
 
 
+class CascadeStageConfig(BaseModel):
+    """
+    Configuration for one stage of the ranking cascade.
+    
+    Attributes:
+        name: Stage name (retrieval, linear, prompt_budget, filter, full_score)
+        output_size: Maximum candidates passed to the next stage (None keeps all)
+        enabled: Whether the stage runs
+    """
+    name: str = Field(..., description="Stage name")
+    output_size: Optional[int] = Field(None, ge=1, description="Candidates passed to the next stage")
+    enabled: bool = Field(True, description="Whether the stage runs")
+
+
 class RecommendationConfig(BaseModel):
     """
     Main configuration class for the recommendation engine.
@@ -123,6 +139,11 @@ class RecommendationConfig(BaseModel):
         consistency_penalty_config: Configuration for career field consistency penalties
         max_recommendations: Maximum number of recommendations to return
         min_recommendations: Minimum number of recommendations to return
+        batch_size: Deprecated and ignored; scoring is not split into multiple calls
+        top_n_candidates: Careers the default funnel passes on to full scoring
+        prefilter_limit: Careers the default funnel keeps after linear pre-filtering
+        cascade_stages: Ordered ranking cascade; None derives the default
+            funnel from prefilter_limit and top_n_candidates (see get_cascade_stages)
     """
     scoring_weights: ScoringWeights = Field(default_factory=ScoringWeights)
     categorization_thresholds: CategorizationThresholds = Field(default_factory=CategorizationThresholds)
@@ -133,9 +154,13 @@ class RecommendationConfig(BaseModel):
     min_recommendations: int = Field(5, ge=1, le=50, description="Minimum recommendations to return")
     
     # Multi-step architecture parameters
-    batch_size: int = Field(20, ge=5, le=50, description="Batch size for multi-call scoring")
+    batch_size: int = Field(
+        20, ge=5, le=50, description="Batch size for multi-call scoring",
+        deprecated="batch_size is ignored: scoring is not split into multiple calls"
+    )
     top_n_candidates: int = Field(30, ge=10, le=100, description="Top candidates for final analysis")
     prefilter_limit: int = Field(100, ge=50, le=500, description="Maximum careers after pre-filtering (reduced to prevent prompt overflow)")
+    cascade_stages: Optional[List[CascadeStageConfig]] = Field(None, description="Ordered ranking cascade stages")
     
     def validate_config(self):
         """Validate the entire configuration."""
@@ -145,7 +170,118 @@ class RecommendationConfig(BaseModel):
         if self.min_recommendations > self.max_recommendations:
             raise ValueError("min_recommendations cannot be greater than max_recommendations")
         
+        if self.cascade_stages is not None and not any(stage.enabled for stage in self.cascade_stages):
+            raise ValueError("cascade_stages must enable at least one stage")
+        
         return self
+    
+    def get_cascade_stages(self) -> List[CascadeStageConfig]:
+        """
+        Get the ranking cascade stages in execution order.
+        
+        Without explicit cascade_stages this is the classic funnel: linear
+        pre-filter to prefilter_limit, prompt size budget, rule filters down to
+        top_n_candidates (never fewer than max_recommendations) and full scoring.
+        """
+        if self.cascade_stages is not None:
+            return self.cascade_stages
+        
+        return [
+            CascadeStageConfig(name="linear", output_size=self.prefilter_limit),
+            CascadeStageConfig(name="prompt_budget"),
+            CascadeStageConfig(name="filter", output_size=max(self.top_n_candidates, self.max_recommendations)),
+            CascadeStageConfig(name="full_score")
+        ]
+
+
+@dataclass(frozen=True)
+class CompiledConfig:
+    """
+    Precompiled, read-only view of a RecommendationConfig for the scoring hot path.
+    
+    Attributes:
+        weight_vector: (skill, interest, salary, experience) scoring weights
+        threshold_vector: (safe, stretch, adventure) zone minimums
+        penalty_table: Final consistency penalty per exploration level,
+            already multiplied and clamped to max_penalty
+        default_penalty: Penalty for exploration levels missing from the table
+        base_penalty: Consistency penalty before the exploration multiplier
+        max_penalty: Upper bound on the consistency penalty
+        exploration_multipliers: Penalty multiplier per exploration level
+        max_recommendations: Maximum number of recommendations to return
+        min_recommendations: Minimum number of recommendations to return
+        prefilter_limit: Maximum careers kept by the linear pre-filter
+        cascade_stages: Ranking cascade stages in execution order
+    """
+    weight_vector: Tuple[float, float, float, float]
+    threshold_vector: Tuple[float, float, float]
+    penalty_table: Mapping[int, float]
+    default_penalty: float
+    base_penalty: float
+    max_penalty: float
+    exploration_multipliers: Mapping[int, float]
+    max_recommendations: int
+    min_recommendations: int
+    prefilter_limit: int
+    cascade_stages: Tuple[CascadeStageConfig, ...]
+    
+    def penalty_for(self, exploration_level: int) -> float:
+        """Get the consistency penalty for an exploration level."""
+        return self.penalty_table.get(exploration_level, self.default_penalty)
+
+
+def compile_weight_vector(weights: ScoringWeights) -> Tuple[float, float, float, float]:
+    """Flatten scoring weights into a (skill, interest, salary, experience) tuple."""
+    return (
+        weights.skill_match,
+        weights.interest_match,
+        weights.salary_compatibility,
+        weights.experience_match
+    )
+
+
+def compile_penalty_table(penalty_config: ConsistencyPenaltyConfig) -> Tuple[Mapping[int, float], float]:
+    """
+    Precompute the clamped consistency penalty for every exploration level.
+    
+    Returns:
+        Tuple of (read-only level -> penalty table, penalty for unknown levels)
+    """
+    table = {
+        level: min(penalty_config.base_penalty * multiplier, penalty_config.max_penalty)
+        for level, multiplier in penalty_config.exploration_level_multiplier.items()
+    }
+    default_penalty = min(penalty_config.base_penalty, penalty_config.max_penalty)
+    return MappingProxyType(table), default_penalty
+
+
+def compile_config(config: RecommendationConfig) -> CompiledConfig:
+    """
+    Compile a validated configuration into immutable lookup vectors and tables.
+    
+    Args:
+        config: Configuration to compile
+        
+    Returns:
+        CompiledConfig for the configuration
+    """
+    thresholds = config.categorization_thresholds
+    penalty_config = config.consistency_penalty_config
+    penalty_table, default_penalty = compile_penalty_table(penalty_config)
+    
+    return CompiledConfig(
+        weight_vector=compile_weight_vector(config.scoring_weights),
+        threshold_vector=(thresholds.safe_zone_min, thresholds.stretch_zone_min, thresholds.adventure_zone_min),
+        penalty_table=penalty_table,
+        default_penalty=default_penalty,
+        base_penalty=penalty_config.base_penalty,
+        max_penalty=penalty_config.max_penalty,
+        exploration_multipliers=MappingProxyType(dict(penalty_config.exploration_level_multiplier)),
+        max_recommendations=config.max_recommendations,
+        min_recommendations=config.min_recommendations,
+        prefilter_limit=config.prefilter_limit,
+        cascade_stages=tuple(stage.model_copy() for stage in config.get_cascade_stages())
+    )
 
 
 # Default configuration instance
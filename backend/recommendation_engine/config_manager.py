@@ -0,0 +1,278 @@
+"""
+Hot configuration reload for the recommendation engine.
+
+Engines keep their configuration and component engines in an immutable
+EngineSnapshot. Reconfiguring builds a complete new snapshot (validated config,
+precompiled weight/threshold vectors and penalty tables, fresh filter, scoring
+and categorization engines) and swaps it in with a single reference assignment,
+so in-flight requests finish on the snapshot they started with.
+
+The ConfigManager validates new configurations and triggers reloads from a
+watched JSON file or from an admin endpoint.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+import logging
+import os
+import threading
+
+from .config import RecommendationConfig, CompiledConfig, compile_config
+from .filters import FilterEngine
+from .scoring import ScoringEngine
+from .categorization import CategorizationEngine
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EngineSnapshot:
+    """
+    Immutable bundle of everything an engine needs to serve one request.
+
+    The configuration is private: ``config`` hands out an editable copy, so
+    callers cannot change the live snapshot. Request paths read ``compiled``,
+    which holds everything they need without copying.
+
+    Attributes:
+        version: Monotonically increasing snapshot version
+        compiled: Precompiled vectors, tables and limits for the configuration
+        skills_db: Skills database the filter engine was built with
+        filter_engine: Filter engine for this configuration
+        scoring_engine: Scoring engine for this configuration
+        categorization_engine: Categorization engine for this configuration
+        created_at: When the snapshot was built
+    """
+    version: int
+    _config: RecommendationConfig
+    compiled: CompiledConfig
+    skills_db: tuple
+    filter_engine: FilterEngine
+    scoring_engine: ScoringEngine
+    categorization_engine: Any
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+    @property
+    def config(self) -> RecommendationConfig:
+        """Editable copy of the configuration the snapshot was built from."""
+        return self._config.model_copy(deep=True)
+
+
+def build_engine_snapshot(
+    config: RecommendationConfig,
+    skills_db: List[Any],
+    version: int = 1,
+    categorization_engine_cls=CategorizationEngine
+) -> EngineSnapshot:
+    """
+    Build a complete engine snapshot for a configuration.
+
+    Args:
+        config: Configuration to build from
+        skills_db: Database of all available skills
+        version: Version number for the snapshot
+        categorization_engine_cls: Categorization engine class to instantiate
+
+    Returns:
+        New EngineSnapshot
+    """
+    # Private copy so later mutation of the caller's object cannot leak in
+    config = config.model_copy(deep=True)
+    compiled = compile_config(config)
+    skills = tuple(skills_db)
+
+    return EngineSnapshot(
+        version=version,
+        _config=config,
+        compiled=compiled,
+        skills_db=skills,
+        filter_engine=FilterEngine(config.filtering_config, list(skills)),
+        scoring_engine=ScoringEngine(
+            config.scoring_config,
+            config.scoring_weights,
+            config.consistency_penalty_config,
+            compiled
+        ),
+        categorization_engine=categorization_engine_cls(config.categorization_thresholds, compiled)
+    )
+
+
+class ConfigManager:
+    """
+    Validates and hot-reloads recommendation engine configuration.
+
+    Reloads can come from a JSON file (polled for changes) or be applied
+    directly, e.g. from an admin endpoint. A configuration that fails
+    validation is rejected and the engine keeps serving its current snapshot.
+    """
+
+    def __init__(self, engine, config_path: Optional[str] = None, poll_interval: float = 2.0):
+        """
+        Initialize the config manager.
+
+        Args:
+            engine: Engine to reconfigure (must provide update_config)
+            config_path: Optional JSON file holding a RecommendationConfig
+            poll_interval: Seconds between file change checks when watching
+        """
+        self.engine = engine
+        self.config_path = config_path
+        self.poll_interval = poll_interval
+
+        self.reload_count = 0
+        self.last_error: Optional[str] = None
+        self.last_reload_at: Optional[datetime] = None
+
+        self._last_mtime: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._watch_thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def validate(config_data: Union[RecommendationConfig, Dict[str, Any]]) -> RecommendationConfig:
+        """
+        Validate a configuration.
+
+        Args:
+            config_data: RecommendationConfig or its dictionary form
+
+        Returns:
+            The validated RecommendationConfig
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        if isinstance(config_data, RecommendationConfig):
+            config = config_data
+        else:
+            # pydantic's ValidationError is a ValueError subclass
+            config = RecommendationConfig(**config_data)
+        return config.validate_config()
+
+    def apply(self, config_data: Union[RecommendationConfig, Dict[str, Any]]) -> EngineSnapshot:
+        """
+        Validate a configuration and atomically swap it into the engine.
+
+        Args:
+            config_data: RecommendationConfig or its dictionary form
+
+        Returns:
+            The newly active EngineSnapshot
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        try:
+            config = self.validate(config_data)
+            snapshot = self.engine.update_config(config)
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Rejected recommendation config: {e}")
+            raise
+
+        self.reload_count += 1
+        self.last_error = None
+        self.last_reload_at = datetime.utcnow()
+        logger.info(f"Recommendation config applied (snapshot version {snapshot.version})")
+        return snapshot
+
+    def reload_from_file(self, path: Optional[str] = None) -> EngineSnapshot:
+        """
+        Load, validate and apply a configuration from a JSON file.
+
+        Args:
+            path: File to load (defaults to config_path)
+
+        Returns:
+            The newly active EngineSnapshot
+
+        Raises:
+            ValueError: If no path is configured or the configuration is invalid
+            OSError: If the file cannot be read
+        """
+        path = path or self.config_path
+        if not path:
+            raise ValueError("No configuration file path configured")
+
+        try:
+            with open(path, 'r') as f:
+                config_data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.last_error = str(e)
+            logger.error(f"Could not read recommendation config from {path}: {e}")
+            raise
+
+        return self.apply(config_data)
+
+    def start_watching(self):
+        """Start polling config_path and reload whenever it changes."""
+        if not self.config_path:
+            raise ValueError("No configuration file path configured")
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return
+
+        self._last_mtime = self._get_mtime()
+        self._stop_event.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop, name="config-watcher", daemon=True
+        )
+        self._watch_thread.start()
+        logger.info(f"Watching {self.config_path} for recommendation config changes")
+
+    def stop_watching(self):
+        """Stop polling the config file."""
+        self._stop_event.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join(timeout=self.poll_interval * 2)
+            self._watch_thread = None
+
+    def check_for_changes(self) -> bool:
+        """
+        Reload the config file if it changed since the last check.
+
+        Returns:
+            True if a new configuration was applied
+        """
+        mtime = self._get_mtime()
+        if mtime is None or mtime == self._last_mtime:
+            return False
+
+        self._last_mtime = mtime
+        try:
+            self.reload_from_file()
+            return True
+        except Exception:
+            # Error already recorded; keep serving the current snapshot
+            return False
+
+    def _watch_loop(self):
+        """Poll the config file until stopped."""
+        while not self._stop_event.wait(self.poll_interval):
+            self.check_for_changes()
+
+    def _get_mtime(self) -> Optional[float]:
+        """Get the config file's modification time, or None if missing."""
+        try:
+            return os.stat(self.config_path).st_mtime
+        except (OSError, TypeError):
+            return None
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the reload status.
+
+        Returns:
+            Dictionary with the active snapshot version and reload history
+        """
+        snapshot = self.engine.snapshot
+        return {
+            "snapshot_version": snapshot.version,
+            "snapshot_created_at": snapshot.created_at.isoformat(),
+            "config_path": self.config_path,
+            "watching": self._watch_thread is not None and self._watch_thread.is_alive(),
+            "reload_count": self.reload_count,
+            "last_reload_at": self.last_reload_at.isoformat() if self.last_reload_at else None,
+            "last_error": self.last_error
+        }
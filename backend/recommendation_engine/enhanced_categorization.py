@@ -465,14 +465,22 @@ class EnhancedCategorizationEngine:
     and context-aware recommendation categorization.
     """
     
-    def __init__(self, thresholds: CategorizationThresholds):
+    def __init__(self, thresholds: CategorizationThresholds, compiled_config=None):
         """
         Initialize the enhanced categorization engine.
         
         Args:
             thresholds: Thresholds for different recommendation categories
+            compiled_config: Precompiled vectors for the same configuration; the
+                threshold vector is built from thresholds when not provided
         """
         self.thresholds = thresholds
+        
+        # (safe, stretch, adventure) zone minimums used on the hot path
+        if compiled_config is not None:
+            self.threshold_vector = compiled_config.threshold_vector
+        else:
+            self.threshold_vector = (thresholds.safe_zone_min, thresholds.stretch_zone_min, thresholds.adventure_zone_min)
     
     def categorize_recommendations(
         self, 
@@ -558,7 +566,8 @@ class EnhancedCategorizationEngine:
         seniority_gap = career_seniority_idx - user_seniority_idx
         
         # Enhanced categorization logic
-        if total_score >= self.thresholds.safe_zone_min:
+        safe_min, stretch_min, _ = self.threshold_vector
+        if total_score >= safe_min:
             if same_field and seniority_gap <= 1 and skill_score >= 0.7:
                 return RecommendationCategory.SAFE_ZONE
             elif (same_field or related_fields) and seniority_gap <= 2:
@@ -566,7 +575,7 @@ class EnhancedCategorizationEngine:
             else:
                 return RecommendationCategory.ADVENTURE_ZONE
                 
-        elif total_score >= self.thresholds.stretch_zone_min:
+        elif total_score >= stretch_min:
             if same_field and seniority_gap <= 0:
                 return RecommendationCategory.SAFE_ZONE
             elif same_field or related_fields:
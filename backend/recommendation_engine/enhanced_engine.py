@@ -8,11 +8,14 @@ in the original implementation.
 
 from typing import List, Dict, Optional
 import logging
-import json
-from .config import RecommendationConfig, DEFAULT_CONFIG
-from .filters import FilterEngine
-from .scoring import ScoringEngine
+from .config import RecommendationConfig
+from .categorization import CategorizationEngine, get_career_field
 from .enhanced_categorization import EnhancedCategorizationEngine
+from .config_manager import EngineSnapshot, build_engine_snapshot
+from .cascade import CascadeContext
+from .catalog_index import CatalogIndex
+from .executor import ScoringExecutor
+from .base_engine import BaseRecommendationEngine, MAX_PROMPT_SIZE, MAX_CAREERS_FOR_PROMPT
 
 # Import models - try both relative and absolute imports
 try:
@@ -31,12 +34,8 @@ except ImportError:
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Constants for prompt size validation
-MAX_PROMPT_SIZE = 100000  # Maximum characters in prompt (adjust based on model limits)
-MAX_CAREERS_FOR_PROMPT = 50  # Maximum number of careers to include in a single prompt
 
-
-class EnhancedRecommendationEngine:
+class EnhancedRecommendationEngine(BaseRecommendationEngine):
     """
     Enhanced recommendation engine with improved categorization accuracy.
     
@@ -51,7 +50,8 @@ class EnhancedRecommendationEngine:
         self, 
         config: Optional[RecommendationConfig] = None,
         skills_db: Optional[List[Skill]] = None,
-        use_enhanced_categorization: bool = True
+        use_enhanced_categorization: bool = True,
+        executor: Optional[ScoringExecutor] = None
     ):
         """
         Initialize the enhanced recommendation engine.
@@ -60,109 +60,96 @@ class EnhancedRecommendationEngine:
             config: Configuration for the recommendation engine
             skills_db: Database of all available skills
             use_enhanced_categorization: Whether to use enhanced categorization
+            executor: Executor for the async entry points (defaults to the shared one)
         """
-        self.config = config or DEFAULT_CONFIG
-        self.skills_db = skills_db or []
+        # Read by _build_snapshot, so set before the base class builds the first one
         self.use_enhanced_categorization = use_enhanced_categorization
+        super().__init__(config, skills_db, executor)
+    
+    def _build_snapshot(
+        self,
+        config: RecommendationConfig,
+        skills_db: List[Skill],
+        version: int
+    ) -> EngineSnapshot:
+        """Build a snapshot using the enhanced or original categorization engine."""
+        if self.use_enhanced_categorization:
+            categorization_engine_cls = EnhancedCategorizationEngine
+        else:
+            categorization_engine_cls = CategorizationEngine
         
-        # Initialize component engines
-        self.filter_engine = FilterEngine(self.config.filtering_config, self.skills_db)
-        self.scoring_engine = ScoringEngine(
-            self.config.scoring_config,
-            self.config.scoring_weights,
-            self.config.consistency_penalty_config
+        return build_engine_snapshot(config, skills_db, version, categorization_engine_cls)
+    
+    def _prefilter_candidates(
+        self,
+        context: CascadeContext,
+        candidates: List[Career],
+        features: List[Dict],
+        limit: int
+    ) -> List[Career]:
+        """Field- and seniority-aware pre-filter for the linear stage."""
+        return self._enhanced_prefilter_careers(
+            context.summarized_profile, candidates, context.user_profile, features, context.snapshot, limit=limit
         )
-        
-        # Use enhanced or original categorization engine
-        if use_enhanced_categorization:
-            self.categorization_engine = EnhancedCategorizationEngine(
-                self.config.categorization_thresholds
-            )
-        else:
-            from .categorization import CategorizationEngine
-            self.categorization_engine = CategorizationEngine(
-                self.config.categorization_thresholds
-            )
     
-    def get_recommendations(
+    def _sort_recommendations(
         self,
+        recommendations: List[CareerRecommendation],
         user_profile: UserProfile,
-        available_careers: List[Career],
-        limit: Optional[int] = None,
-        exploration_level: int = 3
+        catalog: Optional[CatalogIndex] = None
     ) -> List[CareerRecommendation]:
+        """Order recommendations with the field- and seniority-aware sort."""
+        return self._apply_enhanced_sorting(recommendations, user_profile, catalog)
+    
+    def _build_prefilter_features(self, available_careers: List[Career]) -> List[Dict]:
         """
-        Generate career recommendations using enhanced categorization.
+        Precompute the profile-independent features used by enhanced pre-filtering.
         
         Args:
-            user_profile: User's profile with skills, interests, and preferences
-            available_careers: List of all available careers to consider
-            limit: Maximum number of recommendations to return
-            exploration_level: User's exploration level (1-5) for consistency penalty
+            available_careers: Careers to extract features from
             
         Returns:
-            List of CareerRecommendation objects sorted by score with enhanced accuracy
+            One feature dictionary per career, in the same order
         """
-        logger.info(f"Starting enhanced recommendation generation for user with {len(available_careers)} available careers")
-        
-        # Step 1: Pre-process the user profile
-        summarized_profile = self._preprocess_user_profile(user_profile)
+        from .enhanced_categorization import get_enhanced_career_field, extract_seniority_level
         
-        # Step 2: Enhanced pre-filtering with field awareness
-        candidate_careers = self._enhanced_prefilter_careers(summarized_profile, available_careers, user_profile)
+        features = []
         
-        if not candidate_careers:
-            logger.warning("Enhanced pre-filtering returned no careers, falling back to traditional filtering")
-            candidate_careers = self.filter_engine.filter_careers(user_profile, available_careers)
+        for career in available_careers:
+            career_field, career_field_confidence = get_enhanced_career_field(career)
             
-            if not candidate_careers:
-                candidate_careers = self._fallback_filtering(user_profile, available_careers)
-        
-        # Step 3: Validate prompt size
-        validated_careers, was_truncated = self._validate_prompt_size(user_profile, candidate_careers)
-        
-        if was_truncated:
-            logger.warning(f"Career list was truncated from {len(candidate_careers)} to {len(validated_careers)} to prevent prompt overflow")
-        
-        # Step 4: Apply additional filtering
-        refined_careers = self.filter_engine.filter_careers(user_profile, validated_careers)
-        
-        if not refined_careers:
-            refined_careers = validated_careers
-        
-        logger.info(f"Using {len(refined_careers)} careers for enhanced scoring and categorization")
-        
-        # Step 5: Score careers
-        scores = self.scoring_engine.score_multiple_careers(user_profile, refined_careers, exploration_level)
-        
-        # Step 6: Enhanced categorization
-        recommendations = self.categorization_engine.categorize_recommendations(
-            user_profile, refined_careers, scores
-        )
-        
-        # Step 7: Apply enhanced sorting and filtering
-        recommendations = self._apply_enhanced_sorting(recommendations, user_profile)
-        
-        if limit:
-            recommendations = recommendations[:limit]
-        elif len(recommendations) > self.config.max_recommendations:
-            recommendations = recommendations[:self.config.max_recommendations]
-        
-        # Ensure minimum recommendations
-        if len(recommendations) < self.config.min_recommendations and len(available_careers) >= self.config.min_recommendations:
-            recommendations = self._ensure_minimum_recommendations(
-                user_profile, available_careers, recommendations, exploration_level
-            )
-        
-        logger.info(f"Generated {len(recommendations)} enhanced recommendations")
-        
-        return recommendations
+            career_skills = set()
+            if hasattr(career, 'requiredSkills') and career.requiredSkills:
+                career_skills.update(skill.lower() for skill in career.requiredSkills)
+            if hasattr(career, 'preferredSkills') and career.preferredSkills:
+                career_skills.update(skill.lower() for skill in career.preferredSkills)
+            
+            career_industries = set()
+            if hasattr(career, 'industry') and career.industry:
+                career_industries.add(career.industry.lower())
+            if hasattr(career, 'industries') and career.industries:
+                career_industries.update(industry.lower() for industry in career.industries)
+            
+            features.append({
+                "field": career_field,
+                "field_confidence": career_field_confidence,
+                "seniority": extract_seniority_level(career.title),
+                "skills": career_skills,
+                "industries": career_industries,
+                "text": f"{career.title} {getattr(career, 'description', '')}".lower(),
+                "career_field": get_career_field(career)
+            })
+        
+        return features
     
     def _enhanced_prefilter_careers(
         self,
         summarized_profile: Dict,
         available_careers: List[Career],
-        user_profile: UserProfile
+        user_profile: UserProfile,
+        prefilter_features: Optional[List[Dict]] = None,
+        snapshot: Optional[EngineSnapshot] = None,
+        limit: Optional[int] = None
     ) -> List[Career]:
         """
         Enhanced pre-filtering that considers career fields and seniority levels.
@@ -171,6 +158,9 @@ class EnhancedRecommendationEngine:
             summarized_profile: Summarized user profile
             available_careers: All available careers
             user_profile: Full user profile for enhanced analysis
+            prefilter_features: Precomputed features from _build_prefilter_features
+            snapshot: Engine snapshot to use (defaults to the active one)
+            limit: Maximum careers to keep (defaults to prefilter_limit)
             
         Returns:
             Filtered list of candidate careers
@@ -180,11 +170,12 @@ class EnhancedRecommendationEngine:
         # Import enhanced categorization functions
         from .enhanced_categorization import (
             determine_enhanced_user_career_field, 
-            get_enhanced_career_field,
-            extract_seniority_level,
             ENHANCED_CAREER_FIELD_CATEGORIES
         )
         
+        if prefilter_features is None:
+            prefilter_features = self._build_prefilter_features(available_careers)
+        
         # Determine user's career field and seniority
         user_field, user_field_confidence = determine_enhanced_user_career_field(user_profile)
         user_seniority = self._get_user_seniority_level(user_profile)
@@ -199,12 +190,13 @@ class EnhancedRecommendationEngine:
         # Score each career with enhanced logic
         career_scores = []
         
-        for career in available_careers:
+        for career, features in zip(available_careers, prefilter_features):
             score = 0.0
             
             # Get career field and seniority
-            career_field, career_field_confidence = get_enhanced_career_field(career)
-            career_seniority = extract_seniority_level(career.title)
+            career_field = features["field"]
+            career_field_confidence = features["field_confidence"]
+            career_seniority = features["seniority"]
             
             # Field alignment scoring (40% weight)
             if user_field == career_field:
@@ -231,11 +223,7 @@ class EnhancedRecommendationEngine:
                 score += 0.05
             
             # Skill matching (20% weight)
-            career_skills = set()
-            if hasattr(career, 'requiredSkills') and career.requiredSkills:
-                career_skills.update(skill.lower() for skill in career.requiredSkills)
-            if hasattr(career, 'preferredSkills') and career.preferredSkills:
-                career_skills.update(skill.lower() for skill in career.preferredSkills)
+            career_skills = features["skills"]
             
             if career_skills and user_skills:
                 skill_overlap = len(user_skills.intersection(career_skills))
@@ -243,11 +231,7 @@ class EnhancedRecommendationEngine:
                 score += skill_score * 0.2
             
             # Industry matching (10% weight)
-            career_industries = set()
-            if hasattr(career, 'industry') and career.industry:
-                career_industries.add(career.industry.lower())
-            if hasattr(career, 'industries') and career.industries:
-                career_industries.update(industry.lower() for industry in career.industries)
+            career_industries = features["industries"]
             
             if career_industries and user_industries:
                 industry_overlap = len(user_industries.intersection(career_industries))
@@ -255,7 +239,7 @@ class EnhancedRecommendationEngine:
                 score += industry_score * 0.1
             
             # Interest matching (5% weight)
-            career_text = f"{career.title} {getattr(career, 'description', '')}".lower()
+            career_text = features["text"]
             interest_matches = sum(1 for interest in user_interests if interest in career_text)
             if user_interests:
                 interest_score = interest_matches / len(user_interests)
@@ -267,15 +251,16 @@ class EnhancedRecommendationEngine:
         career_scores.sort(key=lambda x: x[1], reverse=True)
         
         # Take top candidates with minimum score threshold
+        prefilter_limit = limit or (snapshot or self._snapshot).compiled.prefilter_limit
         min_score_threshold = 0.15  # Minimum relevance threshold
         filtered_careers = [
             career for career, score in career_scores 
             if score >= min_score_threshold
-        ][:self.config.prefilter_limit]
+        ][:prefilter_limit]
         
         # If too few results, relax threshold
         if len(filtered_careers) < 10:
-            filtered_careers = [career for career, score in career_scores[:self.config.prefilter_limit]]
+            filtered_careers = [career for career, score in career_scores[:prefilter_limit]]
         
         logger.info(f"Enhanced pre-filtering completed: {len(filtered_careers)} careers selected from {len(available_careers)}")
         
@@ -284,7 +269,8 @@ class EnhancedRecommendationEngine:
     def _apply_enhanced_sorting(
         self, 
         recommendations: List[CareerRecommendation], 
-        user_profile: UserProfile
+        user_profile: UserProfile,
+        catalog: Optional[CatalogIndex] = None
     ) -> List[CareerRecommendation]:
         """
         Apply enhanced sorting that considers field transitions and appropriateness.
@@ -292,6 +278,7 @@ class EnhancedRecommendationEngine:
         Args:
             recommendations: List of recommendations to sort
             user_profile: User profile for context
+            catalog: Catalog index whose "field" features are reused when present
             
         Returns:
             Sorted list of recommendations
@@ -305,7 +292,11 @@ class EnhancedRecommendationEngine:
         user_seniority = self._get_user_seniority_level(user_profile)
         
         def sort_key(rec: dict):
-            career_field, _ = get_enhanced_career_field(rec['career'])
+            career = rec['career']
+            if catalog is not None and catalog.position_of(career) is not None:
+                career_field = catalog.features_for(career)["field"]
+            else:
+                career_field, _ = get_enhanced_career_field(career)
             
             # Base score
             base_score = rec['score'].total_score
@@ -347,20 +338,6 @@ class EnhancedRecommendationEngine:
         else:
             return 'junior'
     
-    def get_recommendations_by_category(
-        self,
-        user_profile: UserProfile,
-        available_careers: List[Career],
-        limit_per_category: int = 5,
-        exploration_level: int = 3
-    ) -> Dict[str, List[CareerRecommendation]]:
-        """Get recommendations organized by category using enhanced logic."""
-        all_recommendations = self.get_recommendations(user_profile, available_careers, None, exploration_level)
-        
-        return self.categorization_engine.get_top_recommendations_per_category(
-            all_recommendations, limit_per_category
-        )
-    
     def explain_recommendation(
         self,
         user_profile: UserProfile,
@@ -370,11 +347,13 @@ class EnhancedRecommendationEngine:
         """Generate detailed explanation with enhanced field analysis."""
         from .enhanced_categorization import get_enhanced_career_field, determine_enhanced_user_career_field
         
+        snapshot = self._snapshot
+        
         # Score the individual career
-        score = self.scoring_engine.score_career(user_profile, career, exploration_level)
+        score = snapshot.scoring_engine.score_career(user_profile, career, exploration_level)
         
         # Categorize it
-        recommendations = self.categorization_engine.categorize_recommendations(
+        recommendations = snapshot.categorization_engine.categorize_recommendations(
             user_profile, [career], [score]
         )
         
@@ -426,7 +405,8 @@ class EnhancedRecommendationEngine:
             exploration_level: User's exploration level (1-5)
             
         Returns:
-            A new list of refined career recommendations
+            A new list of refined career recommendations; the input
+            recommendations are left unchanged
         """
         logger.info(f"Starting recommendation refinement with prompt: '{prompt}'")
 
@@ -439,11 +419,14 @@ class EnhancedRecommendationEngine:
             # Simple keyword matching for boosting
             matches = sum(1 for keyword in prompt_keywords if keyword in career_text)
             
-            # Boost score based on matches
+            # Boost score based on matches; copy rather than mutate, the input
+            # recommendations may be shared with other requests or threads
             boost = matches * 0.1
-            rec.score.total_score = min(1.0, rec.score.total_score + boost)
+            refined_score = rec.score.model_copy(
+                update={"total_score": min(1.0, rec.score.total_score + boost)}
+            )
             
-            refined_recommendations.append(rec)
+            refined_recommendations.append(rec.model_copy(update={"score": refined_score}))
             
         # Re-sort recommendations based on new scores
         refined_recommendations.sort(key=lambda x: x.score.total_score, reverse=True)
@@ -452,164 +435,4 @@ class EnhancedRecommendationEngine:
         
         return refined_recommendations
     
-    # Include all the helper methods from the original engine
-    def _fallback_filtering(
-        self, 
-        user_profile: UserProfile, 
-        available_careers: List[Career]
-    ) -> List[Career]:
-        """Fallback filtering when initial filtering returns no results."""
-        relaxed_careers = self.filter_engine.apply_initial_filters(user_profile, available_careers)
-        
-        if relaxed_careers:
-            return relaxed_careers
-        
-        return available_careers[:self.config.max_recommendations]
-    
-    def _ensure_minimum_recommendations(
-        self,
-        user_profile: UserProfile,
-        available_careers: List[Career],
-        current_recommendations: List[CareerRecommendation],
-        exploration_level: int = 3
-    ) -> List[CareerRecommendation]:
-        """Ensure minimum number of recommendations."""
-        if len(current_recommendations) >= self.config.min_recommendations:
-            return current_recommendations
-        
-        recommended_ids = {rec.career.career_id for rec in current_recommendations}
-        remaining_careers = [
-            career for career in available_careers
-            if career.career_id not in recommended_ids
-        ]
-        
-        remaining_scores = self.scoring_engine.score_multiple_careers(
-            user_profile, remaining_careers, exploration_level
-        )
-        
-        additional_recommendations = self.categorization_engine.categorize_recommendations(
-            user_profile, remaining_careers, remaining_scores
-        )
-        
-        needed = self.config.min_recommendations - len(current_recommendations)
-        additional_recommendations.sort(key=lambda x: x.score.total_score, reverse=True)
-        
-        return current_recommendations + additional_recommendations[:needed]
-    
-    def _preprocess_user_profile(self, user_profile: UserProfile) -> Dict:
-        """Preprocess user profile for enhanced filtering."""
-        logger.info("Starting enhanced user profile preprocessing")
-        
-        summary = {
-            "key_skills": user_profile.technicalSkills[:10] if user_profile.technicalSkills else [],
-            "soft_skills": user_profile.softSkills[:5] if user_profile.softSkills else [],
-            "experience_years": user_profile.experience,
-            "primary_industries": user_profile.industries[:3] if user_profile.industries else [],
-            "career_goals": user_profile.careerGoals,
-            "interests": user_profile.interests[:5] if user_profile.interests else [],
-            "work_preferences": {
-                "workingWithData": getattr(user_profile, 'workingWithData', 3),
-                "workingWithPeople": getattr(user_profile, 'workingWithPeople', 3),
-                "creativeTasks": getattr(user_profile, 'creativeTasks', 3),
-                "problemSolving": getattr(user_profile, 'problemSolving', 3),
-                "leadership": getattr(user_profile, 'leadership', 3),
-                "physicalHandsOnWork": getattr(user_profile, 'physicalHandsOnWork', 3),
-                "mechanicalAptitude": getattr(user_profile, 'mechanicalAptitude', 3)
-            },
-            "salary_range": user_profile.salaryExpectations,
-            "education_level": user_profile.educationLevel,
-            "current_role": user_profile.currentRole,
-            "location": user_profile.location
-        }
-        
-        if hasattr(user_profile, 'resumeText') and user_profile.resumeText:
-            resume_text = user_profile.resumeText.strip()
-            if len(resume_text) > 500:
-                summary["resume_summary"] = resume_text[:500] + "..."
-            else:
-                summary["resume_summary"] = resume_text
-        else:
-            summary["resume_summary"] = ""
-        
-        logger.info(f"Enhanced user profile preprocessed: {len(summary['key_skills'])} skills, "
-                   f"{len(summary['primary_industries'])} industries")
-        
-        return summary
-    
-    def _validate_prompt_size(
-        self,
-        user_profile: UserProfile,
-        careers: List[Career],
-        max_size: int = MAX_PROMPT_SIZE
-    ) -> tuple[List[Career], bool]:
-        """Validate prompt size and truncate if necessary."""
-        logger.info(f"Validating prompt size for {len(careers)} careers")
-        
-        try:
-            prompt_data = {
-                "user_profile": {
-                    "skills": [skill.name for skill in user_profile.skills],
-                    "interests": list(user_profile.assessment_results.interests.keys()),
-                    "experience_years": sum(exp.duration_years for exp in user_profile.professional_data.experience),
-                    "salary_range": user_profile.personal_info.salary_expectations.dict() if user_profile.personal_info.salary_expectations else None,
-                    "work_values": user_profile.assessment_results.work_values,
-                    "personality_traits": user_profile.assessment_results.personality_traits
-                },
-                "careers": [
-                    {
-                        "title": career.title,
-                        "description": career.description[:200],
-                        "required_skills": [skill.name for skill in career.required_skills],
-                        "salary_range": career.salary_range.dict(),
-                        "career_field": career.career_field
-                    }
-                    for career in careers
-                ]
-            }
-            
-            estimated_size = len(json.dumps(prompt_data, default=str))
-            logger.info(f"Estimated prompt size: {estimated_size} characters")
-            
-            if estimated_size <= max_size:
-                return careers, False
-            
-            logger.warning(f"Prompt size ({estimated_size}) exceeds limit ({max_size}). Truncating careers list.")
-            
-            # Binary search for optimal career count
-            left, right = 1, len(careers)
-            best_count = min(MAX_CAREERS_FOR_PROMPT, len(careers))
-            
-            while left <= right:
-                mid = (left + right) // 2
-                test_careers = careers[:mid]
-                
-                test_data = prompt_data.copy()
-                test_data["careers"] = [
-                    {
-                        "title": career.title,
-                        "description": career.description[:200],
-                        "required_skills": [skill.name for skill in career.required_skills],
-                        "salary_range": career.salary_range.dict(),
-                        "career_field": career.career_field
-                    }
-                    for career in test_careers
-                ]
-                
-                test_size = len(json.dumps(test_data, default=str))
-                
-                if test_size <= max_size:
-                    best_count = mid
-                    left = mid + 1
-                else:
-                    right = mid - 1
-            
-            truncated_careers = careers[:best_count]
-            logger.warning(f"Truncated careers list from {len(careers)} to {len(truncated_careers)} careers")
-            
-            return truncated_careers, True
-            
-        except Exception as e:
-            logger.error(f"Error during prompt size validation: {e}")
-            fallback_limit = min(MAX_CAREERS_FOR_PROMPT, len(careers))
-            logger.warning(f"Using fallback limit of {fallback_limit} careers due to validation error")
-            return careers[:fallback_limit], len(careers) > fallback_limit
\ No newline at end of file
+    # Include all the helper methods from the original engine
\ No newline at end of file
@@ -8,6 +8,7 @@ and prevents cross-industry/experience level mismatches.
 
 from typing import List, Dict, Set, Optional
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from .models import UserProfile, Career, Skill, SkillLevel, InterestLevel, ExperienceLevel
 from .config import FilteringConfig
 from enum import Enum
@@ -44,8 +45,10 @@ class EnhancedFilterEngine:
     def __init__(self, config: FilteringConfig, skills_db: List[Skill]):
         """Initialize the enhanced filter engine."""
         self.config = config
-        self.skills_db = {skill.skill_id: skill for skill in skills_db}
-        self.skill_name_to_id = {skill.name.lower(): skill.skill_id for skill in skills_db}
+        
+        # Read-only lookups; engines are shared across scoring threads
+        self.skills_db = MappingProxyType({skill.skill_id: skill for skill in skills_db})
+        self.skill_name_to_id = MappingProxyType({skill.name.lower(): skill.skill_id for skill in skills_db})
         
         # Define industry mappings
         self.career_industry_mapping = self._build_career_industry_mapping()
@@ -0,0 +1,501 @@
+"""
+Offline recall/latency evaluation of candidate-generation strategies.
+
+Exhaustive ScoringEngine scoring over the whole catalog is the ground truth: for
+every profile in a corpus we take its top-K careers and measure how many of them
+each pre-filter or retrieval strategy keeps (recall@K), and how long the strategy
+takes. The resulting table shows how far candidate sets can shrink before good
+careers start being dropped.
+
+Usage (from the backend directory):
+    python -m recommendation_engine.evaluation --profiles 50 --careers 500 --k 20
+    python -m recommendation_engine.evaluation --assessments exported_profiles.json --plot recall.png
+
+The profile corpus is synthetic by default. Stored assessments can be added as a
+JSON export of user profiles; identifying fields are stripped on load.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from dataclasses import dataclass
+import argparse
+import hashlib
+import json
+import logging
+import random
+import statistics
+import time
+
+from .config import RecommendationConfig
+from .cascade import CascadeContext, InvertedIndexRetrievalStage
+from .mock_data import (
+    Career, RequiredSkill, SalaryRange, UserProfile, PersonalInfo,
+    AssessmentResults, ProfessionalData, UserSkill, create_mock_skills
+)
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# A strategy maps (engine, profile, careers) to the candidate careers it keeps
+Strategy = Callable[[Any, Any, List[Any]], List[Any]]
+
+
+class EvaluationCareer(Career):
+    """Mock career that also carries the catalog fields pre-filtering reads."""
+    requiredSkills: List[str] = []
+    preferredSkills: List[str] = []
+    industry: str = ""
+
+
+# Vocabulary for synthetic careers and profiles, per career field
+FIELD_VOCABULARY = {
+    "technology_it": {
+        "industry": "Technology",
+        "titles": ["Software Engineer", "Data Scientist", "DevOps Engineer", "Data Analyst", "Security Engineer"],
+        "skills": ["Python", "SQL", "JavaScript", "AWS", "Machine Learning", "Docker", "Data Analysis", "Linux"],
+        "keywords": ["cloud", "data", "automation", "ai ethics", "data privacy"]
+    },
+    "healthcare": {
+        "industry": "Healthcare",
+        "titles": ["Registered Nurse", "Health Informatics Specialist", "Physical Therapist", "Clinical Coordinator"],
+        "skills": ["Patient Care", "Medical Terminology", "EHR Systems", "Clinical Research", "CPR"],
+        "keywords": ["patients", "clinical", "wellness", "care"]
+    },
+    "business_finance": {
+        "industry": "Finance",
+        "titles": ["Financial Analyst", "Accountant", "Risk Manager", "Business Analyst", "Controller"],
+        "skills": ["Excel", "Financial Modeling", "SQL", "Accounting", "Forecasting", "Data Analysis"],
+        "keywords": ["markets", "budget", "risk", "investment"]
+    },
+    "creative_arts": {
+        "industry": "Media",
+        "titles": ["Graphic Designer", "UX Designer", "Content Strategist", "Video Producer"],
+        "skills": ["Figma", "Adobe Creative Suite", "Storytelling", "Copywriting", "User Research"],
+        "keywords": ["design", "brand", "creative", "storytelling"]
+    },
+    "skilled_trades": {
+        "industry": "Construction",
+        "titles": ["Electrician", "HVAC Technician", "Welder", "Construction Manager"],
+        "skills": ["Blueprint Reading", "Electrical Systems", "Welding", "Safety Compliance", "Project Scheduling"],
+        "keywords": ["hands-on", "building", "sustainable technology", "field work"]
+    }
+}
+
+
+def generate_synthetic_careers(count: int, seed: int = 0) -> List[EvaluationCareer]:
+    """
+    Generate a reproducible synthetic career catalog.
+
+    Args:
+        count: Number of careers
+        seed: Random seed
+
+    Returns:
+        List of EvaluationCareer objects
+    """
+    rng = random.Random(seed)
+    skill_ids = {skill.name: skill.skill_id for skill in create_mock_skills()}
+    fields = sorted(FIELD_VOCABULARY)
+    careers = []
+
+    for i in range(count):
+        field = fields[i % len(fields)]
+        vocabulary = FIELD_VOCABULARY[field]
+        seniority = rng.choice(["Junior", "", "Senior", "Lead"])
+        title = f"{seniority} {rng.choice(vocabulary['titles'])}".strip()
+        skills = rng.sample(vocabulary["skills"], k=min(4, len(vocabulary["skills"])))
+        keywords = rng.sample(vocabulary["keywords"], k=2)
+        base_salary = rng.randrange(40000, 150000, 5000)
+
+        careers.append(EvaluationCareer(
+            career_id=f"synthetic_career_{i}",
+            title=title,
+            description=f"{title} working on {keywords[0]} and {keywords[1]}.",
+            required_skills=[
+                RequiredSkill(
+                    skill_id=skill_ids.get(name, f"synthetic_{name.lower().replace(' ', '_')}"),
+                    name=name,
+                    proficiency=rng.choice(["beginner", "intermediate", "advanced"]),
+                    is_mandatory=j < 2
+                )
+                for j, name in enumerate(skills)
+            ],
+            salary_range=SalaryRange(min=base_salary, max=base_salary + rng.randrange(10000, 60000, 5000)),
+            demand=rng.choice(["low", "medium", "high", "very_high"]),
+            related_careers=[],
+            growth_potential="Steady growth",
+            work_environment="Office",
+            education_requirements="Bachelor's degree",
+            career_field=field,
+            requiredSkills=skills[:2],
+            preferredSkills=skills[2:],
+            industry=vocabulary["industry"]
+        ))
+
+    return careers
+
+
+def generate_synthetic_profiles(count: int, seed: int = 0) -> List[UserProfile]:
+    """
+    Generate reproducible synthetic user profiles, mostly within one field.
+
+    Args:
+        count: Number of profiles
+        seed: Random seed
+
+    Returns:
+        List of UserProfile objects
+    """
+    rng = random.Random(seed + 1)
+    fields = sorted(FIELD_VOCABULARY)
+    profiles = []
+
+    for i in range(count):
+        home = FIELD_VOCABULARY[rng.choice(fields)]
+        other = FIELD_VOCABULARY[rng.choice(fields)]
+        skills = rng.sample(home["skills"], k=3) + rng.sample(other["skills"], k=1)
+        interests = rng.sample(home["keywords"], k=2)
+        years = round(rng.uniform(0, 15), 1)
+        salary_min = rng.randrange(40000, 140000, 5000)
+
+        profiles.append(UserProfile(
+            user_id=f"synthetic_user_{i}",
+            personal_info=PersonalInfo(
+                age=22 + int(years),
+                location="",
+                salary_expectations=SalaryRange(min=salary_min, max=salary_min + 30000),
+                willing_to_relocate=rng.random() < 0.5,
+                preferred_work_style="hybrid"
+            ),
+            assessment_results=AssessmentResults(
+                personality_traits=[],
+                work_values=[],
+                interests={interest: "high" for interest in interests}
+            ),
+            professional_data=ProfessionalData(
+                resume_skills=skills,
+                linkedin_skills=[],
+                experience=[],
+                education="Bachelor's degree",
+                certifications=[]
+            ),
+            skills=[
+                UserSkill(
+                    skill_id=f"synthetic_{name.lower().replace(' ', '_')}",
+                    name=name,
+                    level=rng.choice(["beginner", "intermediate", "advanced", "expert"]),
+                    years_experience=min(years, rng.uniform(0.5, 10))
+                )
+                for name in skills
+            ],
+            user_interests=interests,
+            technicalSkills=skills,
+            experience=years,
+            industries=[home["industry"]],
+            interests=interests,
+            salaryExpectations={"min": salary_min, "max": salary_min + 30000, "currency": "USD"},
+            currentRole=rng.choice(home["titles"])
+        ))
+
+    return profiles
+
+
+# Fields that identify a person and are dropped from stored assessments
+IDENTIFYING_FIELDS = ("name", "email", "phone", "location", "resumeText", "linkedin_url")
+
+
+def anonymize_profile(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Strip identifying fields from an exported profile.
+
+    Args:
+        data: Profile dictionary as exported from storage
+
+    Returns:
+        Copy with identifying fields removed and a hashed user_id
+    """
+    anonymized = {key: value for key, value in data.items() if key not in IDENTIFYING_FIELDS}
+    user_id = str(data.get("user_id", ""))
+    anonymized["user_id"] = "anon_" + hashlib.sha256(user_id.encode()).hexdigest()[:12]
+
+    personal_info = anonymized.get("personal_info")
+    if isinstance(personal_info, dict):
+        anonymized["personal_info"] = {**personal_info, "location": ""}
+
+    return anonymized
+
+
+def load_assessment_profiles(path: str) -> List[UserProfile]:
+    """
+    Load and anonymize stored assessment profiles from a JSON export.
+
+    Args:
+        path: JSON file containing a list of profile dictionaries
+
+    Returns:
+        List of UserProfile objects
+    """
+    with open(path, 'r') as f:
+        records = json.load(f)
+
+    profiles = []
+    for record in records:
+        try:
+            profiles.append(UserProfile(**anonymize_profile(record)))
+        except ValueError as e:
+            logger.warning(f"Skipping stored profile that does not match the profile schema: {e}")
+
+    return profiles
+
+
+def exhaustive_top_k(engine, user_profile, careers: List[Any], k: int, exploration_level: int = 3) -> List[Any]:
+    """
+    Ground truth: the top-K careers by full ScoringEngine score over the whole catalog.
+
+    Args:
+        engine: Recommendation engine supplying the scoring snapshot
+        user_profile: Profile to score
+        careers: Complete career catalog
+        k: Number of careers to keep
+        exploration_level: User's exploration level (1-5)
+
+    Returns:
+        The K best careers, best first
+    """
+    scores = engine.snapshot.scoring_engine.score_multiple_careers(user_profile, careers, exploration_level)
+    ranked = sorted(zip(careers, scores), key=lambda pair: pair[1].total_score, reverse=True)
+    return [career for career, _ in ranked[:k]]
+
+
+def prefilter_strategy(limit: int) -> Strategy:
+    """The engine's linear pre-filter cut to ``limit`` careers."""
+    def run(engine, user_profile, careers):
+        summary = engine._preprocess_user_profile(user_profile)
+        features = engine._catalog_index.get(careers).features
+        return engine._prefilter_careers(summary, careers, features, limit=limit)
+    return run
+
+
+def enhanced_prefilter_strategy(limit: int) -> Strategy:
+    """The enhanced engine's field/seniority-aware pre-filter cut to ``limit`` careers."""
+    engines = {}
+
+    def run(engine, user_profile, careers):
+        from .enhanced_engine import EnhancedRecommendationEngine
+
+        enhanced = engines.get(id(engine))
+        if enhanced is None:
+            enhanced = EnhancedRecommendationEngine(engine.config, engine.skills_db, executor=engine.executor)
+            engines[id(engine)] = enhanced
+
+        summary = enhanced._preprocess_user_profile(user_profile)
+        features = enhanced._catalog_index.get(careers).features
+        return enhanced._enhanced_prefilter_careers(summary, careers, user_profile, features, limit=limit)
+    return run
+
+
+def retrieval_strategy(limit: Optional[int]) -> Strategy:
+    """Inverted-index retrieval on skill/industry tokens, cut to ``limit`` careers."""
+    stage = InvertedIndexRetrievalStage(limit)
+
+    def run(engine, user_profile, careers):
+        context = CascadeContext(
+            user_profile=user_profile,
+            summarized_profile=engine._preprocess_user_profile(user_profile),
+            exploration_level=3,
+            snapshot=engine.snapshot,
+            catalog=engine._catalog_index.get(careers)
+        )
+        return stage.run(context, careers)
+    return run
+
+
+def cascade_strategy() -> Strategy:
+    """The engine's full configured ranking cascade."""
+    def run(engine, user_profile, careers):
+        _, result = engine.run_cascade(user_profile, careers)
+        return result.candidates
+    return run
+
+
+def default_strategies(sizes: Sequence[int] = (25, 50, 100)) -> Dict[str, Strategy]:
+    """
+    Get the standard set of strategies at several candidate set sizes.
+
+    Args:
+        sizes: Candidate set sizes to compare
+
+    Returns:
+        Strategy per display name
+    """
+    strategies = {}
+    for size in sizes:
+        strategies[f"prefilter@{size}"] = prefilter_strategy(size)
+        strategies[f"enhanced_prefilter@{size}"] = enhanced_prefilter_strategy(size)
+        strategies[f"retrieval@{size}"] = retrieval_strategy(size)
+    strategies["cascade"] = cascade_strategy()
+    return strategies
+
+
+@dataclass
+class StrategyResult:
+    """Recall and latency of one strategy over the profile corpus."""
+    name: str
+    mean_recall: float
+    min_recall: float
+    mean_candidates: float
+    mean_latency_ms: float
+    p95_latency_ms: float
+    failures: int = 0
+
+
+def evaluate_strategies(
+    engine,
+    profiles: List[Any],
+    careers: List[Any],
+    strategies: Dict[str, Strategy],
+    k: int = 20,
+    exploration_level: int = 3
+) -> List[StrategyResult]:
+    """
+    Measure recall@K and latency of each strategy against exhaustive scoring.
+
+    Args:
+        engine: Recommendation engine to evaluate
+        profiles: Profile corpus
+        careers: Complete career catalog
+        strategies: Strategy per display name
+        k: Size of the ground-truth top list
+        exploration_level: Exploration level used for ground-truth scoring
+
+    Returns:
+        One StrategyResult per strategy, in input order
+    """
+    truths = [
+        {id(career) for career in exhaustive_top_k(engine, profile, careers, k, exploration_level)}
+        for profile in profiles
+    ]
+
+    results = []
+    for name, strategy in strategies.items():
+        recalls, sizes, latencies = [], [], []
+        failures = 0
+
+        for profile, truth in zip(profiles, truths):
+            started = time.perf_counter()
+            try:
+                candidates = strategy(engine, profile, careers)
+            except Exception as e:
+                logger.warning(f"Strategy {name} failed for {getattr(profile, 'user_id', '?')}: {e}")
+                failures += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+            sizes.append(len(candidates))
+            kept = truth.intersection(id(career) for career in candidates)
+            recalls.append(len(kept) / len(truth) if truth else 1.0)
+
+        if not recalls:
+            results.append(StrategyResult(name, 0.0, 0.0, 0.0, 0.0, 0.0, failures))
+            continue
+
+        latencies.sort()
+        results.append(StrategyResult(
+            name=name,
+            mean_recall=statistics.mean(recalls),
+            min_recall=min(recalls),
+            mean_candidates=statistics.mean(sizes),
+            mean_latency_ms=statistics.mean(latencies),
+            p95_latency_ms=latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+            failures=failures
+        ))
+
+    return results
+
+
+def format_results_table(results: List[StrategyResult], k: int) -> str:
+    """
+    Format results as a Markdown table.
+
+    Args:
+        results: Evaluation results
+        k: Ground-truth list size (for the column header)
+
+    Returns:
+        Markdown table
+    """
+    lines = [
+        f"| strategy | recall@{k} | min recall | candidates | mean ms | p95 ms | failures |",
+        "|---|---|---|---|---|---|---|"
+    ]
+    for result in results:
+        lines.append(
+            f"| {result.name} | {result.mean_recall:.3f} | {result.min_recall:.3f} | "
+            f"{result.mean_candidates:.1f} | {result.mean_latency_ms:.2f} | "
+            f"{result.p95_latency_ms:.2f} | {result.failures} |"
+        )
+    return "\n".join(lines)
+
+
+def plot_results(results: List[StrategyResult], path: str, k: int):
+    """
+    Save a recall-vs-latency scatter plot (requires matplotlib).
+
+    Args:
+        results: Evaluation results
+        path: Output image path
+        k: Ground-truth list size (for the axis label)
+    """
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError as e:
+        raise ImportError("Plotting requires matplotlib. Install with: pip install matplotlib") from e
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for result in results:
+        ax.scatter(result.mean_latency_ms, result.mean_recall)
+        ax.annotate(result.name, (result.mean_latency_ms, result.mean_recall), fontsize=8)
+    ax.set_xlabel("mean latency (ms)")
+    ax.set_ylabel(f"recall@{k}")
+    ax.set_ylim(0, 1.05)
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Recall@K / latency evaluation of candidate-generation strategies")
+    parser.add_argument("--profiles", type=int, default=50, help="Number of synthetic profiles")
+    parser.add_argument("--careers", type=int, default=500, help="Number of synthetic careers")
+    parser.add_argument("--assessments", help="JSON export of stored assessment profiles to add to the corpus")
+    parser.add_argument("--k", type=int, default=20, help="Ground-truth top-K size")
+    parser.add_argument("--sizes", default="25,50,100", help="Comma-separated candidate set sizes")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for synthetic data")
+    parser.add_argument("--plot", help="Write a recall/latency plot to this path")
+    args = parser.parse_args(argv)
+
+    from .engine import RecommendationEngine
+
+    careers = generate_synthetic_careers(args.careers, args.seed)
+    profiles = generate_synthetic_profiles(args.profiles, args.seed)
+    if args.assessments:
+        profiles += load_assessment_profiles(args.assessments)
+
+    engine = RecommendationEngine(config=RecommendationConfig(), skills_db=create_mock_skills())
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+
+    results = evaluate_strategies(engine, profiles, careers, default_strategies(sizes), k=args.k)
+
+    print(f"{len(profiles)} profiles x {len(careers)} careers, ground truth = exhaustive top-{args.k}\n")
+    print(format_results_table(results, args.k))
+
+    if args.plot:
+        plot_results(results, args.plot, args.k)
+        print(f"\nPlot written to {args.plot}")
+
+
+if __name__ == "__main__":
+    main()
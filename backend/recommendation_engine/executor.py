@@ -0,0 +1,239 @@
+"""
+Bounded executor for running CPU-bound scoring off the event loop.
+
+The FastAPI handlers are ``async def`` but recommendation generation is pure
+CPU work. This module provides a dedicated, bounded thread pool with queue-depth
+metrics and backpressure so that scoring never runs on the event loop thread and
+an overloaded worker rejects work quickly instead of queueing it without limit.
+"""
+
+from typing import Any, Callable, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Defaults can be overridden per deployment without code changes
+DEFAULT_MAX_WORKERS = int(os.getenv("SCORING_MAX_WORKERS", "4"))
+DEFAULT_MAX_QUEUE_DEPTH = int(os.getenv("SCORING_MAX_QUEUE_DEPTH", "32"))
+
+
+class EngineOverloadedError(RuntimeError):
+    """Raised when the scoring executor cannot accept more work."""
+
+
+class ScoringExecutor:
+    """
+    Bounded thread pool for recommendation scoring.
+
+    Work is admitted only while the number of queued plus running jobs is below
+    ``max_workers + max_queue_depth``; beyond that ``run`` raises
+    ``EngineOverloadedError`` immediately so callers can shed load (HTTP 503).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH,
+        thread_name_prefix: str = "scoring"
+    ):
+        """
+        Initialize the scoring executor.
+
+        Args:
+            max_workers: Number of scoring threads
+            max_queue_depth: Maximum jobs allowed to wait for a free thread
+            thread_name_prefix: Prefix for worker thread names
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue_depth < 0:
+            raise ValueError("max_queue_depth cannot be negative")
+
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.thread_name_prefix = thread_name_prefix
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # Counters are only touched while holding self._lock
+        self._pending = 0
+        self._running = 0
+        self._peak_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._cancelled = 0
+        self._total_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of jobs admitted at once (running + queued)."""
+        return self.max_workers + self.max_queue_depth
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run ``func(*args, **kwargs)`` on a scoring thread and await its result.
+
+        Args:
+            func: Blocking callable to execute
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            EngineOverloadedError: If the executor is at capacity
+        """
+        with self._lock:
+            if self._pending >= self.capacity:
+                self._rejected += 1
+                raise EngineOverloadedError(
+                    f"Scoring executor at capacity ({self._pending}/{self.capacity} jobs)"
+                )
+            self._pending += 1
+            self._submitted += 1
+            queue_depth = self._pending - self._running
+            self._peak_queue_depth = max(self._peak_queue_depth, queue_depth)
+
+        enqueued_at = time.perf_counter()
+        # Shared with the worker; both fields are only touched under self._lock
+        state = {"started": False, "abandoned": False}
+        job = functools.partial(self._execute, func, enqueued_at, state, args, kwargs)
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._get_executor(), job)
+        except RuntimeError:
+            # The pool refused the job (e.g. after shutdown) - release the slot
+            with self._lock:
+                self._pending -= 1
+            raise
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # A job cancelled while still queued never reaches ``_execute``, so
+            # its slot has to be released here. Jobs that already started
+            # release their own slot when they finish.
+            with self._lock:
+                if not state["started"] and not state["abandoned"]:
+                    state["abandoned"] = True
+                    self._pending -= 1
+                    self._cancelled += 1
+            raise
+
+    def _execute(
+        self,
+        func: Callable[..., Any],
+        enqueued_at: float,
+        state: Dict[str, bool],
+        args: tuple,
+        kwargs: dict
+    ) -> Any:
+        """Execute a job on a worker thread, keeping the counters up to date."""
+        started_at = time.perf_counter()
+        with self._lock:
+            if state["abandoned"]:
+                # The awaiter was cancelled and already released this slot
+                return None
+            state["started"] = True
+            self._running += 1
+            self._total_wait_seconds += started_at - enqueued_at
+
+        succeeded = False
+        try:
+            result = func(*args, **kwargs)
+            succeeded = True
+            return result
+        finally:
+            # Slots are released here rather than in ``run`` so that a cancelled
+            # awaiter does not free capacity while its job is still executing.
+            with self._lock:
+                self._running -= 1
+                self._pending -= 1
+                self._total_run_seconds += time.perf_counter() - started_at
+                if succeeded:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the underlying thread pool on first use."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix
+                    )
+        return self._executor
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of executor metrics.
+
+        Returns:
+            Dictionary with queue depth, utilization and timing counters
+        """
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_depth": self.max_queue_depth,
+                "running": self._running,
+                "queue_depth": self._pending - self._running,
+                "peak_queue_depth": self._peak_queue_depth,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "cancelled": self._cancelled,
+                "average_wait_ms": (self._total_wait_seconds / finished * 1000) if finished else 0.0,
+                "average_run_ms": (self._total_run_seconds / finished * 1000) if finished else 0.0
+            }
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shut down the underlying thread pool.
+
+        Args:
+            wait: Whether to wait for running jobs to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_default_executor: Optional[ScoringExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_executor() -> ScoringExecutor:
+    """
+    Get the process-wide scoring executor shared by all engines.
+
+    Returns:
+        The shared ScoringExecutor instance
+    """
+    global _default_executor
+    if _default_executor is None:
+        with _default_executor_lock:
+            if _default_executor is None:
+                _default_executor = ScoringExecutor()
+                logger.info(
+                    f"Scoring executor initialized: workers={_default_executor.max_workers}, "
+                    f"max_queue_depth={_default_executor.max_queue_depth}"
+                )
+    return _default_executor
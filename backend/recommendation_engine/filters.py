@@ -5,8 +5,9 @@ This module implements multi-stage filtering to narrow down career recommendatio
 based on user preferences, skills, and interests.
 """
 
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, FrozenSet, Set, Optional, Tuple
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 # Import models - try both relative and absolute imports
 try:
@@ -24,6 +25,7 @@ except ImportError:
         InterestLevel = Any
 
 from .config import FilteringConfig
+from .catalog_index import CatalogIndex
 
 
 class FilterEngine:
@@ -45,22 +47,31 @@ class FilterEngine:
             skills_db: Database of all available skills for related skill lookup
         """
         self.config = config
-        self.skills_db = {skill.skill_id: skill for skill in skills_db}
-        self.skill_name_to_id = {skill.name.lower(): skill.skill_id for skill in skills_db}
+        
+        # Read-only lookups; engines are shared across scoring threads
+        self.skills_db = MappingProxyType({skill.skill_id: skill for skill in skills_db})
+        self.skill_name_to_id = MappingProxyType({skill.name.lower(): skill.skill_id for skill in skills_db})
     
-    def filter_careers(self, user_profile: UserProfile, careers: List[Career]) -> List[Career]:
+    def filter_careers(
+        self,
+        user_profile: UserProfile,
+        careers: List[Career],
+        catalog: Optional[CatalogIndex] = None
+    ) -> List[Career]:
         """
         Apply all filtering stages to get relevant careers for the user.
         
         Args:
             user_profile: User's profile with preferences and skills
             careers: List of all available careers
+            catalog: Optional catalog index holding the careers, used for
+                indexed salary window filtering
             
         Returns:
             List of filtered careers that match user criteria
         """
         # Stage 1: Initial filtering
-        filtered_careers = self.apply_initial_filters(user_profile, careers)
+        filtered_careers = self.apply_initial_filters(user_profile, careers, catalog)
         
         # Stage 2: Skill-based filtering
         filtered_careers = self.apply_skill_filters(user_profile, filtered_careers)
@@ -70,22 +81,37 @@ class FilterEngine:
         
         return filtered_careers
     
-    def apply_initial_filters(self, user_profile: UserProfile, careers: List[Career]) -> List[Career]:
+    def apply_initial_filters(
+        self,
+        user_profile: UserProfile,
+        careers: List[Career],
+        catalog: Optional[CatalogIndex] = None
+    ) -> List[Career]:
         """
         Apply initial filters based on salary expectations and basic preferences.
         
+        With a catalog index, the salary-compatible careers are looked up in its
+        interval index instead of testing each career; careers the index does
+        not cover are still tested one by one.
+        
         Args:
             user_profile: User's profile with salary expectations
             careers: List of careers to filter
+            catalog: Optional catalog index holding the careers
             
         Returns:
             List of careers that pass initial filtering
         """
         filtered_careers = []
+        compatible = self._indexed_salary_compatible(user_profile, catalog)
         
         for career in careers:
             # Check salary compatibility
-            if not self._is_salary_compatible(user_profile, career):
+            position = catalog.position_of(career) if compatible is not None else None
+            if position is not None and position in catalog.ranges.items:
+                if position not in compatible:
+                    continue
+            elif not self._is_salary_compatible(user_profile, career):
                 continue
             
             # Add other initial filters here (location, work style, etc.)
@@ -110,13 +136,13 @@ class FilterEngine:
         user_skills = self._get_user_skill_set(user_profile)
         
         for career in careers:
-            skill_overlap = self._calculate_skill_overlap(user_profile, career)
+            skill_overlap = self._calculate_skill_overlap(user_profile, career, user_skills)
             
             # Check if skill overlap meets minimum threshold
             if skill_overlap >= self.config.min_skill_overlap:
                 filtered_careers.append(career)
             # Also include careers where user has all mandatory skills
-            elif self._has_mandatory_skills(user_profile, career):
+            elif self._has_mandatory_skills(user_profile, career, user_skills):
                 filtered_careers.append(career)
         
         return filtered_careers
@@ -148,6 +174,37 @@ class FilterEngine:
         
         return filtered_careers
     
+    def _salary_window(self, user_profile: UserProfile) -> Optional[Tuple[float, float]]:
+        """Get the user's salary window widened by the allowed deviation, if any."""
+        user_salary = user_profile.personal_info.salary_expectations
+        if not user_salary:
+            return None
+        return (
+            user_salary.min * (1 - self.config.max_salary_deviation),
+            user_salary.max * (1 + self.config.max_salary_deviation)
+        )
+    
+    def _indexed_salary_compatible(
+        self,
+        user_profile: UserProfile,
+        catalog: Optional[CatalogIndex]
+    ) -> Optional[FrozenSet[int]]:
+        """
+        Look up the salary-compatible catalog positions in the interval index.
+        
+        Returns:
+            Compatible positions (careers in other currencies included), or None
+            if there is no index to use
+        """
+        window = self._salary_window(user_profile)
+        if catalog is None or catalog.ranges is None or window is None:
+            return None
+        return catalog.ranges.query(
+            salary=window,
+            currency=user_profile.personal_info.salary_expectations.currency,
+            include_other_currencies=True
+        )
+    
     def _is_salary_compatible(self, user_profile: UserProfile, career: Career) -> bool:
         """
         Check if career salary range is compatible with user expectations.
@@ -170,8 +227,7 @@ class FilterEngine:
             return True  # For now, assume compatible if different currencies
         
         # Calculate overlap considering deviation tolerance
-        user_min = user_salary.min * (1 - self.config.max_salary_deviation)
-        user_max = user_salary.max * (1 + self.config.max_salary_deviation)
+        user_min, user_max = self._salary_window(user_profile)
         
         # Check if there's any overlap between ranges
         return not (career_salary.max < user_min or career_salary.min > user_max)
@@ -228,13 +284,19 @@ class FilterEngine:
         
         return related_skills
     
-    def _calculate_skill_overlap(self, user_profile: UserProfile, career: Career) -> float:
+    def _calculate_skill_overlap(
+        self,
+        user_profile: UserProfile,
+        career: Career,
+        user_skills: Optional[Set[str]] = None
+    ) -> float:
         """
         Calculate the overlap between user skills and career requirements.
         
         Args:
             user_profile: User profile with skills
             career: Career with required skills
+            user_skills: Precomputed _get_user_skill_set(user_profile)
             
         Returns:
             Skill overlap ratio (0.0 to 1.0)
@@ -242,7 +304,8 @@ class FilterEngine:
         if not career.required_skills:
             return 1.0  # No requirements means perfect match
         
-        user_skills = self._get_user_skill_set(user_profile)
+        if user_skills is None:
+            user_skills = self._get_user_skill_set(user_profile)
         required_skills = {skill.name.lower() for skill in career.required_skills}
         
         if not required_skills:
@@ -251,18 +314,25 @@ class FilterEngine:
         overlap = len(user_skills.intersection(required_skills))
         return overlap / len(required_skills)
     
-    def _has_mandatory_skills(self, user_profile: UserProfile, career: Career) -> bool:
+    def _has_mandatory_skills(
+        self,
+        user_profile: UserProfile,
+        career: Career,
+        user_skills: Optional[Set[str]] = None
+    ) -> bool:
         """
         Check if user has all mandatory skills for the career.
         
         Args:
             user_profile: User profile with skills
             career: Career with required skills
+            user_skills: Precomputed _get_user_skill_set(user_profile)
             
         Returns:
             True if user has all mandatory skills
         """
-        user_skills = self._get_user_skill_set(user_profile)
+        if user_skills is None:
+            user_skills = self._get_user_skill_set(user_profile)
         mandatory_skills = {
             skill.name.lower() for skill in career.required_skills 
             if skill.is_mandatory
@@ -0,0 +1,220 @@
+"""
+Interval indexes for salary and experience windows.
+
+Salary compatibility is an overlap test between the user's window and each
+career's range. Instead of testing every career, a catalog builds one static
+interval tree per dimension and answers "which careers overlap this window" in
+O(log n + matches). Indexes are immutable once built and safe to share between
+scoring threads.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
+from types import MappingProxyType
+
+Window = Tuple[float, float]
+
+
+class IntervalTree:
+    """
+    Static augmented interval tree over closed intervals.
+
+    Intervals are sorted by their low end and laid out as an implicit balanced
+    tree (the middle of each slice is its root); every node stores the highest
+    high end in its subtree so whole subtrees that end before a query window
+    are skipped.
+    """
+
+    __slots__ = ("_lows", "_highs", "_items", "_max_highs")
+
+    def __init__(self, intervals: Iterable[Tuple[float, float, Any]]):
+        """
+        Build the tree.
+
+        Args:
+            intervals: (low, high, item) triples; low must not exceed high
+        """
+        entries = sorted(intervals, key=lambda entry: (entry[0], entry[1]))
+        self._lows = tuple(entry[0] for entry in entries)
+        self._highs = tuple(entry[1] for entry in entries)
+        self._items = tuple(entry[2] for entry in entries)
+
+        max_highs = [0.0] * len(entries)
+        stack = [(0, len(entries), False)]
+        while stack:
+            start, end, children_done = stack.pop()
+            if start >= end:
+                continue
+            middle = (start + end) // 2
+            if not children_done:
+                stack.append((start, end, True))
+                stack.append((start, middle, False))
+                stack.append((middle + 1, end, False))
+                continue
+            highest = self._highs[middle]
+            if start < middle:
+                highest = max(highest, max_highs[(start + middle) // 2])
+            if middle + 1 < end:
+                highest = max(highest, max_highs[(middle + 1 + end) // 2])
+            max_highs[middle] = highest
+        self._max_highs = tuple(max_highs)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def overlapping(self, low: float, high: float) -> List[Any]:
+        """
+        Get the items whose interval overlaps [low, high].
+
+        Args:
+            low: Window start (inclusive)
+            high: Window end (inclusive)
+
+        Returns:
+            Matching items, ordered by interval start
+        """
+        matches = []
+        stack = [(0, len(self._items))]
+        while stack:
+            start, end = stack.pop()
+            if start >= end:
+                continue
+            middle = (start + end) // 2
+            if self._max_highs[middle] < low:
+                continue  # Everything in this subtree ends before the window
+            if self._lows[middle] <= high:
+                if self._highs[middle] >= low:
+                    matches.append((middle, self._items[middle]))
+                stack.append((middle + 1, end))
+            stack.append((start, middle))
+        matches.sort(key=lambda match: match[0])
+        return [item for _, item in matches]
+
+
+@dataclass(frozen=True)
+class RangeEntry:
+    """
+    Salary and experience ranges of one career.
+
+    Attributes:
+        item: Value returned by queries (e.g. the catalog position)
+        currency: Salary currency code
+        salary: (min, max) salary
+        experience: (min, max) years of experience, or None if unknown
+    """
+    item: Any
+    currency: str
+    salary: Window
+    experience: Optional[Window] = None
+
+
+def _ordered(window: Window) -> Window:
+    """Swap the ends of an inverted range."""
+    low, high = window
+    return (low, high) if low <= high else (high, low)
+
+
+class SalaryExperienceIndex:
+    """
+    Two-dimensional window index over career salary and experience ranges.
+
+    Salaries are only comparable within a currency, so there is one salary tree
+    per currency. Careers without known experience requirements match every
+    experience window.
+    """
+
+    def __init__(self, entries: Iterable[RangeEntry]):
+        """
+        Build the index.
+
+        Args:
+            entries: One RangeEntry per career
+        """
+        entries = list(entries)
+        by_currency: Dict[str, List[RangeEntry]] = {}
+        for entry in entries:
+            by_currency.setdefault(entry.currency, []).append(entry)
+
+        self.items: FrozenSet[Any] = frozenset(entry.item for entry in entries)
+        self.items_by_currency = MappingProxyType({
+            currency: frozenset(entry.item for entry in group)
+            for currency, group in by_currency.items()
+        })
+        self._salary = MappingProxyType({
+            currency: IntervalTree((*_ordered(entry.salary), entry.item) for entry in group)
+            for currency, group in by_currency.items()
+        })
+        self._experience = IntervalTree(
+            (*_ordered(entry.experience), entry.item) for entry in entries if entry.experience is not None
+        )
+        self._any_experience = frozenset(entry.item for entry in entries if entry.experience is None)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def query(
+        self,
+        salary: Optional[Window] = None,
+        experience: Optional[Window] = None,
+        currency: Optional[str] = None,
+        include_other_currencies: bool = False
+    ) -> FrozenSet[Any]:
+        """
+        Get the careers whose ranges overlap the given windows.
+
+        Args:
+            salary: Salary window, or None for any salary
+            experience: Experience window in years, or None for any experience
+            currency: Currency of the salary window; None searches every currency
+            include_other_currencies: Also return every career paid in another
+                currency (the salary window cannot be compared for them)
+
+        Returns:
+            Items of the matching careers
+        """
+        currencies = [currency] if currency is not None else list(self._salary)
+
+        matches = set()
+        for code in currencies:
+            if salary is None:
+                matches.update(self.items_by_currency.get(code, ()))
+            elif code in self._salary:
+                matches.update(self._salary[code].overlapping(*salary))
+
+        if include_other_currencies and currency is not None:
+            matches.update(self.items - self.items_by_currency.get(currency, frozenset()))
+
+        if experience is not None:
+            matches.intersection_update(set(self._experience.overlapping(*experience)) | self._any_experience)
+
+        return frozenset(matches)
+
+
+def build_salary_experience_index(careers: Iterable[Any]) -> SalaryExperienceIndex:
+    """
+    Index the salary and experience ranges of careers by catalog position.
+
+    Careers without a ``salary_range`` are left out; callers fall back to
+    checking those directly. Experience uses ``min_years_experience`` and
+    ``max_years_experience`` when a career has them.
+
+    Args:
+        careers: Careers in catalog order
+
+    Returns:
+        SalaryExperienceIndex whose items are catalog positions
+    """
+    entries = []
+    for position, career in enumerate(careers):
+        salary_range = getattr(career, "salary_range", None)
+        if salary_range is None:
+            continue
+        min_years = getattr(career, "min_years_experience", None)
+        max_years = getattr(career, "max_years_experience", None)
+        entries.append(RangeEntry(
+            item=position,
+            currency=salary_range.currency,
+            salary=(salary_range.min, salary_range.max),
+            experience=(min_years, max_years) if min_years is not None and max_years is not None else None
+        ))
+    return SalaryExperienceIndex(entries)
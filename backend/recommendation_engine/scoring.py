@@ -31,7 +31,10 @@ except ImportError:
         UserSkill = Any
         RequiredSkill = Any
 
-from .config import ScoringConfig, ScoringWeights, ConsistencyPenaltyConfig
+from .config import (
+    ScoringConfig, ScoringWeights, ConsistencyPenaltyConfig, CompiledConfig,
+    compile_weight_vector, compile_penalty_table
+)
 from .categorization import get_career_field, determine_user_career_field
 
 
@@ -46,7 +49,13 @@ class ScoringEngine:
     - Experience level matching
     """
     
-    def __init__(self, scoring_config: ScoringConfig, scoring_weights: ScoringWeights, consistency_penalty_config: Optional[ConsistencyPenaltyConfig] = None):
+    def __init__(
+        self,
+        scoring_config: ScoringConfig,
+        scoring_weights: ScoringWeights,
+        consistency_penalty_config: Optional[ConsistencyPenaltyConfig] = None,
+        compiled_config: Optional[CompiledConfig] = None
+    ):
         """
         Initialize the scoring engine.
         
@@ -54,13 +63,34 @@ class ScoringEngine:
             scoring_config: Configuration for scoring algorithms
             scoring_weights: Weights for different scoring components
             consistency_penalty_config: Configuration for consistency penalties
+            compiled_config: Precompiled vectors for the same configuration; compiled
+                from the arguments above when not provided
         """
         self.config = scoring_config
         self.weights = scoring_weights
         self.consistency_penalty_config = consistency_penalty_config
-        self.skill_level_order = [SkillLevel.BEGINNER, SkillLevel.INTERMEDIATE, SkillLevel.ADVANCED, SkillLevel.EXPERT]
+        self.skill_level_order = (SkillLevel.BEGINNER, SkillLevel.INTERMEDIATE, SkillLevel.ADVANCED, SkillLevel.EXPERT)
+        
+        # Precompiled lookups used on the hot path
+        if compiled_config is not None:
+            self.weight_vector = compiled_config.weight_vector
+            self.penalty_table = compiled_config.penalty_table
+            self.default_penalty = compiled_config.default_penalty
+        else:
+            self.weight_vector = compile_weight_vector(scoring_weights)
+            if consistency_penalty_config:
+                self.penalty_table, self.default_penalty = compile_penalty_table(consistency_penalty_config)
+            else:
+                self.penalty_table, self.default_penalty = {}, 0.0
     
-    def score_career(self, user_profile: UserProfile, career: Career, exploration_level: int = 3) -> RecommendationScore:
+    def score_career(
+        self,
+        user_profile: UserProfile,
+        career: Career,
+        exploration_level: int = 3,
+        user_field: Optional[str] = None,
+        career_field: Optional[str] = None
+    ) -> RecommendationScore:
         """
         Calculate comprehensive score for a career recommendation.
         
@@ -68,6 +98,8 @@ class ScoringEngine:
             user_profile: User's profile with skills and preferences
             career: Career to score
             exploration_level: User's exploration level (1-5)
+            user_field: Precomputed determine_user_career_field(user_profile)
+            career_field: Precomputed get_career_field(career)
             
         Returns:
             RecommendationScore with detailed scoring breakdown
@@ -79,15 +111,24 @@ class ScoringEngine:
         experience_score = self._calculate_experience_match_score(user_profile, career)
         
         # Calculate weighted total score
+        skill_weight, interest_weight, salary_weight, experience_weight = self.weight_vector
         total_score = (
-            skill_score * self.weights.skill_match +
-            interest_score * self.weights.interest_match +
-            salary_score * self.weights.salary_compatibility +
-            experience_score * self.weights.experience_match
+            skill_score * skill_weight +
+            interest_score * interest_weight +
+            salary_score * salary_weight +
+            experience_score * experience_weight
         )
         
+        # Both fields are needed by the penalty and its breakdown; resolve them once
+        if user_field is None:
+            user_field = determine_user_career_field(user_profile)
+        if career_field is None:
+            career_field = get_career_field(career)
+        
         # Calculate consistency penalty
-        consistency_penalty = self._calculate_consistency_penalty(user_profile, career, exploration_level)
+        consistency_penalty = self._calculate_consistency_penalty(
+            user_profile, career, exploration_level, user_field, career_field
+        )
         
         # Apply consistency penalty to total score
         final_score = max(0.0, total_score - consistency_penalty)
@@ -98,7 +139,9 @@ class ScoringEngine:
             "interest_details": self._get_interest_score_details(user_profile, career),
             "salary_details": self._get_salary_score_details(user_profile, career),
             "experience_details": self._get_experience_score_details(user_profile, career),
-            "consistency_details": self._get_consistency_score_details(user_profile, career, exploration_level)
+            "consistency_details": self._get_consistency_score_details(
+                user_profile, career, exploration_level, user_field, career_field
+            )
         }
         
         return RecommendationScore(
@@ -112,19 +155,37 @@ class ScoringEngine:
             breakdown=breakdown
         )
     
-    def score_multiple_careers(self, user_profile: UserProfile, careers: List[Career], exploration_level: int = 3) -> List[RecommendationScore]:
+    def score_multiple_careers(
+        self,
+        user_profile: UserProfile,
+        careers: List[Career],
+        exploration_level: int = 3,
+        career_fields: Optional[List[str]] = None
+    ) -> List[RecommendationScore]:
         """
         Score multiple careers and return sorted by total score.
         
+        Profile-level inputs are derived once for the whole list rather than
+        once per career.
+        
         Args:
             user_profile: User's profile
             careers: List of careers to score
             exploration_level: User's exploration level (1-5)
+            career_fields: Precomputed get_career_field result per career, in
+                the same order (e.g. from the catalog index)
             
         Returns:
             List of RecommendationScore objects sorted by total score (descending)
         """
-        scores = [self.score_career(user_profile, career, exploration_level) for career in careers]
+        user_field = determine_user_career_field(user_profile)
+        if career_fields is None:
+            career_fields = [get_career_field(career) for career in careers]
+        
+        scores = [
+            self.score_career(user_profile, career, exploration_level, user_field, career_field)
+            for career, career_field in zip(careers, career_fields)
+        ]
         return sorted(scores, key=lambda x: x.total_score, reverse=True)
     
     def _calculate_skill_match_score(self, user_profile: UserProfile, career: Career) -> float:
@@ -485,7 +546,14 @@ class ScoringEngine:
         else:
             return "expert"
     
-    def _calculate_consistency_penalty(self, user_profile: UserProfile, career: Career, exploration_level: int) -> float:
+    def _calculate_consistency_penalty(
+        self,
+        user_profile: UserProfile,
+        career: Career,
+        exploration_level: int,
+        user_field: Optional[str] = None,
+        career_field: Optional[str] = None
+    ) -> float:
         """
         Calculate consistency penalty for career field mismatch.
         
@@ -493,6 +561,8 @@ class ScoringEngine:
             user_profile: User's profile
             career: Career being scored
             exploration_level: User's exploration level (1-5)
+            user_field: Precomputed user career field
+            career_field: Precomputed career field
             
         Returns:
             Consistency penalty value (0.0 to max_penalty)
@@ -501,32 +571,34 @@ class ScoringEngine:
             return 0.0
         
         # Determine user's career field
-        user_field = determine_user_career_field(user_profile)
+        if user_field is None:
+            user_field = determine_user_career_field(user_profile)
         
         # Determine career's field
-        career_field = get_career_field(career)
+        if career_field is None:
+            career_field = get_career_field(career)
         
         # No penalty if fields match or if either is 'other'
         if user_field == career_field or user_field == 'other' or career_field == 'other':
             return 0.0
         
-        # Calculate base penalty
-        base_penalty = self.consistency_penalty_config.base_penalty
-        
-        # Apply exploration level multiplier
-        multiplier = self.consistency_penalty_config.exploration_level_multiplier.get(exploration_level, 1.0)
-        penalty = base_penalty * multiplier
-        
-        # Apply maximum penalty limit
-        penalty = min(penalty, self.consistency_penalty_config.max_penalty)
-        
-        return penalty
+        # Base penalty times exploration multiplier, clamped to max_penalty (precompiled)
+        return self.penalty_table.get(exploration_level, self.default_penalty)
     
-    def _get_consistency_score_details(self, user_profile: UserProfile, career: Career, exploration_level: int) -> Dict:
+    def _get_consistency_score_details(
+        self,
+        user_profile: UserProfile,
+        career: Career,
+        exploration_level: int,
+        user_field: Optional[str] = None,
+        career_field: Optional[str] = None
+    ) -> Dict:
         """Get detailed breakdown of consistency scoring."""
-        user_field = determine_user_career_field(user_profile)
-        career_field = get_career_field(career)
-        penalty = self._calculate_consistency_penalty(user_profile, career, exploration_level)
+        if user_field is None:
+            user_field = determine_user_career_field(user_profile)
+        if career_field is None:
+            career_field = get_career_field(career)
+        penalty = self._calculate_consistency_penalty(user_profile, career, exploration_level, user_field, career_field)
         
         multiplier = 1.0
         if self.consistency_penalty_config:
@@ -8,18 +8,38 @@ logic between frontend and backend.
 
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, asdict
+import itertools
 import logging
 from datetime import datetime
 
-from enhanced_engine import EnhancedRecommendationEngine
-from career_database import CareerDatabase, CareerData, CareerField, ExperienceLevel
-from enhanced_categorization import get_enhanced_career_field, determine_enhanced_user_career_field
-from models import UserProfile, CareerRecommendation
-from config import DEFAULT_CONFIG
+from fastapi import APIRouter, HTTPException, Query
+
+from .enhanced_engine import EnhancedRecommendationEngine
+from .career_database import CareerDatabase, CareerData, CareerField, CareerFilters, ExperienceLevel
+from .async_database import AsyncCareerDatabase
+from .enhanced_categorization import get_enhanced_career_field, determine_enhanced_user_career_field
+from .config import DEFAULT_CONFIG
+
+# Import models - try both relative and absolute imports
+try:
+    from ..models import UserProfileModel as UserProfile, RecommendationModel as CareerRecommendation
+except ImportError:
+    from models import UserProfileModel as UserProfile, RecommendationModel as CareerRecommendation
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Career columns read by the search and listing responses
+SEARCH_RESULT_COLUMNS = [
+    "title", "description", "career_field", "experience_level",
+    "salary_min", "salary_max", "required_technical_skills", "companies"
+]
+LIST_RESULT_COLUMNS = ["title", "career_field", "experience_level", "salary_min", "salary_max"]
+# Career columns read when converting candidates for the recommendation engine
+CANDIDATE_COLUMNS = ["title", "description", "career_field", "salary_min", "salary_max", "salary_currency"]
+# Most careers considered for one recommendation request
+MAX_CANDIDATE_CAREERS = 1000
+
 
 @dataclass
 class APIUserProfile:
@@ -165,6 +185,7 @@ class UnifiedRecommendationAPI:
             use_enhanced_categorization: Whether to use enhanced categorization
         """
         self.career_db = CareerDatabase(career_db_path)
+        self.career_db_async = AsyncCareerDatabase(self.career_db)
         self.recommendation_engine = EnhancedRecommendationEngine(
             config=DEFAULT_CONFIG,
             use_enhanced_categorization=use_enhanced_categorization
@@ -233,7 +254,60 @@ class UnifiedRecommendationAPI:
         except Exception as e:
             logger.error(f"Error generating recommendations: {e}")
             raise
-    
+
+    async def get_recommendations_async(self, request: APIRecommendationRequest) -> APIRecommendationResponse:
+        """
+        Async version of get_recommendations for FastAPI handlers.
+
+        The database reads and scoring both run on the recommendation engine's
+        bounded executor, so the event loop is never blocked.
+
+        Raises:
+            EngineOverloadedError: If the executor queue is full
+        """
+        return await self.recommendation_engine.executor.run(self.get_recommendations, request)
+
+    async def explain_recommendation_async(
+        self,
+        user_profile: APIUserProfile,
+        career_id: str,
+        exploration_level: int = 1
+    ) -> Dict[str, Any]:
+        """Async version of explain_recommendation that runs on the engine's executor."""
+        return await self.recommendation_engine.executor.run(
+            self.explain_recommendation, user_profile, career_id, exploration_level
+        )
+
+    async def search_careers_async(self, query: str, **kwargs) -> List[Dict[str, Any]]:
+        """Async version of search_careers that runs on the database threads."""
+        return await self.career_db_async.run(self.search_careers, query, **kwargs)
+
+    async def list_careers_async(self, **kwargs) -> Dict[str, Any]:
+        """Async version of list_careers that runs on the database threads."""
+        return await self.career_db_async.run(self.list_careers, **kwargs)
+
+    async def get_database_statistics_async(self) -> Dict[str, Any]:
+        """Async version of get_database_statistics that runs on the database threads."""
+        return await self.career_db_async.get_career_statistics()
+
+    def get_database_metrics(self) -> Dict[str, Any]:
+        """
+        Get pool utilization and per-query timings for the career database.
+
+        Returns:
+            Database metrics dictionary
+        """
+        return self.career_db_async.get_metrics()
+
+    def get_executor_metrics(self) -> Dict[str, Any]:
+        """
+        Get queue-depth and timing metrics for the scoring executor.
+
+        Returns:
+            Executor metrics dictionary
+        """
+        return self.recommendation_engine.executor.get_metrics()
+
     def explain_recommendation(
         self, 
         user_profile: APIUserProfile, 
@@ -346,10 +420,11 @@ class UnifiedRecommendationAPI:
             
             # Search in database
             careers = self.career_db.search_careers(
-                title_query=query,
+                text_query=query,
                 career_fields=field_filters,
                 experience_levels=level_filters,
-                limit=limit
+                limit=limit,
+                columns=SEARCH_RESULT_COLUMNS
             )
             
             # Convert to API format
@@ -371,6 +446,50 @@ class UnifiedRecommendationAPI:
             logger.error(f"Error searching careers: {e}")
             return []
     
+    def list_careers(
+        self,
+        career_fields: Optional[List[str]] = None,
+        experience_levels: Optional[List[str]] = None,
+        page_size: int = 50,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        List careers one page at a time, ordered by title.
+        
+        Args:
+            career_fields: Optional list of career fields to filter by
+            experience_levels: Optional list of experience levels to filter by
+            page_size: Careers per page
+            cursor: next_cursor from the previous page, None for the first page
+            
+        Returns:
+            Dictionary with the careers and the next_cursor (None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        filters = CareerFilters(
+            career_fields=[CareerField(field) for field in career_fields or [] if field in [f.value for f in CareerField]] or None,
+            experience_levels=[ExperienceLevel(level) for level in experience_levels or [] if level in [l.value for l in ExperienceLevel]] or None
+        )
+        careers, next_cursor = self.career_db.get_careers_page(
+            filters, page_size=page_size, cursor=cursor, columns=LIST_RESULT_COLUMNS
+        )
+        
+        return {
+            "careers": [
+                {
+                    "career_id": career.career_id,
+                    "title": career.title,
+                    "career_field": career.career_field.value,
+                    "experience_level": career.experience_level.value,
+                    "salary_range": f"${career.salary_min:,} - ${career.salary_max:,}"
+                }
+                for career in careers
+            ],
+            "next_cursor": next_cursor
+        }
+    
     def get_database_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about the career database.
@@ -455,17 +574,20 @@ class UnifiedRecommendationAPI:
             salary_min = request.salary_range.get("min")
             salary_max = request.salary_range.get("max")
         
-        # Search careers
-        career_data_list = self.career_db.search_careers(
+        # Stream matching careers, converting each as it arrives
+        filters = CareerFilters(
             career_fields=field_filters,
             experience_levels=level_filters,
             salary_min=salary_min,
-            salary_max=salary_max,
-            limit=1000  # Large limit for initial filtering
+            salary_max=salary_max
         )
+        careers = self.career_db.iter_careers(filters, batch_size=200, columns=CANDIDATE_COLUMNS)
         
-        # Convert to internal format
-        return [self._convert_career_data_to_internal(cd) for cd in career_data_list]
+        # Convert to internal format; the engine needs the whole candidate list
+        return [
+            self._convert_career_data_to_internal(row)
+            for row in itertools.islice(careers, MAX_CANDIDATE_CAREERS)
+        ]
     
     def _convert_recommendation_to_api(
         self, 
@@ -560,6 +682,42 @@ class UnifiedRecommendationAPI:
         }
 
 
+def create_careers_router(api: UnifiedRecommendationAPI) -> APIRouter:
+    """
+    Build the HTTP routes for browsing the career database.
+    
+    GET /careers/page returns one page from list_careers; pass its
+    next_cursor back as ``cursor`` to get the following page.
+    
+    Args:
+        api: Unified API whose career database is served
+        
+    Returns:
+        Router to include in a FastAPI app
+    """
+    router = APIRouter()
+    
+    @router.get("/careers/page")
+    async def get_careers_page(
+        page_size: int = Query(50, ge=1, le=200),
+        cursor: Optional[str] = None,
+        career_field: Optional[List[str]] = Query(None),
+        experience_level: Optional[List[str]] = Query(None)
+    ):
+        """Get one page of careers ordered by title, with the cursor for the next page."""
+        try:
+            return await api.list_careers_async(
+                career_fields=career_field,
+                experience_levels=experience_level,
+                page_size=page_size,
+                cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    return router
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Initialize API
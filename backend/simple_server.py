@@ -3,7 +3,7 @@ Simple FastAPI backend server for the Career Recommendation Engine.
 This version includes a simplified recommendation engine directly.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, Body
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
@@ -11,20 +11,34 @@ from enum import Enum
 from datetime import datetime
 import json
 import os
+import hmac
 import logging
 # Recommendation Engine Imports
 # Recommendation Engine Imports
 from recommendation_engine.engine import RecommendationEngine as EnhancedRecommendationEngine
 from recommendation_engine.config import DEFAULT_CONFIG
+from recommendation_engine.executor import EngineOverloadedError
+from recommendation_engine.coalescer import RequestCoalescer
+from recommendation_engine.config_manager import ConfigManager
+from recommendation_engine.catalog_store import CatalogStore
+from recommendation_engine.catalog_artifact import load_catalog
 try:
     from models import UserProfileModel as UserProfile, CareerModel as Career
-    from comprehensive_careers import COMPREHENSIVE_CAREERS
 except (ImportError, ModuleNotFoundError):
     # Fallback for different execution contexts
     import sys
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     from models import UserProfileModel as UserProfile, CareerModel as Career
+
+
+def _import_comprehensive_careers():
     from comprehensive_careers import COMPREHENSIVE_CAREERS
+    return COMPREHENSIVE_CAREERS
+
+
+# A compiled catalog artifact is memory-mapped (and shared by all workers);
+# without one the career modules are imported as before
+COMPREHENSIVE_CAREERS = load_catalog(os.getenv("CAREER_CATALOG_ARTIFACT"), _import_comprehensive_careers)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -43,6 +57,58 @@ logger.info("Initializing recommendation engine...")
 recommendation_engine = EnhancedRecommendationEngine(config=DEFAULT_CONFIG)
 logger.info("Recommendation engine initialized.")
 
+# Versioned catalog read once per request. The records are frontend career
+# dictionaries, not engine Career objects, so there is no catalog index to warm
+# here (nor to rebuild on change); subscribe warm_catalog once the store holds
+# engine careers.
+catalog_store = CatalogStore(COMPREHENSIVE_CAREERS)
+
+# Opt-in micro-batching of concurrent requests (disabled when the window is 0)
+COALESCE_WINDOW_MS = float(os.getenv("RECOMMENDATION_COALESCE_WINDOW_MS", "0"))
+COALESCE_MAX_BATCH = int(os.getenv("RECOMMENDATION_COALESCE_MAX_BATCH", "16"))
+recommendation_coalescer = None
+if COALESCE_WINDOW_MS > 0:
+    recommendation_coalescer = RequestCoalescer(
+        recommendation_engine,
+        window_ms=COALESCE_WINDOW_MS,
+        max_batch_size=COALESCE_MAX_BATCH
+    )
+    logger.info(f"Request coalescing enabled: window={COALESCE_WINDOW_MS}ms, max_batch={COALESCE_MAX_BATCH}")
+
+# Hot config reload from a watched JSON file and/or the admin endpoint
+CONFIG_PATH = os.getenv("RECOMMENDATION_CONFIG_PATH")
+CONFIG_POLL_SECONDS = float(os.getenv("RECOMMENDATION_CONFIG_POLL_SECONDS", "2"))
+ADMIN_TOKEN = os.getenv("RECOMMENDATION_ADMIN_TOKEN")
+config_manager = ConfigManager(recommendation_engine, config_path=CONFIG_PATH, poll_interval=CONFIG_POLL_SECONDS)
+if CONFIG_PATH:
+    try:
+        config_manager.reload_from_file()
+    except Exception as e:
+        logger.error(f"Keeping default recommendation config: {e}")
+    config_manager.start_watching()
+
+# Cursor-paged browsing of the SQLite career database, when one is configured
+CAREER_DB_PATH = os.getenv("CAREER_DB_PATH")
+if CAREER_DB_PATH:
+    from recommendation_engine.unified_api import UnifiedRecommendationAPI, create_careers_router
+    app.include_router(create_careers_router(UnifiedRecommendationAPI(career_db_path=CAREER_DB_PATH)))
+    logger.info(f"Career database routes enabled: {CAREER_DB_PATH}")
+
+
+async def generate_recommendations(user_profile, limit=None, exploration_level=3):
+    """Score a profile off the event loop, through the coalescer when enabled."""
+    careers = catalog_store.snapshot.careers
+    if recommendation_coalescer is not None:
+        return await recommendation_coalescer.submit(
+            user_profile, careers, limit, exploration_level
+        )
+    return await recommendation_engine.get_recommendations_async(
+        user_profile=user_profile,
+        available_careers=careers,
+        limit=limit,
+        exploration_level=exploration_level
+    )
+
 # Configure CORS
 logger.info("Configuring CORS...")
 app.add_middleware(
@@ -84,6 +150,7 @@ try:
 except Exception as e:
     logger.error(f"Error loading career data: {e}")
     CAREER_DATA = []
+career_data_store = CatalogStore(CAREER_DATA)
 
 # Request/Response models
 class RecommendationRequest(BaseModel):
@@ -148,6 +215,61 @@ async def health_check():
         engine_status="healthy"
     )
 
+@app.get("/health/engine")
+async def engine_health():
+    """Scoring executor and ranking cascade metrics (queue depth, stage timings)."""
+    metrics = recommendation_engine.executor.get_metrics()
+    metrics["cascade"] = recommendation_engine.get_cascade_metrics()
+    if recommendation_coalescer is not None:
+        metrics["coalescer"] = recommendation_coalescer.get_metrics()
+    return metrics
+
+def require_admin(token: Optional[str]):
+    """Reject requests without the configured admin token."""
+    if not ADMIN_TOKEN or not token or not hmac.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+@app.get("/admin/config")
+async def get_engine_config(x_admin_token: Optional[str] = Header(None)):
+    """Active recommendation config and reload status."""
+    require_admin(x_admin_token)
+    status = config_manager.get_status()
+    status["config"] = recommendation_engine.config.dict()
+    return status
+
+@app.post("/admin/config/reload")
+async def reload_engine_config(
+    config: Optional[Dict[str, Any]] = Body(None),
+    x_admin_token: Optional[str] = Header(None)
+):
+    """
+    Hot-swap the recommendation config.
+
+    Applies the posted config, or reloads RECOMMENDATION_CONFIG_PATH when no
+    body is sent. In-flight requests finish on the previous config.
+    """
+    require_admin(x_admin_token)
+    try:
+        if config:
+            snapshot = config_manager.apply(config)
+        else:
+            snapshot = config_manager.reload_from_file()
+    except (ValueError, OSError) as e:
+        raise HTTPException(status_code=400, detail=f"Config rejected: {str(e)}")
+
+    return {"status": "reloaded", "snapshot_version": snapshot.version}
+
+@app.post("/admin/catalog/reload")
+async def reload_career_data(x_admin_token: Optional[str] = Header(None)):
+    """Reload career_data.json; requests in flight keep the previous snapshot."""
+    require_admin(x_admin_token)
+    try:
+        change = career_data_store.load_file(CAREER_DATA_PATH)
+    except (ValueError, OSError) as e:
+        raise HTTPException(status_code=400, detail=f"Career data rejected: {str(e)}")
+
+    return {"status": "reloaded", "catalog_version": change.version, "total_careers": len(change.snapshot)}
+
 @app.post("/recommendations", response_model=RecommendationResponse)
 async def get_recommendations(request: RecommendationRequest):
     """
@@ -157,12 +279,8 @@ async def get_recommendations(request: RecommendationRequest):
         # Convert request to UserProfile
         user_profile = UserProfile(**request.user_profile) if request.user_profile else UserProfile()
 
-        # Get recommendations from the engine
-        recommendations = recommendation_engine.get_recommendations(
-            user_profile=user_profile,
-            available_careers=COMPREHENSIVE_CAREERS,
-            limit=request.limit
-        )
+        # Get recommendations from the engine (scored off the event loop)
+        recommendations = await generate_recommendations(user_profile, limit=request.limit)
 
         # Format response
         rec_data = []
@@ -178,6 +296,8 @@ async def get_recommendations(request: RecommendationRequest):
             categories=categories
         )
         
+    except EngineOverloadedError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating recommendations: {str(e)}")
 
@@ -212,8 +332,8 @@ async def get_careers():
 async def get_career_detail(career_type: str):
     """Get detailed information about a specific career using the same comprehensive database as recommendations."""
     try:
-        # Find the career in the CAREER_DATA list
-        career = next((c for c in CAREER_DATA if c.get("careerType") == career_type), None)
+        # Find the career in the career data snapshot
+        career = career_data_store.snapshot.get(career_type)
         if career:
             return career
         
@@ -354,11 +474,9 @@ async def get_recommendations_direct(request: DirectRecommendationRequest):
         }
         user_profile = UserProfile(**user_profile_data)
 
-        # Get recommendations from the engine
-        recommendations = recommendation_engine.get_recommendations(
-            user_profile=user_profile,
-            available_careers=COMPREHENSIVE_CAREERS,
-            exploration_level=request.explorationLevel or 1
+        # Get recommendations from the engine (scored off the event loop)
+        recommendations = await generate_recommendations(
+            user_profile, exploration_level=request.explorationLevel or 1
         )
 
         # Format response to be JSON serializable
@@ -373,6 +491,9 @@ async def get_recommendations_direct(request: DirectRecommendationRequest):
         print(f"✅ Generated {len(rec_data)} recommendations")
         return rec_data
         
+    except EngineOverloadedError as e:
+        print(f"⚠️  Scoring executor overloaded: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         print(f"❌ Error in /api/recommendations: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to generate recommendations: {str(e)}")
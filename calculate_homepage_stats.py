@@ -1,6 +1,73 @@
 import json
+import os
+import sys
 from collections import defaultdict
 
+# Homepage category label per CareerDatabase career field
+FIELD_CATEGORIES = {
+    "technology": "Technology & Engineering",
+    "healthcare": "Healthcare & Medical",
+    "skilled_trades": "Skilled Trades & Construction",
+    "education": "Education & Training",
+    "business_finance": "Business & Finance",
+    "executive_leadership": "Business & Finance",
+    "sales_marketing": "Business & Finance",
+    "legal_law": "Legal & Law",
+    "creative_arts": "Creative & Arts",
+    "government_public_service": "Public Service & Government",
+    "hospitality_service": "Hospitality & Service",
+    "manufacturing_industrial": "Manufacturing & Industrial",
+    "agriculture_environment": "Agriculture & Environment",
+    "other": "Other"
+}
+
+# Based on the structure of frontend/src/pages/Assessment.tsx
+ASSESSMENT_DATA_POINTS = {
+    "Basic Information": 10, # age, location, education, etc. + resume + linkedin
+    "Certifications": 44,
+    "Technical Skills": 32,
+    "Soft Skills": 32,
+    "Work Preferences": 8, # sliders
+    "Interests": 18,
+    "Industries": 18,
+    "Goals & Expectations": 3 # careerGoals, workLifeBalance, salaryExpectations
+}
+
+
+def calculate_stats_from_database(db_path):
+    """
+    Prints the homepage statistics from the career database.
+
+    The database keeps its statistics materialized, so this reads a handful of
+    rows instead of loading every career.
+    """
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+    from recommendation_engine.career_database import CareerDatabase, CAREER_COLUMNS
+
+    db = CareerDatabase(db_path)
+    stats = db.get_career_statistics()
+    db.close()
+    if not stats:
+        print(f"Error: Could not read statistics from {db_path}.")
+        return
+
+    num_careers = stats["total_careers"]
+    career_data_points = num_careers * len(CAREER_COLUMNS)
+    total_assessment_points = sum(ASSESSMENT_DATA_POINTS.values())
+
+    category_counts = defaultdict(int)
+    for career_field, count in stats["careers_by_field"].items():
+        category_counts[FIELD_CATEGORIES.get(career_field, "Other")] += count
+
+    print("--- Homepage Statistics ---")
+    print(f"\n1. Total Careers in Database: {num_careers}")
+    print(f"2. Skill-Career Connections: {stats['skill_career_links']}")
+    print(f"3. Total Data Points Analyzed: {career_data_points + total_assessment_points} (Careers: {career_data_points}, User Profile: {total_assessment_points})")
+
+    print("\n4. Career Category Counts:")
+    for category, count in sorted(category_counts.items()):
+        print(f"- {category}: {count}")
+
 def calculate_all_stats():
     """
     Calculates all statistics for the homepage from the career data and assessment structure.
@@ -28,22 +95,11 @@ def calculate_all_stats():
     # 2. Career Data Points
     career_data_points = 0
     if num_careers > 0:
-        # CORRECTED LOGIC: Get keys from the first career object in the list
-        career_data_points = num_careers * len(career_data.keys())
+        # Get keys from the first career object in the list
+        career_data_points = num_careers * len(career_data[0].keys())
 
     # --- User Assessment Data Point Analysis ---
-    # Based on the structure of frontend/src/pages/Assessment.tsx
-    assessment_data_points = {
-        "Basic Information": 10, # age, location, education, etc. + resume + linkedin
-        "Certifications": 44,
-        "Technical Skills": 32,
-        "Soft Skills": 32,
-        "Work Preferences": 8, # sliders
-        "Interests": 18,
-        "Industries": 18,
-        "Goals & Expectations": 3 # careerGoals, workLifeBalance, salaryExpectations
-    }
-    total_assessment_points = sum(assessment_data_points.values())
+    total_assessment_points = sum(ASSESSMENT_DATA_POINTS.values())
     
     # 3. Total Data Points Analyzed
     total_data_points = career_data_points + total_assessment_points
@@ -100,4 +156,8 @@ def calculate_all_stats():
             print(f"- {title}")
 
 if __name__ == "__main__":
-    calculate_all_stats()
\ No newline at end of file
+    # Usage: python calculate_homepage_stats.py [careers.db]
+    if len(sys.argv) > 1:
+        calculate_stats_from_database(sys.argv[1])
+    else:
+        calculate_all_stats()
\ No newline at end of file
@@ -6,32 +6,1382 @@ A simple in-memory MongoDB-compatible server for immediate development
 """
 
 import asyncio
+import bisect
+import concurrent.futures
+import itertools
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
 import hashlib
+import heapq
 from motor.motor_asyncio import AsyncIOMotorClient
 import pymongo
+from pymongo.errors import DuplicateKeyError, OperationFailure
+import bson
 from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
+
+# Marks a field that is not present in a document
+_MISSING = object()
+
+# Range operators a sorted index can answer
+RANGE_OPERATORS = ("$gt", "$gte", "$lt", "$lte")
+# create_index options the stand-in implements ("background" is a no-op, as in MongoDB 4.2+)
+SUPPORTED_INDEX_OPTIONS = {"expireAfterSeconds", "sparse", "background"}
+
+
+def get_field(doc: Dict, path: str, default=_MISSING):
+    """Get a (dotted) field from a document"""
+    value = doc
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return default
+        value = value[part]
+    return value
+
+
+def sort_value(value) -> Tuple:
+    """
+    Comparable key for any field value. Values are ordered by type first, roughly
+    like MongoDB: missing/null, numbers, strings, objects, ObjectIds, booleans, dates.
+    """
+    if value is None or value is _MISSING:
+        return (0, 0)
+    if isinstance(value, bool):
+        return (5, value)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    if isinstance(value, str):
+        return (2, value)
+    if isinstance(value, datetime):
+        return (6, value)
+    if isinstance(value, ObjectId):
+        return (4, str(value))
+    return (3, repr(value))
+
+
+def is_operator_condition(condition) -> bool:
+    """Check whether a filter value is an operator document like {"$gt": 5}"""
+    return isinstance(condition, dict) and bool(condition) and all(str(key).startswith("$") for key in condition)
+
+
+def _equals(value, expected) -> bool:
+    """MongoDB equality: arrays match when they equal, or contain, the value; null matches missing"""
+    if isinstance(expected, re.Pattern):
+        return _regex_matches(value, expected)
+    if value is _MISSING:
+        return expected is None
+    if sort_value(value) == sort_value(expected):
+        return True
+    return isinstance(value, list) and any(sort_value(item) == sort_value(expected) for item in value)
+
+
+def _in_range(value, operator: str, operand) -> bool:
+    left, right = sort_value(value), sort_value(operand)
+    if left[0] != right[0]:
+        return False  # Like MongoDB, ranges only compare values of the same type
+    if operator == "$gt":
+        return left > right
+    if operator == "$gte":
+        return left >= right
+    if operator == "$lt":
+        return left < right
+    return left <= right
+
+
+def _regex_matches(value, pattern) -> bool:
+    candidates = value if isinstance(value, list) else [value]
+    return any(isinstance(item, str) and pattern.search(item) for item in candidates)
+
+
+def _compile_regex(pattern, options: str = ""):
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    flags = 0
+    for option, flag in (("i", re.IGNORECASE), ("m", re.MULTILINE), ("s", re.DOTALL), ("x", re.VERBOSE)):
+        if option in (options or ""):
+            flags |= flag
+    return re.compile(pattern, flags)
+
+
+def matches_condition(value, condition) -> bool:
+    """Check one field value against an equality value or an operator document"""
+    if not is_operator_condition(condition):
+        return _equals(value, condition)
+    
+    for operator, operand in condition.items():
+        if operator == "$eq":
+            matched = _equals(value, operand)
+        elif operator == "$ne":
+            matched = not _equals(value, operand)
+        elif operator in RANGE_OPERATORS:
+            candidates = [] if value is _MISSING else value if isinstance(value, list) else [value]
+            matched = any(_in_range(item, operator, operand) for item in candidates)
+        elif operator == "$in":
+            matched = any(_equals(value, option) for option in operand)
+        elif operator == "$nin":
+            matched = not any(_equals(value, option) for option in operand)
+        elif operator == "$exists":
+            matched = (value is not _MISSING) == bool(operand)
+        elif operator == "$regex":
+            matched = _regex_matches(value, _compile_regex(operand, condition.get("$options", "")))
+        elif operator == "$options":
+            continue  # Read together with $regex
+        elif operator == "$all":
+            matched = isinstance(value, list) and all(_equals(value, item) for item in operand)
+        elif operator == "$size":
+            matched = isinstance(value, list) and len(value) == operand
+        elif operator == "$elemMatch":
+            matched = isinstance(value, list) and any(
+                matches_filter(item, operand) if isinstance(item, dict) and not is_operator_condition(operand)
+                else matches_condition(item, operand)
+                for item in value
+            )
+        elif operator == "$not":
+            matched = not matches_condition(value, operand)
+        else:
+            raise OperationFailure(f"unknown operator: {operator}")
+        if not matched:
+            return False
+    return True
+
+
+def matches_filter(doc: Dict, filter_dict: Optional[Dict]) -> bool:
+    """Check a document against a query filter ($and, $or and $nor included)"""
+    for key, condition in (filter_dict or {}).items():
+        if key == "$and":
+            matched = all(matches_filter(doc, clause) for clause in condition)
+        elif key == "$or":
+            matched = any(matches_filter(doc, clause) for clause in condition)
+        elif key == "$nor":
+            matched = not any(matches_filter(doc, clause) for clause in condition)
+        elif key.startswith("$"):
+            raise OperationFailure(f"unknown top level operator: {key}")
+        else:
+            matched = matches_condition(get_field(doc, key), condition)
+        if not matched:
+            return False
+    return True
+
+
+def sort_documents(docs: List, sort, document=None) -> List:
+    """Sort documents by a list of (field, direction) pairs; document() gets the dict from an item"""
+    document = document or (lambda doc: doc)
+    for field, direction in reversed(list(sort)):
+        docs.sort(key=lambda item: sort_value(get_field(document(item), field)), reverse=direction == pymongo.DESCENDING)
+    return docs
+
+
+def normalize_sort(key_or_list, direction=None) -> List[Tuple[str, int]]:
+    """Turn pymongo sort arguments ("field", -1 / [("field", -1)] / {"field": -1}) into pairs"""
+    if key_or_list is None:
+        return []
+    if isinstance(key_or_list, str):
+        return [(key_or_list, direction if direction is not None else pymongo.ASCENDING)]
+    if isinstance(key_or_list, dict):
+        return list(key_or_list.items())
+    return [tuple(pair) for pair in key_or_list]
+
+
+def copy_document(value):
+    """Copy the dicts and lists of a document (other BSON values are immutable)"""
+    if isinstance(value, dict):
+        return {key: copy_document(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_document(item) for item in value]
+    return value
+
+
+def apply_update(doc: Dict, update_dict: Dict) -> Dict:
+    """Apply $set/$unset (dotted paths included) to a private copy of a document"""
+    for operator in update_dict:
+        if operator not in ("$set", "$unset"):
+            raise OperationFailure(f"Unknown modifier: {operator}")
+    for path, value in update_dict.get("$set", {}).items():
+        _set_field(doc, path, copy_document(value))
+    for path in update_dict.get("$unset", {}):
+        parent = get_field(doc, path.rpartition(".")[0]) if "." in path else doc
+        if isinstance(parent, dict):
+            parent.pop(path.rpartition(".")[2], None)
+    return doc
+
+
+def _set_field(doc: Dict, path: str, value):
+    parts = path.split(".")
+    for part in parts[:-1]:
+        doc = doc[int(part)] if isinstance(doc, list) else doc.setdefault(part, {})
+    if isinstance(doc, list):
+        position = int(parts[-1])
+        doc.extend([None] * (position + 1 - len(doc)))
+        doc[position] = value
+    else:
+        doc[parts[-1]] = value
+
+
+def project(doc: Dict, projection) -> Dict:
+    """
+    Apply a find() projection: {"field": 1, ...} keeps only those fields,
+    {"field": 0, ...} drops them; _id is kept unless excluded.
+    """
+    if not projection:
+        return doc
+    if isinstance(projection, (list, tuple)):
+        projection = {field: 1 for field in projection}
+    
+    include_id = bool(projection.get("_id", 1))
+    fields = {field: bool(flag) for field, flag in projection.items() if field != "_id"}
+    if fields and len(set(fields.values())) > 1:
+        raise OperationFailure("Cannot do inclusion and exclusion in the same projection")
+    
+    if fields and all(fields.values()):
+        result = {}
+        if include_id and "_id" in doc:
+            result["_id"] = doc["_id"]
+        for field in fields:
+            value = get_field(doc, field)
+            if value is not _MISSING:
+                _set_field(result, field, value)
+        return result
+    
+    result = dict(doc)
+    for field in fields:
+        parts = field.split(".")
+        target = result
+        for part in parts[:-1]:
+            if not isinstance(target.get(part), dict):
+                target = None
+                break
+            target[part] = dict(target[part])  # Copy on the way down; doc is shared
+            target = target[part]
+        if target is not None:
+            target.pop(parts[-1], None)
+    if not include_id:
+        result.pop("_id", None)
+    return result
+
+
+def _evaluate(expression, doc: Dict):
+    """Evaluate an aggregation expression: "$field" paths, literals and {name: expression} documents"""
+    if isinstance(expression, str) and expression.startswith("$"):
+        value = get_field(doc, expression[1:])
+        return None if value is _MISSING else value
+    if isinstance(expression, dict) and not is_operator_condition(expression):
+        return {key: _evaluate(value, doc) for key, value in expression.items()}
+    return expression
+
+
+def _accumulate(operator: str, values: List):
+    """Combine the values of one $group accumulator"""
+    numbers = [value for value in values if isinstance(value, (int, float)) and not isinstance(value, bool)]
+    present = [value for value in values if value is not None]
+    if operator == "$sum":
+        return sum(numbers)
+    if operator == "$avg":
+        return sum(numbers) / len(numbers) if numbers else None
+    if operator == "$min":
+        return min(present, key=sort_value) if present else None
+    if operator == "$max":
+        return max(present, key=sort_value) if present else None
+    if operator == "$first":
+        return values[0] if values else None
+    if operator == "$last":
+        return values[-1] if values else None
+    if operator == "$push":
+        return list(values)
+    if operator == "$addToSet":
+        unique = {}
+        for value in values:
+            unique.setdefault(repr(sort_value(value)), value)
+        return list(unique.values())
+    raise OperationFailure(f"unknown group operator: {operator}")
+
+
+def run_pipeline(docs: List[Dict], pipeline: List[Dict]) -> List[Dict]:
+    """Run the aggregation stages after the leading $match on a list of documents"""
+    for stage in pipeline:
+        (name, spec), = stage.items()
+        if name == "$match":
+            docs = [doc for doc in docs if matches_filter(doc, spec)]
+        elif name == "$project":
+            docs = [project(doc, spec) for doc in docs]
+        elif name == "$sort":
+            docs = sort_documents(list(docs), normalize_sort(spec))
+        elif name == "$skip":
+            docs = docs[spec:]
+        elif name == "$limit":
+            docs = docs[:spec]
+        elif name == "$count":
+            docs = [{spec: len(docs)}]
+        elif name == "$unwind":
+            path = spec if isinstance(spec, str) else spec["path"]
+            keep_empty = isinstance(spec, dict) and spec.get("preserveNullAndEmptyArrays", False)
+            unwound = []
+            for doc in docs:
+                value = get_field(doc, path[1:])
+                if isinstance(value, list) and value:
+                    for item in value:
+                        copy = dict(doc)
+                        _set_field(copy, path[1:], item)
+                        unwound.append(copy)
+                elif keep_empty or (value is not _MISSING and value is not None and not isinstance(value, list)):
+                    unwound.append(doc)
+            docs = unwound
+        elif name == "$group":
+            groups: Dict[str, Dict] = {}
+            for doc in docs:
+                group_id = _evaluate(spec["_id"], doc)
+                group = groups.setdefault(repr(sort_value(group_id)), {"_id": group_id, "values": {}})
+                for field, accumulator in spec.items():
+                    if field != "_id":
+                        (operator, expression), = accumulator.items()
+                        group["values"].setdefault(field, []).append(_evaluate(expression, doc))
+            docs = []
+            for group in groups.values():
+                result = {"_id": group["_id"]}
+                for field, accumulator in spec.items():
+                    if field != "_id":
+                        (operator, _), = accumulator.items()
+                        result[field] = _accumulate(operator, group["values"].get(field, []))
+                docs.append(result)
+        else:
+            raise OperationFailure(f"Unrecognized pipeline stage name: '{name}'")
+    return docs
+
+
+def normalize_index_keys(keys) -> List[Tuple[str, Any]]:
+    """Turn create_index key specs ("email", [("user_id", 1), ...]) into (field, direction) pairs"""
+    if isinstance(keys, str):
+        return [(keys, pymongo.ASCENDING)]
+    if isinstance(keys, dict):
+        return list(keys.items())
+    return [(key, pymongo.ASCENDING) if isinstance(key, str) else tuple(key) for key in keys]
+
+
+def default_index_name(keys: List[Tuple[str, Any]]) -> str:
+    """MongoDB's default index name, e.g. "user_id_1_created_at_-1" """
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+
+class HashIndex:
+    """
+    Equality index: full key -> ids of the documents with that key (O(1) lookups).
+    Array fields are multikey: a document is indexed under each element (and the
+    whole array), like MongoDB multikey indexes. A sparse index skips documents
+    that have none of its fields.
+    """
+    
+    kind = "hash"
+    
+    def __init__(self, name: str, keys: List[Tuple[str, Any]], unique: bool = False,
+                 expire_after_seconds: Optional[float] = None, sparse: bool = False):
+        self.name = name
+        self.keys = keys
+        self.fields = [field for field, _ in keys]
+        self.unique = unique
+        self.expire_after_seconds = expire_after_seconds  # TTL index (see InMemoryCollection.expire)
+        self.sparse = sparse
+        self.entries: Dict[Tuple, Dict[Any, None]] = {}
+    
+    def keys_for(self, doc: Dict) -> set:
+        if self.sparse and all(get_field(doc, field) is _MISSING for field in self.fields):
+            return set()
+        parts = []
+        for field in self.fields:
+            value = get_field(doc, field)
+            if isinstance(value, list):
+                parts.append({sort_value(value)} | {sort_value(item) for item in value})
+            else:
+                parts.append((sort_value(value),))
+        return set(itertools.product(*parts))
+    
+    def check_unique(self, doc: Dict, _id):
+        """Raise DuplicateKeyError if another document already has this key"""
+        if self.unique:
+            for key in self.keys_for(doc):
+                if any(holder != _id for holder in self.entries.get(key, {})):
+                    raise DuplicateKeyError(f"E11000 duplicate key error collection index: {self.name}")
+    
+    def add(self, doc: Dict, _id, seq: int):
+        for key in self.keys_for(doc):
+            self.entries.setdefault(key, {})[_id] = None
+    
+    def remove(self, doc: Dict, _id, seq: int):
+        for key in self.keys_for(doc):
+            holders = self.entries.get(key)
+            if holders is not None:
+                holders.pop(_id, None)
+                if not holders:
+                    del self.entries[key]
+    
+    def clear(self):
+        self.entries.clear()
+    
+    def lookup(self, values) -> List:
+        """Ids of the documents whose indexed fields equal values"""
+        return list(self.entries.get(tuple(sort_value(value) for value in values), ()))
+    
+    def info(self) -> Dict:
+        info = {"key": list(self.keys)}
+        if self.unique:
+            info["unique"] = True
+        if self.sparse:
+            info["sparse"] = True
+        if self.expire_after_seconds is not None:
+            info["expireAfterSeconds"] = self.expire_after_seconds
+        return info
+
+
+class SortedIndex(HashIndex):
+    """
+    Ordered index. Keeps the hash lookup for full-key equality, plus a sorted list
+    of (key, insertion order, id) entries for equality prefixes, ranges and sorts
+    (O(log n) to find the start of a scan).
+    """
+    
+    kind = "sorted"
+    
+    def __init__(self, name: str, keys: List[Tuple[str, Any]], unique: bool = False,
+                 expire_after_seconds: Optional[float] = None, sparse: bool = False):
+        super().__init__(name, keys, unique, expire_after_seconds, sparse)
+        self.ordered: List[Tuple] = []
+    
+    def add(self, doc: Dict, _id, seq: int):
+        super().add(doc, _id, seq)
+        for key in self.keys_for(doc):
+            bisect.insort(self.ordered, (key, seq, _id))
+    
+    def remove(self, doc: Dict, _id, seq: int):
+        super().remove(doc, _id, seq)
+        for key in self.keys_for(doc):
+            entry = (key, seq, _id)
+            position = bisect.bisect_left(self.ordered, entry)
+            if position < len(self.ordered) and self.ordered[position] == entry:
+                del self.ordered[position]
+    
+    def clear(self):
+        super().clear()
+        self.ordered.clear()
+    
+    def scan(self, prefix, condition: Optional[Dict] = None, reverse: bool = False) -> List:
+        """
+        Ids of the documents whose leading fields equal prefix and whose next field
+        satisfies a range condition, in index order.
+        """
+        prefix = tuple(sort_value(value) for value in prefix)
+        # (prefix,) sorts before, and (prefix + ((99,),),) after, every key starting with prefix
+        lower, upper = (prefix,), (prefix + ((99,),),)
+        for operator, operand in (condition or {}).items():
+            rank, value = sort_value(operand)
+            # Ranges never cross types; (rank, value, 1) sorts just after (rank, value)
+            lower = max(lower, (prefix + ((rank,),),))
+            upper = min(upper, (prefix + ((rank + 1,),),))
+            if operator == "$gte":
+                lower = max(lower, (prefix + ((rank, value),),))
+            elif operator == "$gt":
+                lower = max(lower, (prefix + ((rank, value, 1),),))
+            elif operator == "$lt":
+                upper = min(upper, (prefix + ((rank, value),),))
+            elif operator == "$lte":
+                upper = min(upper, (prefix + ((rank, value, 1),),))
+        
+        entries = self.ordered[bisect.bisect_left(self.ordered, lower):bisect.bisect_left(self.ordered, upper)]
+        if reverse:
+            entries.reverse()
+        # A multikey document can appear under several keys; keep its first position
+        return list(dict.fromkeys(_id for _, _, _id in entries))
+
+
+class QueryPlan:
+    """How a query is answered: candidate ids from an index (None = collection scan)"""
+    
+    def __init__(self, stage: str, index=None, ids: Optional[List] = None, ordered: bool = False):
+        self.stage = stage
+        self.index = index
+        self.ids = ids
+        self.ordered = ordered  # Candidates already come in the requested sort order
+    
+    def describe(self, namespace: str) -> Dict:
+        if self.index is None and self.stage == "COLLSCAN":
+            winning_plan = {"stage": "COLLSCAN"}
+        else:
+            input_stage = {"stage": self.stage}
+            if self.index is not None:
+                input_stage["indexName"] = self.index.name
+                input_stage["keyPattern"] = dict(self.index.keys)
+            winning_plan = {"stage": "FETCH", "inputStage": input_stage}
+        return {"namespace": namespace, "winningPlan": winning_plan}
+
+
+class InMemoryCollection:
+    """
+    Documents of one collection by _id (in insertion order) plus its secondary
+    indexes, which are kept current on every write and used to plan queries.
+    
+    With compact=True documents are stored BSON-encoded: a query decodes only
+    the fields its filter and sort read, and results decode only the projected
+    fields. Like a real server, this keeps datetimes to millisecond precision.
+    
+    Stored documents are immutable versions: writes store a private copy and an
+    update swaps in a new version (copy-on-write), and readers get their own
+    copies. A query captures the versions it will read when it starts, so a
+    cursor sees the collection as of its first batch and never a torn update.
+    Writers serialize on a per-collection lock; readers take no lock.
+    
+    TTL indexes work like MongoDB's: a document expires expireAfterSeconds after
+    the (earliest) date in the indexed field. Expiry times are kept in a
+    min-heap so expire() only looks at documents that are due; reads skip
+    expired documents that have not been swept yet.
+    """
+    
+    def __init__(self, name: str, compact: bool = False):
+        self.name = name
+        self.compact = compact
+        self.documents: Dict[Any, Any] = {}
+        self.indexes: Dict[str, HashIndex] = {}
+        self._seq: Dict[Any, int] = {}
+        self._counter = itertools.count()
+        self._write_lock = threading.RLock()
+        # TTL: current expiry per _id, and a min-heap of (expiry, seq, _id) that
+        # may hold stale entries (checked against _expiry when popped)
+        self._expiry: Dict[Any, datetime] = {}
+        self._expiry_heap: List[Tuple[datetime, int, Any]] = []
+    
+    def __len__(self):
+        return len(self.documents)
+    
+    def __iter__(self):
+        return (self._materialize(stored) for stored in self._snapshot())
+    
+    def _encode(self, document: Dict):
+        return bson.encode(document) if self.compact else copy_document(document)
+    
+    def _decode(self, stored, fields=None) -> Dict:
+        if not self.compact:
+            return stored
+        return bson.decode(stored) if fields is None else decode_fields(stored, fields)
+    
+    def _materialize(self, stored, projection=None) -> Dict:
+        """A result document; compact storage decodes just the fields an inclusion projection keeps"""
+        if self.compact and projection:
+            if isinstance(projection, (list, tuple)):
+                projection = {field: 1 for field in projection}
+            included = [field for field, flag in projection.items() if flag and field != "_id"]
+            if included:
+                stored = decode_fields(stored, {field.split(".", 1)[0] for field in included} | {"_id"})
+                return project(stored, projection)
+        if self.compact:
+            return project(self._decode(stored), projection)
+        return copy_document(project(stored, projection))
+    
+    def _snapshot(self, ids=None) -> List:
+        """The stored versions a query will read (all documents, or the given ids), minus expired ones"""
+        documents = self.documents
+        while True:
+            try:
+                if ids is None:
+                    items = list(documents.items())
+                else:
+                    items = [(_id, documents[_id]) for _id in ids if _id in documents]
+                break
+            except RuntimeError:
+                continue  # Resized by a writer thread mid-copy; take the snapshot again
+        if self._expiry:
+            now, expiry = datetime.utcnow(), self._expiry
+            return [stored for _id, stored in items if (expires := expiry.get(_id)) is None or expires > now]
+        return [stored for _, stored in items]
+    
+    def _expiry_for(self, document: Dict) -> Optional[datetime]:
+        """When a document expires under the TTL indexes (None: never)"""
+        expires = None
+        for index in self.indexes.values():
+            if index.expire_after_seconds is None:
+                continue
+            value = get_field(document, index.fields[0])
+            dates = [item for item in (value if isinstance(value, list) else [value]) if isinstance(item, datetime)]
+            if dates:
+                earliest = min(date.replace(tzinfo=None) - (date.utcoffset() or timedelta()) for date in dates)
+                candidate = earliest + timedelta(seconds=index.expire_after_seconds)
+                expires = candidate if expires is None else min(expires, candidate)
+        return expires
+    
+    def _track_expiry(self, _id, document: Dict, seq: int):
+        expires = self._expiry_for(document)
+        if expires is None:
+            self._expiry.pop(_id, None)
+        elif self._expiry.get(_id) != expires:
+            self._expiry[_id] = expires
+            heapq.heappush(self._expiry_heap, (expires, seq, _id))
+        if len(self._expiry_heap) > 2 * len(self._expiry) + 64:
+            # Too many stale entries (updated or deleted documents): rebuild
+            self._expiry_heap = [(expires, self._seq[_id], _id) for _id, expires in self._expiry.items()]
+            heapq.heapify(self._expiry_heap)
+    
+    def clear(self):
+        """Remove every document; index definitions are kept"""
+        with self._write_lock:
+            self.documents.clear()
+            self._seq.clear()
+            self._expiry.clear()
+            self._expiry_heap.clear()
+            for index in self.indexes.values():
+                index.clear()
+    
+    def copy(self) -> List[Dict]:
+        return [self._materialize(stored) for stored in self._snapshot()]
+    
+    def insert(self, document: Dict):
+        with self._write_lock:
+            _id = document['_id']
+            if _id in self.documents:
+                raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.name} index: _id_")
+            stored = self._encode(document)
+            # Key indexes on the stored version (BSON truncates datetimes to milliseconds)
+            # so delete and replace, which decode it, remove exactly the same keys
+            document = self._decode(stored)
+            for index in self.indexes.values():
+                index.check_unique(document, _id)
+            
+            seq = next(self._counter)
+            self.documents[_id] = stored
+            self._seq[_id] = seq
+            for index in self.indexes.values():
+                index.add(document, _id, seq)
+            self._track_expiry(_id, document, seq)
+    
+    def replace(self, _id, document: Dict):
+        with self._write_lock:
+            old = self._decode(self.documents[_id])
+            stored = self._encode(document)
+            document = self._decode(stored)
+            for index in self.indexes.values():
+                index.check_unique(document, _id)
+            
+            seq = self._seq[_id]
+            for index in self.indexes.values():
+                index.remove(old, _id, seq)
+                index.add(document, _id, seq)
+            self.documents[_id] = stored
+            self._track_expiry(_id, document, seq)
+    
+    def delete(self, _id) -> bool:
+        with self._write_lock:
+            stored = self.documents.pop(_id, None)
+            if stored is None:
+                return False
+            document = self._decode(stored)
+            seq = self._seq.pop(_id)
+            for index in self.indexes.values():
+                index.remove(document, _id, seq)
+            self._expiry.pop(_id, None)
+            return True
+    
+    def delete_matching(self, filter_dict: Optional[Dict], limit: Optional[int] = None) -> List:
+        """Atomically delete the documents matching a filter; returns their ids"""
+        with self._write_lock:
+            ids = [doc["_id"] for doc in self.query(filter_dict, limit=limit, projection={"_id": 1})]
+            return [_id for _id in ids if self.delete(_id)]
+    
+    def next_expiry(self) -> Optional[datetime]:
+        """Earliest pending TTL expiry"""
+        with self._write_lock:
+            heap = self._expiry_heap
+            while heap and self._expiry.get(heap[0][2]) != heap[0][0]:
+                heapq.heappop(heap)
+            return heap[0][0] if heap else None
+    
+    def expire(self, now: Optional[datetime] = None) -> List:
+        """Delete the documents whose TTL has passed; returns their ids"""
+        now = now or datetime.utcnow()
+        expired = []
+        with self._write_lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                expires, _, _id = heapq.heappop(heap)
+                if self._expiry.get(_id) == expires and self.delete(_id):
+                    expired.append(_id)
+        return expired
+    
+    def update(self, filter_dict: Optional[Dict], update_dict: Dict) -> Optional[Dict]:
+        """Atomically apply an update to the first matching document; returns the new version"""
+        with self._write_lock:
+            matches = self.query(filter_dict, limit=1)
+            if not matches:
+                return None
+            doc = apply_update(matches[0], update_dict)
+            doc['updated_at'] = datetime.utcnow()
+            self.replace(doc['_id'], doc)
+            return doc
+    
+    def create_index(self, keys, unique: bool = False, name: Optional[str] = None,
+                     expire_after_seconds: Optional[float] = None, sparse: bool = False) -> str:
+        with self._write_lock:
+            return self._create_index(keys, unique, name, expire_after_seconds, sparse)
+    
+    def _create_index(self, keys, unique: bool, name: Optional[str], expire_after_seconds: Optional[float], sparse: bool) -> str:
+        keys = normalize_index_keys(keys)
+        name = name or default_index_name(keys)
+        if name == "_id_" or name in self.indexes:
+            return name
+        if expire_after_seconds is not None and len(keys) != 1:
+            raise OperationFailure("TTL indexes are single-field indexes, compound indexes do not support TTL")
+        
+        index_class = HashIndex if any(direction == pymongo.HASHED for _, direction in keys) else SortedIndex
+        index = index_class(name, keys, unique, expire_after_seconds, sparse)
+        fields = {field.split(".", 1)[0] for field in index.fields}
+        for _id, stored in self.documents.items():
+            document = self._decode(stored, fields)
+            index.check_unique(document, _id)
+            index.add(document, _id, self._seq[_id])
+        self.indexes[name] = index
+        if expire_after_seconds is not None:
+            for _id, stored in self.documents.items():
+                self._track_expiry(_id, self._decode(stored, fields), self._seq[_id])
+        return name
+    
+    def drop_index(self, name: str):
+        with self._write_lock:
+            if name not in self.indexes:
+                raise OperationFailure(f"index not found with name [{name}]")
+            index = self.indexes.pop(name)
+            if index.expire_after_seconds is not None:
+                for _id, stored in self.documents.items():
+                    self._track_expiry(_id, self._decode(stored), self._seq[_id])
+    
+    def index_information(self) -> Dict[str, Dict]:
+        information = {"_id_": {"key": [("_id", pymongo.ASCENDING)]}}
+        information.update({name: index.info() for name, index in self.indexes.items()})
+        return information
+    
+    def plan(self, filter_dict: Optional[Dict], sort=None) -> QueryPlan:
+        """Pick the index that narrows the query the most (or a collection scan)"""
+        filter_dict = filter_dict or {}
+        sort = normalize_sort(sort)
+        
+        equalities = {}
+        choices = {}
+        ranges = {}
+        for field, condition in filter_dict.items():
+            if field.startswith("$"):
+                continue
+            if not is_operator_condition(condition):
+                if not isinstance(condition, (dict, re.Pattern)):
+                    equalities[field] = condition
+            elif set(condition) == {"$eq"}:
+                equalities[field] = condition["$eq"]
+            elif set(condition) == {"$in"} and not any(isinstance(value, re.Pattern) for value in condition["$in"]):
+                choices[field] = list(condition["$in"])
+            elif set(condition) <= set(RANGE_OPERATORS):
+                ranges[field] = condition
+        
+        if "_id" in equalities:
+            _id = equalities["_id"]
+            _id = str(_id) if isinstance(_id, ObjectId) else _id
+            return QueryPlan("IDHACK", ids=[_id] if _id in self.documents else [])
+        
+        sort_fields = [field for field, _ in sort]
+        sort_directions = {direction for _, direction in sort}
+        
+        def excludes_missing(field) -> bool:
+            """Whether the filter only matches documents that have field"""
+            if field in equalities:
+                return equalities[field] is not None
+            if field in choices:
+                return None not in choices[field]
+            return field in ranges and all(operand is not None for operand in ranges[field].values())
+        
+        best, best_score = None, None
+        for index in self.indexes.values():
+            if index.sparse and not any(excludes_missing(field) for field in index.fields):
+                continue  # The index lacks documents the query could match
+            prefix = 0
+            while prefix < len(index.fields) and (index.fields[prefix] in equalities or index.fields[prefix] in choices):
+                prefix += 1
+            in_fields = sum(field in choices for field in index.fields[:prefix])
+            
+            if prefix == len(index.fields):
+                score = (3, prefix, False, -in_fields)
+            elif index.kind != "sorted":
+                continue
+            else:
+                next_field = index.fields[prefix]
+                has_range = next_field in ranges
+                # Sort fields following the equality prefix come out of the scan in order
+                provides_sort = (
+                    bool(sort) and not in_fields and len(sort_directions) == 1
+                    and index.fields[prefix:prefix + len(sort)] == sort_fields
+                )
+                if not (prefix or has_range or provides_sort):
+                    continue
+                score = (2 if prefix or has_range else 1, prefix + has_range, provides_sort, -in_fields)
+            
+            if best_score is None or score > best_score:
+                best, best_score, best_prefix = index, score, prefix
+        
+        if best is None:
+            return QueryPlan("COLLSCAN")
+        
+        full_key = best_score[0] == 3
+        prefix_fields = best.fields[:best_prefix]
+        combinations = itertools.product(*(
+            [equalities[field]] if field in equalities else choices[field] for field in prefix_fields
+        ))
+        
+        if full_key:
+            ids = {}
+            for values in combinations:
+                ids.update(dict.fromkeys(best.lookup(values)))
+            return QueryPlan("IXSCAN", best, ids=list(ids))
+        
+        next_field = best.fields[len(prefix_fields)]
+        ordered = best_score[2]
+        reverse = ordered and sort[0][1] == pymongo.DESCENDING
+        ids = {}
+        for values in combinations:
+            ids.update(dict.fromkeys(best.scan(values, ranges.get(next_field), reverse)))
+        return QueryPlan("IXSCAN", best, ids=list(ids), ordered=ordered)
+    
+    def iter_query(self, filter_dict: Optional[Dict], sort=None, skip: int = 0, limit: Optional[int] = None, projection=None):
+        """
+        Stream the documents matching a query through its plan. Candidates are
+        fixed when the query starts; without a pending sort, skip and limit are
+        applied while scanning so only the needed documents are examined.
+        """
+        sort = normalize_sort(sort)
+        plan = self.plan(filter_dict, sort)
+        candidates = self._snapshot(plan.ids)
+        # (stored, fields the filter and sort read) pairs
+        if self.compact:
+            needed = top_level_fields(filter_dict) | {field.split(".", 1)[0] for field, _ in sort}
+            partial = ((stored, decode_fields(stored, needed)) for stored in candidates)
+        else:
+            partial = ((doc, doc) for doc in candidates)
+        matches = (pair for pair in partial if matches_filter(pair[1], filter_dict))
+        stop = skip + limit if limit else None
+        
+        if sort and not plan.ordered:
+            directions = {direction for _, direction in sort}
+            if stop is not None and len(directions) == 1:
+                # Top-k instead of a full sort when only the first documents are wanted
+                key = lambda pair: tuple(sort_value(get_field(pair[1], field)) for field, _ in sort)
+                select = heapq.nlargest if directions == {pymongo.DESCENDING} else heapq.nsmallest
+                matches = iter(select(stop, matches, key=key))
+            else:
+                matches = iter(sort_documents(list(matches), sort, document=lambda pair: pair[1]))
+        return (self._materialize(stored, projection) for stored, _ in itertools.islice(matches, skip, stop))
+    
+    def query(self, filter_dict: Optional[Dict], sort=None, limit: Optional[int] = None, skip: int = 0, projection=None) -> List[Dict]:
+        """Run a query through its plan; limit stops early when no sort is pending"""
+        return list(self.iter_query(filter_dict, sort, skip, limit, projection))
+    
+    def count(self, filter_dict: Optional[Dict] = None) -> int:
+        if not filter_dict and not self._expiry:
+            return len(self.documents)
+        return sum(1 for _ in self.iter_query(filter_dict))
+    
+    def memory_report(self) -> Dict[str, Any]:
+        """Approximate memory held by the documents and by each index"""
+        seen = set()
+        document_bytes = sys.getsizeof(self.documents) + sum(
+            approximate_size(stored, seen) for stored in self.documents.values()
+        )
+        index_bytes = {
+            name: approximate_size(index.entries, seen) + approximate_size(getattr(index, "ordered", []), seen)
+            for name, index in self.indexes.items()
+        }
+        index_bytes["_id_"] = sys.getsizeof(self._seq) + approximate_size(list(self._seq), seen)
+        total = document_bytes + sum(index_bytes.values())
+        return {
+            "storage": "bson" if self.compact else "dict",
+            "documents": len(self.documents),
+            "indexes": len(self.indexes) + 1,
+            "document_bytes": document_bytes,
+            "avg_document_bytes": document_bytes // len(self.documents) if self.documents else 0,
+            "encoded_bytes": sum(map(len, self.documents.values())) if self.compact else None,
+            "index_bytes": index_bytes,
+            "ttl_tracked": len(self._expiry),
+            "ttl_heap_entries": len(self._expiry_heap),
+            "approx_memory_bytes": total
+        }
+    
+    def aggregate(self, pipeline: List[Dict]) -> List[Dict]:
+        """Run an aggregation pipeline; a leading $match (and $sort) is planned like a query"""
+        pipeline = list(pipeline)
+        filter_dict, sort = None, None
+        if pipeline and "$match" in pipeline[0]:
+            filter_dict = pipeline.pop(0)["$match"]
+        if pipeline and "$sort" in pipeline[0]:
+            sort = normalize_sort(pipeline.pop(0)["$sort"])
+        return run_pipeline(self.query(filter_dict, sort), pipeline)
+
+
+# Value sizes of fixed-width BSON element types
+_BSON_FIXED_SIZES = {0x01: 8, 0x06: 0, 0x07: 12, 0x08: 1, 0x09: 8, 0x0A: 0, 0x10: 4, 0x11: 8, 0x12: 8, 0x13: 16, 0x7F: 0, 0xFF: 0}
+
+
+def bson_elements(raw: bytes):
+    """
+    Yield (name, start, end) for each top-level element of an encoded document,
+    without decoding any values; raw[start:end] is the complete element.
+    """
+    position, end_of_document = 4, len(raw) - 1
+    while position < end_of_document:
+        start = position
+        element_type = raw[position]
+        name_end = raw.index(b"\x00", position + 1)
+        name = raw[position + 1:name_end].decode("utf-8")
+        position = name_end + 1
+        if element_type in _BSON_FIXED_SIZES:
+            position += _BSON_FIXED_SIZES[element_type]
+        elif element_type in (0x02, 0x0D, 0x0E):  # string, code, symbol
+            position += 4 + int.from_bytes(raw[position:position + 4], "little")
+        elif element_type in (0x03, 0x04, 0x0F):  # document, array, code with scope
+            position += int.from_bytes(raw[position:position + 4], "little")
+        elif element_type == 0x05:  # binary: length, subtype, data
+            position += 5 + int.from_bytes(raw[position:position + 4], "little")
+        elif element_type == 0x0B:  # regex: pattern and options cstrings
+            position = raw.index(b"\x00", raw.index(b"\x00", position) + 1) + 1
+        elif element_type == 0x0C:  # DBPointer: string + ObjectId
+            position += 16 + int.from_bytes(raw[position:position + 4], "little")
+        else:
+            raise bson.errors.InvalidBSON(f"unknown element type {element_type:#x}")
+        yield name, start, position
+
+
+def decode_fields(raw: bytes, fields) -> Dict:
+    """Decode only the given top-level fields of an encoded document"""
+    wanted = set(fields)
+    body = b"".join(raw[start:end] for name, start, end in bson_elements(raw) if name in wanted)
+    return bson.decode((len(body) + 5).to_bytes(4, "little") + body + b"\x00")
+
+
+def top_level_fields(filter_dict: Optional[Dict]) -> set:
+    """Top-level document fields a filter reads (through $and/$or/$nor)"""
+    fields = set()
+    for key, condition in (filter_dict or {}).items():
+        if key in ("$and", "$or", "$nor"):
+            for clause in condition:
+                fields |= top_level_fields(clause)
+        elif not key.startswith("$"):
+            fields.add(key.split(".", 1)[0])
+    return fields
+
+
+def approximate_size(value, seen=None) -> int:
+    """Approximate memory held by a document (the object and everything it contains)"""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(approximate_size(key, seen) + approximate_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approximate_size(item, seen) for item in value)
+    return size
+
+
+class OperationJournal:
+    """
+    Append-only operation log for InMemoryMongoDB.
+    
+    Every write is appended as a BSON record with a log sequence number (LSN).
+    A background thread writes the pending records in groups and fsyncs once per
+    group, so concurrent writers share the cost of a sync (group commit); each
+    writer's future completes when its record is on disk. A snapshot is the
+    compacted state written as the same kind of records; on startup the snapshot
+    is loaded and only the log records after it are replayed.
+    
+    Files in the directory:
+        snapshot.bson            header {"op": "snapshot", "lsn": N} + state records
+        oplog-<first lsn>.bson   log segments, a new one per startup and snapshot
+    """
+    
+    SNAPSHOT_FILE = "snapshot.bson"
+    
+    def __init__(self, directory: str, commit_interval_ms: float = 2.0, max_batch: int = 1000, fsync: bool = True):
+        self.directory = directory
+        self.commit_interval = commit_interval_ms / 1000
+        self.max_batch = max_batch
+        self.fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+        
+        self.last_lsn = 0
+        self.snapshot_lsn = 0
+        # (encoded record, future), or (None, future) for a segment switch
+        self._pending: List[Tuple[Optional[bytes], concurrent.futures.Future]] = []
+        self._condition = threading.Condition()
+        self._segment = None
+        self._closed = False
+        self._flusher = None
+        self.stats = {"records": 0, "groups": 0, "fsyncs": 0, "bytes": 0, "snapshots": 0, "last_snapshot_seconds": None}
+    
+    def _segment_paths(self) -> List[str]:
+        names = sorted(name for name in os.listdir(self.directory) if name.startswith("oplog-") and name.endswith(".bson"))
+        return [os.path.join(self.directory, name) for name in names]
+    
+    @staticmethod
+    def _read_records(path: str):
+        """Yield the records of a BSON file, truncating a torn record at the end"""
+        with open(path, "r+b") as f:
+            while True:
+                offset = f.tell()
+                header = f.read(4)
+                if not header:
+                    return
+                length = int.from_bytes(header, "little") if len(header) == 4 else 0
+                body = f.read(length - 4) if length >= 5 else b""
+                try:
+                    if len(body) != length - 4:
+                        raise bson.errors.InvalidBSON("truncated record")
+                    record = bson.decode(header + body)
+                except bson.errors.InvalidBSON:
+                    # Crash during an append: drop the partial record
+                    f.truncate(offset)
+                    return
+                yield record
+    
+    def recover(self):
+        """Yield the snapshot records, then the log records written after it"""
+        snapshot_path = os.path.join(self.directory, self.SNAPSHOT_FILE)
+        if os.path.exists(snapshot_path):
+            records = self._read_records(snapshot_path)
+            header = next(records, None)
+            if header and header.get("op") == "snapshot":
+                self.snapshot_lsn = self.last_lsn = header["lsn"]
+                yield from records
+        
+        for path in self._segment_paths():
+            for record in self._read_records(path):
+                if record["lsn"] > self.snapshot_lsn:
+                    self.last_lsn = record["lsn"]
+                    yield record
+    
+    def open(self):
+        """Start a new log segment and the group commit thread (after recovery)"""
+        self._open_segment()
+        self._flusher = threading.Thread(target=self._flush_loop, name="mongodb-journal", daemon=True)
+        self._flusher.start()
+    
+    def _open_segment(self, first_lsn: Optional[int] = None):
+        first_lsn = self.last_lsn + 1 if first_lsn is None else first_lsn
+        path = os.path.join(self.directory, f"oplog-{first_lsn:016d}.bson")
+        self._segment = open(path, "ab")
+    
+    def append(self, record: Dict) -> concurrent.futures.Future:
+        """Assign the next LSN to a record and queue it; the future completes once it is durable"""
+        future = concurrent.futures.Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Journal is closed")
+            self.last_lsn += 1
+            record["lsn"] = self.last_lsn
+            self._pending.append((bson.encode(record), future))
+            self._condition.notify()
+        return future
+    
+    def _flush_loop(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending and self._closed:
+                    return
+                # Give concurrent writers a moment to join this group
+                if len(self._pending) < self.max_batch and not self._closed:
+                    self._condition.wait(self.commit_interval)
+                group, self._pending = self._pending, []
+            
+            # Segment switches are queued like records, so the log stays in LSN order
+            batch = []
+            for encoded, future in group:
+                if encoded is not None:
+                    batch.append((encoded, future))
+                    continue
+                self._write_group(batch)
+                batch = []
+                self._segment.close()
+                self._open_segment(future.first_lsn)
+                future.set_result(True)
+            self._write_group(batch)
+    
+    def _write_group(self, group):
+        if not group:
+            return
+        try:
+            data = b"".join(encoded for encoded, _ in group)
+            self._segment.write(data)
+            self._segment.flush()
+            if self.fsync:
+                os.fsync(self._segment.fileno())
+                self.stats["fsyncs"] += 1
+            self.stats["records"] += len(group)
+            self.stats["groups"] += 1
+            self.stats["bytes"] += len(data)
+        except Exception as e:
+            for _, future in group:
+                future.set_exception(e)
+            return
+        for _, future in group:
+            future.set_result(True)
+    
+    def rotate(self) -> Tuple[int, concurrent.futures.Future]:
+        """
+        Start a new log segment after the current LSN.
+        
+        Capture the state right before calling this (without yielding to other
+        writers) and pass it to write_snapshot with the returned LSN once the
+        returned future completes.
+        """
+        future = concurrent.futures.Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Journal is closed")
+            lsn = self.last_lsn
+            future.first_lsn = lsn + 1
+            self._pending.append((None, future))
+            self._condition.notify()
+        return lsn, future
+    
+    def write_snapshot(self, records: List[Dict], lsn: int):
+        """Write the compacted state and drop the log segments it covers"""
+        started = time.perf_counter()
+        path = os.path.join(self.directory, self.SNAPSHOT_FILE)
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(bson.encode({"op": "snapshot", "lsn": lsn, "created_at": datetime.utcnow()}))
+            for record in records:
+                f.write(bson.encode(record))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+        
+        for segment_path in self._segment_paths():
+            first_lsn = int(os.path.basename(segment_path)[len("oplog-"):-len(".bson")])
+            if first_lsn <= lsn:
+                os.remove(segment_path)
+        
+        self.snapshot_lsn = lsn
+        self.stats["snapshots"] += 1
+        self.stats["last_snapshot_seconds"] = time.perf_counter() - started
+    
+    def close(self):
+        """Write everything still queued and stop the group commit thread"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        if self._flusher is not None:
+            self._flusher.join()
+        if self._segment is not None:
+            self._segment.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats["last_lsn"] = self.last_lsn
+        stats["snapshot_lsn"] = self.snapshot_lsn
+        stats["records_per_group"] = stats["records"] / stats["groups"] if stats["groups"] else 0.0
+        return stats
+
 
 class InMemoryMongoDB:
-    def __init__(self):
+    def __init__(self, compact_storage: bool = False):
         self.databases = {}
+        self.compact_storage = compact_storage  # Store documents BSON-encoded (see InMemoryCollection)
         self.running = False
         self.active_connections = set()
         self.connection_count = 0
         self.max_connections = 50  # Limit concurrent connections
+        
+        # Optional durability (see enable_durability)
+        self.journal: Optional[OperationJournal] = None
+        self.snapshot_every: Optional[int] = None
+        self.recovery_stats: Optional[Dict[str, Any]] = None
+        self._writes_since_snapshot = 0
+        self._snapshot_thread: Optional[threading.Thread] = None
+        # Held while a write is applied and journaled, and while a snapshot is
+        # captured: log order matches apply order and no write straddles a snapshot
+        self._write_barrier = threading.RLock()
+        
+        # TTL monitor (see start_ttl_monitor), started by the first TTL index
+        self.ttl_interval = float(os.getenv("MONGODB_REPLACEMENT_TTL_INTERVAL", "60"))
+        self.ttl_stats = {"passes": 0, "deleted": 0}
+        self._ttl_thread: Optional[threading.Thread] = None
+        self._ttl_stop = threading.Event()
+        self._ttl_wake = threading.Event()
+    
+    def enable_durability(
+        self,
+        directory: str,
+        commit_interval_ms: float = 2.0,
+        fsync: bool = True,
+        snapshot_every: Optional[int] = 10000
+    ) -> Dict[str, Any]:
+        """
+        Persist every write to an operation log in directory, recovering the
+        data already there first (latest snapshot plus the log written after it).
+        
+        Args:
+            directory: Where the snapshot and log segments live
+            commit_interval_ms: How long a group commit waits for more writers
+            fsync: fsync each group (otherwise data is only flushed to the OS)
+            snapshot_every: Take a compacted snapshot after this many writes (None: only on request)
+        
+        Returns:
+            Recovery statistics (also kept in recovery_stats)
+        """
+        if self.journal is not None:
+            raise RuntimeError("Durability is already enabled")
+        
+        started = time.perf_counter()
+        journal = OperationJournal(directory, commit_interval_ms=commit_interval_ms, fsync=fsync)
+        loaded = replayed = 0
+        for record in journal.recover():
+            self._apply(record)
+            if "lsn" in record:
+                replayed += 1
+            else:
+                loaded += 1
+        journal.open()
+        
+        self.journal = journal
+        self.snapshot_every = snapshot_every
+        # Only now: a TTL pass during replay would delete documents that later
+        # records still update, and its deletes would not reach the journal
+        if self._has_ttl_indexes():
+            self.start_ttl_monitor()
+        self.recovery_stats = {
+            "snapshot_lsn": journal.snapshot_lsn,
+            "last_lsn": journal.last_lsn,
+            "snapshot_records": loaded,
+            "log_records_replayed": replayed,
+            "documents": sum(len(collection) for db in self.databases.values() for collection in db.values()),
+            "recovery_seconds": time.perf_counter() - started
+        }
+        print(f"💾 Recovered {self.recovery_stats['documents']} documents (snapshot + {replayed} log records) "
+              f"from {directory} in {self.recovery_stats['recovery_seconds']:.3f}s")
+        return self.recovery_stats
+    
+    def _apply(self, record: Dict):
+        """Apply a journal record to the in-memory state (recovery; not logged again)"""
+        collection = self.get_collection(record["db"], record["coll"])
+        op = record["op"]
+        if op == "insert":
+            collection.insert(record["doc"])
+        elif op == "replace":
+            collection.replace(record["_id"], record["doc"])
+        elif op == "delete":
+            collection.delete(record["_id"])
+        elif op == "create_index":
+            collection.create_index(record["keys"], unique=record.get("unique", False), name=record.get("name"),
+                                    expire_after_seconds=record.get("expireAfterSeconds"),
+                                    sparse=record.get("sparse", False))
+        elif op == "drop_index":
+            collection.drop_index(record["name"])
+    
+    def _append_log(self, record: Dict) -> Optional[concurrent.futures.Future]:
+        """
+        Queue a write in the journal (taking a snapshot when one is due). Call
+        with _write_barrier held, in the same critical section that applied it.
+        """
+        if self.journal is None:
+            return None
+        future = self.journal.append(record)
+        
+        self._writes_since_snapshot += 1
+        if self.snapshot_every and self._writes_since_snapshot >= self.snapshot_every:
+            if self._snapshot_thread is None or not self._snapshot_thread.is_alive():
+                self._start_snapshot()
+        return future
+    
+    async def _wait_durable(self, *futures: Optional[concurrent.futures.Future]):
+        """Wait until the group commits of the given journal appends are durable"""
+        for future in futures:
+            if future is not None:
+                await asyncio.wrap_future(future)
+    
+    def _capture_state(self) -> List[Dict]:
+        """Current state as journal records (documents are replaced on update, never mutated)"""
+        records = []
+        for db_name, db in self.databases.items():
+            for collection_name, collection in db.items():
+                for index in collection.indexes.values():
+                    records.append({"op": "create_index", "db": db_name, "coll": collection_name,
+                                    "keys": index.keys, "unique": index.unique, "name": index.name,
+                                    "expireAfterSeconds": index.expire_after_seconds, "sparse": index.sparse})
+                for stored in collection._snapshot():
+                    # Encoded documents are written out as they are, without a decode
+                    doc = RawBSONDocument(stored) if collection.compact else stored
+                    records.append({"op": "insert", "db": db_name, "coll": collection_name, "doc": doc})
+        return records
+    
+    def _start_snapshot(self) -> Tuple[threading.Thread, int]:
+        with self._write_barrier:
+            records = self._capture_state()
+            lsn, rotated = self.journal.rotate()
+            self._writes_since_snapshot = 0
+            journal, previous = self.journal, self._snapshot_thread
+            
+            def write():
+                if previous is not None:
+                    previous.join()  # Snapshots are written one at a time, in LSN order
+                rotated.result()
+                journal.write_snapshot(records, lsn)
+            
+            thread = threading.Thread(target=write, name="mongodb-snapshot", daemon=True)
+            thread.start()
+            self._snapshot_thread = thread
+        return thread, lsn
+    
+    async def snapshot(self) -> int:
+        """Write a compacted snapshot now and drop the log it replaces; returns its LSN"""
+        if self.journal is None:
+            raise RuntimeError("Durability is not enabled")
+        if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+            await asyncio.get_running_loop().run_in_executor(None, self._snapshot_thread.join)
+        thread, lsn = self._start_snapshot()
+        await asyncio.get_running_loop().run_in_executor(None, thread.join)
+        return lsn
+    
+    def close_durability(self):
+        """Flush and close the journal; the data stays on disk for the next start"""
+        if self.journal is None:
+            return
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+        self.journal.close()
+        self.journal = None
+    
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Memory report per collection (see InMemoryCollection.memory_report), plus journal statistics"""
+        collections = {}
+        for db_name, db in self.databases.items():
+            for collection_name, collection in db.items():
+                collections[f"{db_name}.{collection_name}"] = collection.memory_report()
+        return {
+            "collections": collections,
+            "total_documents": sum(stats["documents"] for stats in collections.values()),
+            "approx_memory_bytes": sum(stats["approx_memory_bytes"] for stats in collections.values()),
+            "journal": self.journal.get_stats() if self.journal is not None else None,
+            "ttl": dict(self.ttl_stats),
+            "recovery": self.recovery_stats
+        }
     
     def get_database(self, db_name: str):
         if db_name not in self.databases:
-            self.databases[db_name] = {}
+            # setdefault: two threads creating the same database end up sharing one
+            self.databases.setdefault(db_name, {})
         return self.databases[db_name]
     
     def get_collection(self, db_name: str, collection_name: str):
         db = self.get_database(db_name)
         if collection_name not in db:
-            db[collection_name] = []
+            db.setdefault(collection_name, InMemoryCollection(collection_name, compact=self.compact_storage))
         return db[collection_name]
     
     async def insert_one(self, db_name: str, collection_name: str, document: Dict):
@@ -43,63 +1393,173 @@ class InMemoryMongoDB:
             if hasattr(document['_id'], '__str__'):
                 document['_id'] = str(document['_id'])
         document['created_at'] = datetime.utcnow()
-        collection.append(document.copy())
+        with self._write_barrier:
+            collection.insert(document)
+            future = self._append_log({"op": "insert", "db": db_name, "coll": collection_name, "doc": document})
+        await self._wait_durable(future)
         return document['_id']
     
-    async def find_one(self, db_name: str, collection_name: str, filter_dict: Dict, sort=None):
+    async def find_one(self, db_name: str, collection_name: str, filter_dict: Dict = None, sort=None, projection=None, skip: int = 0):
         collection = self.get_collection(db_name, collection_name)
-        matches = []
-        for doc in collection:
-            match = True
-            for key, value in filter_dict.items():
-                if key not in doc or doc[key] != value:
-                    match = False
-                    break
-            if match:
-                matches.append(doc)
-        
-        if not matches:
-            return None
-            
-        # Handle sorting if provided
-        if sort:
-            sort_key, sort_direction = sort[0]  # Take first sort criteria
-            reverse = sort_direction == -1
-            matches.sort(key=lambda x: x.get(sort_key, datetime.min), reverse=reverse)
-        
-        return matches[0]
+        matches = collection.query(filter_dict, sort, limit=1, skip=skip, projection=projection)
+        return matches[0] if matches else None
     
-    async def find(self, db_name: str, collection_name: str, filter_dict: Dict = None):
+    async def find(self, db_name: str, collection_name: str, filter_dict: Dict = None, projection=None, sort=None, skip: int = 0, limit: int = 0):
         collection = self.get_collection(db_name, collection_name)
-        if filter_dict is None:
-            return collection.copy()
-        
-        results = []
-        for doc in collection:
-            match = True
-            for key, value in filter_dict.items():
-                if key not in doc or doc[key] != value:
-                    match = False
-                    break
-            if match:
-                results.append(doc)
-        return results
+        return collection.query(filter_dict, sort, limit, skip, projection)
+    
+    async def count_documents(self, db_name: str, collection_name: str, filter_dict: Dict = None):
+        return self.get_collection(db_name, collection_name).count(filter_dict)
+    
+    async def aggregate(self, db_name: str, collection_name: str, pipeline: List[Dict]):
+        return self.get_collection(db_name, collection_name).aggregate(pipeline)
     
     async def update_one(self, db_name: str, collection_name: str, filter_dict: Dict, update_dict: Dict):
         collection = self.get_collection(db_name, collection_name)
-        for i, doc in enumerate(collection):
-            match = True
-            for key, value in filter_dict.items():
-                if key not in doc or doc[key] != value:
-                    match = False
+        with self._write_barrier:
+            doc = collection.update(filter_dict, update_dict)
+            if doc is None:
+                return False
+            future = self._append_log({"op": "replace", "db": db_name, "coll": collection_name, "_id": doc['_id'], "doc": doc})
+        await self._wait_durable(future)
+        return True
+    
+    async def create_index(self, db_name: str, collection_name: str, keys, unique: bool = False, name: Optional[str] = None, **kwargs):
+        """
+        Create a secondary index; "hashed" keys make an equality-only hash index,
+        expireAfterSeconds makes a TTL index and sparse skips documents without
+        the indexed fields. Other index options are rejected rather than ignored.
+        """
+        unsupported = set(kwargs) - SUPPORTED_INDEX_OPTIONS
+        if unsupported:
+            raise OperationFailure(f"Unsupported index options: {', '.join(sorted(unsupported))}")
+        collection = self.get_collection(db_name, collection_name)
+        expire_after_seconds = kwargs.get("expireAfterSeconds")
+        sparse = bool(kwargs.get("sparse", False))
+        future = None
+        with self._write_barrier:
+            existing = set(collection.indexes)
+            name = collection.create_index(keys, unique=unique, name=name,
+                                           expire_after_seconds=expire_after_seconds, sparse=sparse)
+            created = name not in existing and name in collection.indexes
+            if created:
+                index = collection.indexes[name]
+                future = self._append_log({"op": "create_index", "db": db_name, "coll": collection_name,
+                                           "keys": index.keys, "unique": index.unique, "name": name,
+                                           "expireAfterSeconds": expire_after_seconds, "sparse": sparse})
+        if created and expire_after_seconds is not None:
+            self.start_ttl_monitor()
+        await self._wait_durable(future)
+        return name
+    
+    async def delete_one(self, db_name: str, collection_name: str, filter_dict: Dict):
+        return await self._delete(db_name, collection_name, filter_dict, limit=1)
+    
+    async def delete_many(self, db_name: str, collection_name: str, filter_dict: Dict):
+        return await self._delete(db_name, collection_name, filter_dict)
+    
+    async def _delete(self, db_name: str, collection_name: str, filter_dict: Dict, limit: Optional[int] = None) -> int:
+        collection = self.get_collection(db_name, collection_name)
+        with self._write_barrier:
+            deleted = collection.delete_matching(filter_dict, limit)
+            futures = [self._append_log({"op": "delete", "db": db_name, "coll": collection_name, "_id": _id})
+                       for _id in deleted]
+        await self._wait_durable(*futures)
+        return len(deleted)
+    
+    def sweep_expired(self, now: Optional[datetime] = None) -> int:
+        """Delete every document whose TTL has passed (one TTL monitor pass); returns how many"""
+        deleted = 0
+        for db_name, db in list(self.databases.items()):
+            for collection_name, collection in list(db.items()):
+                with self._write_barrier:
+                    for _id in collection.expire(now):
+                        self._append_log({"op": "delete", "db": db_name, "coll": collection_name, "_id": _id})
+                        deleted += 1
+        self.ttl_stats["passes"] += 1
+        self.ttl_stats["deleted"] += deleted
+        return deleted
+    
+    def _has_ttl_indexes(self) -> bool:
+        return any(
+            index.expire_after_seconds is not None
+            for db in list(self.databases.values()) for collection in list(db.values())
+            for index in list(collection.indexes.values())
+        )
+    
+    def _seconds_to_next_expiry(self) -> float:
+        upcoming = [
+            expires for db in list(self.databases.values()) for collection in list(db.values())
+            if (expires := collection.next_expiry()) is not None
+        ]
+        if not upcoming:
+            return self.ttl_interval
+        return max(0.0, min(self.ttl_interval, (min(upcoming) - datetime.utcnow()).total_seconds()))
+    
+    def start_ttl_monitor(self, interval: Optional[float] = None):
+        """
+        Run TTL passes on a background thread: it sleeps until the earliest
+        pending expiry (at most interval seconds, 60 by default like mongod)
+        and then deletes what is due. Reads already skip expired documents, so
+        the interval only bounds how long they stay in memory.
+        """
+        if interval is not None:
+            self.ttl_interval = interval
+        if self._ttl_thread is not None and self._ttl_thread.is_alive():
+            self._ttl_wake.set()  # Plan the next pass with the new interval
+            return
+        self._ttl_stop.clear()
+        
+        def monitor():
+            while not self._ttl_stop.is_set():
+                self._ttl_wake.wait(self._seconds_to_next_expiry())
+                self._ttl_wake.clear()
+                if self._ttl_stop.is_set():
                     break
-            if match:
-                if '$set' in update_dict:
-                    doc.update(update_dict['$set'])
-                doc['updated_at'] = datetime.utcnow()
-                collection[i] = doc
-                return True
-        return False
+                try:
+                    self.sweep_expired()
+                except RuntimeError as e:  # e.g. the journal closed during shutdown
+                    print(f"⚠️  TTL pass failed: {e}")
+        
+        self._ttl_thread = threading.Thread(target=monitor, name="mongodb-ttl-monitor", daemon=True)
+        self._ttl_thread.start()
+    
+    def stop_ttl_monitor(self):
+        self._ttl_stop.set()
+        self._ttl_wake.set()
+        if self._ttl_thread is not None:
+            self._ttl_thread.join()
+            self._ttl_thread = None
+    
+    async def drop_index(self, db_name: str, collection_name: str, name: str):
+        collection = self.get_collection(db_name, collection_name)
+        with self._write_barrier:
+            collection.drop_index(name)
+            future = self._append_log({"op": "drop_index", "db": db_name, "coll": collection_name, "name": name})
+        await self._wait_durable(future)
+    
+    async def index_information(self, db_name: str, collection_name: str):
+        return self.get_collection(db_name, collection_name).index_information()
+    
+    async def explain(self, db_name: str, collection_name: str, filter_dict: Dict = None, sort=None, skip: int = 0, limit: int = 0):
+        """Describe how a query would run, shaped like MongoDB's explain output"""
+        collection = self.get_collection(db_name, collection_name)
+        plan = collection.plan(filter_dict, sort)
+        results = collection.query(filter_dict, sort, limit=limit, skip=skip)
+        planner = plan.describe(f"{db_name}.{collection_name}")
+        stages = planner["winningPlan"].get("inputStage", planner["winningPlan"])
+        execution_stages = {"stage": stages["stage"]}
+        if "indexName" in stages:
+            execution_stages["indexName"] = stages["indexName"]
+        return {
+            "queryPlanner": planner,
+            "executionStats": {
+                "nReturned": len(results),
+                "totalKeysExamined": len(plan.ids) if plan.index is not None else 0,
+                "totalDocsExamined": len(collection) if plan.ids is None else len(plan.ids),
+                "executionStages": execution_stages
+            }
+        }
 
 # Add connection management methods to InMemoryMongoDB
 def register_connection(self, client):
@@ -119,6 +1579,10 @@ async def cleanup(self):
     """Cleanup all resources"""
     print("🧹 Cleaning up MongoDB replacement system...")
     
+    # Persisted data survives: flush the journal before dropping the in-memory copy
+    self.stop_ttl_monitor()
+    self.close_durability()
+    
     # Clear all databases
     for db_name in list(self.databases.keys()):
         db_data = self.databases[db_name]
@@ -139,8 +1603,17 @@ InMemoryMongoDB.register_connection = register_connection
 InMemoryMongoDB.unregister_connection = unregister_connection
 InMemoryMongoDB.cleanup = cleanup
 
-# Global in-memory database
-in_memory_db = InMemoryMongoDB()
+# Global in-memory database; MONGODB_REPLACEMENT_COMPACT=1 keeps documents BSON-encoded
+in_memory_db = InMemoryMongoDB(compact_storage=os.getenv("MONGODB_REPLACEMENT_COMPACT", "0") == "1")
+
+# Optional durability, e.g. for staging load tests that should survive restarts
+if os.getenv("MONGODB_REPLACEMENT_DATA_DIR"):
+    in_memory_db.enable_durability(
+        os.environ["MONGODB_REPLACEMENT_DATA_DIR"],
+        commit_interval_ms=float(os.getenv("MONGODB_REPLACEMENT_COMMIT_INTERVAL_MS", "2")),
+        fsync=os.getenv("MONGODB_REPLACEMENT_FSYNC", "1") != "0",
+        snapshot_every=int(os.getenv("MONGODB_REPLACEMENT_SNAPSHOT_EVERY", "10000")) or None
+    )
 
 async def setup_test_user():
     """Create the test user that your app expects"""
@@ -251,11 +1724,139 @@ class MockDatabase:
             self.collections.clear()
             print(f"🗄️  Mock database '{self.db_name}' cleaned up")
     
+    def __getitem__(self, collection_name):
+        return self.__getattr__(collection_name)
+    
     def __getattr__(self, collection_name):
+        if collection_name.startswith("__"):
+            raise AttributeError(collection_name)
         if collection_name not in self.collections:
             self.collections[collection_name] = MockCollection(self.db_name, collection_name)
         return self.collections[collection_name]
 
+class MockCursor:
+    """
+    Motor-style cursor over an in-memory query. sort/skip/limit/batch_size chain
+    before iteration; results are produced by a streaming index scan and handed
+    out batch_size documents at a time, yielding to the event loop between
+    batches so long scans don't starve other requests.
+    """
+    
+    DEFAULT_BATCH_SIZE = 101
+    
+    def __init__(self, collection, filter_dict=None, projection=None, skip=0, limit=0, sort=None, batch_size=DEFAULT_BATCH_SIZE):
+        self.collection = collection
+        self.filter_dict = filter_dict
+        self.projection = projection
+        self._skip = skip
+        self._limit = limit
+        self._sort = sort or []
+        self._batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        self._results = None
+        self._buffer = []
+    
+    def _check_not_started(self):
+        if self._results is not None:
+            raise pymongo.errors.InvalidOperation("cannot set options after executing query")
+    
+    def sort(self, key_or_list, direction=None):
+        self._check_not_started()
+        self._sort = normalize_sort(key_or_list, direction)
+        return self
+    
+    def skip(self, skip):
+        self._check_not_started()
+        self._skip = skip
+        return self
+    
+    def limit(self, limit):
+        self._check_not_started()
+        self._limit = limit
+        return self
+    
+    def batch_size(self, batch_size):
+        self._batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        return self
+    
+    def _start(self):
+        if self._results is None:
+            collection = in_memory_db.get_collection(self.collection.db_name, self.collection.collection_name)
+            self._results = collection.iter_query(self.filter_dict, self._sort, self._skip, self._limit, self.projection)
+    
+    async def _next_batch(self) -> List[Dict]:
+        self._start()
+        await asyncio.sleep(0)
+        return list(itertools.islice(self._results, self._batch_size))
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        if not self._buffer:
+            self._buffer = await self._next_batch()
+            if not self._buffer:
+                raise StopAsyncIteration
+        return self._buffer.pop(0)
+    
+    async def to_list(self, length=None):
+        results = []
+        while length is None or len(results) < length:
+            if not self._buffer:
+                self._buffer = await self._next_batch()
+                if not self._buffer:
+                    break
+            take = len(self._buffer) if length is None else length - len(results)
+            results.extend(self._buffer[:take])
+            del self._buffer[:take]
+        return results
+    
+    async def explain(self):
+        return await in_memory_db.explain(
+            self.collection.db_name, self.collection.collection_name,
+            self.filter_dict, self._sort, self._skip, self._limit
+        )
+    
+    def __await__(self):
+        # Older callers awaited find() directly
+        async def itself():
+            return self
+        return itself().__await__()
+
+
+class MockAggregateCursor:
+    """Cursor over the results of an aggregation pipeline"""
+    
+    def __init__(self, collection, pipeline):
+        self.collection = collection
+        self.pipeline = list(pipeline)
+        self._results = None
+    
+    async def _run(self):
+        if self._results is None:
+            self._results = iter(await in_memory_db.aggregate(
+                self.collection.db_name, self.collection.collection_name, self.pipeline
+            ))
+        return self._results
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        try:
+            return next(await self._run())
+        except StopIteration:
+            raise StopAsyncIteration
+    
+    async def to_list(self, length=None):
+        results = await self._run()
+        return list(results if length is None else itertools.islice(results, length))
+    
+    async def explain(self):
+        first = self.pipeline[0].get("$match") if self.pipeline else None
+        plan = await in_memory_db.explain(self.collection.db_name, self.collection.collection_name, first)
+        return {"stages": [{"$cursor": plan}] + [stage for stage in self.pipeline[1 if first is not None else 0:]],
+                "executionStats": plan["executionStats"]}
+
 class MockCollection:
     def __init__(self, db_name, collection_name):
         self.db_name = db_name
@@ -263,11 +1864,11 @@ class MockCollection:
         self.closed = False
         self.operation_timeout = 20.0  # Default 20 second timeout
     
-    async def find_one(self, filter_dict, sort=None):
+    async def find_one(self, filter=None, projection=None, sort=None, skip=0, **kwargs):
         if self.closed:
             raise Exception("Collection is closed")
         return await asyncio.wait_for(
-            in_memory_db.find_one(self.db_name, self.collection_name, filter_dict, sort),
+            in_memory_db.find_one(self.db_name, self.collection_name, filter, normalize_sort(sort), projection, skip),
             timeout=self.operation_timeout
         )
     
@@ -280,14 +1881,21 @@ class MockCollection:
         )
         return type('InsertResult', (), {'inserted_id': _id})()
     
-    async def find(self, filter_dict=None):
+    def find(self, filter=None, projection=None, skip=0, limit=0, sort=None, batch_size=MockCursor.DEFAULT_BATCH_SIZE, **kwargs):
+        """Return a cursor; nothing runs until it is iterated, like Motor"""
         if self.closed:
             raise Exception("Collection is closed")
-        results = await asyncio.wait_for(
-            in_memory_db.find(self.db_name, self.collection_name, filter_dict),
-            timeout=self.operation_timeout
-        )
-        return MockCursor(results)
+        return MockCursor(self, filter, projection, skip, limit, normalize_sort(sort), batch_size)
+    
+    async def count_documents(self, filter=None, **kwargs):
+        if self.closed:
+            raise Exception("Collection is closed")
+        return await in_memory_db.count_documents(self.db_name, self.collection_name, filter)
+    
+    def aggregate(self, pipeline, **kwargs):
+        if self.closed:
+            raise Exception("Collection is closed")
+        return MockAggregateCursor(self, pipeline)
     
     async def update_one(self, filter_dict, update_dict):
         if self.closed:
@@ -298,21 +1906,40 @@ class MockCollection:
         )
         return type('UpdateResult', (), {'modified_count': 1 if success else 0})()
     
+    async def create_index(self, keys, unique=False, name=None, **kwargs):
+        if self.closed:
+            raise Exception("Collection is closed")
+        return await in_memory_db.create_index(self.db_name, self.collection_name, keys, unique=unique, name=name, **kwargs)
+    
+    async def delete_one(self, filter_dict):
+        if self.closed:
+            raise Exception("Collection is closed")
+        deleted = await in_memory_db.delete_one(self.db_name, self.collection_name, filter_dict)
+        return type('DeleteResult', (), {'deleted_count': deleted})()
+    
+    async def delete_many(self, filter_dict):
+        if self.closed:
+            raise Exception("Collection is closed")
+        deleted = await in_memory_db.delete_many(self.db_name, self.collection_name, filter_dict)
+        return type('DeleteResult', (), {'deleted_count': deleted})()
+    
+    async def drop_index(self, name):
+        if self.closed:
+            raise Exception("Collection is closed")
+        await in_memory_db.drop_index(self.db_name, self.collection_name, name)
+    
+    async def index_information(self):
+        return await in_memory_db.index_information(self.db_name, self.collection_name)
+    
+    async def explain(self, filter_dict=None, sort=None):
+        return await in_memory_db.explain(self.db_name, self.collection_name, filter_dict, normalize_sort(sort))
+    
     def cleanup(self):
         """Cleanup collection resources"""
         if not self.closed:
             self.closed = True
             print(f"📄 Mock collection '{self.db_name}.{self.collection_name}' cleaned up")
 
-class MockCursor:
-    def __init__(self, results):
-        self.results = results
-    
-    async def to_list(self, length=None):
-        if length is None:
-            return self.results
-        return self.results[:length]
-
 # Monkey patch the motor client
 original_client = AsyncIOMotorClient
 
@@ -0,0 +1,71 @@
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.async_database import AsyncCareerDatabase
+from recommendation_engine.career_database import CareerData, CareerField, ExperienceLevel
+from recommendation_engine.executor import EngineOverloadedError
+
+
+def make_career(career_id):
+    return CareerData(
+        career_id=career_id,
+        title=f"Career {career_id}",
+        description="Builds things",
+        career_field=CareerField.TECHNOLOGY,
+        experience_level=ExperienceLevel.MID,
+        salary_min=80000,
+        salary_max=120000
+    )
+
+
+def test_awaitable_methods_run_off_the_event_loop(tmp_path):
+    """
+    Reads and writes run on database threads, are timed per method, and the
+    wrapped database keeps working synchronously.
+    """
+    db = AsyncCareerDatabase(str(tmp_path / "careers.db"), max_workers=2)
+    threads = set()
+
+    async def scenario():
+        loop_thread = threading.get_ident()
+        assert await db.add_career(make_career("a"))
+        await db.add_careers_bulk([make_career("b"), make_career("c")])
+        careers = await asyncio.gather(*(db.get_career(cid) for cid in "abc"))
+        threads.add(await db.run(threading.get_ident))
+        streamed = [career.career_id async for career in db.iter_careers(batch_size=2)]
+        return loop_thread, [career.career_id for career in careers], streamed
+
+    loop_thread, fetched, streamed = asyncio.run(scenario())
+
+    assert fetched == ["a", "b", "c"] and streamed == ["a", "b", "c"]
+    assert loop_thread not in threads
+    assert db.db.get_career("a").career_id == "a"
+    metrics = db.get_metrics()
+    assert metrics["queries"]["get_career"]["calls"] == 3
+    assert metrics["queries"]["add_careers_bulk"]["failed"] == 0
+    db.close()
+
+
+def test_concurrency_is_bounded(tmp_path):
+    """
+    Calls beyond the worker and queue limits are rejected immediately.
+    """
+    db = AsyncCareerDatabase(str(tmp_path / "careers.db"), max_workers=1, max_queue_depth=0)
+    release = threading.Event()
+
+    async def scenario():
+        blocked = asyncio.ensure_future(db.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        with pytest.raises(EngineOverloadedError):
+            await db.get_career("a")
+        release.set()
+        await blocked
+
+    asyncio.run(scenario())
+    db.close()
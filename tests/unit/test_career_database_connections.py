@@ -0,0 +1,336 @@
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.career_database import CAREER_COLUMNS, CareerData, CareerDatabase, CareerField, ExperienceLevel
+
+
+def make_career(career_id, title):
+    return CareerData(
+        career_id=career_id,
+        title=title,
+        description="Builds things",
+        career_field=CareerField.TECHNOLOGY,
+        experience_level=ExperienceLevel.MID,
+        salary_min=80000,
+        salary_max=120000,
+        required_technical_skills=["Python"]
+    )
+
+
+def test_connections_are_persistent_and_use_wal(tmp_path):
+    """
+    The database runs in WAL mode and a thread reuses its read connection.
+    """
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    try:
+        with db.connections.reader() as first:
+            assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        with db.connections.reader() as second:
+            assert second is first
+
+        assert db.add_career(make_career("swe", "Software Engineer"))
+        assert db.get_career("swe").required_technical_skills == ["Python"]
+    finally:
+        db.close()
+
+
+def test_read_connections_of_finished_threads_are_closed(tmp_path):
+    """
+    A thread's read connection is closed and forgotten once the thread exits,
+    so short-lived threads do not accumulate open connections.
+    """
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    db.add_career(make_career("swe", "Software Engineer"))
+    baseline = len(db.connections._readers)
+    opened = []
+
+    def read():
+        with db.connections.reader() as conn:
+            opened.append(conn)
+        assert db.get_career("swe").title == "Software Engineer"
+
+    for _ in range(5):
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+
+    assert len(opened) == 5
+    assert len(db.connections._readers) == baseline
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    assert db.get_career("swe").title == "Software Engineer"
+    db.close()
+
+
+def test_readers_do_not_wait_on_an_open_write(tmp_path):
+    """
+    While a write transaction is open, readers see the last committed state
+    right away instead of blocking until the writer commits.
+    """
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    db.add_career(make_career("swe", "Software Engineer"))
+    written = threading.Event()
+    release = threading.Event()
+
+    def slow_write():
+        with db.connections.writer() as conn:
+            conn.execute("UPDATE careers SET title = 'Changed' WHERE career_id = 'swe'")
+            written.set()
+            release.wait(5)
+
+    writer = threading.Thread(target=slow_write)
+    writer.start()
+    try:
+        assert written.wait(5)
+        started = time.perf_counter()
+        titles = [career.title for career in db.get_all_careers()]
+        assert time.perf_counter() - started < 1.0
+        assert titles == ["Software Engineer"]
+    finally:
+        release.set()
+        writer.join()
+
+    assert db.get_career("swe").title == "Changed"
+    db.close()
+
+
+def test_bulk_load_reports_bad_rows_per_batch(tmp_path):
+    """
+    Bulk loading writes every valid career, reports the rejected ones with
+    their batch, and leaves the secondary indexes in place.
+    """
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    careers = [make_career(f"career_{i}", f"Career {i}") for i in range(7)]
+    careers[4].title = None
+
+    reports = db.add_careers_bulk(careers, batch_size=3)
+
+    assert [(r.batch_number, r.attempted, r.inserted) for r in reports] == [(1, 3, 3), (2, 3, 2), (3, 1, 1)]
+    assert [career_id for career_id, _ in reports[1].errors] == ["career_4"]
+    assert len(db.get_all_careers()) == 6
+    with db.connections.reader() as conn:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_career_field", "idx_experience_level", "idx_salary_range", "idx_title"} <= indexes
+    db.close()
+
+
+def test_full_text_search_ranks_and_stays_in_sync(tmp_path):
+    """
+    Text queries match skills and keywords, support phrases and prefixes,
+    combine with filters, and follow updates and deletes.
+    """
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    data_engineer = make_career("de", "Data Engineer")
+    data_engineer.required_technical_skills = ["Spark", "SQL"]
+    analyst = make_career("da", "Business Analyst")
+    analyst.description = "Turns data into reports for engineers"
+    analyst.experience_level = ExperienceLevel.ENTRY
+    chef = make_career("chef", "Chef")
+    chef.career_field = CareerField.HOSPITALITY_SERVICE
+    chef.resume_keywords = ["menu planning"]
+    db.add_careers_bulk([data_engineer, analyst, chef])
+
+    assert [c.career_id for c in db.search_careers(text_query="data eng")] == ["de", "da"]
+    assert [c.career_id for c in db.search_careers(text_query="spark")] == ["de"]
+    assert [c.career_id for c in db.search_careers(text_query='"menu planning"')] == ["chef"]
+    assert db.search_careers(text_query='"planning menu"') == []
+    assert [c.career_id for c in db.search_careers(
+        text_query="data", experience_levels=[ExperienceLevel.ENTRY]
+    )] == ["da"]
+
+    chef.resume_keywords = ["plating"]
+    db.update_career(chef)
+    db.delete_career("de")
+    assert db.search_careers(text_query='"menu planning"') == []
+    assert [c.career_id for c in db.search_careers(text_query="plat")] == ["chef"]
+    assert [c.career_id for c in db.search_careers(text_query="spark OR")] == []
+    db.close()
+
+
+def test_search_index_is_rebuilt_after_an_interrupted_bulk_load(tmp_path):
+    """
+    Reopening a database whose search triggers were dropped by a bulk load
+    that never finished rebuilds careers_fts from the table.
+    """
+    path = str(tmp_path / "careers.db")
+    db = CareerDatabase(path)
+    db.add_career(make_career("de", "Data Engineer"))
+    with db.connections.writer() as conn:
+        db._drop_search_triggers(conn)
+    db.add_career(make_career("ds", "Data Scientist"))
+    db.close()
+
+    db = CareerDatabase(path)
+    try:
+        assert db.full_text_search
+        assert sorted(c.career_id for c in db.search_careers(text_query="data")) == ["de", "ds"]
+    finally:
+        db.close()
+
+
+def test_careers_are_ranked_by_weighted_skill_overlap(tmp_path):
+    """
+    Required technical skills outweigh preferred ones, matching ignores case,
+    and updates and deletes keep the normalized skill rows current.
+    """
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    engineer = make_career("swe", "Software Engineer")
+    engineer.required_technical_skills = ["Python", "SQL"]
+    analyst = make_career("da", "Data Analyst")
+    analyst.required_technical_skills = ["SQL"]
+    analyst.preferred_skills = ["Python"]
+    chef = make_career("chef", "Chef")
+    chef.required_technical_skills = ["Cooking"]
+    for career in (engineer, analyst, chef):
+        db.add_career(career)
+
+    ranked = db.rank_careers_by_skills(["python", "sql"])
+    assert [(career.career_id, score) for career, score in ranked] == [("swe", 2.0), ("da", 1.5)]
+
+    analyst.preferred_skills = []
+    db.update_career(analyst)
+    db.delete_career("swe")
+    assert [(c.career_id, s) for c, s in db.rank_careers_by_skills(["Python", "SQL"])] == [("da", 1.0)]
+    assert db.rank_careers_by_skills(["Python"], kinds=["technical"]) == []
+    db.close()
+
+
+def test_iter_careers_streams_with_keyset_pages(tmp_path):
+    """
+    Streaming returns every matching career once in (title, career_id) order,
+    including duplicate titles that straddle a batch boundary, and cursor
+    pages chain to the same sequence.
+    """
+    from recommendation_engine.career_database import CareerFilters
+
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    careers = [make_career(f"c{i:02d}", f"Title {i % 4}") for i in range(11)]
+    careers[3].experience_level = ExperienceLevel.SENIOR
+    db.add_careers_bulk(careers)
+    expected = sorted(((c.title, c.career_id) for c in careers))
+
+    assert [(c.title, c.career_id) for c in db.iter_careers(batch_size=2)] == expected
+    assert [c.career_id for c in db.get_all_careers(limit=3)] == [cid for _, cid in expected[:3]]
+    assert [c.career_id for c in db.iter_careers(CareerFilters(experience_levels=[ExperienceLevel.SENIOR]))] == ["c03"]
+
+    paged, cursor = [], None
+    while True:
+        page, cursor = db.get_careers_page(page_size=4, cursor=cursor)
+        paged.extend((c.title, c.career_id) for c in page)
+        if cursor is None:
+            break
+    assert paged == expected
+    db.close()
+
+
+def test_careers_page_endpoint_returns_next_cursor(tmp_path):
+    """
+    GET /careers/page chains pages through next_cursor and rejects a
+    malformed cursor with 400.
+    """
+    pytest.importorskip("beanie")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from recommendation_engine.unified_api import UnifiedRecommendationAPI, create_careers_router
+
+    api = UnifiedRecommendationAPI(career_db_path=str(tmp_path / "careers.db"))
+    api.career_db.add_careers_bulk([make_career(f"c{i}", f"Title {i}") for i in range(5)])
+    app = FastAPI()
+    app.include_router(create_careers_router(api))
+    client = TestClient(app)
+
+    seen, cursor = [], None
+    while True:
+        params = {"page_size": 2, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/careers/page", params=params).json()
+        seen.extend(career["career_id"] for career in body["careers"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [f"c{i}" for i in range(5)]
+    assert client.get("/careers/page", params={"cursor": "not-a-cursor"}).status_code == 400
+    api.career_db.close()
+
+
+def test_projected_reads_return_lazy_rows(tmp_path):
+    """
+    Projected reads select only the requested columns and decode JSON
+    columns on first access.
+    """
+    from recommendation_engine.career_database import CareerRow
+
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    db.add_career(make_career("swe", "Software Engineer"))
+
+    row = db.get_career("swe", columns=["title", "required_technical_skills", "career_field"])
+    assert isinstance(row, CareerRow)
+    assert sorted(row.keys()) == ["career_field", "career_id", "required_technical_skills", "title"]
+    assert row.career_field is CareerField.TECHNOLOGY
+    assert row.required_technical_skills == ["Python"]
+    assert row.required_technical_skills is row.required_technical_skills
+    try:
+        row.description
+        assert False, "description was not selected"
+    except AttributeError:
+        pass
+
+    [streamed] = db.iter_careers(columns=["salary_min"])
+    assert (streamed.title, streamed.salary_min) == ("Software Engineer", 80000)
+    assert db.search_careers(text_query="software", columns=["bogus"]) == []
+    assert db.get_career("swe", columns=CAREER_COLUMNS).to_career_data() == db.get_career("swe")
+    db.close()
+
+
+def test_statistics_are_maintained_incrementally(tmp_path):
+    """
+    Statistics follow inserts, updates, deletes and bulk loads, and match a
+    full recomputation.
+    """
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    careers = [make_career(f"c{i}", f"Career {i}") for i in range(5)]
+    careers[0].career_field = CareerField.HEALTHCARE
+    careers[1].salary_max = 200000
+    db.add_careers_bulk(careers)
+
+    moved = make_career("c2", "Career 2")
+    moved.experience_level = ExperienceLevel.SENIOR
+    moved.required_technical_skills = ["Python", "Go"]
+    db.update_career(moved)
+    db.delete_career("c3")
+
+    stats = db.get_career_statistics()
+    assert stats["total_careers"] == 4
+    assert stats["careers_by_field"] == {"healthcare": 1, "technology": 3}
+    assert stats["careers_by_experience_level"] == {"mid": 3, "senior": 1}
+    assert stats["salary_statistics"]["highest_salary"] == 200000
+    assert stats["salary_statistics"]["average_max_salary"] == 140000
+    assert stats["salary_histogram"]["bands"] == {100000: 3, 125000: 1}
+    assert stats["top_skills"][0] == {"skill": "Python", "careers": 4}
+    assert stats["skill_career_links"] == 5
+
+    assert db.rebuild_statistics()
+    assert db.get_career_statistics() == stats
+    db.close()
+
+
+def test_search_breaks_title_ties_by_career_id(tmp_path):
+    """
+    Careers with the same title (and rank) come back in career_id order,
+    whatever order they were inserted in.
+    """
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    for career_id in ("c3", "c1", "c2"):
+        db.add_career(make_career(career_id, "Data Engineer"))
+
+    assert [c.career_id for c in db.search_careers()] == ["c1", "c2", "c3"]
+    assert [c.career_id for c in db.search_careers(text_query="data")] == ["c1", "c2", "c3"]
+    db.close()
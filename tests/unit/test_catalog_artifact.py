@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.catalog_artifact import (
+    CatalogArtifact, build_catalog_artifact, load_catalog
+)
+
+
+CAREERS = [
+    {"title": "Data Analyst", "careerType": "data-analyst", "minSalary": 60000,
+     "relevanceScore": 85, "requiredTechnicalSkills": ["SQL", "Python"], "learningPath": "Bootcamp"},
+    {"title": "Ingénieur Logiciel", "careerType": "software-engineer", "minSalary": 90000,
+     "relevanceScore": 91.5, "requiredTechnicalSkills": [], "learningPath": ["CS degree", "Projects"],
+     "remote": True},
+]
+
+
+def test_artifact_round_trips_careers(tmp_path):
+    """
+    Every record decodes to the original dictionary, including unicode text,
+    mixed int/float values, lists and keys missing from some records.
+    """
+    path = str(tmp_path / "catalog.bin")
+    header = build_catalog_artifact(CAREERS, path, source="test")
+
+    kinds = {column["name"]: column["kind"] for column in header["columns"]}
+    assert kinds["minSalary"] == "int"
+    assert kinds["title"] == "text"
+    assert kinds["relevanceScore"] == "json"
+
+    artifact = CatalogArtifact(path)
+    try:
+        assert len(artifact) == 2
+        assert artifact.to_dicts() == CAREERS
+        assert "remote" not in artifact[0] and artifact[-1]["remote"] is True
+        assert artifact[1].get("careerType") == "software-engineer"
+        assert list(artifact.column("minSalary")) == [60000, 90000]
+        with pytest.raises(TypeError):
+            artifact.column("title")
+    finally:
+        artifact.close()
+
+
+def test_load_catalog_falls_back_without_artifact(tmp_path):
+    """
+    A missing artifact builds the catalog in-process; a bad file is rejected.
+    """
+    assert load_catalog(str(tmp_path / "missing.bin"), lambda: CAREERS) is CAREERS
+    assert load_catalog(None, lambda: CAREERS) is CAREERS
+
+    bogus = tmp_path / "bogus.bin"
+    bogus.write_bytes(b"not a catalog artifact")
+    with pytest.raises(ValueError):
+        CatalogArtifact(str(bogus))
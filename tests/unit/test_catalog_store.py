@@ -0,0 +1,66 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.catalog_store import CatalogStore
+from recommendation_engine.career_database import CareerData, CareerDatabase, CareerField, ExperienceLevel
+
+
+def test_changes_publish_new_versions_and_keep_old_snapshots():
+    """
+    Every change swaps in a new indexed snapshot with a higher version and
+    notifies subscribers; snapshots held by readers never change.
+    """
+    store = CatalogStore(
+        [{"careerType": "chef", "field": "food"}, {"careerType": "nurse", "field": "health"}],
+        indexes={"field": lambda career: career["field"]}
+    )
+    events = []
+    store.subscribe(lambda change: events.append((change.kind, change.career_ids, change.version)))
+    before = store.snapshot
+
+    store.add_career({"careerType": "baker", "field": "food"})
+    store.update_career({"careerType": "chef", "field": "food", "title": "Head Chef"})
+    store.delete_career("nurse")
+    assert store.delete_career("nurse") is None
+
+    assert events == [("add", ("baker",), 2), ("update", ("chef",), 3), ("delete", ("nurse",), 4)]
+    assert [c["careerType"] for c in store.snapshot.careers] == ["chef", "baker"]
+    assert store.snapshot.get("chef")["title"] == "Head Chef"
+    assert [c["careerType"] for c in store.snapshot.lookup("field", "food")] == ["chef", "baker"]
+    assert before.version == 1 and len(before) == 2 and before.get("nurse") is not None
+
+
+def test_file_reload_and_database_changes_are_published(tmp_path):
+    """
+    Reloading a file and writing through a mirrored CareerDatabase both
+    produce change events and new snapshots.
+    """
+    path = tmp_path / "careers.json"
+    path.write_text(json.dumps([{"careerType": "a"}, {"careerType": "b"}]))
+    store = CatalogStore()
+    change = store.load_file(str(path))
+    assert (change.kind, change.version, len(change.snapshot)) == ("reload", 2, 2)
+
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    mirror = CatalogStore()
+    events = []
+    mirror.subscribe(lambda change: events.append((change.kind, change.career_ids)))
+    mirror.attach_database(db)
+
+    career = CareerData(
+        career_id="swe", title="Software Engineer", description="Builds software",
+        career_field=CareerField.TECHNOLOGY, experience_level=ExperienceLevel.MID,
+        salary_min=80000, salary_max=120000
+    )
+    db.add_career(career)
+    career.title = "Senior Software Engineer"
+    db.update_career(career)
+    assert mirror.snapshot.get("swe").title == "Senior Software Engineer"
+    db.delete_career("swe")
+
+    assert events == [("reload", ()), ("add", ("swe",)), ("update", ("swe",)), ("delete", ("swe",))]
+    assert len(mirror.snapshot) == 0
+    db.close()
@@ -0,0 +1,130 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.config import CascadeStageConfig, RecommendationConfig, ScoringWeights, compile_config
+
+
+def make_engine():
+    pytest.importorskip("beanie")
+    from recommendation_engine.engine import RecommendationEngine
+
+    return RecommendationEngine(config=RecommendationConfig())
+
+
+def test_compiled_penalty_table_matches_formula():
+    """
+    Precompiled penalties equal base * multiplier clamped to max_penalty.
+    """
+    config = RecommendationConfig()
+    compiled = compile_config(config)
+    penalty_config = config.consistency_penalty_config
+
+    for level, multiplier in penalty_config.exploration_level_multiplier.items():
+        expected = min(penalty_config.base_penalty * multiplier, penalty_config.max_penalty)
+        assert compiled.penalty_for(level) == pytest.approx(expected)
+    assert compiled.penalty_for(99) == pytest.approx(min(penalty_config.base_penalty, penalty_config.max_penalty))
+
+
+def test_compiled_config_is_detached_from_its_source():
+    """
+    Request paths read the compiled config, which later edits cannot change.
+    """
+    config = RecommendationConfig(
+        prefilter_limit=80,
+        cascade_stages=[CascadeStageConfig(name="linear", output_size=80), CascadeStageConfig(name="full_score")]
+    )
+    compiled = compile_config(config)
+
+    config.prefilter_limit = 60
+    config.consistency_penalty_config.max_penalty = 0.1
+    config.cascade_stages[0].output_size = 5
+
+    assert compiled.prefilter_limit == 80
+    assert compiled.max_penalty == RecommendationConfig().consistency_penalty_config.max_penalty
+    assert [(stage.name, stage.output_size) for stage in compiled.cascade_stages] == [("linear", 80), ("full_score", None)]
+
+def test_default_funnel_uses_prefilter_limit_and_top_n_candidates():
+    """
+    The default cascade cuts to prefilter_limit, then to top_n_candidates
+    (but never below max_recommendations) before full scoring.
+    """
+    def sizes(config):
+        return [(stage.name, stage.output_size) for stage in config.get_cascade_stages()]
+
+    assert sizes(RecommendationConfig(prefilter_limit=80, top_n_candidates=25)) == [
+        ("linear", 80), ("prompt_budget", None), ("filter", 25), ("full_score", None)
+    ]
+    assert sizes(RecommendationConfig(top_n_candidates=25, max_recommendations=40))[2] == ("filter", 40)
+
+    with pytest.deprecated_call():
+        RecommendationConfig().batch_size
+
+def test_update_config_swaps_snapshot_atomically():
+    """
+    A request holding the old snapshot keeps seeing the old config after a swap.
+    """
+    engine = make_engine()
+    in_flight = engine.snapshot
+
+    new_config = RecommendationConfig(max_recommendations=7)
+    swapped = engine.update_config(new_config)
+
+    assert swapped.version == in_flight.version + 1
+    assert engine.config.max_recommendations == 7
+    assert in_flight.config.max_recommendations == RecommendationConfig().max_recommendations
+    assert in_flight.scoring_engine is not swapped.scoring_engine
+
+    # Mutating the caller's object afterwards does not leak into the snapshot
+    new_config.max_recommendations = 3
+    assert engine.config.max_recommendations == 7
+
+    # Nor does mutating the config read back from the live snapshot
+    swapped.config.categorization_thresholds.safe_zone_min = 0.1
+    engine.config.max_recommendations = 1
+    assert swapped.config.categorization_thresholds.safe_zone_min == new_config.categorization_thresholds.safe_zone_min
+    assert swapped.compiled.max_recommendations == 7
+    assert swapped.categorization_engine.threshold_vector == swapped.compiled.threshold_vector
+
+
+def test_invalid_config_is_rejected_and_old_snapshot_kept():
+    """
+    Validation failures leave the active snapshot untouched.
+    """
+    from recommendation_engine.config_manager import ConfigManager
+
+    engine = make_engine()
+    manager = ConfigManager(engine)
+    before = engine.snapshot
+
+    bad = RecommendationConfig(scoring_weights=ScoringWeights(skill_match=0.9))
+    with pytest.raises(ValueError):
+        manager.apply(bad)
+
+    assert engine.snapshot is before
+    assert "sum to 1.0" in manager.last_error
+
+
+def test_reload_from_watched_file(tmp_path):
+    """
+    Changing the watched file applies the new config on the next check.
+    """
+    from recommendation_engine.config_manager import ConfigManager
+
+    engine = make_engine()
+    path = tmp_path / "recommendation_config.json"
+    path.write_text(json.dumps({"prefilter_limit": 80}))
+
+    manager = ConfigManager(engine, config_path=str(path))
+    manager.reload_from_file()
+    assert engine.config.prefilter_limit == 80
+
+    path.write_text(json.dumps({"prefilter_limit": 60}))
+    os.utime(path, (0, 12345))
+    assert manager.check_for_changes()
+    assert engine.config.prefilter_limit == 60
+    assert manager.get_status()["reload_count"] == 2
@@ -0,0 +1,133 @@
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.catalog_index import CatalogIndexCache
+
+
+def summarize(recommendations):
+    """Comparable form of a recommendation list."""
+    return [
+        (rec["career_id"], str(rec["category"]), round(rec["score"].total_score, 12), tuple(rec["reasons"]))
+        for rec in recommendations
+    ]
+
+
+def test_concurrent_recommendations_match_serial_run_across_config_swaps():
+    """
+    Many threads calling get_recommendations on one engine, while its config is
+    being swapped, each get exactly what a serial run gives under one of the configs.
+    """
+    pytest.importorskip("beanie")
+    from recommendation_engine.enhanced_engine import EnhancedRecommendationEngine
+    from recommendation_engine.config import RecommendationConfig
+    from recommendation_engine.mock_data import (
+        create_mock_careers, create_mock_skills, create_mock_user_profile, create_alternative_user_profile
+    )
+
+    configs = [
+        RecommendationConfig(prefilter_limit=100, max_recommendations=20, min_recommendations=1),
+        RecommendationConfig(prefilter_limit=50, max_recommendations=3, min_recommendations=1),
+    ]
+    engine = EnhancedRecommendationEngine(config=configs[0], skills_db=create_mock_skills())
+    careers = create_mock_careers()
+    profiles = [create_mock_user_profile(), create_alternative_user_profile()]
+    requests = [(profile, level) for profile in profiles for level in range(1, 6)]
+
+    def recommend(profile, level):
+        return summarize(engine.get_recommendations(profile, careers, exploration_level=level))
+
+    expected = [set() for _ in requests]
+    for config in configs:
+        engine.update_config(config)
+        for i, (profile, level) in enumerate(requests):
+            expected[i].add(tuple(recommend(profile, level)))
+
+    stop = threading.Event()
+
+    def swap_configs():
+        n = 0
+        while not stop.is_set():
+            engine.update_config(configs[n % 2])
+            n += 1
+
+    swapper = threading.Thread(target=swap_configs)
+    swapper.start()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = []
+            for n in range(200):
+                i = n % len(requests)
+                futures.append((i, pool.submit(recommend, *requests[i])))
+            results = [(i, future.result()) for i, future in futures]
+    finally:
+        stop.set()
+        swapper.join()
+
+    for i, result in results:
+        assert tuple(result) in expected[i]
+
+
+class FakeScore(BaseModel):
+    total_score: float
+
+
+class FakeRecommendation(BaseModel):
+    career: Any
+    score: FakeScore
+
+
+class FakeCareer(BaseModel):
+    title: str
+    description: str
+
+
+def test_refine_recommendations_does_not_mutate_input():
+    """
+    Refinement returns boosted copies and leaves shared recommendations untouched.
+    """
+    pytest.importorskip("beanie")
+    from recommendation_engine.enhanced_engine import EnhancedRecommendationEngine
+
+    engine = EnhancedRecommendationEngine()
+    original = [
+        FakeRecommendation(career=FakeCareer(title="Data Engineer", description="pipelines"), score=FakeScore(total_score=0.5)),
+        FakeRecommendation(career=FakeCareer(title="Chef", description="kitchen"), score=FakeScore(total_score=0.6)),
+    ]
+
+    refined = engine.refine_recommendations(original, "data pipelines", user_profile=None)
+
+    assert [rec.score.total_score for rec in original] == [0.5, 0.6]
+    assert refined[0].career.title == "Data Engineer"
+    assert refined[0].score.total_score == pytest.approx(0.7)
+
+
+def test_catalog_index_is_shared_and_frozen():
+    """
+    The same career list reuses one read-only index; a different list rebuilds it.
+    """
+    calls = []
+
+    def build(careers):
+        calls.append(len(careers))
+        return [{"skills": {c}, "text": c} for c in careers]
+
+    cache = CatalogIndexCache(build)
+    careers = ["a", "b"]
+
+    first = cache.get(careers)
+    assert cache.get(careers) is first
+    assert isinstance(first.features[0]["skills"], frozenset)
+    with pytest.raises(TypeError):
+        first.features[0]["text"] = "changed"
+
+    careers.append("c")
+    assert cache.get(careers) is not first
+    assert calls == [2, 3]
@@ -0,0 +1,61 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from mongodb_replacement import MockDatabase, in_memory_db
+from app.core.indexes import HOT_QUERIES, INDEX_MANIFEST, bootstrap_indexes, verify_hot_queries
+
+
+def test_bootstrap_creates_the_manifest_and_covers_hot_queries():
+    """
+    Before bootstrapping the hot queries scan their collections; afterwards
+    every manifest index exists, each hot query uses its index, and running
+    the bootstrap again changes nothing.
+    """
+    database = MockDatabase("index_bootstrap_test")
+
+    async def main():
+        await database.users.insert_one({"email": "ada@example.com"})
+        before = await verify_hot_queries(database)
+        assert not any(query["covered"] for query in before)
+
+        report = await bootstrap_indexes(database)
+        assert report["failed"] == [] and len(report["ensured"]) == len(INDEX_MANIFEST)
+        assert [query["query"] for query in report["queries"] if query["covered"]] == [query.name for query in HOT_QUERIES]
+        assert "unique" in (await database.users.index_information())["email_1"]
+        assert (await database.users.index_information())["reset_token_1"]["sparse"] is True
+        assert (await database.recommendations.index_information())["expires_at_1"]["expireAfterSeconds"] == 0
+        assert in_memory_db._ttl_thread is not None and in_memory_db._ttl_thread.is_alive()
+
+        again = await bootstrap_indexes(database)
+        assert again["failed"] == [] and all(query["covered"] for query in again["queries"])
+
+    try:
+        asyncio.run(main())
+    finally:
+        in_memory_db.databases.pop("index_bootstrap_test", None)
+
+
+def test_bootstrap_reports_indexes_it_cannot_create():
+    """
+    Existing duplicate emails block the unique index; the failure is reported
+    and the other indexes are still created.
+    """
+    database = MockDatabase("index_bootstrap_duplicates")
+
+    async def main():
+        for _ in range(2):
+            await database.users.insert_one({"email": "twice@example.com"})
+        report = await bootstrap_indexes(database)
+        assert [failure["index"] for failure in report["failed"]] == ["users.email_1"]
+        assert len(report["ensured"]) == len(INDEX_MANIFEST) - 1
+        covered = {query["query"]: query["covered"] for query in report["queries"]}
+        assert covered["user_by_email"] is False and covered["latest_assessment"] is True
+
+    try:
+        asyncio.run(main())
+    finally:
+        in_memory_db.databases.pop("index_bootstrap_duplicates", None)
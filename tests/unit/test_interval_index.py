@@ -0,0 +1,137 @@
+import dataclasses
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.career_database import CareerData, CareerDatabase, CareerField, CareerFilters, ExperienceLevel
+from recommendation_engine.interval_index import IntervalTree, RangeEntry, SalaryExperienceIndex
+
+
+def test_interval_tree_matches_a_linear_scan():
+    """
+    Overlap queries return exactly the intervals a full scan finds, in order
+    of interval start.
+    """
+    rng = random.Random(7)
+    intervals = []
+    for item in range(300):
+        low = rng.randrange(20000, 250000, 1000)
+        intervals.append((low, low + rng.randrange(0, 80000, 1000), item))
+    tree = IntervalTree(intervals)
+
+    for _ in range(50):
+        low = rng.randrange(0, 300000, 500)
+        high = low + rng.randrange(0, 60000, 500)
+        expected = {item for start, end, item in intervals if start <= high and end >= low}
+        found = tree.overlapping(low, high)
+        assert set(found) == expected
+        assert len(found) == len(expected)
+
+    assert IntervalTree([]).overlapping(0, 10) == []
+
+
+def test_salary_experience_index_handles_currencies_and_experience():
+    """
+    Salary windows only apply within a currency; careers without experience
+    ranges match every experience window.
+    """
+    index = SalaryExperienceIndex([
+        RangeEntry("junior", "USD", (50000, 70000), (0, 2)),
+        RangeEntry("senior", "USD", (120000, 160000), (5, 15)),
+        RangeEntry("berlin", "EUR", (60000, 80000), (2, 6)),
+        RangeEntry("open", "USD", (65000, 130000)),
+    ])
+
+    assert index.query(salary=(60000, 100000), currency="USD") == {"junior", "open"}
+    assert index.query(salary=(60000, 100000), currency="USD", include_other_currencies=True) == {"junior", "open", "berlin"}
+    assert index.query(experience=(6, 8)) == {"senior", "open", "berlin"}
+    assert index.query(salary=(100000, 200000), experience=(0, 3), currency="USD") == {"open"}
+
+
+def test_search_careers_uses_the_range_index(tmp_path):
+    """
+    Salary and experience windows go through the career_ranges R*Tree, which
+    follows inserts, updates and deletes.
+    """
+    db = CareerDatabase(str(tmp_path / "careers.db"))
+    try:
+        base = CareerData(
+            career_id="analyst", title="Analyst", description="Analyses data",
+            career_field=CareerField.TECHNOLOGY, experience_level=ExperienceLevel.ENTRY,
+            salary_min=50000, salary_max=70000, min_years_experience=0, max_years_experience=2
+        )
+        db.add_careers_bulk([
+            base,
+            dataclasses.replace(base, career_id="lead", title="Lead", salary_min=130000, salary_max=180000,
+                                min_years_experience=6, max_years_experience=20),
+        ])
+        assert db.range_index
+
+        def ids(**windows):
+            return [career.career_id for career in db.search_careers(**windows)]
+
+        assert ids(salary_min=60000, salary_max=90000) == ["analyst"]
+        assert ids(experience_min=5, experience_max=8) == ["lead"]
+        assert ids(salary_min=100000, experience_max=3) == []
+
+        db.add_career(dataclasses.replace(base, salary_min=95000, salary_max=110000))
+        assert ids(salary_min=100000, salary_max=120000) == ["analyst"]
+        db.delete_career("lead")
+        assert ids(experience_min=5) == []
+
+        conditions, _ = CareerFilters(salary_min=1).to_sql(range_index=True)
+        with db.connections.reader() as conn:
+            plan = " ".join(row[-1] for row in conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT career_id FROM careers WHERE 1=1{conditions}", (1, 1)
+            ))
+        assert "career_ranges" in plan
+    finally:
+        db.close()
+
+
+def test_range_index_is_rebuilt_after_an_interrupted_bulk_load(tmp_path):
+    """
+    Reopening a database whose range triggers were dropped by a bulk load
+    that never finished rebuilds career_ranges, so no career is hidden.
+    """
+    path = str(tmp_path / "careers.db")
+    base = CareerData(
+        career_id="analyst", title="Analyst", description="Analyses data",
+        career_field=CareerField.TECHNOLOGY, experience_level=ExperienceLevel.ENTRY,
+        salary_min=50000, salary_max=70000
+    )
+    db = CareerDatabase(path)
+    db.add_career(base)
+    with db.connections.writer() as conn:
+        db._drop_range_triggers(conn)
+    db.add_career(dataclasses.replace(base, career_id="engineer", title="Engineer"))
+    db.close()
+
+    db = CareerDatabase(path)
+    try:
+        assert db.range_index
+        assert sorted(c.career_id for c in db.search_careers(salary_min=60000)) == ["analyst", "engineer"]
+    finally:
+        db.close()
+
+
+def test_indexed_salary_filter_matches_per_career_checks():
+    """
+    Filtering through the catalog's interval index keeps exactly the careers
+    the per-career salary check keeps, in the same order.
+    """
+    pytest.importorskip("beanie")
+    from recommendation_engine import RecommendationEngine
+    from recommendation_engine.evaluation import generate_synthetic_careers, generate_synthetic_profiles
+
+    engine = RecommendationEngine()
+    careers = generate_synthetic_careers(200, seed=2)
+    catalog = engine.warm_catalog(careers)
+
+    for profile in generate_synthetic_profiles(10, seed=2):
+        assert engine.filter_engine.apply_initial_filters(profile, careers, catalog) == \
+            engine.filter_engine.apply_initial_filters(profile, careers)
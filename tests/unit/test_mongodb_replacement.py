@@ -0,0 +1,557 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from mongodb_replacement import (
+    DuplicateKeyError, InMemoryMongoDB, MockDatabase, OperationFailure, bson_elements, decode_fields, in_memory_db
+)
+
+
+def test_equality_lookups_use_a_unique_index():
+    """
+    find_one by email is answered from the index, updates move index entries
+    and a duplicate key is rejected.
+    """
+    db = InMemoryMongoDB()
+
+    async def main():
+        await db.create_index("app", "users", "email", unique=True)
+        for i in range(100):
+            await db.insert_one("app", "users", {"email": f"user{i}@example.com"})
+
+        plan = await db.explain("app", "users", {"email": "user42@example.com"})
+        assert plan["queryPlanner"]["winningPlan"]["inputStage"]["indexName"] == "email_1"
+        assert plan["executionStats"]["totalDocsExamined"] == 1
+
+        with pytest.raises(DuplicateKeyError):
+            await db.insert_one("app", "users", {"email": "user42@example.com"})
+
+        await db.update_one("app", "users", {"email": "user42@example.com"}, {"$set": {"email": "renamed@example.com"}})
+        assert await db.find_one("app", "users", {"email": "user42@example.com"}) is None
+        assert await db.find_one("app", "users", {"email": "renamed@example.com"}) is not None
+
+    asyncio.run(main())
+
+
+def test_sparse_index_skips_documents_without_the_field():
+    """
+    A sparse unique index only holds documents that have the field, is not
+    used for queries that could match documents without it, and unsupported
+    index options are rejected.
+    """
+    db = InMemoryMongoDB()
+
+    async def main():
+        await db.create_index("app", "users", "reset_token", name="reset_token_1", sparse=True, unique=True)
+        for i in range(10):
+            await db.insert_one("app", "users", {"email": f"user{i}@example.com"})
+        await db.insert_one("app", "users", {"email": "reset@example.com", "reset_token": "abc"})
+
+        index = db.get_collection("app", "users").indexes["reset_token_1"]
+        assert list(index.entries) == [((2, "abc"),)]
+        assert (await db.index_information("app", "users"))["reset_token_1"]["sparse"] is True
+
+        plan = await db.explain("app", "users", {"reset_token": "abc"})
+        assert plan["queryPlanner"]["winningPlan"]["inputStage"]["indexName"] == "reset_token_1"
+        plan = await db.explain("app", "users", {"reset_token": None})
+        assert plan["queryPlanner"]["winningPlan"]["stage"] == "COLLSCAN"
+        assert await db.count_documents("app", "users", {"reset_token": None}) == 10
+
+        with pytest.raises(OperationFailure):
+            await db.create_index("app", "users", "email", partialFilterExpression={"email": {"$exists": True}})
+
+    asyncio.run(main())
+
+
+def test_latest_document_comes_from_a_compound_sorted_index():
+    """
+    The newest assessment per user and created_at ranges are read from a
+    (user_id, created_at) index scan and agree with a collection scan.
+    """
+    indexed, scanned = InMemoryMongoDB(), InMemoryMongoDB()
+    start = datetime(2024, 1, 1)
+
+    async def main():
+        await indexed.create_index("app", "assessments", [("user_id", 1), ("created_at", -1)])
+        for db in (indexed, scanned):
+            collection = db.get_collection("app", "assessments")
+            for day in range(60):
+                collection.insert({"_id": f"a{day}", "user_id": f"user{day % 4}", "created_at": start + timedelta(days=day)})
+
+        for db in (indexed, scanned):
+            latest = await db.find_one("app", "assessments", {"user_id": "user1"}, sort=[("created_at", -1)])
+            assert latest["_id"] == "a57"
+            window = await db.find("app", "assessments", {
+                "user_id": "user2", "created_at": {"$gte": start + timedelta(days=10), "$lt": start + timedelta(days=30)}
+            })
+            assert sorted(doc["_id"] for doc in window) == ["a10", "a14", "a18", "a22", "a26"]
+
+        plan = await indexed.explain("app", "assessments", {"user_id": "user1"}, sort=[("created_at", -1)])
+        assert plan["queryPlanner"]["winningPlan"]["inputStage"]["stage"] == "IXSCAN"
+        assert plan["executionStats"]["totalDocsExamined"] == 15
+        plan = await scanned.explain("app", "assessments", {"user_id": "user1"})
+        assert plan["queryPlanner"]["winningPlan"]["stage"] == "COLLSCAN"
+
+    asyncio.run(main())
+
+
+def test_durable_store_recovers_from_snapshot_and_log(tmp_path):
+    """
+    Writes survive a restart through the snapshot plus the log tail, concurrent
+    writers share group commits, and a torn record at the end of the log is
+    dropped instead of failing recovery.
+    """
+    directory = str(tmp_path / "data")
+
+    async def write():
+        db = InMemoryMongoDB()
+        db.enable_durability(directory, snapshot_every=150)
+        await db.create_index("app", "users", "email", unique=True)
+        await asyncio.gather(*(db.insert_one("app", "users", {"email": f"user{i}@example.com"}) for i in range(200)))
+        await db.update_one("app", "users", {"email": "user7@example.com"}, {"$set": {"full_name": "Seven"}})
+        journal = db.journal.get_stats()
+        db.close_durability()
+        return journal
+
+    journal = asyncio.run(write())
+    assert journal["records"] == 202
+    assert journal["groups"] < journal["records"]
+
+    segment = sorted(name for name in os.listdir(directory) if name.startswith("oplog-"))[-1]
+    with open(os.path.join(directory, segment), "ab") as f:
+        f.write(b"\x40\x00\x00\x00partial")
+
+    async def recover():
+        db = InMemoryMongoDB()
+        stats = db.enable_durability(directory)
+        user = await db.find_one("app", "users", {"email": "user7@example.com"})
+        plan = await db.explain("app", "users", {"email": "user7@example.com"})
+        report = db.get_storage_stats()
+        db.close_durability()
+        return stats, user, plan, report
+
+    stats, user, plan, report = asyncio.run(recover())
+    assert stats["documents"] == 200 and stats["snapshot_lsn"] > 0
+    assert user["full_name"] == "Seven"
+    assert plan["queryPlanner"]["winningPlan"]["inputStage"]["indexName"] == "email_1"
+    assert report["collections"]["app.users"]["approx_memory_bytes"] > 0
+
+
+def test_durable_store_recovers_concurrent_writers_exactly(tmp_path):
+    """
+    Writers on several threads, racing on the same documents while snapshots
+    are taken, recover to exactly the state they left in memory.
+    """
+    directory = str(tmp_path / "data")
+    db = InMemoryMongoDB()
+    db.enable_durability(directory, commit_interval_ms=0.5, fsync=False, snapshot_every=40)
+    asyncio.run(db.create_index("app", "counters", "name", unique=True))
+
+    def writer(thread):
+        async def main():
+            for i in range(150):
+                await db.insert_one("app", "events", {"_id": f"t{thread}-{i}", "n": i})
+                await db.update_one("app", "counters", {"_id": f"c{i % 5}"}, {"$set": {"value": f"{thread}-{i}"}})
+                if i % 10 == 9:
+                    await db.delete_one("app", "events", {"_id": f"t{thread}-{i - 5}"})
+        asyncio.run(main())
+
+    for i in range(5):
+        asyncio.run(db.insert_one("app", "counters", {"_id": f"c{i}", "name": f"c{i}"}))
+    threads = [threading.Thread(target=writer, args=(thread,)) for thread in range(8)]
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Interleave the threads as much as possible
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    async def state(store):
+        # Timestamps are stored to the millisecond on disk
+        projection = {"created_at": 0, "updated_at": 0}
+        return {name: sorted(await store.find("app", name, projection=projection), key=lambda doc: doc["_id"])
+                for name in ("counters", "events")}
+
+    expected = asyncio.run(state(db))
+    snapshots = db.journal.get_stats()["snapshots"]
+    db.close_durability()
+    assert snapshots > 1
+
+    recovered = InMemoryMongoDB()
+    recovered.enable_durability(directory)
+    try:
+        assert asyncio.run(state(recovered)) == expected
+        assert len(expected["events"]) == 8 * (150 - 15)
+    finally:
+        recovered.close_durability()
+
+
+def test_query_operators_and_projection():
+    """
+    Comparison, membership, array, regex and logical operators match like
+    MongoDB; projections include or exclude fields and reject mixed specs.
+    """
+    db = InMemoryMongoDB()
+    careers = [
+        {"_id": "c1", "title": "Data Analyst", "salaryMin": 60000, "skills": ["SQL", "Python"], "meta": {"level": "Entry"}},
+        {"_id": "c2", "title": "Backend Engineer", "salaryMin": 95000, "skills": ["Python", "Go"], "meta": {"level": "Mid"}},
+        {"_id": "c3", "title": "UX Designer", "salaryMin": 70000, "skills": ["Figma"], "remote": True},
+    ]
+
+    async def main():
+        await db.create_index("app", "careers", "skills")
+        collection = db.get_collection("app", "careers")
+        for career in careers:
+            collection.insert(dict(career))
+
+        async def ids(filter_dict, **kwargs):
+            return [doc["_id"] for doc in await db.find("app", "careers", filter_dict, **kwargs)]
+
+        assert await ids({"salaryMin": {"$gte": 70000}}) == ["c2", "c3"]
+        assert await ids({"skills": "Python"}) == ["c1", "c2"]
+        assert await ids({"skills": {"$in": ["Go", "Figma"]}}) == ["c2", "c3"]
+        assert await ids({"skills": {"$all": ["Python", "SQL"]}, "salaryMin": {"$ne": 1}}) == ["c1"]
+        assert await ids({"title": {"$regex": "^data", "$options": "i"}}) == ["c1"]
+        assert await ids({"remote": {"$exists": False}, "meta.level": {"$nin": ["Mid"]}}) == ["c1"]
+        assert await ids({"$or": [{"skills": {"$size": 1}}, {"salaryMin": {"$lt": 65000}}]}) == ["c1", "c3"]
+        assert await ids({"salaryMin": {"$not": {"$gt": 65000}}}) == ["c1"]
+
+        plan = await db.explain("app", "careers", {"skills": {"$in": ["Go", "Figma"]}})
+        assert plan["executionStats"]["executionStages"]["indexName"] == "skills_1"
+        assert plan["executionStats"]["totalDocsExamined"] == 2
+
+        doc = await db.find_one("app", "careers", {"_id": "c1"}, projection={"title": 1, "meta.level": 1, "_id": 0})
+        assert doc == {"title": "Data Analyst", "meta": {"level": "Entry"}}
+        doc = await db.find_one("app", "careers", {"_id": "c1"}, projection={"skills": 0, "meta": 0})
+        assert doc == {"_id": "c1", "title": "Data Analyst", "salaryMin": 60000}
+        with pytest.raises(OperationFailure):
+            await db.find("app", "careers", {}, projection={"title": 1, "skills": 0})
+
+    asyncio.run(main())
+
+
+def test_cursor_pages_through_an_index_in_batches():
+    """
+    sort/skip/limit on a cursor page through the index order, the cursor hands
+    out documents in batches, and profiler-style count and $group queries work
+    through the Motor-shaped wrappers.
+    """
+    async def main():
+        database = MockDatabase("cursor_test")
+        collection = database["careers"]
+        await collection.create_index([("salaryMin", -1)])
+        for i in range(250):
+            await collection.insert_one({"_id": f"c{i:03d}", "salaryMin": 40000 + i * 100, "level": ["Entry", "Mid"][i % 2]})
+
+        cursor = collection.find({"salaryMin": {"$gte": 50000}}, projection={"salaryMin": 1}).sort("salaryMin", -1).skip(10).limit(30)
+        page = await cursor.to_list(length=None)
+        assert [doc["_id"] for doc in page] == [f"c{i:03d}" for i in range(239, 209, -1)]
+        assert set(page[0]) == {"_id", "salaryMin"}
+        explain = await collection.find({"salaryMin": {"$gte": 50000}}).sort("salaryMin", -1).explain()
+        assert explain["executionStats"]["executionStages"]["indexName"] == "salaryMin_-1"
+
+        seen, cursor = [], collection.find({}).batch_size(64)
+        async for doc in cursor:
+            seen.append(doc["_id"])
+            if len(seen) == 1:
+                assert len(cursor._buffer) == 63
+        assert len(seen) == 250 and len(set(seen)) == 250
+        assert len(await (await collection.find({"level": "Mid"})).to_list(length=5)) == 5
+
+        assert await collection.count_documents({"level": "Entry"}) == 125
+        groups = await collection.aggregate([
+            {"$group": {"_id": "$level", "count": {"$sum": 1}, "top": {"$max": "$salaryMin"}}},
+            {"$sort": {"_id": 1}},
+        ]).to_list(length=None)
+        assert groups == [{"_id": "Entry", "count": 125, "top": 64800}, {"_id": "Mid", "count": 125, "top": 64900}]
+
+    try:
+        asyncio.run(main())
+    finally:
+        in_memory_db.databases.pop("cursor_test", None)
+
+
+def test_compact_storage_matches_dict_storage():
+    """
+    BSON-encoded collections answer queries, projections and updates like
+    dict-backed ones, decode single fields without parsing the rest of the
+    document, and report less document memory.
+    """
+    plain, compact = InMemoryMongoDB(), InMemoryMongoDB(compact_storage=True)
+    start = datetime(2024, 1, 1)
+
+    async def main():
+        for db in (plain, compact):
+            await db.create_index("app", "assessments", [("user_id", 1), ("created_at", -1)])
+            collection = db.get_collection("app", "assessments")
+            for i in range(200):
+                collection.insert({
+                    "_id": f"a{i}", "user_id": f"user{i % 10}", "created_at": start + timedelta(hours=i),
+                    "answers": {"interests": ["data", "design"][i % 2], "years": i % 7}, "score": i / 2,
+                })
+            await db.update_one("app", "assessments", {"_id": "a5"}, {"$set": {"score": -1}})
+
+        async def run(db):
+            return (
+                await db.find("app", "assessments", {"user_id": "user3"}, sort=[("created_at", -1)], limit=3),
+                await db.find("app", "assessments", {"$or": [{"answers.years": 6}, {"score": {"$lt": 0}}]},
+                              projection={"answers.years": 1, "_id": 0}),
+                await db.find_one("app", "assessments", {"_id": "a5"}, projection={"answers": 0, "updated_at": 0}),
+            )
+
+        assert await run(compact) == await run(plain)
+
+        raw = compact.get_collection("app", "assessments").documents["a7"]
+        assert decode_fields(raw, ["score", "missing"]) == {"score": 3.5}
+        assert [name for name, _, _ in bson_elements(raw)] == ["_id", "user_id", "created_at", "answers", "score"]
+
+        plain_report = plain.get_storage_stats()["collections"]["app.assessments"]
+        compact_report = compact.get_storage_stats()["collections"]["app.assessments"]
+        assert compact_report["storage"] == "bson" and compact_report["encoded_bytes"] > 0
+        assert compact_report["document_bytes"] < plain_report["document_bytes"]
+        assert set(compact_report["index_bytes"]) == {"_id_", "user_id_1_created_at_-1"}
+
+    asyncio.run(main())
+
+
+def test_compact_storage_removes_datetime_index_entries():
+    """
+    Index and TTL entries on microsecond datetimes, which BSON stores to the
+    millisecond, are removed by updates, deletes and TTL sweeps.
+    """
+    db = InMemoryMongoDB(compact_storage=True)
+    start = datetime(2100, 1, 1, 12, 0, 0, 123456)  # Nothing expires before the sweep
+
+    async def main():
+        await db.create_index("app", "recommendations", [("user_id", 1), ("created_at", -1)])
+        await db.create_index("app", "recommendations", [("expires_at", 1)], expireAfterSeconds=0)
+        collection = db.get_collection("app", "recommendations")
+        for i in range(50):
+            await db.insert_one("app", "recommendations", {
+                "_id": f"r{i}", "user_id": f"user{i % 5}", "created_at": start + timedelta(microseconds=i),
+                "expires_at": start + timedelta(days=1, microseconds=i),
+            })
+        for _ in range(2):
+            await db.update_one("app", "recommendations", {"_id": "r0"},
+                                {"$set": {"created_at": datetime.utcnow(), "expires_at": datetime.utcnow() + timedelta(days=1)}})
+        assert len(collection.indexes["user_id_1_created_at_-1"].ordered) == 50
+
+        await db.delete_many("app", "recommendations", {"user_id": "user1"})
+        assert db.sweep_expired(now=start + timedelta(days=30)) == 40
+        for index in collection.indexes.values():
+            assert index.entries == {}
+            assert getattr(index, "ordered", []) == []
+        assert collection._expiry == {} and collection.next_expiry() is None
+
+    asyncio.run(main())
+
+
+def test_concurrent_register_login_assessment_flows():
+    """
+    Thousands of register/login/submit-assessment flows on several threads,
+    racing with password changes, never see a torn user document, never
+    corrupt the store by mutating what they read, and leave the indexes in
+    agreement with a collection scan.
+    """
+    threads, users_per_thread = 4, 500
+    database = MockDatabase("stress_test")
+    torn = []
+
+    async def setup():
+        await database.users.create_index("email", unique=True)
+        await database.assessments.create_index([("user_id", 1), ("created_at", -1)])
+
+    async def flow(email):
+        # register: two threads race for every email; the unique index lets one win
+        if await database.users.find_one({"email": email}) is None:
+            try:
+                await database.users.insert_one({"email": email, "hashed_password": "hash-0", "password_version": 0})
+            except DuplicateKeyError:
+                pass
+        # login, mutating the returned document the way endpoints do
+        user = await database.users.find_one({"email": email})
+        if user["hashed_password"] != f"hash-{user['password_version']}":
+            torn.append(user)
+        user.pop("hashed_password")
+        await database.assessments.find_one({"user_id": user["_id"]})
+        # submit assessment and change the password
+        await database.assessments.insert_one({"user_id": user["_id"], "answers": {"skills": ["python"]}})
+        version = user["password_version"] + 1
+        await database.users.update_one({"email": email}, {"$set": {"hashed_password": f"hash-{version}", "password_version": version}})
+        latest = await database.assessments.find_one({"user_id": user["_id"]}, sort=[("created_at", -1)])
+        latest["answers"]["skills"].append("mutated")
+
+    def worker(thread):
+        async def run():
+            emails = [f"user{(thread // 2) * users_per_thread + i}@example.com" for i in range(users_per_thread)]
+            await asyncio.gather(*(flow(email) for email in emails))
+        asyncio.run(run())
+
+    try:
+        asyncio.run(setup())
+        pool = [threading.Thread(target=worker, args=(thread,)) for thread in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+
+        users = in_memory_db.get_collection("stress_test", "users")
+        assessments = in_memory_db.get_collection("stress_test", "assessments")
+        assert not torn
+        assert len(users) == threads // 2 * users_per_thread
+        assert len(assessments) == threads * users_per_thread
+        scanned = {}
+        for doc in assessments:
+            scanned.setdefault(doc["user_id"], set()).add(doc["_id"])
+        for user in users:
+            assert user["hashed_password"] == f"hash-{user['password_version']}"
+            assert users.query({"email": user["email"]}) == [user]
+            mine = assessments.query({"user_id": user["_id"]})
+            assert all(doc["answers"]["skills"] == ["python"] for doc in mine)
+            assert {doc["_id"] for doc in mine} == scanned[user["_id"]] and len(mine) == 2
+    finally:
+        in_memory_db.databases.pop("stress_test", None)
+
+
+def test_cursor_reads_a_consistent_snapshot():
+    """
+    A cursor returns the versions that existed when its first batch was read,
+    even when documents are updated or added between batches.
+    """
+    db = InMemoryMongoDB()
+
+    async def main():
+        collection = db.get_collection("app", "users")
+        for i in range(10):
+            collection.insert({"_id": f"u{i}", "balance": 100, "history": []})
+        results = collection.iter_query({})
+        first = next(results)
+        for i in range(10):
+            await db.update_one("app", "users", {"_id": f"u{i}"}, {"$set": {"balance": 0, "history.0": "spent"}})
+        collection.insert({"_id": "late", "balance": 5})
+        rest = list(results)
+        assert [(doc["balance"], doc["history"]) for doc in [first] + rest] == [(100, [])] * 10
+        updated = await db.find_one("app", "users", {"_id": "u3"})
+        assert updated["balance"] == 0 and updated["history"] == ["spent"]
+
+    asyncio.run(main())
+
+
+def test_ttl_monitor_starts_only_after_recovery(tmp_path):
+    """
+    Replaying TTL indexes does not start the monitor mid-recovery: documents
+    that expired while the server was down are still updated by the log tail,
+    and the monitor's deletes after recovery are journaled.
+    """
+    directory = str(tmp_path / "data")
+
+    async def write():
+        db = InMemoryMongoDB()
+        db.enable_durability(directory, fsync=False, snapshot_every=None)
+        expires_at = datetime.utcnow() + timedelta(milliseconds=200)
+        for name in ("sessions", "recommendations"):
+            await db.create_index("app", name, "expires_at", expireAfterSeconds=0)
+            for i in range(20):
+                await db.insert_one("app", name, {"_id": f"{name}{i}", "expires_at": expires_at})
+        await db.snapshot()
+        await db.update_one("app", "sessions", {"_id": "sessions3"}, {"$set": {"seen": True}})
+        db.stop_ttl_monitor()
+        db.close_durability()
+
+    asyncio.run(write())
+    time.sleep(0.3)
+
+    db = InMemoryMongoDB()
+    db.ttl_interval = 0.01
+    monitor_started_with_journal = []
+    start_ttl_monitor = db.start_ttl_monitor
+
+    def recording_start(*args, **kwargs):
+        monitor_started_with_journal.append(db.journal is not None)
+        return start_ttl_monitor(*args, **kwargs)
+
+    db.start_ttl_monitor = recording_start
+    stats = db.enable_durability(directory, fsync=False)
+    assert stats["log_records_replayed"] == 1
+    assert monitor_started_with_journal == [True]
+
+    for _ in range(100):
+        if db.ttl_stats["deleted"] == 40:
+            break
+        time.sleep(0.02)
+    assert db.ttl_stats["deleted"] == 40
+    db.stop_ttl_monitor()
+    db.close_durability()
+
+    recovered = InMemoryMongoDB()
+    recovered.ttl_interval = 60
+    recovered.enable_durability(directory)
+    assert sum(len(recovered.get_collection("app", name)) for name in ("sessions", "recommendations")) == 0
+    recovered.stop_ttl_monitor()
+    recovered.close_durability()
+
+
+def test_ttl_index_expires_documents(tmp_path):
+    """
+    Documents behind a TTL index disappear from reads once due, are deleted
+    by a TTL pass or the background monitor, and the deletes survive a
+    restart; repeated updates do not grow the expiry heap without bound.
+    """
+    directory = str(tmp_path / "data")
+    now = datetime.utcnow()
+
+    async def main():
+        db = InMemoryMongoDB()
+        db.enable_durability(directory, fsync=False)
+        await db.create_index("app", "recommendations", "expires_at", expireAfterSeconds=0)
+        assert (await db.index_information("app", "recommendations"))["expires_at_1"]["expireAfterSeconds"] == 0
+        collection = db.get_collection("app", "recommendations")
+        for i in range(100):
+            await db.insert_one("app", "recommendations", {
+                "user_id": f"user{i % 5}", "expires_at": now + timedelta(hours=1 if i % 2 else -1)
+            })
+        await db.insert_one("app", "recommendations", {"user_id": "user0", "expires_at": "never"})
+
+        assert await db.count_documents("app", "recommendations", {"user_id": "user0"}) == 11
+        assert len(collection.documents) == 101
+
+        for _ in range(20):
+            for doc in await db.find("app", "recommendations", {"user_id": "user1"}):
+                await db.update_one("app", "recommendations", {"_id": doc["_id"]}, {"$set": {"expires_at": now + timedelta(hours=2)}})
+        report = collection.memory_report()
+        assert report["ttl_heap_entries"] <= 2 * report["ttl_tracked"] + 64
+
+        assert db.sweep_expired() == 50
+        assert db.sweep_expired(now + timedelta(hours=1, minutes=1)) == 40
+        assert len(collection.documents) == 11
+        db.stop_ttl_monitor()
+        db.close_durability()
+
+        recovered = InMemoryMongoDB()
+        recovered.enable_durability(directory)
+        assert len(recovered.get_collection("app", "recommendations")) == 11
+        recovered.stop_ttl_monitor()
+        recovered.close_durability()
+
+        monitored = InMemoryMongoDB()
+        await monitored.create_index("app", "sessions", "expires_at", expireAfterSeconds=0)
+        monitored.start_ttl_monitor(interval=0.05)
+        await monitored.insert_one("app", "sessions", {"expires_at": datetime.utcnow() + timedelta(milliseconds=100)})
+        for _ in range(50):
+            if not monitored.get_collection("app", "sessions").documents:
+                break
+            await asyncio.sleep(0.02)
+        assert not monitored.get_collection("app", "sessions").documents
+        monitored.stop_ttl_monitor()
+
+    asyncio.run(main())
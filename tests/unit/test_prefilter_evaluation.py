@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.evaluation import (
+    anonymize_profile, evaluate_strategies, format_results_table,
+    generate_synthetic_careers, generate_synthetic_profiles, prefilter_strategy
+)
+
+
+def test_recall_is_measured_against_exhaustive_scoring():
+    """
+    Keeping every career gives recall 1.0, keeping none gives 0.0, and a
+    real pre-filter lands in between with its candidate count reported.
+    """
+    pytest.importorskip("beanie")
+    from recommendation_engine import RecommendationEngine
+
+    engine = RecommendationEngine()
+    careers = generate_synthetic_careers(60, seed=1)
+    profiles = generate_synthetic_profiles(4, seed=1)
+
+    results = evaluate_strategies(engine, profiles, careers, {
+        "all": lambda engine, profile, careers: careers,
+        "none": lambda engine, profile, careers: [],
+        "prefilter@30": prefilter_strategy(30),
+    }, k=10)
+
+    by_name = {result.name: result for result in results}
+    assert by_name["all"].mean_recall == 1.0
+    assert by_name["none"].mean_recall == 0.0
+    assert 0.0 <= by_name["prefilter@30"].mean_recall <= 1.0
+    assert by_name["prefilter@30"].mean_candidates == 30
+
+    table = format_results_table(results, k=10)
+    assert "recall@10" in table
+    assert "| prefilter@30 |" in table
+
+
+def test_synthetic_corpus_is_reproducible():
+    """
+    The same seed yields the same catalog and profiles.
+    """
+    assert [c.title for c in generate_synthetic_careers(20, seed=3)] == [c.title for c in generate_synthetic_careers(20, seed=3)]
+    assert [p.technicalSkills for p in generate_synthetic_profiles(5, seed=3)] == [p.technicalSkills for p in generate_synthetic_profiles(5, seed=3)]
+
+
+def test_stored_profiles_are_anonymized():
+    """
+    Identifying fields are dropped and the user id is hashed.
+    """
+    record = {
+        "user_id": "user_42",
+        "email": "someone@example.com",
+        "location": "Springfield",
+        "personal_info": {"location": "Springfield", "age": 30},
+        "technicalSkills": ["Python"]
+    }
+
+    anonymized = anonymize_profile(record)
+
+    assert "email" not in anonymized and "location" not in anonymized
+    assert anonymized["personal_info"]["location"] == ""
+    assert anonymized["user_id"].startswith("anon_")
+    assert anonymized["user_id"] == anonymize_profile(record)["user_id"]
+    assert anonymized["technicalSkills"] == ["Python"]
@@ -0,0 +1,87 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.cascade import (
+    CascadeContext, CostClass, FunctionStage, InvertedIndexRetrievalStage, RankingCascade
+)
+from recommendation_engine.catalog_index import build_catalog_index
+
+
+def make_context(careers, summary=None):
+    catalog = build_catalog_index(careers, lambda items: [{"skills": set(item.split("-"))} for item in items])
+    return CascadeContext(
+        user_profile=None,
+        summarized_profile=summary or {},
+        exploration_level=3,
+        snapshot=None,
+        catalog=catalog
+    )
+
+
+def test_stages_cut_to_output_size_and_report_recall():
+    """
+    Each stage passes on at most its output size, and recall is measured
+    against the reference set after every stage.
+    """
+    careers = [f"career{i}" for i in range(10)]
+    context = make_context(careers)
+    cascade = RankingCascade([
+        FunctionStage("cheap", CostClass.CHEAP, lambda ctx, cands, size: cands, output_size=6),
+        FunctionStage("full", CostClass.FULL, lambda ctx, cands, size: list(reversed(cands)), output_size=2),
+    ])
+
+    reference = {id(careers[0]), id(careers[8])}
+    result = cascade.run(context, careers, reference)
+
+    assert result.candidates == ["career5", "career4"]
+    assert [(r.name, r.input_count, r.output_count) for r in result.reports] == [("cheap", 10, 6), ("full", 6, 2)]
+    assert [r.recall for r in result.reports] == [0.5, 0.0]
+
+
+def test_inverted_index_retrieval_ranks_by_matching_tokens():
+    """
+    Retrieval keeps only careers sharing a token, most matches first.
+    """
+    careers = ["python-sql", "cooking", "python-sql-spark", "sql"]
+    context = make_context(careers, {"key_skills": ["Python", "SQL", "Spark"]})
+
+    result = InvertedIndexRetrievalStage(output_size=2).run(context, careers)
+
+    assert result == ["python-sql-spark", "python-sql"]
+
+
+def test_engine_cascade_is_configurable():
+    """
+    Stage order and sizes come from the config; unknown stages are rejected
+    without replacing the active snapshot.
+    """
+    pytest.importorskip("beanie")
+    from recommendation_engine import RecommendationEngine
+    from recommendation_engine.config import RecommendationConfig, CascadeStageConfig
+    from recommendation_engine.mock_data import create_mock_careers, create_mock_skills, create_mock_user_profile
+
+    engine = RecommendationEngine(skills_db=create_mock_skills())
+    careers = create_mock_careers()
+    profile = create_mock_user_profile()
+
+    _, result = engine.run_cascade(profile, careers)
+    assert [r.name for r in result.reports] == ["linear", "prompt_budget", "filter", "full_score"]
+
+    engine.update_config(RecommendationConfig(cascade_stages=[
+        CascadeStageConfig(name="retrieval", output_size=4),
+        CascadeStageConfig(name="filter", enabled=False),
+        CascadeStageConfig(name="full_score", output_size=2),
+    ]))
+    context, result = engine.run_cascade(profile, careers)
+    assert [(r.name, r.output_count) for r in result.reports] == [("retrieval", 4), ("full_score", 2)]
+    scores = [context.scores[id(career)].total_score for career in result.candidates]
+    assert scores == sorted(scores, reverse=True)
+
+    before = engine.snapshot
+    with pytest.raises(ValueError):
+        engine.update_config(RecommendationConfig(cascade_stages=[CascadeStageConfig(name="bogus")]))
+    assert engine.snapshot is before
@@ -0,0 +1,162 @@
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.coalescer import RequestCoalescer
+from recommendation_engine.executor import ScoringExecutor
+
+
+class FakeBatchEngine:
+    """Records the batches it is asked to score."""
+
+    def __init__(self, max_workers=1):
+        self.executor = ScoringExecutor(max_workers=max_workers, max_queue_depth=8)
+        self.batches = []
+
+    def get_recommendations_batch(self, user_profiles, available_careers, limits, exploration_levels, return_exceptions=False):
+        self.batches.append(list(user_profiles))
+        results = []
+        for profile, limit in zip(user_profiles, limits):
+            if profile == "bad":
+                results.append(ValueError("bad profile"))
+            else:
+                results.append([f"{profile}:{career}" for career in available_careers][:limit])
+        return results
+
+
+def test_concurrent_requests_are_scored_in_one_batch():
+    """
+    Requests arriving within the window share a single batch pass.
+    """
+    engine = FakeBatchEngine()
+    careers = ["a", "b", "c"]
+
+    async def main():
+        coalescer = RequestCoalescer(engine, window_ms=20, max_batch_size=10)
+        results = await asyncio.gather(*[
+            coalescer.submit(f"user{i}", careers, limit=2) for i in range(4)
+        ])
+        return results, coalescer.get_metrics()
+
+    results, metrics = asyncio.run(main())
+    engine.executor.shutdown()
+
+    assert len(engine.batches) == 1
+    assert results[3] == ["user3:a", "user3:b"]
+    assert metrics["batches"] == 1
+    assert metrics["average_batch_size"] == 4
+
+
+def test_max_batch_size_flushes_early():
+    """
+    A full batch is dispatched without waiting for the window to elapse.
+    """
+    engine = FakeBatchEngine()
+    careers = ["a"]
+
+    async def main():
+        coalescer = RequestCoalescer(engine, window_ms=10_000, max_batch_size=2)
+        return await asyncio.wait_for(
+            asyncio.gather(coalescer.submit("u1", careers), coalescer.submit("u2", careers)),
+            timeout=2
+        )
+
+    results = asyncio.run(main())
+    engine.executor.shutdown()
+
+    assert results == [["u1:a"], ["u2:a"]]
+
+
+def test_failures_are_isolated_per_request():
+    """
+    One failing profile does not fail the rest of its batch.
+    """
+    engine = FakeBatchEngine()
+    careers = ["a"]
+
+    async def main():
+        coalescer = RequestCoalescer(engine, window_ms=20)
+        return await asyncio.gather(
+            coalescer.submit("good", careers),
+            coalescer.submit("bad", careers),
+            return_exceptions=True
+        )
+
+    good, bad = asyncio.run(main())
+    engine.executor.shutdown()
+
+    assert good == ["good:a"]
+    assert isinstance(bad, ValueError)
+
+
+def test_requests_for_different_catalogs_are_not_mixed():
+    """
+    Requests are only batched with others targeting the same career list.
+    """
+    engine = FakeBatchEngine()
+
+    async def main():
+        coalescer = RequestCoalescer(engine, window_ms=20)
+        return await asyncio.gather(
+            coalescer.submit("u1", ["a"]),
+            coalescer.submit("u2", ["b"])
+        )
+
+    results = asyncio.run(main())
+    engine.executor.shutdown()
+
+    assert results == [["u1:a"], ["u2:b"]]
+    assert len(engine.batches) == 2
+
+
+def test_shared_prefilter_features_match_per_request_prefiltering():
+    """
+    Pre-filtering with batch-shared features ranks careers exactly as before.
+    """
+    pytest.importorskip("beanie")
+    from recommendation_engine import RecommendationEngine
+    from recommendation_engine.mock_data import create_mock_careers, create_mock_user_profile
+
+    engine = RecommendationEngine()
+    careers = create_mock_careers()
+    summary = engine._preprocess_user_profile(create_mock_user_profile())
+
+    shared = engine._build_prefilter_features(careers)
+    assert engine._prefilter_careers(summary, careers, shared) == engine._prefilter_careers(summary, careers)
+
+
+def test_batches_are_split_across_executor_workers():
+    """
+    A batch is scored as one concurrent chunk per executor worker.
+    """
+    engine = FakeBatchEngine(max_workers=2)
+    careers = ["a"]
+    # Both chunks must be inside the engine at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=2)
+    score_batch = engine.get_recommendations_batch
+
+    def get_recommendations_batch(*args, **kwargs):
+        barrier.wait()
+        return score_batch(*args, **kwargs)
+
+    engine.get_recommendations_batch = get_recommendations_batch
+
+    async def main():
+        coalescer = RequestCoalescer(engine, window_ms=20, max_batch_size=10)
+        results = await asyncio.gather(*[
+            coalescer.submit(f"user{i}", careers) for i in range(5)
+        ])
+        return results, coalescer.get_metrics()
+
+    results, metrics = asyncio.run(main())
+    engine.executor.shutdown()
+
+    assert sorted(len(batch) for batch in engine.batches) == [2, 3]
+    assert results == [[f"user{i}:a"] for i in range(5)]
+    assert metrics["batches"] == 1
+    assert metrics["chunks"] == 2
@@ -0,0 +1,140 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from recommendation_engine.executor import ScoringExecutor, EngineOverloadedError
+
+
+def test_run_returns_result_off_loop_thread():
+    """
+    Jobs run on a scoring thread, not on the event loop thread.
+    """
+    executor = ScoringExecutor(max_workers=2, max_queue_depth=2)
+
+    async def main():
+        loop_thread = threading.get_ident()
+        result, job_thread = await executor.run(lambda x: (x * 2, threading.get_ident()), 21)
+        return result, job_thread != loop_thread
+
+    result, off_loop = asyncio.run(main())
+    executor.shutdown()
+
+    assert result == 42
+    assert off_loop
+    assert executor.get_metrics()["completed"] == 1
+
+
+def test_event_loop_stays_responsive_while_scoring():
+    """
+    A blocking job must not stall other coroutines on the loop.
+    """
+    executor = ScoringExecutor(max_workers=1, max_queue_depth=1)
+
+    async def main():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        beat = asyncio.create_task(heartbeat())
+        await executor.run(time.sleep, 0.2)
+        beat.cancel()
+        return ticks
+
+    ticks = asyncio.run(main())
+    executor.shutdown()
+
+    assert ticks >= 5
+
+
+def test_backpressure_rejects_when_full():
+    """
+    Work beyond max_workers + max_queue_depth is rejected immediately.
+    """
+    executor = ScoringExecutor(max_workers=1, max_queue_depth=1)
+    release = threading.Event()
+
+    async def main():
+        first = asyncio.create_task(executor.run(release.wait))
+        second = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(EngineOverloadedError):
+            await executor.run(release.wait)
+
+        metrics = executor.get_metrics()
+        release.set()
+        await asyncio.gather(first, second)
+        return metrics
+
+    metrics = asyncio.run(main())
+    executor.shutdown()
+
+    assert metrics["running"] == 1
+    assert metrics["queue_depth"] == 1
+    assert metrics["rejected"] == 1
+    assert executor.get_metrics()["completed"] == 2
+
+
+def test_failed_jobs_release_capacity():
+    """
+    A job that raises frees its slot and is counted as failed.
+    """
+    executor = ScoringExecutor(max_workers=1, max_queue_depth=0)
+
+    def boom():
+        raise ValueError("scoring failed")
+
+    async def main():
+        with pytest.raises(ValueError):
+            await executor.run(boom)
+        return await executor.run(lambda: "ok")
+
+    assert asyncio.run(main()) == "ok"
+    executor.shutdown()
+
+    metrics = executor.get_metrics()
+    assert metrics["failed"] == 1
+    assert metrics["completed"] == 1
+    assert metrics["queue_depth"] == 0
+
+
+def test_cancelled_queued_job_releases_capacity():
+    """
+    Cancelling a job that is still queued gives its slot back.
+    """
+    executor = ScoringExecutor(max_workers=1, max_queue_depth=1)
+    release = threading.Event()
+    ran = []
+
+    async def main():
+        running = asyncio.create_task(executor.run(release.wait))
+        queued = asyncio.create_task(executor.run(ran.append, "queued"))
+        await asyncio.sleep(0.05)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        release.set()
+        await running
+        return await executor.run(lambda: "ok")
+
+    assert asyncio.run(main()) == "ok"
+    executor.shutdown()
+
+    metrics = executor.get_metrics()
+    assert ran == []
+    assert metrics["queue_depth"] == 0
+    assert metrics["running"] == 0
+    assert metrics["cancelled"] == 1
+    assert metrics["completed"] == 2
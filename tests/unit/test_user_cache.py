@@ -0,0 +1,101 @@
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+pytest.importorskip("jose")
+
+from app.core.user_cache import AuthCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_bounds_expiry_and_stale_fills():
+    """
+    Entries expire after the TTL, the least recently used entry is evicted
+    when full, and a fill that raced an invalidation is not cached.
+    """
+    clock = FakeClock()
+    cache = TTLCache(max_entries=2, ttl_seconds=10, clock=clock)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts b, the least recently used
+    assert cache.get("b") is None and cache.get("c") == 3
+
+    clock.now += 11
+    assert cache.get("a") is None
+
+    ticket = cache.ticket()
+    cache.invalidate("x")
+    cache.set("a", "stale", ticket=ticket)
+    assert cache.get("a") is None
+
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1 and stats["expirations"] == 1 and stats["stale_fills"] == 1
+    assert stats["hit_rate"] == pytest.approx(2 / 5)
+
+
+def test_cached_user_documents_are_isolated_from_callers():
+    """
+    Nested fields of a cached user cannot be changed through the document
+    that was stored or through one that was handed out.
+    """
+    cache = AuthCache(user_ttl_seconds=30, max_users=10, max_tokens=10)
+    user = {"email": "ada@example.com", "profile": {"skills": ["python"]}}
+    cache.put_user("ada@example.com", user, cache.users.ticket())
+
+    user["profile"]["skills"].append("stored")
+    cache.get_user("ada@example.com")["profile"]["skills"].append("returned")
+    assert cache.get_user("ada@example.com")["profile"] == {"skills": ["python"]}
+
+
+def test_get_current_user_is_served_from_the_cache(monkeypatch):
+    """
+    Repeated requests with the same token decode it once and read the user
+    once; a password change invalidates the cached user document.
+    """
+    from app.api.v1.endpoints import auth
+    from app.core.security import create_access_token
+
+    cache = AuthCache(user_ttl_seconds=30, max_users=100, max_tokens=100)
+    monkeypatch.setattr(auth, "auth_cache", cache)
+    users = {"ada@example.com": {"_id": "u1", "email": "ada@example.com", "hashed_password": "old"}}
+    reads = []
+
+    async def find_one(filter_dict):
+        reads.append(filter_dict)
+        return dict(users[filter_dict["email"]])
+
+    request = SimpleNamespace(app=SimpleNamespace(mongodb=SimpleNamespace(users=SimpleNamespace(find_one=find_one))))
+    token = create_access_token({"sub": "ada@example.com"})
+
+    async def main():
+        for _ in range(5):
+            user = await auth.get_current_user(request, token)
+            user["scratch"] = True  # callers get their own copy
+        assert len(reads) == 1 and "scratch" not in (await auth.get_current_user(request, token))
+
+        users["ada@example.com"]["hashed_password"] = "new"
+        cache.invalidate_user("ada@example.com")
+        assert (await auth.get_current_user(request, token))["hashed_password"] == "new"
+        assert len(reads) == 2
+
+        with pytest.raises(auth.HTTPException):
+            await auth.get_current_user(request, "not-a-token")
+
+    asyncio.run(main())
+    stats = cache.get_stats()
+    assert stats["tokens"]["misses"] == 2 and stats["tokens"]["hits"] == 6
+    assert stats["users"]["hit_rate"] == pytest.approx(5 / 7)